@@ -1,17 +1,40 @@
 import streamlit as st
-import re
 import random
 import datetime
-import spacy
-import fitz  # PyMuPDF for better PDF extraction (fitz is the module name for PyMuPDF)
-from difflib import SequenceMatcher
-import docx  # For .docx support
-from io import BytesIO  # For PDF generation
 import base64
+import json
+from concurrent.futures import FIRST_COMPLETED, wait
+from profile_analyser.constants import CERTIFICATIONS, COURSES, PROJECT_IDEAS, SKILL_KEYWORDS
+from profile_analyser.batch import submit_batch
+from profile_analyser.blobs import get_blob_store
+from profile_analyser.cache import get_parse_cache
+from profile_analyser.graph import get_analysis
+from profile_analyser.jobs import get_job_catalog, missing_catalog_paths, salary_floor_k
+from profile_analyser import metrics
+from profile_analyser.metrics import span, timed
+from profile_analyser.similarity import match as match_documents, top_terms
+from profile_analyser.nlp import get_nlp
+from profile_analyser.render import (
+    RESUME_FIELDS,
+    RenderError,
+    export_combined,
+    export_zip,
+    generate_pdf_resume as render_pdf_resume,
+    render_key,
+    sections_from_info,
+)
+from profile_analyser.scoring import (
+    detect_field,
+    dynamic_resume_score,
+)
 
 # --- Page config & theme ---
 st.set_page_config(page_title="AI Resume Analyzer", page_icon="📄", layout="wide")
 
+# Per-rerun stage timings for the performance panel (and the optional metrics exports)
+metrics.begin_run()
+metrics.serve_from_env()
+
 # Global styling to modernize the look & feel
 st.markdown(
     """
@@ -193,1052 +216,11 @@ elif page == "Insights":
     st.markdown('<a name="insights"></a>', unsafe_allow_html=True)
     st.markdown("## 💡 Insights")
 
-nlp = spacy.load("en_core_web_sm")
-
-# --- Enhanced PDF Text Extraction ---
-def extract_text_from_pdf(file_path):
-    """Improved PDF text extraction using PyMuPDF"""
-    try:
-        doc = fitz.open(file_path)
-        text = ""
-        urls = set()
-        for page in doc:
-            text += page.get_text()
-            try:
-                for link in page.get_links():
-                    uri = link.get('uri')
-                    if uri and isinstance(uri, str) and uri.startswith(('http://', 'https://')):
-                        urls.add(uri.strip())
-            except Exception:
-                pass
-        doc.close()
-        if urls:
-            text += "\n\n" + "\n".join(sorted(urls))
-        return text
-    except Exception as e:
-        st.error(f"Error extracting text from PDF: {e}")
-        return ""
-
-def extract_text_from_docx(file_path):
-    """Extract text from .docx files"""
-    try:
-        doc = docx.Document(file_path)
-        text = ""
-        for paragraph in doc.paragraphs:
-            text += paragraph.text + "\n"
-        # Append embedded hyperlink targets (clickable links that may not appear in visible text)
-        try:
-            from docx.opc.constants import RELATIONSHIP_TYPE as DOCX_RT
-            urls = set()
-            for rel in doc.part.rels.values():
-                if getattr(rel, 'reltype', None) == DOCX_RT.HYPERLINK:
-                    target = getattr(rel, 'target_ref', None)
-                    if target and isinstance(target, str) and target.startswith(('http://', 'https://')):
-                        urls.add(target.strip())
-            if urls:
-                text += "\n" + "\n".join(sorted(urls))
-        except Exception:
-            pass
-        return text
-    except Exception as e:
-        st.error(f"Error extracting text from DOCX: {e}")
-        return ""
-
-def extract_text_from_file(file_path, file_type):
-    """Extract text based on file type"""
-    if file_type == "pdf":
-        return extract_text_from_pdf(file_path)
-    elif file_type == "docx":
-        return extract_text_from_docx(file_path)
-    else:
-        return ""
-
-# --- Enhanced Skill Keywords with Synonyms and Abbreviations ---
-SKILL_KEYWORDS = {
-    "Data Science": [
-        "python", "machine learning", "pandas", "numpy", "tensorflow", "data analysis",
-        "scikit-learn", "sklearn", "jupyter", "matplotlib", "seaborn", "plotly",
-        "sql", "postgresql", "mysql", "mongodb", "spark", "hadoop", "kafka",
-        "powerbi", "tableau", "excel", "r", "statistics", "regression", "classification",
-        "clustering", "nlp", "natural language processing", "deep learning", "neural networks"
-    ],
-    "Web Development": [
-        "html", "css", "javascript", "js", "react", "vue", "angular", "node", "nodejs",
-        "flask", "django", "express", "mongodb", "mysql", "postgresql", "rest api",
-        "graphql", "typescript", "ts", "bootstrap", "tailwind", "sass", "less",
-        "webpack", "babel", "npm", "yarn", "git", "github", "docker", "kubernetes"
-    ],
-    "Android Development": [
-        "android", "kotlin", "java", "xml", "gradle", "android studio", "firebase",
-        "room database", "retrofit", "okhttp", "glide", "picasso", "jetpack compose",
-        "material design", "mvvm", "mvp", "dagger", "hilt", "coroutines", "flow"
-    ],
-    "UI/UX": [
-        "figma", "adobe xd", "photoshop", "sketch", "invision", "protopie", "framer",
-        "wireframing", "prototyping", "user research", "usability testing", "design systems",
-        "responsive design", "accessibility", "wcag", "user personas", "journey mapping"
-    ],
-    "Artificial Intelligence": [
-        "deep learning", "neural networks", "nlp", "bert", "transformers", "pytorch", "keras",
-        "tensorflow", "opencv", "computer vision", "cnn", "rnn", "lstm", "gru", "gan",
-        "reinforcement learning", "q-learning", "openai", "gpt", "chatgpt", "langchain"
-    ],
-    "Cybersecurity": [
-        "network security", "penetration testing", "pen testing", "firewalls", "siem",
-        "vulnerability assessment", "encryption", "ssl", "tls", "wireshark", "nmap",
-        "metasploit", "burp suite", "owasp", "ethical hacking", "ceh", "comptia security+",
-        "cryptography", "hash functions", "digital signatures", "vpn", "ids", "ips"
-    ],
-    "Cloud Computing": [
-        "aws", "amazon web services", "azure", "gcp", "google cloud", "cloud", "devops",
-        "docker", "kubernetes", "k8s", "ci/cd", "jenkins", "gitlab", "github actions",
-        "terraform", "ansible", "serverless", "lambda", "ec2", "s3", "rds", "vpc",
-        "load balancer", "auto scaling", "cloudformation", "cloudwatch"
-    ],
-    "Software Development": [
-        "c++", "cpp", "java", "python", "oop", "object oriented programming", "git",
-        "algorithms", "data structures", "leetcode", "hackerrank", "design patterns",
-        "microservices", "api", "rest", "graphql", "testing", "unit testing", "integration testing",
-        "tdd", "bdd", "agile", "scrum", "kanban", "jira", "confluence"
-    ],
-    "Business Analyst": [
-        "business analysis", "requirement gathering", "process modeling", "sql", "excel",
-        "powerbi", "tableau", "jira", "confluence", "user stories", "use cases",
-        "bpmn", "uml", "data modeling", "er diagrams", "stakeholder management",
-        "gap analysis", "swot analysis", "root cause analysis"
-    ],
-    "Product Management": [
-        "roadmap", "product strategy", "user stories", "agile", "scrum", "market research",
-        "competitive analysis", "user personas", "journey mapping", "a/b testing",
-        "analytics", "google analytics", "mixpanel", "amplitude", "jira", "confluence",
-        "figma", "prototyping", "mvp", "minimum viable product"
-    ],
-    "Mobile App Development": [
-        "android", "ios", "swift", "kotlin", "flutter", "react native", "xamarin",
-        "mobile development", "app store", "google play", "firebase", "push notifications",
-        "in-app purchases", "mobile ui", "responsive design", "cross platform"
-    ],
-    "Game Development": [
-        "unity", "unreal", "c#", "game design", "3d modeling", "physics engine",
-        "blender", "maya", "3ds max", "game mechanics", "level design", "character design",
-        "animation", "rigging", "texturing", "shaders", "game physics", "ai in games"
-    ],
-    "Finance": [
-        "accounting", "financial analysis", "excel", "valuation", "markets", "investment",
-        "portfolio management", "risk management", "derivatives", "options", "futures",
-        "bonds", "stocks", "mutual funds", "etf", "financial modeling", "dcf", "npv", "irr"
-    ],
-    "HR": [
-        "recruitment", "onboarding", "payroll", "employee engagement", "hrms", "compliance",
-        "performance management", "talent acquisition", "employee relations", "benefits",
-        "compensation", "training", "development", "diversity", "inclusion", "workplace culture"
-    ],
-    "Digital Marketing": [
-        "seo", "search engine optimization", "sem", "search engine marketing", "google analytics",
-        "content marketing", "social media", "email marketing", "ppc", "google ads",
-        "facebook ads", "instagram ads", "linkedin ads", "conversion optimization",
-        "landing pages", "a/b testing", "marketing automation", "hubspot", "mailchimp"
-    ],
-    "Blockchain": [
-        "blockchain", "bitcoin", "ethereum", "solidity", "smart contracts", "web3",
-        "defi", "decentralized finance", "nft", "non-fungible tokens", "cryptocurrency",
-        "hyperledger", "consensus algorithms", "proof of work", "proof of stake",
-        "metamask", "ipfs", "interplanetary file system"
-    ],
-    "DevOps": [
-        "devops", "ci/cd", "continuous integration", "continuous deployment", "jenkins",
-        "gitlab ci", "github actions", "docker", "kubernetes", "terraform", "ansible",
-        "prometheus", "grafana", "elk stack", "elasticsearch", "logstash", "kibana",
-        "monitoring", "logging", "infrastructure as code", "iac"
-    ],
-    "UI/UX Design": [
-        "ui design", "ux design", "user interface", "user experience", "figma", "sketch",
-        "adobe xd", "invision", "prototyping", "wireframing", "user research",
-        "usability testing", "design systems", "responsive design", "mobile design",
-        "accessibility", "wcag", "user personas", "journey mapping"
-    ],
-    "AR/VR": [
-        "augmented reality", "virtual reality", "ar", "vr", "unity", "unreal engine",
-        "oculus", "htc vive", "hololens", "3d modeling", "blender", "maya",
-        "spatial computing", "mixed reality", "mr", "computer vision", "tracking"
-    ],
-    "IoT": [
-        "internet of things", "iot", "raspberry pi", "arduino", "sensors", "mqtt",
-        "coap", "edge computing", "fog computing", "embedded systems", "microcontrollers",
-        "wireless protocols", "bluetooth", "wifi", "zigbee", "lorawan", "nb-iot"
-    ]
-}
-
-# --- Courses by Field ---
-COURSES = {
-    "Data Science": [
-        "Data Science with Python – IBM (Coursera)",
-        "Machine Learning A-Z – Udemy",
-        "Python for Data Science – DataCamp",
-        "SQL for Data Analysis – Mode Analytics",
-        "Statistics for Data Science – Coursera",
-        "Deep Learning Specialization – DeepLearning.AI (Coursera)"
-    ],
-    "Web Development": [
-        "React for Beginners – Udemy",
-        "Full Stack with Django – Udemy",
-        "JavaScript Complete Guide – Udemy",
-        "Node.js Bootcamp – Udemy",
-        "MongoDB Complete Course – Udemy",
-        "Git & GitHub Crash Course – Udemy"
-    ],
-    "Android Development": [
-        "Android with Kotlin – Udemy",
-        "Build Apps with Firebase – Udemy",
-        "Android App Development – Coursera",
-        "Kotlin for Android – Udemy",
-        "Android Studio Masterclass – Udemy"
-    ],
-    "UI/UX": [
-        "Figma UI Basics – Udemy",
-        "UX Design Crash Course – Udemy",
-        "Adobe XD Complete Course – Udemy",
-        "User Research Methods – Coursera",
-        "Prototyping with Figma – Udemy"
-    ],
-    "Artificial Intelligence": [
-        "Deep Learning Specialization – DeepLearning.AI (Coursera)",
-        "Natural Language Processing with BERT (Coursera)",
-        "AI For Everyone (Coursera)",
-        "Computer Vision with OpenCV – Udemy",
-        "Machine Learning with Python – Coursera",
-        "TensorFlow Developer Certificate – Google"
-    ],
-    "Cybersecurity": [
-        "Introduction to Cyber Security (Coursera)",
-        "Network Security (Udemy)",
-        "Penetration Testing (NPTEL)",
-        "Ethical Hacking Course – Udemy",
-        "CompTIA Security+ Certification – Udemy",
-        "CEH v12 Complete Course – Udemy"
-    ],
-    "Cloud Computing": [
-        "AWS Cloud Practitioner Essentials (AWS)",
-        "Azure Fundamentals (Microsoft)",
-        "DevOps on AWS (Coursera)",
-        "CI/CD with GitHub Actions (Coursera)",
-        "Docker Complete Course – Udemy",
-        "Kubernetes for Beginners – Udemy"
-    ],
-    "Software Development": [
-        "Java Programming (Coursera)",
-        "Data Structures & Algorithms (Coursera)",
-        "Git & GitHub Bootcamp (Udemy)",
-        "Python Complete Course – Udemy",
-        "C++ Programming – Udemy",
-        "System Design Interview Course – Udemy"
-    ],
-    "Business Analyst": [
-        "Business Analysis Fundamentals (Udemy)",
-        "Excel to MySQL: Analytics for Business (Coursera)",
-        "SQL for Business Analysts – Udemy",
-        "Power BI Complete Course – Udemy",
-        "Tableau for Data Science – Udemy",
-        "Business Process Modeling – Udemy"
-    ],
-    "Product Management": [
-        "Digital Product Management (Coursera)",
-        "Product Management by Pragmatic Institute",
-        "Agile Project Management – Udemy",
-        "User Story Mapping – Udemy",
-        "Product Strategy Course – Udemy",
-        "A/B Testing for Product Managers – Udemy"
-    ],
-    "Mobile App Development": [
-        "iOS App Development with Swift (Coursera)",
-        "Flutter & Dart (Udemy)",
-        "React Native Complete Course – Udemy",
-        "Mobile App Development – Udemy",
-        "Cross-Platform Development – Udemy"
-    ],
-    "Game Development": [
-        "Game Development with Unity (Coursera)",
-        "Unreal Engine C++ Developer (Udemy)",
-        "Unity 2D Game Development – Udemy",
-        "3D Modeling with Blender – Udemy",
-        "Game Design Principles – Udemy"
-    ],
-    "Finance": [
-        "Financial Markets – Yale (Coursera)",
-        "Accounting Fundamentals (Udemy)",
-        "Investment Management – Coursera",
-        "Financial Modeling – Udemy",
-        "Risk Management – Coursera",
-        "Portfolio Management – Udemy"
-    ],
-    "HR": [
-        "Human Resource Management (Coursera)",
-        "HR Analytics (Udemy)",
-        "Recruitment and Selection – Udemy",
-        "Employee Relations – Udemy",
-        "HR Compliance – Udemy",
-        "Performance Management – Udemy"
-    ],
-    "Digital Marketing": [
-        "Digital Marketing Specialization (Coursera)",
-        "SEO Training (Udemy)",
-        "Google Analytics (Coursera)",
-        "Social Media Marketing – Udemy",
-        "Email Marketing – Udemy",
-        "Content Marketing – Udemy"
-    ],
-    "Blockchain": [
-        "Blockchain Basics – Coursera",
-        "Ethereum Development – Udemy",
-        "Solidity Programming – Udemy",
-        "Web3 Development – Udemy",
-        "Cryptocurrency Trading – Udemy",
-        "DeFi Fundamentals – Udemy"
-    ],
-    "DevOps": [
-        "DevOps Fundamentals – Udemy",
-        "Docker and Kubernetes – Udemy",
-        "CI/CD Pipeline – Udemy",
-        "Terraform for Beginners – Udemy",
-        "Ansible Automation – Udemy",
-        "Monitoring and Logging – Udemy"
-    ],
-    "UI/UX Design": [
-        "UI/UX Design Bootcamp – Udemy",
-        "User Experience Design – Coursera",
-        "Prototyping with Figma – Udemy",
-        "Design Systems – Udemy",
-        "User Research Methods – Udemy",
-        "Accessibility Design – Udemy"
-    ],
-    "AR/VR": [
-        "Unity AR Development – Udemy",
-        "VR Development with Unity – Udemy",
-        "3D Modeling for VR – Udemy",
-        "Spatial Computing – Coursera",
-        "Mixed Reality Development – Udemy"
-    ],
-    "IoT": [
-        "IoT Fundamentals – Coursera",
-        "Arduino Programming – Udemy",
-        "Raspberry Pi Projects – Udemy",
-        "IoT Security – Udemy",
-        "Edge Computing – Udemy",
-        "Sensor Networks – Udemy"
-    ]
-}
-
-# --- Enhanced Section Headers with Fuzzy Matching ---
-SECTION_HEADERS = {
-    "experience": ["experience", "work experience", "employment", "work history", "professional experience", "career", "employment history"],
-    "education": ["education", "academic", "academics", "qualifications", "academic background", "educational background"],
-    "skills": ["skills", "technical skills", "competencies", "expertise", "technologies", "tools", "programming languages"],
-    "projects": ["projects", "project work", "portfolio", "achievements", "key projects", "work samples"],
-    "certifications": ["certifications", "certificates", "credentials", "accreditations", "professional certifications"],
-    "contact": ["contact", "contact information", "personal information", "details", "contact details"],
-    "objective": ["objective", "career objective", "summary", "profile", "personal statement", "career summary"],
-    "declaration": ["declaration", "statement", "affirmation", "disclaimer"]
-}
-
-def normalize_section_heading(text):
-    """Normalize section headings using fuzzy matching"""
-    text_lower = text.lower().strip()
-    for section, variations in SECTION_HEADERS.items():
-        for variation in variations:
-            if SequenceMatcher(None, text_lower, variation).ratio() > 0.8:
-                return section
-    return text_lower
-
-# --- Enhanced Personal Info Extraction ---
-def extract_personal_info(text):
-    """Enhanced personal information extraction with improved name detection"""
-    
-    def is_valid_name(name_candidate):
-        """Validate if a candidate string is likely a person's name"""
-        if not name_candidate or len(name_candidate.strip()) < 2:
-            return False
-            
-        # Clean the candidate
-        cleaned = re.sub(r"[^A-Za-z\s\-'.]", "", name_candidate).strip()
-        words = cleaned.split()
-        
-        # Must have 2-4 words
-        if not (2 <= len(words) <= 4):
-            return False
-            
-        # Each word should start with capital letter and be mostly alphabetic
-        for word in words:
-            if not word[0].isupper() or not word.replace("'", "").replace("-", "").isalpha():
-                return False
-                
-        # Avoid common non-name patterns
-        tech_words = {
-            "java", "python", "html", "css", "sql", "react", "node", "django", "flask", 
-            "aws", "azure", "javascript", "typescript", "angular", "vue", "spring",
-            "developer", "engineer", "analyst", "manager", "director", "consultant",
-            "software", "web", "mobile", "frontend", "backend", "fullstack", "data",
-            "science", "machine", "learning", "artificial", "intelligence", "cloud",
-            "devops", "database", "api", "rest", "graphql", "docker", "kubernetes"
-        }
-        
-        # Check if any word is a tech term
-        for word in words:
-            if word.lower() in tech_words:
-                return False
-                
-        # Avoid email-like patterns
-        if "@" in name_candidate or "." in name_candidate.split()[-1]:
-            return False
-            
-        # Avoid phone number patterns
-        if re.search(r'\d{3,}', name_candidate):
-            return False
-            
-        return True
-    
-    # Improved name extraction
-    lines = [ln.strip() for ln in text.split("\n")[:20] if ln.strip()]
-    name = "Not found"
-    
-    # 1) Look for explicit name labels first
-    name_label_patterns = [
-        r"(?i)^(?:name|full\s*name|applicant)\s*[:\-]\s*([A-Z][a-z]+(?:\s[A-Z][a-z]+)+)",
-        r"(?i)^(?:name|full\s*name|applicant)\s*[:\-]\s*([A-Z][a-z]+(?:\s[A-Z][a-z]+){1,3})"
-    ]
-    
-    for pattern in name_label_patterns:
-        for line in lines[:10]:
-            match = re.search(pattern, line)
-            if match:
-                candidate = match.group(1).strip()
-                if is_valid_name(candidate):
-                    name = candidate
-                    break
-        if name != "Not found":
-            break
-    
-    # 2) Look for standalone names in first few lines (most common case)
-    if name == "Not found":
-        for i, line in enumerate(lines[:8]):  # Check first 8 lines
-            # Skip lines that look like headers or contact info
-            if any(keyword in line.lower() for keyword in ["email", "phone", "address", "linkedin", "github", "portfolio", "objective", "summary", "profile"]):
-                continue
-                
-            # Clean the line and check if it's a valid name
-            cleaned_line = re.sub(r"[^A-Za-z\s\-'.]", "", line).strip()
-            if is_valid_name(cleaned_line):
-                # Additional check: make sure it's not a job title or company name
-                if not any(title in line.lower() for title in ["engineer", "developer", "analyst", "manager", "consultant", "specialist", "coordinator", "assistant", "associate", "senior", "junior", "lead", "principal", "architect", "director", "vice", "president", "ceo", "cto", "cfo"]):
-                    name = cleaned_line
-                    break
-    
-    # 3) Fallback: Use spaCy NER on top section
-    if name == "Not found":
-        try:
-            # Use first 10 lines for NER
-            top_text = "\n".join(lines[:10])
-            doc = nlp(top_text)
-            
-            # Look for PERSON entities
-            person_entities = []
-            for ent in doc.ents:
-                if ent.label_ == "PERSON" and 2 <= len(ent.text.split()) <= 4:
-                    if is_valid_name(ent.text):
-                        person_entities.append(ent.text.strip())
-            
-            if person_entities:
-                # Prefer entities that appear earlier in the text
-                name = person_entities[0]
-        except Exception:
-            pass
-    
-    # 4) Final fallback: simple pattern matching
-    if name == "Not found":
-        simple_patterns = [
-            r"^([A-Z][a-z]+\s[A-Z][a-z]+)$",  # First Last
-            r"^([A-Z][a-z]+\s[A-Z][a-z]+\s[A-Z][a-z]+)$",  # First Middle Last
-            r"^([A-Z][a-z]+\s[A-Z]\.\s[A-Z][a-z]+)$"  # First M. Last
-        ]
-        
-        for pattern in simple_patterns:
-            for line in lines[:5]:
-                match = re.match(pattern, line.strip())
-                if match:
-                    candidate = match.group(1).strip()
-                    if is_valid_name(candidate):
-                        name = candidate
-                        break
-            if name != "Not found":
-                break
-    
-    # Enhanced email extraction
-    email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-    emails = re.findall(email_pattern, text)
-    email = emails[0] if emails else "Not found"
-    
-    # Enhanced phone extraction
-    phone_patterns = [
-        r'\+?1?[-.\s]?\(?([0-9]{3})\)?[-.\s]?([0-9]{3})[-.\s]?([0-9]{4})',
-        r'\+?[0-9]{1,4}[-.\s]?[0-9]{1,4}[-.\s]?[0-9]{1,4}[-.\s]?[0-9]{1,4}',
-        r'\+?[0-9]{10,15}'
-    ]
-    phone = "Not found"
-    for pattern in phone_patterns:
-        phones = re.findall(pattern, text)
-        if phones:
-            if isinstance(phones[0], tuple):
-                phone = ''.join(phones[0])
-            else:
-                phone = phones[0]
-            break
-    
-    # Enhanced URL extraction
-    def normalize_url(u: str) -> str:
-        if not u:
-            return u
-        u = u.strip()
-        if u.startswith("www."):
-            return "https://" + u
-        if u.startswith("linkedin.com"):
-            return "https://www." + u
-        if u and not u.startswith("http"):
-            return "https://" + u
-        return u
-
-    # Accept URLs with or without protocol and across potential newlines after labels
-    joined = text
-    linkedin_pattern = r'(?:linkedin\s*[:\-]?\s*(?:\n|\r|\s)*)?(https?://(?:www\.)?linkedin\.com/[a-zA-Z0-9\-_/=?]+|www\.linkedin\.com/[a-zA-Z0-9\-_/=?]+|linkedin\.com/[a-zA-Z0-9\-_/=?]+)'
-    linkedin_matches = re.findall(linkedin_pattern, joined, re.IGNORECASE)
-    linkedin = normalize_url(linkedin_matches[0]) if linkedin_matches else "Not found"
-
-    github_pattern = r'(?:github\s*[:\-]?\s*(?:\n|\r|\s)*)?(https?://(?:www\.)?github\.com/[a-zA-Z0-9\-_/=?]+|www\.github\.com/[a-zA-Z0-9\-_/=?]+|github\.com/[a-zA-Z0-9\-_/=?]+)'
-    github_matches = re.findall(github_pattern, joined, re.IGNORECASE)
-    github = normalize_url(github_matches[0]) if github_matches else "Not found"
-
-    portfolio_pattern = r'(?:portfolio\s*[:\-]?\s*(?:\n|\r|\s)*)?(https?://[\w\.-]+\.[a-z]{2,}(?:/[a-zA-Z0-9\-_/=?#]+)?|www\.[\w\.-]+\.[a-z]{2,}(?:/[a-zA-Z0-9\-_/=?#]+)?)'
-    portfolio_matches = re.findall(portfolio_pattern, joined, re.IGNORECASE)
-    portfolio = normalize_url(portfolio_matches[0]) if portfolio_matches else "Not found"
-    
-    return {
-        "name": name,
-        "email": email,
-        "phone": phone,
-        "linkedin": linkedin,
-        "github": github,
-        "portfolio": portfolio
-    }
-
-# --- Enhanced Education Extraction ---
-def extract_education_info(text):
-    """Enhanced education information extraction (section-aware, robust patterns, deduped)"""
-    degree_keywords = [
-        "bachelor", "master", "phd", "m\.?tech", "b\.?tech", "b\.?e", "m\.?e",
-        "b\.?sc", "m\.?sc", "mba", "bba", "associate", "diploma", "high school",
-        "intermediate", "secondary", "senior secondary", "10th", "12th", "hsc", "ssc"
-    ]
-    inst_keywords = [
-        "university", "college", "institute", "school", "academy", "polytechnic"
-    ]
-    year_pattern = r"(19|20)\d{2}"
-    range_pattern = r"(19|20)\d{2}\s*[\-–—]\s*(19|20)?\d{2}|to\s*(19|20)\d{2}"
-
-    found = []
-
-    # 1) Section-aware parse: Education/Academics/Qualifications
-    header_multi = re.compile(r"(?im)^(education|academics|academic qualifications|qualifications|educational background)\b[:\-]?(.*)$")
-    for header in header_multi.finditer(text):
-        start = header.end()
-        nxt = re.search(r"(?im)^(experience|work|employment|projects|skills?|certifications?|licenses|summary|objective|contact|achievements?)\b", text[start:])
-        end = start + nxt.start() if nxt else len(text)
-        block = text[start:end]
-        if header.group(2):
-            block = header.group(2) + "\n" + block
-        items = re.split(r"[\n\r;\u2022\u2023\u25E6\u2043\-\–\—\|/•·∙‣◦▪]+", block)
-        for item in items:
-            line = item.strip()
-            low = line.lower()
-            if len(line) < 4:
-                continue
-            if any(re.search(k, low) for k in degree_keywords) or any(k in low for k in inst_keywords) or re.search(year_pattern, low):
-                # Keep typical education lines; avoid pure addresses/contacts
-                if "@" in low or "http" in low:
-                    continue
-                found.append(line)
-
-    # 2) Fallback patterns across full text
-    degree_union = '(?:' + '|'.join(degree_keywords) + ')'
-    inst_union = '(?:' + '|'.join(inst_keywords) + ')'
-    patterns = [
-        rf"(({degree_union})[^\n\r,;]*?(?:at|from|in)?\s*[A-Za-z .&'\-]*\s*(?:{year_pattern})?(?:\s*(?:{range_pattern}))?)",
-        rf"([A-Za-z .&'\-]+(?:{inst_union})[^\n\r,;]*\s*(?:{year_pattern})?(?:\s*(?:{range_pattern}))?)"
-    ]
-    for pattern in patterns:
-        try:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-        except re.error:
-            continue
-        for match in matches:
-            if isinstance(match, tuple):
-                edu_text = ' '.join([m for m in match if isinstance(m, str) and m]).strip()
-            else:
-                edu_text = match.strip()
-            if edu_text and len(edu_text) > 5:
-                found.append(edu_text)
-
-    # 3) Normalize and deduplicate
-    normalized = []
-    seen = set()
-    for line in found:
-        clean = re.sub(r"\s+", " ", line).strip(" .")
-        # Collapse duplicated consecutive words: e.g., "Intermediate Intermediate" -> "Intermediate"
-        clean = re.sub(r"\b(\w+)(?:\s+\1)+\b", r"\1", clean, flags=re.IGNORECASE)
-        key = clean.lower()
-        if key not in seen:
-            seen.add(key)
-            normalized.append(clean)
-
-    # 4) Preferred formatting: B.Tech college, Intermediate college, 10th school
-    def extract_institute(line_text: str) -> str:
-        t = line_text
-        # Remove degree keywords and years
-        t = re.sub(r"(?i)\b(b\.?(e|tech)|btech|b\.e|b\.tech|m\.?(e|tech)|mtech|b\.sc|m\.sc|bsc|msc|phd|mba|bba|associate|diploma|intermediate|12th|hsc|senior secondary|10th|ssc|secondary|standard|grade)\b", " ", t)
-        t = re.sub(r"(?i)\b(at|from|in|of)\b", " ", t)
-        t = re.sub(r"\b(19|20)\d{2}\b", " ", t)
-        t = re.sub(r"\s+[\-–—]\s+", " ", t)
-        t = re.sub(r"\s+", " ", t).strip(" ,.-")
-        return t
-
-    btech_line = None
-    inter_line = None
-    ssc_line = None
-
-    for ln in normalized:
-        low = ln.lower()
-        if btech_line is None and re.search(r"\b(b\.?(e|tech)|btech|b\.e|b\.tech)\b", low):
-            btech_line = f"B.Tech - {extract_institute(ln)}".strip()
-        if inter_line is None and re.search(r"\b(intermediate|12th|hsc|senior secondary)\b", low):
-            inter_line = f"Intermediate - {extract_institute(ln)}".strip()
-        if ssc_line is None and re.search(r"\b(10th|ssc|secondary)\b", low):
-            ssc_line = f"SSC - {extract_institute(ln)}".strip()
-
-    preferred = [x for x in [btech_line, inter_line, ssc_line] if x and len(x.split('-')[-1].strip()) > 0]
-    if preferred:
-        # Deduplicate preferred
-        seenp = set()
-        finalp = []
-        for x in preferred:
-            k = x.lower()
-            if k not in seenp:
-                seenp.add(k)
-                finalp.append(x)
-        return finalp
-
-    return normalized if normalized else ["Not found"]
-
-# --- Enhanced Skills Extraction with Preprocessing ---
-def preprocess_text(text):
-    """Preprocess text for better skill matching"""
-    # Normalize case and remove punctuation
-    text = text.lower()
-    text = re.sub(r'[^\w\s]', ' ', text)
-    # Remove extra whitespace
-    text = re.sub(r'\s+', ' ', text).strip()
-    return text
-
-def extract_skills_enhanced(text):
-    """Enhanced skills extraction with preprocessing and soft skills detection"""
-    processed_text = preprocess_text(text)
-    doc = nlp(processed_text)
-    
-    # Section-aware extraction from explicit Skills sections (support multiple)
-    section_skills_map = {}
-    try:
-        header_regex = re.compile(r"(?im)^(skills?|technical skills?)\b[:\-]?(.*)$")
-        for m in header_regex.finditer(text):
-            start = m.end()
-            next_header = re.search(r"(?im)^(experience|work|employment|projects|education|certifications?|licenses|summary|objective|contact)\b", text[start:])
-            end = start + next_header.start() if next_header else len(text)
-            skills_block = text[start:end]
-            if m.group(2):
-                skills_block = m.group(2) + "\n" + skills_block
-            raw_items = re.split(r"[\n\r,;\u2022\u2023\u25E6\u2043\-\–\—\|/•·∙‣◦▪]+", skills_block)
-            for item in raw_items:
-                original = item.strip()
-                cleaned_norm = re.sub(r"[^a-zA-Z0-9\+\.#\s]", "", original).strip().lower()
-                if 1 < len(cleaned_norm) <= 40:
-                    section_skills_map.setdefault(cleaned_norm, original)
-    except Exception:
-        pass
-
-    # Contextual spans like "proficient in", "experience with", etc.
-    context_spans_text = []
-    try:
-        ctx_regex = re.compile(r"(?i)(skills?\s*[:\-]|proficient in|experience with|technologies\s*[:\-]|tools\s*[:\-]|stack\s*[:\-]|familiar with)\s*(.{0,200})")
-        for ctx in ctx_regex.finditer(text):
-            span = ctx.group(2)
-            if span:
-                context_spans_text.append(span)
-    except Exception:
-        pass
-    context_terms = set()
-    for span in context_spans_text:
-        for token in re.split(r"[\n\r,;\u2022\u2023\u25E6\u2043\-\–\—\|/•·∙‣◦▪]+", span):
-            cleaned = re.sub(r"[^a-zA-Z0-9\+\.#\s]", "", token).strip().lower()
-            if 1 < len(cleaned) <= 40:
-                context_terms.add(cleaned)
-
-    # Technical skills from known keywords but limit to Skills sections or contextual spans
-    technical_skills = set()
-    for field, skills in SKILL_KEYWORDS.items():
-        for skill in skills:
-            k = skill.lower()
-            if k in section_skills_map or k in context_terms:
-                technical_skills.add(k)
-
-    # Soft skills detection
-    soft_skills = [
-        "leadership", "communication", "teamwork", "problem solving", "critical thinking",
-        "creativity", "adaptability", "time management", "organization", "attention to detail",
-        "analytical", "strategic thinking", "project management", "customer service",
-        "negotiation", "presentation", "research", "collaboration", "initiative",
-        "flexibility", "multitasking", "decision making", "mentoring", "coaching"
-    ]
-    
-    detected_soft_skills = set()
-    for skill in soft_skills:
-        if skill.lower() in processed_text:
-            detected_soft_skills.add(skill.lower())
-    
-    # Named entity recognition for additional skills (only from skills blocks)
-    ner_skills = set()
-    try:
-        skills_blocks_concat = "\n".join(section_skills_map.values()).lower()
-        if skills_blocks_concat:
-            doc_blocks = nlp(preprocess_text(skills_blocks_concat))
-            for ent in doc_blocks.ents:
-                if ent.label_ in ["ORG", "PRODUCT"] and len(ent.text) < 30:
-                    ner_skills.add(ent.text.lower())
-    except Exception:
-        pass
-    
-    # Merge and normalize unique skills
-    all_norm = set(section_skills_map.keys())
-    all_norm |= technical_skills
-    all_norm |= detected_soft_skills
-    all_norm |= ner_skills
-    
-    # Filters to remove institutions/companies and noise from skills
-    org_edu_blocklist = [
-        "university", "college", "school", "institute", "academy", "junior college",
-        "polytechnic", "campus"
-    ]
-    org_company_blocklist = [
-        " private limited", " pvt", "pvt.", "limited", " ltd", "ltd.", " inc", "inc.", " llc", "llc.",
-        "solutions", "technologies", "labs", "systems", "corporation", "corp", "company"
-    ]
-    def looks_like_org_or_edu(s: str) -> bool:
-        low = s.lower()
-        if any(k in low for k in org_edu_blocklist):
-            return True
-        if any(k in low for k in org_company_blocklist):
-            return True
-        if re.search(r"\b(19|20)\d{2}\b", low):
-            return True
-        if "@" in low or "http" in low:
-            return True
-        # Too many digits likely not a skill
-        digits = sum(ch.isdigit() for ch in low)
-        if digits / max(1, len(low)) > 0.3:
-            return True
-        return False
-
-    # Prefer original casing from section items when available
-    result = []
-    for s in all_norm:
-        if s in section_skills_map:
-            val = re.sub(r"\s+", " ", section_skills_map[s]).strip(" .")
-            if not looks_like_org_or_edu(val):
-                result.append(val)
-        else:
-            if not looks_like_org_or_edu(s):
-                result.append(s)
-    # Deduplicate while preserving order
-    seen = set()
-    unique = []
-    for it in result:
-        key = it.lower()
-        if key not in seen:
-            seen.add(key)
-            unique.append(it)
-
-    # Final cleanup: remove noise, expand acronyms, allow only known short skills
-    noise_terms = {
-        "tstracking", "tracking id", "tracking", "na", "n/a"
-    }
-    alias_map = {
-        "ar": "Augmented Reality",
-        "vr": "Virtual Reality",
-        "ai": "Artificial Intelligence",
-        "ml": "Machine Learning",
-        "nlp": "Natural Language Processing",
-        "ux": "User Experience",
-        "ui": "User Interface",
-        "sem": "Search Engine Marketing",
-        "seo": "Search Engine Optimization",
-        "ips": "Intrusion Prevention System",
-        "ids": "Intrusion Detection System",
-    }
-    allowed_short = {
-        "ai", "ml", "dl", "nlp", "cv", "ux", "ui", "qa", "db", "ar", "vr", "sem", "seo", "ips", "ids"
-    }
-    cleaned = []
-    seen2 = set()
-    for item in unique:
-        base = item.strip()
-        low = base.lower()
-        if low in noise_terms:
-            continue
-        # Drop very short tokens unless in allowlist
-        if len(low) <= 2 and low not in allowed_short:
-            continue
-        if 2 < len(low) <= 3 and low not in allowed_short and not low.isupper():
-            # three-letter lowercase randoms are likely noise unless allowed
-            continue
-        # Expand known acronyms to canonical names
-        if low in alias_map:
-            base = alias_map[low]
-        # Normalize inner spaces
-        base = re.sub(r"\s+", " ", base).strip()
-        key2 = base.lower()
-        if key2 not in seen2:
-            seen2.add(key2)
-            cleaned.append(base)
-
-    return cleaned if cleaned else ["Not found"]
-
-# --- Enhanced Certifications Extraction ---
-def extract_certifications_enhanced(text):
-    """Enhanced certifications extraction"""
-    # Known certification providers and keywords
-    cert_providers = [
-        "coursera", "udemy", "edx", "udacity", "aws", "amazon", "google", "microsoft", "ibm",
-        "oracle", "linkedin learning", "skillshare", "pluralsight", "datacamp",
-        "deeplearning.ai", "fast.ai", "kaggle", "hackerrank", "leetcode"
-    ]
-    
-    # Certification keywords and patterns
-    cert_keywords = [
-        "certified", "certification", "certificate", "accredited", "professional",
-        "specialist", "expert", "master", "foundation", "associate"
-    ]
-    patterns = [
-        r"\baws certified [a-zA-Z ][a-zA-Z \-+:/()0-9]+",
-        r"\bgoogle (?:cloud )?professional [a-zA-Z \-+:/()0-9]+",
-        r"\b(?:microsoft|azure) certified [a-zA-Z \-+:/()0-9]+",
-        r"\bcertificate in [a-zA-Z \-+:/()0-9]+",
-        r"\bcertification in [a-zA-Z \-+:/()0-9]+"
-    ]
-
-    found = set()
-    # Common cert acronyms and codes
-    cert_acronyms = [
-        "pmp", "cissp", "ceh", "ccna", "csm", "psm", "pspo", "itil", "ocp", "oca",
-        "security+", "network+", "a+", "aws saa", "aws sap", "gcp pca", "az-900", "dp-100",
-        "pl-300", "sc-200", "ai-102", "ms-900"
-    ]
-    code_pattern = re.compile(r"\b[A-Z]{2,}-\d{2,3}\b")
-
-    # 1) Section-aware parsing
-    lower = text.lower()
-    # Parse multiple certification-like sections
-    header_multi = re.compile(r"(?im)^(certificates?|certifications?|licenses?(?:\s*&\s*certifications?)?|licenses|courses|training|professional development|credentials|badges|awards\s*&\s*certifications?)\b[:\-]?(.*)$")
-    for header in header_multi.finditer(text):
-        start = header.end()
-        nxt = re.search(r"(?im)^(experience|work|employment|projects|education|skills?|summary|objective|contact|achievements?)\b", text[start:])
-        end = start + nxt.start() if nxt else len(text)
-        block = text[start:end]
-        if header.group(2):
-            block = header.group(2) + "\n" + block
-        # Split by lines, bullets, commas, semicolons, pipes (avoid splitting on hyphens/dashes to keep titles intact)
-        items = re.split(r"[\n\r,;\u2022\u2023\u25E6\u2043\|/•·∙‣◦▪]+", block)
-        for item in items:
-            clean = item.strip()
-            low = clean.lower()
-            if len(clean) < 3:
-                continue
-            # Within certification-like sections, accept reasonable certificate/course lines
-            if any(ex in low for ex in ["university", "college", "school", "degree"]):
-                continue
-            # Keep if clear signals present
-            titlecase_words = sum(1 for w in re.findall(r"\b[A-Za-z][a-z]+\b", clean) if w[:1].isupper())
-            signals = (
-                any(p in low for p in cert_providers) or
-                any(k in low for k in cert_keywords) or
-                any(a in low for a in cert_acronyms) or
-                code_pattern.search(clean) or
-                any(w in low for w in ["course", "training", "badge", "credential", "nanodegree", "bootcamp", "license", "academy", "forage"])
-            )
-            if signals or titlecase_words >= 2:
-                # Collapse duplicated consecutive words inside item
-                cleaned_item = re.sub(r"\b(\w+)(?:\s+\1)+\b", r"\1", clean, flags=re.IGNORECASE)
-                found.add(cleaned_item)
-
-    # 2) Line-by-line heuristics across entire document
-    for raw in text.split("\n"):
-        line = raw.strip()
-        low = line.lower()
-        if any(provider in low for provider in cert_providers) and len(line) > 3:
-            found.add(line)
-        elif (any(keyword in low for keyword in cert_keywords) or any(a in low for a in cert_acronyms) or code_pattern.search(line)) and len(line) > 3 and not any(ex in low for ex in ["university", "college", "school", "degree"]):
-            found.add(line)
-        else:
-            for pat in patterns:
-                m = re.search(pat, low)
-                if m:
-                    found.add(line)
-                    break
-
-    normalized = {re.sub(r"\s+", " ", c).strip(" .") for c in found}
-    return list(normalized) if normalized else ["Not found"]
-
-# --- Enhanced Projects Extraction ---
-def extract_projects(text):
-    """Extract project titles/lines from resume text (section-aware with fallbacks)."""
-    projects = []
-
-    def title_from_line(line: str) -> str:
-        s = line.strip().strip("-–—|:;•·")
-        # Take portion before comma if it looks like tags list
-        if "," in s and len(s.split(",")[0].split()) <= 6:
-            s = s.split(",")[0].strip()
-        # Prefer text before separators
-        for sep in [" - ", " – ", " — ", ":", " | ", " |", "| "]:
-            if sep in s:
-                left = s.split(sep)[0].strip()
-                if len(left) >= 3:
-                    s = left
-                    break
-        # Remove trailing parenthetical details
-        s = re.sub(r"\s*\([^)]*\)$", "", s).strip()
-        # If long sentence, try to capture leading Title Case chunk
-        m = re.match(r"^([A-Z][A-Za-z0-9]+(?:[\s\-][A-Z][A-Za-z0-9]+){0,6})\b", s)
-        if m and len(m.group(1)) >= 3:
-            return m.group(1)
-        # Otherwise limit to first 6 words
-        return " ".join(s.split()[:6]).strip()
-
-    def is_valid_title(title: str) -> bool:
-        low = title.lower().strip()
-        if len(low) < 3:
-            return False
-        stop_exact = {
-            "technologies", "internships", "internship", "currently", "experience", "responsibilities",
-            "built", "created", "developed"
-        }
-        if low in stop_exact:
-            return False
-        stop_sub = [" internship", "internship ", " responsibilities", " duties"]
-        if any(ss in low for ss in stop_sub):
-            return False
-        # Allow CamelCase single tokens like ScholarHunt
-        if " " not in title and re.search(r"[A-Z][a-z]+[A-Z][a-z]+", title):
-            return True
-        # Prefer 2-6 words for multi-word titles
-        wc = len(title.split())
-        if 2 <= wc <= 6:
-            return True
-        return False
-    # 1) Section-aware: Projects/Personal Projects/Academic Projects
-    try:
-        header_multi = re.compile(r"(?im)^(projects?|personal projects?|academic projects?)\b[:\-]?(.*)$")
-        for header in header_multi.finditer(text):
-            start = header.end()
-            nxt = re.search(r"(?im)^(experience|work|employment|education|skills?|certifications?|licenses|summary|objective|contact|achievements?)\b", text[start:])
-            end = start + (nxt.start() if nxt else 0) if nxt else len(text)
-            block = text[start:end]
-            # If inline items on header line
-            if header.group(2):
-                block = header.group(2) + "\n" + block
-            # Split primarily by newlines and bullets (avoid splitting on hyphens to keep names intact)
-            items = re.split(r"[\n\r\u2022\u2023\u25E6\u2043•·∙‣◦▪]+", block)
-            for raw in items:
-                line = raw.strip().strip("-–—|:;")
-                if len(line) < 5:
-                    continue
-                # Typical noise filters
-                low = line.lower()
-                if any(h in low for h in ["experience", "education", "skills", "certification", "contact"]):
-                    continue
-                t = title_from_line(line)
-                if is_valid_title(t):
-                    projects.append(t)
-    except Exception:
-        pass
-
-    # 2) Fallback: scan for lines containing project-like cues
-    if not projects:
-        cues = ["project:", "capstone", "built", "developed", "implemented", "designed", "engineered"]
-        lines = text.splitlines()
-        for i, ln in enumerate(lines):
-            low = ln.strip().lower()
-            if any(c in low for c in cues):
-                cleaned = ln.strip().strip("-–—|:;")
-                if len(cleaned) > 5:
-                    t = title_from_line(cleaned)
-                    if is_valid_title(t):
-                        projects.append(t)
-                # Grab immediate next bullet/line as context
-                if i + 1 < len(lines):
-                    nxt = lines[i+1].strip().strip("-–—|:;")
-                    if len(nxt) > 5:
-                        t2 = title_from_line(nxt)
-                        if is_valid_title(t2):
-                            projects.append(t2)
-
-    # Normalize and deduplicate
-    normalized = []
-    seen = set()
-    for p in projects:
-        clean = re.sub(r"\s+", " ", p).strip(" .")
-        if len(clean) > 4:
-            k = clean.lower()
-            if k not in seen:
-                seen.add(k)
-                normalized.append(clean)
-    return normalized if normalized else ["Not found"]
-
-# --- Enhanced Info Extraction Function ---
-def extract_info(text):
-    """Enhanced information extraction with all improvements"""
-    # Extract personal info
-    personal_info = extract_personal_info(text)
-    
-    # Extract education
-    education = extract_education_info(text)
-    
-    # Extract skills
-    skills = extract_skills_enhanced(text)
-    
-    # Extract certifications
-    certifications = extract_certifications_enhanced(text)
-    
-    # Extract projects
-    projects = extract_projects(text)
-    
-    return {
-        "name": personal_info["name"],
-        "email": personal_info["email"],
-        "phone": personal_info["phone"],
-        "education": education,
-        "skills": skills,
-        "certifications": certifications,
-        "projects": projects,
-        "linkedin": personal_info["linkedin"],
-        "github": personal_info["github"],
-        "portfolio": personal_info["portfolio"]
-    }
+# Shared spaCy pipeline: loaded once per server process, not once per rerun
+get_nlp()
 
 # --- Multi-Resume Comparison Functions ---
+@timed("render.comparison_table")
 def create_comparison_table(resume_data):
     """Create a comparison table for multiple resumes"""
     st.markdown("### 📊 Resume Comparison Table")
@@ -1378,6 +360,7 @@ def create_skill_comparison(resume_data):
                 st.markdown(f"**{resume_name}:** *{', '.join(important_missing)}*")
 
 
+@timed("render.summary_analysis")
 def create_summary_analysis(resume_data):
     """Create summary analysis of resume strengths"""
     st.markdown("### 📈 Summary Analysis")
@@ -1466,32 +449,6 @@ def create_summary_analysis(resume_data):
             else:
                 st.markdown("• Resume is already well-optimized!")
 
-# --- Resume Format Validation ---
-def validate_resume_format(text):
-    """Validate resume format and warn about potential issues"""
-    warnings = []
-    
-    # Check for very short content (might be scanned)
-    if len(text.strip()) < 500:
-        warnings.append("⚠ Very short content detected. This might be a scanned PDF or image-based resume.")
-    
-    # Check for weird symbols (OCR artifacts)
-    weird_symbols = re.findall(r'[^\w\s\.\,\-\+\@\#\$\%\(\)\[\]\{\}\:\;\?\!]', text)
-    if len(weird_symbols) > len(text) * 0.1:  # More than 10% weird symbols
-        warnings.append("⚠ Many unusual symbols detected. This might be a scanned PDF with poor OCR.")
-    
-    # Check for multi-column indicators
-    multi_column_indicators = ["|", "  ", "\t\t"]
-    if any(indicator in text for indicator in multi_column_indicators):
-        warnings.append("⚠ Multi-column layout detected. Consider using a single-column format for better ATS compatibility.")
-    
-    # Check for image-heavy indicators (very few words)
-    words = text.split()
-    if len(words) < 100:
-        warnings.append("⚠ Very few words detected. This might be an image-heavy resume.")
-    
-    return warnings
-
 # --- Pre-upload Guidelines ---
 PRE_UPLOAD_GUIDELINES = """
 📋 *Before Uploading Your Resume:*
@@ -1523,770 +480,14 @@ PRE_UPLOAD_GUIDELINES = """
 • Proofread for spelling and grammar errors
 """
 
-# --- Project Suggestions by Field ---
-PROJECT_IDEAS = {
-    "Data Science": [
-        "Movie Recommendation System (ML)",
-        "E-commerce Sales Dashboard (Tableau/Excel)",
-        "Customer Churn Prediction",
-        "Stock Price Predictor"
-    ],
-    "Web Development": [
-        "Portfolio Website (HTML/CSS/JS)",
-        "Blog Platform (Django/Flask)",
-        "E-commerce Store (React/Node)"
-    ],
-    "Android Development": [
-        "Expense Tracker App (Kotlin)",
-        "Weather App (Java)",
-        "Chat App (Firebase)"
-    ],
-    "UI/UX": [
-        "Mobile App Redesign (Figma)",
-        "Landing Page UI (Adobe XD)",
-        "User Flow Mapping"
-    ],
-    "Artificial Intelligence": ["Fake News Detection using BERT", "Image Captioning with CNN+RNN", "Speech Recognition System (Deep Learning)", "Chatbot with Transformers"],
-    "Cybersecurity": ["Network Vulnerability Scanner", "Phishing Detection System", "Firewall Rule Automation", "SIEM Log Analyzer"],
-    "Cloud Computing": ["Deploy a CI/CD pipeline with GitHub Actions and AWS", "Serverless Web App (AWS Lambda)", "Multi-cloud Monitoring Dashboard"],
-    "Software Development": ["Library Management System (Java)", "Task Manager App (Python)", "REST API with Flask/Django"],
-    "Business Analyst": ["Sales Data Dashboard (PowerBI)", "Process Optimization Case Study", "Customer Segmentation Analysis"],
-    "Product Management": ["Go-to-Market Strategy Plan", "User Feedback Analysis Tool", "Product Roadmap Dashboard"],
-    "Mobile App Development": ["Fitness Tracker App (Flutter)", "Recipe App (iOS/Swift)", "Event Planner App (React Native)"],
-    "Game Development": ["2D Platformer Game (Unity)", "Multiplayer Card Game (Unreal)", "VR Puzzle Game"],
-    "Finance": ["Stock Portfolio Tracker (Excel/Python)", "Loan Default Prediction (ML)", "Financial Statement Analyzer"],
-    "HR": ["Employee Onboarding Portal", "HR Analytics Dashboard", "Leave Management System"],
-    "Digital Marketing": ["SEO Audit & Digital Campaign (Google Analytics)", "Social Media Sentiment Analysis", "Email Campaign Automation"]
-}
-
-CERTIFICATIONS = {
-    "Data Science": ["Google Data Analytics", "IBM Data Science", "Microsoft Data Analyst Associate","CISCO","EDUSKILLS"],
-    "Web Development": ["Meta Front-End Certificate", "FreeCodeCamp Responsive Web Design"],
-    "Artificial Intelligence": ["DeepLearning.AI Specialization", "Google AI Professional Certificate"],
-    "Cybersecurity": ["CompTIA Security+", "Certified Ethical Hacker (CEH)", "Cisco CCNA Security"],
-    "Cloud Computing": ["AWS Cloud Practitioner", "Azure Fundamentals", "Google Associate Cloud Engineer"],
-    "Software Development": ["Oracle Certified Java Programmer", "Microsoft Certified: Azure Developer Associate"],
-    "Business Analyst": ["IIBA ECBA", "CBAP Certification"],
-    "Product Management": ["Pragmatic Institute Product Management", "Certified Scrum Product Owner (CSPO)"],
-    "Mobile App Development": ["Google Associate Android Developer", "Apple Certified iOS Developer"],
-    "Game Development": ["Unity Certified Developer", "Unreal Engine Certification"],
-    "Finance": ["CFA Level 1", "CPA", "Financial Risk Manager (FRM)"],
-    "HR": ["SHRM-CP", "HRCI PHR"],
-    "Digital Marketing": ["Google Analytics Individual Qualification", "HubSpot Content Marketing"],
-    "UI/UX": ["NN/g UX Certification", "Adobe Certified Expert"]
-}
-
-TOOLS_LIST = ["VS Code", "Jupyter", "GitHub", "Excel", "Tableau"]
-
-# Expanded known skills and certifications
-KNOWN_SKILLS = set([
-    "python", "machine learning", "pandas", "numpy", "tensorflow", "data analysis", "html", "css", "javascript", "react", "node", "flask", "django",
-    "android", "kotlin", "java", "xml", "figma", "adobe xd", "photoshop", "sketch", "sql", "powerbi", "tableau", "c++", "c#", "aws", "azure", "gcp", "docker", "kubernetes"
-])
-CERT_PROVIDERS = ["coursera", "udemy", "aws", "google", "microsoft", "edx", "udacity", "ibm", "oracle", "linkedin learning"]
-
-
-# --- Detect Field ---
-def detect_field(text_or_skills):
-    # Build a searchable lowercase corpus from either raw text or extracted skills
-    if isinstance(text_or_skills, str):
-        corpus = text_or_skills.lower()
-    else:
-        corpus = " ".join([s for s in text_or_skills if isinstance(s, str)]).lower()
-    max_matches = 0
-    best_field = "General"
-    for field, keywords in SKILL_KEYWORDS.items():
-        match_count = sum(1 for kw in keywords if kw.lower() in corpus)
-        if match_count > max_matches:
-            max_matches = match_count
-            best_field = field
-    return best_field
-
-
-# --- Ideal Resume Template ---
-IDEAL_SECTIONS = ["objective", "projects", "skills", "education", "experience", "certifications", "contact", "declaration"]
-IDEAL_SKILLS = set([kw for kws in SKILL_KEYWORDS.values() for kw in kws])
-IDEAL_CERTS = set([prov.title() for prov in CERT_PROVIDERS])
-
-# --- Scoring without Job Description ---
-def template_score(text, info):
-    # Section completeness
-    section_score = int(40 * sum(1 for s in IDEAL_SECTIONS if s in text.lower()) / len(IDEAL_SECTIONS))
-    # Skill diversity
-    skill_score = int(30 * len([s for s in info['skills'] if s in IDEAL_SKILLS]) / len(IDEAL_SKILLS))
-    # Certification diversity
-    cert_score = int(15 * len([c for c in info['certifications'] if any(p.lower() in c.lower() for p in CERT_PROVIDERS)]) / len(CERT_PROVIDERS))
-    # Education presence
-    edu_score = 15 if info['education'] and info['education'][0] != 'Not found' else 0
-    return section_score + skill_score + cert_score + edu_score
-
-# --- Resume Clarity Helper ---
-def clarity_score(text):
-    # Metrics: presence of numbers/percentages, bullet points, concise sentences
-    metrics = 0
-    if any(x in text for x in ["%", "percent", "improved", "reduced", "increased", "decreased"]):
-        metrics += 1
-    if "•" in text or "- " in text:
-        metrics += 1
-    if len([s for s in text.split(". ") if len(s) < 120]) > 3:
-        metrics += 1
-    return int((metrics / 3) * 15)  # up to 15 points for clarity
-
-# --- Professional Resume Scoring System (Enhancv-inspired) ---
-def dynamic_resume_score(text, info, field="General"):
-    """
-    Comprehensive resume scoring based on industry standards and ATS optimization.
-    Scoring criteria inspired by professional resume analyzers like Enhancv.
-    """
-    score = 0
-    breakdown = {}
-    
-    # === 1. CONTENT COMPLETENESS (20 points) ===
-    content_score = 0
-    
-    # Essential sections (12 points)
-    essential_sections = ["experience", "education", "skills"]
-    present_essential = sum(1 for section in essential_sections if section in text.lower())
-    content_score += (present_essential / len(essential_sections)) * 12
-    
-    # Optional sections (8 points)
-    optional_sections = ["objective", "summary", "projects", "certifications", "achievements", "volunteer"]
-    present_optional = sum(1 for section in optional_sections if section in text.lower())
-    content_score += min((present_optional / len(optional_sections)) * 8, 8)
-    
-    score += content_score
-    breakdown["Content Completeness"] = round(content_score, 1)
-    
-    # === 2. SKILLS ASSESSMENT (25 points) ===
-    skills_score = 0
-    
-    # Skills quantity and relevance (15 points)
-    valid_skills = [s for s in info['skills'] if s != 'Not found' and len(s.strip()) > 0]
-    skills_count = len(valid_skills)
-    
-    if skills_count >= 8:
-        skills_score += 10
-    elif skills_count >= 5:
-        skills_score += 7
-    elif skills_count >= 3:
-        skills_score += 5
-    elif skills_count >= 1:
-        skills_score += 3
-    
-    # Field-specific skills (10 points)
-    field_skills = SKILL_KEYWORDS.get(field, [])
-    if field_skills:
-        relevant_skills = [s for s in valid_skills if s.lower() in [sk.lower() for sk in field_skills]]
-        relevance_ratio = len(relevant_skills) / max(1, len(valid_skills))
-        skills_score += relevance_ratio * 10
-    
-    score += skills_score
-    breakdown["Skills Assessment"] = round(skills_score, 1)
-    
-    # === 3. EXPERIENCE & IMPACT (20 points) ===
-    experience_score = 0
-    
-    # Action verbs and metrics (15 points)
-    action_verbs = ["achieved", "developed", "implemented", "managed", "led", "created", "designed", 
-                   "improved", "increased", "reduced", "optimized", "launched", "coordinated", "analyzed"]
-    metrics_indicators = ["%", "percent", "improved", "reduced", "increased", "decreased", "by", "from", "to"]
-    
-    action_verb_count = sum(1 for verb in action_verbs if verb in text.lower())
-    metrics_count = sum(1 for metric in metrics_indicators if metric in text.lower())
-    
-    if action_verb_count >= 5 and metrics_count >= 3:
-        experience_score += 15
-    elif action_verb_count >= 3 and metrics_count >= 1:
-        experience_score += 10
-    elif action_verb_count >= 2:
-        experience_score += 7
-    elif action_verb_count >= 1:
-        experience_score += 3
-    
-    # Experience length and depth (5 points)
-    if len(text) > 2000:  # Substantial content
-        experience_score += 5
-    elif len(text) > 1000:
-        experience_score += 3
-    elif len(text) > 500:
-        experience_score += 1
-    
-    score += experience_score
-    breakdown["Experience & Impact"] = round(experience_score, 1)
-    
-    # === 4. PROFESSIONAL PRESENTATION (15 points) ===
-    presentation_score = 0
-    
-    # Contact information (5 points)
-    contact_info = 0
-    if info['email'] != 'Not found':
-        contact_info += 2
-    if info['phone'] != 'Not found':
-        contact_info += 2
-    if info['linkedin'] != 'Not found':
-        contact_info += 1
-    presentation_score += min(contact_info, 5)
-    
-    # Professional formatting (5 points)
-    formatting_indicators = 0
-    if "•" in text or "- " in text:  # Bullet points
-        formatting_indicators += 2
-    if any(char in text for char in ["|", "•", "-"]):  # Consistent formatting
-        formatting_indicators += 2
-    if len([s for s in text.split(". ") if len(s) < 150]) > 5:  # Concise sentences
-        formatting_indicators += 1
-    presentation_score += min(formatting_indicators, 5)
-    
-    # Certifications and credentials (5 points)
-    valid_certs = [c for c in info['certifications'] if c != 'Not found' and len(c.strip()) > 0]
-    if len(valid_certs) >= 3:
-        presentation_score += 5
-    elif len(valid_certs) >= 1:
-        presentation_score += 3
-    
-    score += presentation_score
-    breakdown["Professional Presentation"] = round(presentation_score, 1)
-    
-    # === 5. ATS OPTIMIZATION (20 points) ===
-    ats_score = 0
-    ats_breakdown = {}
-    
-    # === ATS Keyword Optimization (8 points) ===
-    field_keywords = SKILL_KEYWORDS.get(field, [])
-    if field_keywords:
-        keyword_matches = sum(1 for keyword in field_keywords if keyword.lower() in text.lower())
-        keyword_ratio = keyword_matches / max(1, len(field_keywords))
-        keyword_score = keyword_ratio * 8
-        ats_score += keyword_score
-        ats_breakdown["Keyword Match"] = round(keyword_score, 1)
-    else:
-        ats_breakdown["Keyword Match"] = 0
-    
-    # === ATS Section Headers (4 points) ===
-    standard_headers = ["experience", "education", "skills", "certifications", "projects", "summary", "objective"]
-    header_matches = sum(1 for header in standard_headers if header in text.lower())
-    header_score = (header_matches / len(standard_headers)) * 4
-    ats_score += header_score
-    ats_breakdown["Section Headers"] = round(header_score, 1)
-    
-    # === ATS Format Compatibility (3 points) ===
-    format_score = 0
-    # Check for common ATS-friendly formatting
-    if "•" in text or "- " in text:  # Bullet points
-        format_score += 1
-    if not any(char in text for char in ["[", "]", "{", "}", "|", "~", "^"]):  # No special characters
-        format_score += 1
-    if len(text) > 500 and len(text) < 3000:  # Optimal length
-        format_score += 1
-    ats_score += format_score
-    ats_breakdown["Format Compatibility"] = format_score
-    
-    # === ATS Contact Information (2 points) ===
-    contact_score = 0
-    if info['email'] != 'Not found':
-        contact_score += 1
-    if info['phone'] != 'Not found':
-        contact_score += 1
-    ats_score += contact_score
-    ats_breakdown["Contact Info"] = contact_score
-    
-    # === ATS Experience Details (3 points) ===
-    experience_score = 0
-    # Check for job titles, company names, dates
-    if any(word in text.lower() for word in ["experience", "work", "employment", "job"]):
-        experience_score += 1
-    if any(word in text.lower() for word in ["2024", "2023", "2022", "2021", "2020"]):
-        experience_score += 1
-    if any(word in text.lower() for word in ["company", "corporation", "inc", "ltd", "llc"]):
-        experience_score += 1
-    ats_score += experience_score
-    ats_breakdown["Experience Details"] = experience_score
-    
-    score += ats_score
-    breakdown["ATS Optimization"] = round(ats_score, 1)
-    breakdown["ATS Details"] = ats_breakdown
-    
-    # === BONUS POINTS (up to 10 points) ===
-    bonus_points = 0
-    
-    # Projects section
-    if 'projects' in text.lower():
-        bonus_points += 3
-    
-    # GitHub/Portfolio links
-    if any(url in text.lower() for url in ['github.com', 'portfolio', 'behance.net']):
-        bonus_points += 2
-    
-    # Education details
-    if info['education'] and info['education'][0] != 'Not found':
-        bonus_points += 2
-    
-    # Professional summary/objective
-    if any(section in text.lower() for section in ['summary', 'objective', 'profile']):
-        bonus_points += 2
-    
-    # Recent experience (if mentioned)
-    if any(year in text for year in ['2024', '2023', '2022']):
-        bonus_points += 1
-    
-    score += bonus_points
-    breakdown["Bonus Points"] = round(bonus_points, 1)
-    
-    # === FINAL SCORE CALCULATION ===
-    final_score = min(100, round(score))
-    
-    # Adjust score based on field-specific requirements
-    if field in ["Cybersecurity", "Cloud Computing"] and len(valid_certs) < 1:
-        final_score = max(0, final_score - 10)  # Certifications are crucial for these fields
-    
-    if field in ["Data Science", "Artificial Intelligence"] and skills_count < 5:
-        final_score = max(0, final_score - 8)  # Technical skills are essential
-    
-    if field in ["Product Management", "Business Analyst"] and action_verb_count < 3:
-        final_score = max(0, final_score - 5)  # Leadership/management skills important
-    
-    breakdown["Total Score"] = final_score
-    
-    return final_score, breakdown
-
-# --- Enhanced Dynamic Strengths/Weaknesses Analysis ---
-def get_strengths_weaknesses(text, info):
-    """
-    Comprehensive analysis of resume strengths and weaknesses based on industry standards.
-    """
-    strengths = []
-    weaknesses = []
-    
-    # === STRENGTHS ANALYSIS ===
-    
-    # Contact Information
-    if info['email'] != 'Not found' and info['phone'] != 'Not found':
-        strengths.append("Complete contact information provided")
-    elif info['email'] != 'Not found':
-        strengths.append("Email address included")
-    
-    # Professional Presence
-    if info['linkedin'] != 'Not found':
-        strengths.append("LinkedIn profile linked for professional networking")
-    
-    # Content Structure
-    if 'projects' in text.lower():
-        strengths.append("Projects section demonstrates practical experience")
-    if 'summary' in text.lower() or 'objective' in text.lower():
-        strengths.append("Professional summary/objective provides clear direction")
-    if 'certifications' in text.lower():
-        strengths.append("Certifications section shows continuous learning")
-    
-    # Skills Assessment
-    valid_skills = [s for s in info['skills'] if s != 'Not found' and len(s.strip()) > 0]
-    if len(valid_skills) >= 8:
-        strengths.append("Comprehensive skill set with 8+ technical skills")
-    elif len(valid_skills) >= 5:
-        strengths.append("Good range of technical skills (5+ skills listed)")
-    
-    # Impact and Metrics
-    action_verbs = ["achieved", "developed", "implemented", "managed", "led", "created", "designed", 
-                   "improved", "increased", "reduced", "optimized", "launched", "coordinated", "analyzed"]
-    action_verb_count = sum(1 for verb in action_verbs if verb in text.lower())
-    if action_verb_count >= 5:
-        strengths.append("Strong use of action verbs demonstrates leadership")
-    elif action_verb_count >= 3:
-        strengths.append("Good use of action verbs shows initiative")
-    
-    # Quantifiable Results
-    metrics_indicators = ["%", "percent", "improved", "reduced", "increased", "decreased", "by", "from", "to"]
-    metrics_count = sum(1 for metric in metrics_indicators if metric in text.lower())
-    if metrics_count >= 3:
-        strengths.append("Quantifiable achievements with measurable impact")
-    elif metrics_count >= 1:
-        strengths.append("Some quantifiable results included")
-    
-    # Formatting and Presentation
-    if "•" in text or "- " in text:
-        strengths.append("Professional bullet-point formatting")
-    if len([s for s in text.split(". ") if len(s) < 150]) > 5:
-        strengths.append("Concise, readable writing style")
-    
-    # === WEAKNESSES ANALYSIS ===
-    
-    # Contact Information Issues
-    if info['email'] == 'Not found':
-        weaknesses.append("Missing email address - essential for contact")
-    if info['phone'] == 'Not found':
-        weaknesses.append("Missing phone number - limits communication options")
-    if info['linkedin'] == 'Not found':
-        weaknesses.append("No LinkedIn profile - missing professional networking opportunity")
-    
-    # Content Gaps
-    if 'projects' not in text.lower():
-        weaknesses.append("No projects section - missing practical experience demonstration")
-    if 'summary' not in text.lower() and 'objective' not in text.lower():
-        weaknesses.append("No professional summary/objective - unclear career direction")
-    if 'certifications' not in text.lower():
-        weaknesses.append("No certifications section - missing credential validation")
-    
-    # Skills Issues
-    if len(valid_skills) < 3:
-        weaknesses.append("Limited technical skills (less than 3 skills listed)")
-    elif len(valid_skills) < 5:
-        weaknesses.append("Moderate skill set - consider adding more relevant skills")
-    
-    # Impact and Results Issues
-    if action_verb_count < 2:
-        weaknesses.append("Limited use of action verbs - weakens impact statements")
-    if metrics_count == 0:
-        weaknesses.append("No quantifiable results - missing measurable achievements")
-    
-    # Formatting Issues
-    if "•" not in text and "- " not in text:
-        weaknesses.append("No bullet points - reduces readability and scannability")
-    if len([s for s in text.split(". ") if len(s) > 200]) > 3:
-        weaknesses.append("Some sentences too long - affects readability")
-    
-    # Content Quality
-    if len(text) < 500:
-        weaknesses.append("Resume too brief - may lack sufficient detail")
-    elif len(text) > 3000:
-        weaknesses.append("Resume too lengthy - may lose reader attention")
-    
-    # Professional Development
-    if not info['certifications'] or info['certifications'][0] == 'Not found':
-        weaknesses.append("No certifications - missing professional development evidence")
-    
-    # Recent Experience
-    if not any(year in text for year in ['2024', '2023', '2022']):
-        weaknesses.append("No recent experience mentioned - may appear outdated")
-    
-    # Remove duplicates and ensure quality
-    strengths = list(set([s for s in strengths if s and len(s.strip()) > 0]))
-    weaknesses = list(set([w for w in weaknesses if w and len(w.strip()) > 0]))
-    
-    # Limit to top 5 most important items
-    return strengths[:5], weaknesses[:5]
-
-# --- ATS Feature Extraction and Analysis ---
-def extract_ats_features(text, info, field):
-    """
-    Comprehensive ATS feature extraction and analysis.
-    Returns detailed breakdown of ATS compatibility factors.
-    """
-    features = {}
-    
-    # === KEYWORD ANALYSIS ===
-    field_keywords = SKILL_KEYWORDS.get(field, [])
-    if field_keywords:
-        keyword_matches = [kw for kw in field_keywords if kw.lower() in text.lower()]
-        features["Keywords Found"] = keyword_matches[:10]  # Top 10 matches
-        features["Keyword Match Rate"] = f"{len(keyword_matches)}/{len(field_keywords)} ({len(keyword_matches)/len(field_keywords)*100:.1f}%)"
-    else:
-        features["Keywords Found"] = []
-        features["Keyword Match Rate"] = "N/A"
-    
-    # === SECTION HEADERS ===
-    standard_headers = ["experience", "education", "skills", "certifications", "projects", "summary", "objective", "work history", "employment"]
-    found_headers = [h for h in standard_headers if h in text.lower()]
-    features["Standard Headers Found"] = found_headers
-    features["Header Compliance"] = f"{len(found_headers)}/{len(standard_headers)} ({len(found_headers)/len(standard_headers)*100:.1f}%)"
-    
-    # === CONTACT INFORMATION ===
-    contact_info = {}
-    contact_info["Email"] = "Present" if info['email'] != 'Not found' else "Missing"
-    contact_info["Phone"] = "Present" if info['phone'] != 'Not found' else "Missing"
-    contact_info["LinkedIn"] = "Present" if info['linkedin'] != 'Not found' else "Missing"
-    features["Contact Information"] = contact_info
-    
-    # === FORMATTING ANALYSIS ===
-    formatting = {}
-    formatting["Bullet Points"] = "Present" if "•" in text or "- " in text else "Missing"
-    formatting["Special Characters"] = "Clean" if not any(char in text for char in ["[", "]", "{", "}", "|", "~", "^"]) else "Contains Special Chars"
-    formatting["Content Length"] = f"{len(text)} characters ({'Optimal' if 500 <= len(text) <= 3000 else 'Too Short' if len(text) < 500 else 'Too Long'})"
-    features["Formatting"] = formatting
-    
-    # === EXPERIENCE DETAILS ===
-    experience = {}
-    experience["Experience Section"] = "Present" if any(word in text.lower() for word in ["experience", "work", "employment"]) else "Missing"
-    experience["Recent Dates"] = "Present" if any(year in text for year in ["2024", "2023", "2022"]) else "Missing"
-    experience["Company Names"] = "Present" if any(word in text.lower() for word in ["company", "corporation", "inc", "ltd", "llc"]) else "Missing"
-    features["Experience Details"] = experience
-    
-    # === SKILLS ANALYSIS ===
-    skills = {}
-    valid_skills = [s for s in info['skills'] if s != 'Not found' and len(s.strip()) > 0]
-    skills["Skills Count"] = len(valid_skills)
-    skills["Skills Quality"] = "Strong" if len(valid_skills) >= 5 else "Moderate" if len(valid_skills) >= 3 else "Weak"
-    features["Skills Analysis"] = skills
-    
-    # === ATS COMPATIBILITY SCORE ===
-    compatibility_score = 0
-    max_score = 20
-    
-    # Keywords (8 points)
-    if field_keywords:
-        keyword_ratio = len([kw for kw in field_keywords if kw.lower() in text.lower()]) / len(field_keywords)
-        compatibility_score += keyword_ratio * 8
-    
-    # Headers (4 points)
-    header_ratio = len(found_headers) / len(standard_headers)
-    compatibility_score += header_ratio * 4
-    
-    # Formatting (3 points)
-    if "•" in text or "- " in text:
-        compatibility_score += 1
-    if not any(char in text for char in ["[", "]", "{", "}", "|", "~", "^"]):
-        compatibility_score += 1
-    if 500 <= len(text) <= 3000:
-        compatibility_score += 1
-    
-    # Contact (2 points)
-    if info['email'] != 'Not found':
-        compatibility_score += 1
-    if info['phone'] != 'Not found':
-        compatibility_score += 1
-    
-    # Experience (3 points)
-    if any(word in text.lower() for word in ["experience", "work", "employment"]):
-        compatibility_score += 1
-    if any(year in text for year in ["2024", "2023", "2022"]):
-        compatibility_score += 1
-    if any(word in text.lower() for word in ["company", "corporation", "inc", "ltd", "llc"]):
-        compatibility_score += 1
-    
-    features["ATS Compatibility Score"] = f"{compatibility_score:.1f}/{max_score} ({compatibility_score/max_score*100:.1f}%)"
-    
-    return features
-
-# --- Enhanced Personalized Tips ---
-def get_personalized_tips(text, info):
-    """
-    Generate personalized, actionable tips based on resume analysis.
-    """
-    tips = []
-    
-    # Contact Information Tips
-    if info['linkedin'] == 'Not found':
-        tips.append("🔗 *Add LinkedIn Profile*: Include your LinkedIn URL to enhance professional credibility and networking opportunities.")
-    
-    if info['email'] == 'Not found':
-        tips.append("📧 *Add Email Address*: Include a professional email address for direct communication.")
-    
-    if info['phone'] == 'Not found':
-        tips.append("📱 *Add Phone Number*: Include your phone number for immediate contact options.")
-    
-    # Content Structure Tips
-    if 'projects' not in text.lower():
-        tips.append("💼 *Add Projects Section*: Include 2-3 relevant projects with technologies used and outcomes achieved.")
-    
-    if 'summary' not in text.lower() and 'objective' not in text.lower():
-        tips.append("📝 *Add Professional Summary*: Include a 2-3 sentence summary highlighting your key strengths and career goals.")
-    
-    if 'certifications' not in text.lower():
-        tips.append("🏆 *Add Certifications*: Include relevant certifications to demonstrate continuous learning and expertise.")
-    
-    # Skills Enhancement Tips
-    valid_skills = [s for s in info['skills'] if s != 'Not found' and len(s.strip()) > 0]
-    if len(valid_skills) < 5:
-        tips.append("🛠 *Expand Skills Section*: List at least 5-8 relevant technical skills for your target role.")
-    
-    # Impact and Results Tips
-    action_verbs = ["achieved", "developed", "implemented", "managed", "led", "created", "designed", 
-                   "improved", "increased", "reduced", "optimized", "launched", "coordinated", "analyzed"]
-    action_verb_count = sum(1 for verb in action_verbs if verb in text.lower())
-    if action_verb_count < 3:
-        tips.append("🚀 *Use Action Verbs*: Start bullet points with strong action verbs like 'Developed', 'Implemented', 'Led'.")
-    
-    metrics_indicators = ["%", "percent", "improved", "reduced", "increased", "decreased", "by", "from", "to"]
-    metrics_count = sum(1 for metric in metrics_indicators if metric in text.lower())
-    if metrics_count < 2:
-        tips.append("📊 *Add Quantifiable Results*: Include specific metrics like 'Increased efficiency by 25%' or 'Reduced costs by $10K'.")
-    
-    # Formatting Tips
-    if "•" not in text and "- " not in text:
-        tips.append("📋 *Use Bullet Points*: Format experience and skills with bullet points for better readability.")
-    
-    # Content Quality Tips
-    if len(text) < 800:
-        tips.append("📄 *Expand Content*: Add more detail to experience descriptions and achievements.")
-    
-    if len(text) > 2500:
-        tips.append("✂ *Condense Content*: Keep resume concise and focused on most relevant information.")
-    
-    # Professional Development Tips
-    if not info['certifications'] or info['certifications'][0] == 'Not found':
-        tips.append("🎓 *Pursue Certifications*: Consider industry-relevant certifications to strengthen your profile.")
-    
-    # Recent Experience Tips
-    if not any(year in text for year in ['2024', '2023', '2022']):
-        tips.append("🕒 *Update Recent Experience*: Ensure your most recent work experience is prominently featured.")
-    
-    # ATS Optimization Tips
-    if not any(section in text.lower() for section in ['experience', 'education', 'skills']):
-        tips.append("🔍 *Use Standard Headers*: Include standard section headers like 'Experience', 'Education', 'Skills' for ATS compatibility.")
-    
-    # Limit to most important tips
-    return tips[:6]
-
 # --- PDF Resume Generator ---
 def generate_pdf_resume(name, email, phone, linkedin, summary, skills, experience, education, projects, certifications, field):
     """Generate a professional PDF resume with ATS-optimized formatting"""
-    # Lazy-import reportlab so the app can run even if reportlab is not installed
     try:
-        import importlib
-        _pagesizes = importlib.import_module("reportlab.lib.pagesizes")
-        letter, A4 = _pagesizes.letter, _pagesizes.A4
-        _platypus = importlib.import_module("reportlab.platypus")
-        SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle = (
-            _platypus.SimpleDocTemplate,
-            _platypus.Paragraph,
-            _platypus.Spacer,
-            _platypus.Table,
-            _platypus.TableStyle,
-        )
-        _styles = importlib.import_module("reportlab.lib.styles")
-        getSampleStyleSheet, ParagraphStyle = _styles.getSampleStyleSheet, _styles.ParagraphStyle
-        _units = importlib.import_module("reportlab.lib.units")
-        inch = _units.inch
-        colors = importlib.import_module("reportlab.lib.colors")
-        _enums = importlib.import_module("reportlab.lib.enums")
-        TA_CENTER, TA_LEFT, TA_JUSTIFY = _enums.TA_CENTER, _enums.TA_LEFT, _enums.TA_JUSTIFY
-    except Exception:
-        st.error("PDF generation requires the 'reportlab' package. Please install it: pip install reportlab")
+        return render_pdf_resume(name, email, phone, linkedin, summary, skills, experience, education, projects, certifications, field)
+    except RenderError as e:
+        st.error(str(e))
         return None
-    
-    # Create a buffer to store the PDF
-    buffer = BytesIO()
-    
-    # Create the PDF document
-    doc = SimpleDocTemplate(buffer, pagesize=letter, rightMargin=0.75*inch, leftMargin=0.75*inch, topMargin=0.75*inch, bottomMargin=0.75*inch)
-    
-    # Get styles
-    styles = getSampleStyleSheet()
-    
-    # Create custom styles
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=18,
-        spaceAfter=6,
-        alignment=TA_CENTER,
-        textColor=colors.darkblue,
-        fontName='Helvetica-Bold'
-    )
-    
-    heading_style = ParagraphStyle(
-        'CustomHeading',
-        parent=styles['Heading2'],
-        fontSize=14,
-        spaceAfter=6,
-        spaceBefore=12,
-        textColor=colors.darkblue,
-        fontName='Helvetica-Bold',
-        borderWidth=1,
-        borderColor=colors.darkblue,
-        borderPadding=3
-    )
-    
-    normal_style = ParagraphStyle(
-        'CustomNormal',
-        parent=styles['Normal'],
-        fontSize=10,
-        spaceAfter=6,
-        alignment=TA_JUSTIFY
-    )
-    
-    bullet_style = ParagraphStyle(
-        'CustomBullet',
-        parent=styles['Normal'],
-        fontSize=10,
-        spaceAfter=3,
-        leftIndent=20,
-        bulletIndent=10
-    )
-    
-    # Build the story (content)
-    story = []
-    
-    # Title
-    story.append(Paragraph(name.upper(), title_style))
-    story.append(Spacer(1, 6))
-    
-    # Contact Information
-    contact_info = f"{email} | {phone} | {linkedin}"
-    story.append(Paragraph(contact_info, normal_style))
-    story.append(Spacer(1, 12))
-    
-    # Professional Summary
-    story.append(Paragraph("PROFESSIONAL SUMMARY", heading_style))
-    story.append(Paragraph(summary, normal_style))
-    story.append(Spacer(1, 6))
-    
-    # Technical Skills
-    story.append(Paragraph("TECHNICAL SKILLS", heading_style))
-    story.append(Paragraph(skills, normal_style))
-    story.append(Spacer(1, 6))
-    
-    # Professional Experience
-    story.append(Paragraph("PROFESSIONAL EXPERIENCE", heading_style))
-    experience_lines = experience.split('\n')
-    for line in experience_lines:
-        if line.strip():
-            if line.strip().startswith('•'):
-                story.append(Paragraph(line.strip(), bullet_style))
-            else:
-                story.append(Paragraph(line.strip(), normal_style))
-    story.append(Spacer(1, 6))
-    
-    # Education
-    story.append(Paragraph("EDUCATION", heading_style))
-    education_lines = education.split('\n')
-    for line in education_lines:
-        if line.strip():
-            if line.strip().startswith('•'):
-                story.append(Paragraph(line.strip(), bullet_style))
-            else:
-                story.append(Paragraph(line.strip(), normal_style))
-    story.append(Spacer(1, 6))
-    
-    # Projects
-    story.append(Paragraph("PROJECTS", heading_style))
-    project_lines = projects.split('\n')
-    for line in project_lines:
-        if line.strip():
-            if line.strip().startswith('•'):
-                story.append(Paragraph(line.strip(), bullet_style))
-            else:
-                story.append(Paragraph(line.strip(), normal_style))
-    story.append(Spacer(1, 6))
-    
-    # Certifications
-    story.append(Paragraph("CERTIFICATIONS & TRAINING", heading_style))
-    cert_lines = certifications.split('\n')
-    for line in cert_lines:
-        if line.strip():
-            if line.strip().startswith('•'):
-                story.append(Paragraph(line.strip(), bullet_style))
-            else:
-                story.append(Paragraph(line.strip(), normal_style))
-    story.append(Spacer(1, 6))
-    
-    # Additional Information
-    story.append(Paragraph("ADDITIONAL INFORMATION", heading_style))
-    additional_info = [
-        "• Proficient in Agile methodologies and project management tools",
-        "• Strong problem-solving skills with analytical mindset", 
-        "• Excellent communication and collaboration abilities",
-        "• Committed to continuous professional development"
-    ]
-    for info in additional_info:
-        story.append(Paragraph(info, bullet_style))
-    
-    # Build the PDF
-    doc.build(story)
-    
-    # Get the PDF content
-    pdf_content = buffer.getvalue()
-    buffer.close()
-    
-    return pdf_content
 
 # --- YouTube Video Recommendation ---
 YOUTUBE_VIDEO = {
@@ -2295,59 +496,6 @@ YOUTUBE_VIDEO = {
     "url": "https://youtu.be/IIGWpw1FXhk?si=eaG2uk0OCHGvm7Tw"
 }
 
-# --- Relevant/Irrelevant Courses/Certs ---
-def classify_courses_certs(info, field):
-    relevant_courses = [c for c in COURSES.get(field, []) if any(kw in c.lower() for kw in info['skills'])]
-    irrelevant_courses = [c for c in COURSES.get(field, []) if c not in relevant_courses]
-    relevant_certs = [c for c in info['certifications'] if any(p in c.lower() for p in CERT_PROVIDERS if p in field.lower() or p in ' '.join(info['skills']).lower())]
-    irrelevant_certs = [c for c in info['certifications'] if c not in relevant_certs]
-    return relevant_courses, irrelevant_courses, relevant_certs, irrelevant_certs
-
-# --- Suggest Missing from Template ---
-def suggest_missing(info, text):
-    missing_sections = [s for s in IDEAL_SECTIONS if s not in text.lower()]
-    missing_skills = [s for s in IDEAL_SKILLS if s not in [sk.lower() for sk in info['skills']]]
-    missing_certs = [p.title() for p in CERT_PROVIDERS if not any(p in c.lower() for c in info['certifications'])]
-    return missing_sections, missing_skills, missing_certs
-
-
-# Recommend missing skills for the predicted field
-
-def recommend_skills(extracted_skills, field):
-    if field in SKILL_KEYWORDS:
-        missing = [kw for kw in SKILL_KEYWORDS[field] if kw not in [s.lower() for s in extracted_skills]]
-        return missing
-    return []
-
-
-# --- NLP-based keyword extraction ---
-def extract_keywords(text):
-    doc = nlp(text)
-    # Use noun chunks and named entities as keywords
-    keywords = set()
-    for chunk in doc.noun_chunks:
-        if len(chunk.text) > 2:
-            keywords.add(chunk.text.strip().lower())
-    for ent in doc.ents:
-        if ent.label_ in ["ORG", "PRODUCT", "GPE", "PERSON", "SKILL", "WORK_OF_ART", "EVENT"]:
-            keywords.add(ent.text.strip().lower())
-    # Add unique words longer than 4 chars (excluding stopwords)
-    for token in doc:
-        if not token.is_stop and not token.is_punct and len(token.text) > 4:
-            keywords.add(token.text.strip().lower())
-    return keywords
-
-
-# --- Course Relevance Helper ---
-def course_relevance(course, missing_skills):
-    for skill in missing_skills:
-        if skill.lower() in course.lower():
-            return "✅ Strongly Recommended"
-    if any(word in course.lower() for word in ["crash", "introduction", "beginner"]):
-        return "✅ Add after completion"
-    return "✅ Must Have"
-
-
 # (Removed duplicate set_page_config; configured earlier)
 
 # --- Custom CSS for Neatness ---
@@ -2492,6 +640,57 @@ ICON_VIDEO = "https://cdn-icons-png.flaticon.com/512/1384/1384060.png"
 ICON_SUGGEST = "https://cdn-icons-png.flaticon.com/512/1828/1828884.png"
 ICON_FEEDBACK = "https://cdn-icons-png.flaticon.com/512/1828/1828919.png"
 
+# --- Uploads live in the shared blob store; sessions keep name, type and hash only ---
+def cache_upload(uf):
+    """Store an UploadedFile's bytes in the shared blob store and return the session's handle"""
+    try:
+        data = uf.read()
+    except Exception:
+        data = b""
+    return {
+        'name': uf.name,
+        'ext': uf.name.split('.')[-1].lower(),
+        'sha256': get_blob_store().put(data),
+        'size': len(data),
+    }
+
+def release_uploads(entries):
+    """Drop this session's references to cached uploads"""
+    for entry in entries or []:
+        if isinstance(entry, dict) and entry.get('sha256'):
+            get_blob_store().release(entry['sha256'])
+
+# --- Shared parse cache: each unique file is parsed once per server process ---
+def resume_source(uploaded):
+    """Return (bytes, extension) for a cached upload dict or an UploadedFile"""
+    if isinstance(uploaded, dict):
+        if 'bytes' in uploaded:
+            return uploaded['bytes'], uploaded.get('ext', 'pdf')
+        try:
+            return get_blob_store().get(uploaded.get('sha256')), uploaded.get('ext', 'pdf')
+        except KeyError:
+            # Don't keep an empty analysis under this hash: a re-upload must be parsed again
+            get_parse_cache().discard(uploaded.get('sha256'))
+            st.error(f"{uploaded.get('name', 'This resume')} is no longer cached on the server. Please upload it again.")
+            return b"", uploaded.get('ext', 'pdf')
+    try:
+        data_bytes = uploaded.read()
+    except Exception:
+        data_bytes = b""
+    return data_bytes, uploaded.name.split('.')[-1].lower()
+
+def analysis_source(uploaded):
+    """Return (bytes or loader, extension, digest); stored uploads are only read on an analysis cache miss"""
+    if isinstance(uploaded, dict) and uploaded.get('sha256') and 'bytes' not in uploaded:
+        return (lambda: resume_source(uploaded)[0]), uploaded.get('ext', 'pdf'), uploaded['sha256']
+    data_bytes, file_extension = resume_source(uploaded)
+    return data_bytes, file_extension, None
+
+def get_resume_analysis(uploaded):
+    """Return the shared, lazily computed analysis of an uploaded resume (keyed by SHA-256 of its bytes)"""
+    data, file_extension, digest = analysis_source(uploaded)
+    return get_analysis(data, file_extension, digest=digest)
+
 files = st.session_state.get('uploaded_files_cache', [])
 
 if page == "Start / Upload":
@@ -2513,18 +712,9 @@ if page == "Start / Upload":
     uploaded_files = st.file_uploader("📤 Upload Resume(s) (PDF/DOCX)", type=["pdf", "docx"], accept_multiple_files=True)
     st.markdown("<div class='st-bb'></div>", unsafe_allow_html=True)
     if uploaded_files:
-        # Persist safe copies (name, ext, bytes) because UploadedFile streams may not persist across pages
-        cached = []
-        for uf in uploaded_files:
-            try:
-                data = uf.read()
-            except Exception:
-                data = b""
-            cached.append({
-                'name': uf.name,
-                'ext': uf.name.split('.')[-1].lower(),
-                'bytes': data,
-            })
+        # Persist handles (name, ext, hash) because UploadedFile streams may not persist across pages
+        cached = [cache_upload(uf) for uf in uploaded_files]
+        release_uploads(st.session_state.get('uploaded_files_cache'))
         st.session_state['uploaded_files_cache'] = cached
         files = cached
 
@@ -2546,6 +736,7 @@ if files:
     
     # Clear all files button
     if st.sidebar.button("🗑️ Clear All Resumes", help="Remove all uploaded resumes"):
+        release_uploads(st.session_state.get('uploaded_files_cache'))
         st.session_state['uploaded_files_cache'] = []
         st.session_state['show_uploader'] = False
         st.rerun()
@@ -2559,15 +750,7 @@ if files:
             # Add new files to existing cache
             current_files = st.session_state.get('uploaded_files_cache', [])
             for uf in additional_files:
-                try:
-                    data = uf.read()
-                except Exception:
-                    data = b""
-                current_files.append({
-                    'name': uf.name,
-                    'ext': uf.name.split('.')[-1].lower(),
-                    'bytes': data,
-                })
+                current_files.append(cache_upload(uf))
             st.session_state['uploaded_files_cache'] = current_files
             st.session_state['show_uploader'] = False
             st.rerun()
@@ -2576,6 +759,10 @@ if files:
             st.session_state['show_uploader'] = False
             st.rerun()
     
+    # Multi-resume analysis runs in the background; indexes of resumes still in flight
+    futures = []
+    pending = set()
+
     # Check if multiple resumes are uploaded
     if len(files) > 1:
         # Show comparison view for multiple resumes
@@ -2586,39 +773,30 @@ if files:
         </div>
         """.format(num_resumes=len(files)), unsafe_allow_html=True)
         
-        # Debug info
-        st.info(f"Processing {len(files)} resumes for comparison...")
-        
-        # Extract data from all resumes
+        # Analyze all resumes on the background pool; work in flight survives reruns
+        # (keyed by file hash), so each rerun renders whatever has finished so far.
+        # Submitted together so the files' NER runs batched on the workers
+        futures = submit_batch([analysis_source(uploaded) for uploaded in files])
+        pending = {idx for idx, future in enumerate(futures) if not future.done()}
+        if pending:
+            analyzed = len(files) - len(pending)
+            st.progress(analyzed / len(files), text=f"Analyzed {analyzed}/{len(files)} resumes, results appear as they finish...")
+
+        # Extract data from the resumes analyzed so far
         all_resume_data = []
-        for idx, uploaded in enumerate(files):
-            # Build temp file from cached bytes
-            if isinstance(uploaded, dict):
-                file_extension = uploaded.get('ext', 'pdf')
-                data_bytes = uploaded.get('bytes', b"")
-            else:
-                file_extension = uploaded.name.split('.')[-1].lower()
-                try:
-                    data_bytes = uploaded.read()
-                except Exception:
-                    data_bytes = b""
-            
-            temp_file_path = f"temp_resume_{idx}.{file_extension}"
-            with open(temp_file_path, "wb") as f:
-                f.write(data_bytes)
-            
-            # Extract text based on file type
-            if file_extension == "pdf":
-                text = extract_text_from_pdf(temp_file_path)
-            elif file_extension == "docx":
-                text = extract_text_from_docx(temp_file_path)
-            else:
-                text = ""
-            
-            # Extract information
-            info = extract_info(text)
-            field = detect_field(text)
-            resume_score, score_breakdown = dynamic_resume_score(text, info, field)
+        for idx, (uploaded, future) in enumerate(zip(files, futures)):
+            if idx in pending:
+                continue
+            try:
+                analysis = future.result()
+            except Exception as e:
+                st.error(f"Error analyzing resume {idx+1}: {e}")
+                continue
+            if analysis.get('error'):
+                st.error(analysis['error'])
+            info = analysis['info']
+            field = analysis['field']
+            resume_score = analysis['score']
             
             all_resume_data.append({
                 'name': info['name'],
@@ -2635,21 +813,25 @@ if files:
         
         # Create comparison table
         try:
-            create_comparison_table(all_resume_data)
+            if not all_resume_data:
+                st.info("⏳ The comparison table appears as soon as the first resume is analyzed.")
+            else:
+                create_comparison_table(all_resume_data)
         except Exception as e:
             st.error(f"Error creating comparison table: {e}")
             st.exception(e)
         
         # Add summary analysis
         try:
-            create_summary_analysis(all_resume_data)
+            if all_resume_data:
+                create_summary_analysis(all_resume_data)
         except Exception as e:
             st.error(f"Error creating summary analysis: {e}")
             st.exception(e)
         
         # Individual resume tabs
         st.markdown("### 📄 Individual Resume Analysis")
-        tab_labels = [f"Resume {i+1}" for i in range(len(files))]
+        tab_labels = [f"Resume {i+1}" + (" ⏳" if i in pending else "") for i in range(len(files))]
         tabs = st.tabs(tab_labels)
     else:
         # Single resume - show individual tabs with option to add more
@@ -2667,9 +849,13 @@ if files:
         tab_labels = [f"Resume {i+1}" for i in range(len(files))]
         tabs = st.tabs(tab_labels)
     
+    # Job Matching and the length check read the first resume; share one
+    # analysis, and only once it has landed (pages check ``0 in pending``)
+    primary_analysis = None if 0 in pending else get_resume_analysis(files[0])
+
     for idx, uploaded in enumerate(files):
-        with tabs[idx]:
-            st.markdown(f"<div class='st-section'>", unsafe_allow_html=True)
+        with tabs[idx], span(f"page.{page}"):
+            st.markdown("<div class='st-section'>", unsafe_allow_html=True)
             st.image(ICON_RESUME, width=48)
             st.markdown(f"### 📄 <span class='st-emoji'>Resume {idx+1}</span>", unsafe_allow_html=True)
             # After first upload, auto-switch to Edit & Build so users see the main workflow
@@ -2680,37 +866,26 @@ if files:
                 except Exception:
                     pass
 
-            # Build temp file from cached bytes or live upload
-            if isinstance(uploaded, dict):
-                file_extension = uploaded.get('ext', 'pdf')
-                data_bytes = uploaded.get('bytes', b"")
-            else:
-                file_extension = uploaded.name.split('.')[-1].lower()
-                try:
-                    data_bytes = uploaded.read()
-                except Exception:
-                    data_bytes = b""
-            temp_file_path = f"temp_resume_{idx}.{file_extension}"
-            with open(temp_file_path, "wb") as f:
-                f.write(data_bytes)
-            
-            # Extract text based on file type
-            if file_extension == "pdf":
-                text = extract_text_from_pdf(temp_file_path)
-            elif file_extension == "docx":
-                text = extract_text_from_docx(temp_file_path)
-            else:
-                text = ""
+            if idx in pending:
+                st.info("⏳ Still analyzing this resume; it will appear here when ready.")
+                continue
+
+            # Every value below is computed on first use and shared across pages
+            # and reruns; each page only pulls what it renders
+            analysis = get_resume_analysis(uploaded)
+            if analysis.get('error'):
+                st.error(analysis['error'])
+            text = analysis['text']
             
             # Validate resume format
-            format_warnings = validate_resume_format(text)
+            format_warnings = analysis['format_warnings']
             if format_warnings:
                 st.warning("*Resume Format Issues Detected:*")
                 for warning in format_warnings:
                     st.markdown(f"• {warning}")
             
-            info = extract_info(text)
-            field = detect_field(text)
+            info = analysis['info']
+            field = analysis['field']
 
             # --- Fixed counts for display (removed sliders) ---
             skill_count = 10
@@ -2753,7 +928,7 @@ if files:
             # --- ATS Score Display (Before Editing) ---
             if page == "Edit & Build":
                 st.markdown("### 📊 **Current ATS Score**")
-                current_score, current_breakdown = dynamic_resume_score(text, info, field)
+                current_score, current_breakdown = analysis['score'], analysis['breakdown']
                 
                 col1, col2, col3 = st.columns([1, 2, 1])
                 with col2:
@@ -2853,11 +1028,15 @@ if files:
                     
                     # Update session state
                     st.session_state[f'edited_info_{idx}'] = edited_info
-                    
+
+                    # Live preview: only the info-derived score parts are re-evaluated
+                    live_score, _ = dynamic_resume_score(text, edited_info, detect_field(edited_info['skills']))
+                    st.caption(f"📊 Score with these edits: {live_score}/100 (original: {analysis['score']}/100)")
+
                     # Use edited info for scoring if user has made changes
                     if st.button("🔄 Update Analysis with Edited Info", key=f"update_{idx}"):
                         info = edited_info
-                        field = detect_field(" ".join(edited_info['skills']))
+                        field = detect_field(edited_info['skills'])
                         # Set flag to show updated score
                         st.session_state[f'score_updated_{idx}'] = True
                         st.success("✅ Analysis updated with your changes!")
@@ -2872,7 +1051,7 @@ if files:
                 
                 # Calculate updated score with edited info
                 updated_info = st.session_state[f'edited_info_{idx}']
-                updated_field = detect_field(" ".join(updated_info['skills']))
+                updated_field = detect_field(updated_info['skills'])
                 updated_score, updated_breakdown = dynamic_resume_score(text, updated_info, updated_field)
                 
                 col1, col2, col3 = st.columns([1, 2, 1])
@@ -2949,12 +1128,12 @@ if files:
                     if f'edited_info_{idx}' in st.session_state and st.session_state.get(f'score_updated_{idx}', False):
                         # Use updated information for scoring
                         updated_info = st.session_state[f'edited_info_{idx}']
-                        updated_field = detect_field(" ".join(updated_info['skills']))
+                        updated_field = detect_field(updated_info['skills'])
                         resume_score, score_breakdown = dynamic_resume_score(text, updated_info, updated_field)
                         st.info("📊 **Analysis based on your updated resume information**")
                     else:
-                        # Use original information for scoring
-                        resume_score, score_breakdown = dynamic_resume_score(text, info, field)
+                        # Use original information for scoring (cached)
+                        resume_score, score_breakdown = analysis['score'], analysis['breakdown']
                         st.info("📊 **Analysis based on original resume information**")
                     
                     st.markdown(f'<div class="score-badge">{resume_score}/100</div>', unsafe_allow_html=True)
@@ -3107,7 +1286,7 @@ if files:
                             st.markdown(f"• {tip}")
                 
                 # Comprehensive ATS Feature Analysis (compact, two-column layout)
-                ats_features = extract_ats_features(text, info, field)
+                ats_features = analysis['ats_features']
                 with st.expander("🔍 **Comprehensive ATS Feature Analysis**", expanded=(st.session_state.get("ats_active_panel") == "ATS Feature Analysis")):
                     st.markdown("<div class='card'>", unsafe_allow_html=True)
                     col1, col2 = st.columns([1,1])
@@ -3183,7 +1362,7 @@ if files:
                     st.markdown("</div>", unsafe_allow_html=True)
                 
                 # Strengths and Weaknesses
-                strengths, weaknesses = get_strengths_weaknesses(text, info)
+                strengths, weaknesses = analysis['strengths_weaknesses']
                 if strengths:
                     st.markdown('<span class="section-title section-title-green">✅ Strengths</span>', unsafe_allow_html=True)
                     for s in strengths:
@@ -3195,7 +1374,7 @@ if files:
                         st.markdown(f'<div class="suggestion-card">• {w}</div>', unsafe_allow_html=True)
                 
                 # Personalized Tips
-                tips = get_personalized_tips(text, info)
+                tips = analysis['tips']
                 if tips:
                     st.markdown('<span class="section-title section-title-purple">💡 Personalized Tips</span>', unsafe_allow_html=True)
                     for tip in tips:
@@ -3266,7 +1445,7 @@ if files:
                     # Precompute shared data - use updated info if available
                     if f'edited_info_{idx}' in st.session_state and st.session_state.get(f'score_updated_{idx}', False):
                         analysis_info = st.session_state[f'edited_info_{idx}']
-                        analysis_field = detect_field(" ".join(analysis_info['skills']))
+                        analysis_field = detect_field(analysis_info['skills'])
                     else:
                         analysis_info = info
                         analysis_field = field
@@ -3434,17 +1613,15 @@ if files:
                 target_role = st.text_input("Target Role / Title", value="", key=f"target_role_{idx}")
                 job_description = st.text_area("Paste Job Description (JD)", value="", height=150, key=f"job_desc_{idx}")
                 
-                # Simple keyword extraction from JD
-                def extract_keywords(text_block):
-                    words = re.findall(r"[A-Za-z]{3,}", text_block.lower())
-                    stop = set(["and","with","for","you","your","the","this","that","from","will","have","are","our","not","but","per","who","job","role","work","team","ability","skills","experience","years","strong","good","excellent","required","preferred","plus","using","use"])    
-                    freq = {}
-                    for w in words:
-                        if w in stop:
-                            continue
-                        freq[w] = freq.get(w, 0) + 1
-                    return [w for w,_ in sorted(freq.items(), key=lambda x: x[1], reverse=True)[:12]]
-                jd_keywords = extract_keywords(job_description) if job_description else []
+                # Score the resume against the JD; its keywords are its most frequent terms
+                jd_keywords = []
+                if job_description:
+                    jd_match = match_documents([text], [job_description])
+                    jd_keywords = top_terms(job_description, k=12)
+                    shared_terms = [term for term, _ in jd_match.contributions(0, 0, k=8)]
+                    st.metric("Resume ↔ JD Similarity", f"{jd_match.scores[0, 0]:.0%}")
+                    if shared_terms:
+                        st.caption("Top shared terms: " + ", ".join(shared_terms))
                 # Tailored skills: prioritize overlap between JD keywords and provided skills/field skills
                 provided_skills = [s.strip().lower() for s in (edited_skills.split("\n") if edited_skills else []) if s.strip()]
                 tailored_priority = [kw for kw in jd_keywords if kw in provided_skills or kw in [fs.lower() for fs in SKILL_KEYWORDS.get(field, [])]]
@@ -3727,11 +1904,14 @@ ADDITIONAL INFORMATION
                             pdf_certifications = edited_certifications if edited_certifications else f"• {field} Certification - Industry-recognized credential\n• Professional Development Courses - Continuous learning initiatives"
                             
                             # Generate PDF
-                            pdf_content = generate_pdf_resume(
+                            pdf_inputs = (
                                 edited_name, edited_email, edited_phone, edited_linkedin,
                                 pdf_summary, pdf_skills, pdf_experience, pdf_education,
                                 pdf_projects, pdf_certifications, field
                             )
+                            pdf_content = generate_pdf_resume(*pdf_inputs)
+                            # Reused by "Export All Resumes"
+                            st.session_state[f'pdf_inputs_{idx}'] = dict(zip(RESUME_FIELDS, pdf_inputs))
                             
                             # Store PDF in session state only if valid bytes were returned
                             if pdf_content:
@@ -3790,34 +1970,13 @@ ADDITIONAL INFORMATION
                 # Check if user has uploaded a resume
                 if files:
                     # Analyze the first resume to determine the role
-                    if len(files) > 0:
-                        # Use the first uploaded file
-                        uploaded = files[0]
-                        if isinstance(uploaded, dict):
-                            file_extension = uploaded.get('ext', 'pdf')
-                            data_bytes = uploaded.get('bytes', b"")
-                        else:
-                            file_extension = uploaded.name.split('.')[-1].lower()
-                            try:
-                                data_bytes = uploaded.read()
-                            except Exception:
-                                data_bytes = b""
-                        
-                        temp_file_path = f"temp_resume_job_matching.{file_extension}"
-                        with open(temp_file_path, "wb") as f:
-                            f.write(data_bytes)
-                        
-                        # Extract text and analyze
-                        if file_extension == "pdf":
-                            text = extract_text_from_pdf(temp_file_path)
-                        elif file_extension == "docx":
-                            text = extract_text_from_docx(temp_file_path)
-                        else:
-                            text = ""
-                        
-                        # Analyze resume to determine role
-                        info = extract_info(text)
-                        field = detect_field(text)
+                    if 0 in pending:
+                        st.info("⏳ Still analyzing your first resume...")
+                    elif len(files) > 0:
+                        # Use the first uploaded file (analyzed once, not once per tab)
+                        text = primary_analysis['text']
+                        info = primary_analysis['info']
+                        field = primary_analysis['field']
                         
                         st.markdown("### 📋 **Your Resume Analysis**")
                         col1, col2 = st.columns(2)
@@ -3835,44 +1994,19 @@ ADDITIONAL INFORMATION
                         # Job matching based on detected field
                         st.markdown("### 🎯 **Matching Job Opportunities**")
                         
-                        # Define job opportunities by field
-                        job_opportunities = {
-                            "Data Science": [
-                                {"company": "Google", "role": "Data Scientist", "location": "Mountain View, CA", "salary": "$130k-180k", "match": "95%", "skills": ["Python", "Machine Learning", "SQL"]},
-                                {"company": "Microsoft", "role": "Senior Data Analyst", "location": "Seattle, WA", "salary": "$120k-160k", "match": "92%", "skills": ["Python", "PowerBI", "Statistics"]},
-                                {"company": "Amazon", "role": "Data Engineer", "location": "Austin, TX", "salary": "$125k-170k", "match": "88%", "skills": ["Python", "AWS", "Spark"]},
-                                {"company": "Meta", "role": "Research Scientist", "location": "Menlo Park, CA", "salary": "$140k-200k", "match": "90%", "skills": ["Python", "Deep Learning", "Research"]},
-                                {"company": "Netflix", "role": "Data Scientist", "location": "Los Gatos, CA", "salary": "$135k-185k", "match": "87%", "skills": ["Python", "A/B Testing", "Statistics"]}
-                            ],
-                            "Web Development": [
-                                {"company": "Google", "role": "Frontend Engineer", "location": "Mountain View, CA", "salary": "$120k-170k", "match": "93%", "skills": ["React", "JavaScript", "CSS"]},
-                                {"company": "Facebook", "role": "Full Stack Developer", "location": "Menlo Park, CA", "salary": "$125k-175k", "match": "91%", "skills": ["React", "Node.js", "GraphQL"]},
-                                {"company": "Airbnb", "role": "Software Engineer", "location": "San Francisco, CA", "salary": "$130k-180k", "match": "89%", "skills": ["React", "Python", "Django"]},
-                                {"company": "Uber", "role": "Frontend Engineer", "location": "San Francisco, CA", "salary": "$115k-165k", "match": "86%", "skills": ["React", "TypeScript", "Webpack"]},
-                                {"company": "Stripe", "role": "Full Stack Engineer", "location": "San Francisco, CA", "salary": "$140k-190k", "match": "94%", "skills": ["React", "Ruby", "PostgreSQL"]}
-                            ],
-                            "Artificial Intelligence": [
-                                {"company": "OpenAI", "role": "AI Research Engineer", "location": "San Francisco, CA", "salary": "$150k-220k", "match": "96%", "skills": ["Python", "TensorFlow", "NLP"]},
-                                {"company": "Tesla", "role": "Machine Learning Engineer", "location": "Palo Alto, CA", "salary": "$140k-200k", "match": "92%", "skills": ["Python", "PyTorch", "Computer Vision"]},
-                                {"company": "NVIDIA", "role": "AI Software Engineer", "location": "Santa Clara, CA", "salary": "$135k-185k", "match": "89%", "skills": ["Python", "CUDA", "Deep Learning"]},
-                                {"company": "DeepMind", "role": "Research Scientist", "location": "London, UK", "salary": "$130k-180k", "match": "95%", "skills": ["Python", "Reinforcement Learning", "Research"]},
-                                {"company": "Anthropic", "role": "AI Safety Researcher", "location": "San Francisco, CA", "salary": "$145k-210k", "match": "91%", "skills": ["Python", "AI Safety", "Research"]}
-                            ],
-                            "Cybersecurity": [
-                                {"company": "CrowdStrike", "role": "Security Engineer", "location": "Austin, TX", "salary": "$120k-170k", "match": "94%", "skills": ["Python", "SIEM", "Threat Analysis"]},
-                                {"company": "Palo Alto Networks", "role": "Cybersecurity Analyst", "location": "Santa Clara, CA", "salary": "$115k-160k", "match": "91%", "skills": ["Network Security", "Firewalls", "Incident Response"]},
-                                {"company": "FireEye", "role": "Security Consultant", "location": "Milpitas, CA", "salary": "$125k-175k", "match": "88%", "skills": ["Penetration Testing", "Vulnerability Assessment", "Security"]},
-                                {"company": "Rapid7", "role": "Security Researcher", "location": "Boston, MA", "salary": "$130k-180k", "match": "92%", "skills": ["Python", "Malware Analysis", "Research"]},
-                                {"company": "Zscaler", "role": "Cloud Security Engineer", "location": "San Jose, CA", "salary": "$135k-185k", "match": "90%", "skills": ["Cloud Security", "AWS", "Zero Trust"]}
-                            ]
-                        }
-                        
-                        # Get opportunities for the detected field
-                        opportunities = job_opportunities.get(field, job_opportunities["Data Science"])  # Default to Data Science
+                        # Rank postings from the local job catalog by skill overlap
+                        resume_skills = [s for s in info['skills'] if s != 'Not found']
+                        resume_skills += sorted(primary_analysis['document'].skills.keywords)
+                        missing_catalogs = missing_catalog_paths()
+                        if missing_catalogs:
+                            st.error("Job catalog file(s) not found, skipped: " + ", ".join(missing_catalogs) + ". Check PROFILE_ANALYSER_JOB_CATALOG; the bundled catalog is used if none of them exists.")
+                        opportunities = get_job_catalog().top_k(resume_skills, k=5, field=field)
+                        if not opportunities:
+                            st.info("No job postings are available in the job catalog.")
                         
                         # Display job opportunities
                         for i, job in enumerate(opportunities):
-                            with st.expander(f"🏢 {job['company']} - {job['role']} ({job['match']} Match)", expanded=(i==0)):
+                            with st.expander(f"🏢 {job['company']} - {job['role']} ({job['match']}% Match)", expanded=(i==0)):
                                 col1, col2, col3 = st.columns(3)
                                 
                                 with col1:
@@ -3880,15 +2014,14 @@ ADDITIONAL INFORMATION
                                     st.markdown(f"**💰 Salary:** {job['salary']}")
                                 
                                 with col2:
-                                    st.markdown(f"**🎯 Match Score:** {job['match']}")
+                                    st.markdown(f"**🎯 Match Score:** {job['match']}%")
                                     st.markdown(f"**🏢 Company:** {job['company']}")
                                 
                                 with col3:
                                     st.markdown("**🛠 Required Skills:**")
                                     for skill in job['skills']:
                                         # Check if user has this skill
-                                        user_skills = [s.lower() for s in info['skills'] if s != 'Not found']
-                                        if skill.lower() in user_skills:
+                                        if skill in job['matched_skills']:
                                             st.markdown(f"✅ {skill}")
                                         else:
                                             st.markdown(f"❌ {skill}")
@@ -3924,10 +2057,10 @@ ADDITIONAL INFORMATION
                         with col1:
                             st.metric("Total Opportunities", len(opportunities))
                         with col2:
-                            avg_salary = sum([int(job['salary'].split('-')[0].replace('$', '').replace('k', '')) for job in opportunities]) // len(opportunities)
-                            st.metric("Avg. Salary", f"${avg_salary}k")
+                            salaries = [k for k in (salary_floor_k(job['salary']) for job in opportunities) if k is not None]
+                            st.metric("Avg. Salary", f"${sum(salaries) // len(salaries)}k" if salaries else "N/A")
                         with col3:
-                            high_match = len([j for j in opportunities if int(j['match'].replace('%', '')) >= 90])
+                            high_match = len([j for j in opportunities if j['match'] >= 90])
                             st.metric("High Match Jobs", high_match)
                         with col4:
                             st.metric("Your Skills Match", f"{len([s for s in info['skills'] if s != 'Not found'])} skills")
@@ -3945,7 +2078,7 @@ OPPORTUNITIES FOUND: {len(opportunities)}
 {i}. {job['company']} - {job['role']}
    Location: {job['location']}
    Salary: {job['salary']}
-   Match Score: {job['match']}
+   Match Score: {job['match']}%
    Required Skills: {', '.join(job['skills'])}
    
 """
@@ -3974,33 +2107,47 @@ OPPORTUNITIES FOUND: {len(opportunities)}
                 
                 st.markdown("</div>", unsafe_allow_html=True)
 
+    # --- Batch export of every resume (Outside tabs loop) ---
+    if page == "Resume Generator" and len(files) > 1 and not pending:
+        st.markdown("### 📦 Export All Resumes")
+        st.caption("Each resume uses the details its PDF was last generated with, or the extracted details if none was generated yet.")
+        batch_sections = []
+        batch_names = []
+        for i, uploaded in enumerate(files):
+            sections = st.session_state.get(f'pdf_inputs_{i}')
+            if sections is None:
+                batch_analysis = get_resume_analysis(uploaded)
+                batch_field = batch_analysis['field']
+                sections = sections_from_info(batch_analysis['info'], batch_field, SKILL_KEYWORDS.get(batch_field, []))
+            file_name = uploaded.get('name', f'Resume {i+1}') if isinstance(uploaded, dict) else uploaded.name
+            batch_sections.append(sections)
+            batch_names.append(f"{file_name.rsplit('.', 1)[0].replace(' ', '_')}_Professional_Resume.pdf")
+        # Built exports are only offered while they match the current inputs
+        export_key = tuple(render_key(sections) for sections in batch_sections)
+        export_cols = st.columns(2)
+        for col, (label, kind, mime, file_name) in zip(export_cols, [
+            ("🗜️ Build ZIP of all resumes", "zip", "application/zip", "Professional_Resumes.zip"),
+            ("📚 Build one combined PDF", "pdf", "application/pdf", "Professional_Resumes.pdf"),
+        ]):
+            with col:
+                if st.button(label, key=f"batch_export_{kind}"):
+                    try:
+                        with st.spinner(f"Rendering {len(batch_sections)} resumes..."):
+                            data = export_zip(batch_sections, batch_names) if kind == "zip" else export_combined(batch_sections)
+                        st.session_state[f'batch_export_{kind}_data'] = (export_key, data)
+                    except RenderError as e:
+                        st.error(str(e))
+                built = st.session_state.get(f'batch_export_{kind}_data')
+                if built and built[0] == export_key:
+                    st.download_button(f"⬇️ Download {file_name}", data=built[1], file_name=file_name, mime=mime, key=f"batch_download_{kind}")
+
     # --- Resume Length Checker (Outside tabs loop) ---
     if page == "Edit & Build" and files:
         st.markdown("### 📏 **Resume Length Analysis**")
         
         # Get the first resume's text for analysis
-        if len(files) > 0:
-            # Build temp file from cached bytes or live upload
-            if isinstance(files[0], dict):
-                file_extension = files[0].get('ext', 'pdf')
-                data_bytes = files[0].get('bytes', b"")
-            else:
-                file_extension = files[0].name.split('.')[-1].lower()
-                try:
-                    data_bytes = files[0].read()
-                except Exception:
-                    data_bytes = b""
-            temp_file_path = f"temp_resume_length_check.{file_extension}"
-            with open(temp_file_path, "wb") as f:
-                f.write(data_bytes)
-            
-            # Extract text based on file type
-            if file_extension == "pdf":
-                text = extract_text_from_pdf(temp_file_path)
-            elif file_extension == "docx":
-                text = extract_text_from_docx(temp_file_path)
-            else:
-                text = ""
+        if len(files) > 0 and 0 not in pending:
+            text = primary_analysis['text']
             
             # Calculate resume length metrics
             word_count = len(text.split())
@@ -4076,3 +2223,39 @@ OPPORTUNITIES FOUND: {len(opportunities)}
             
             st.markdown("---")
 
+# --- Performance panel ---
+def render_performance_panel(spans, total):
+    """Sidebar breakdown of this rerun's spans, process-wide percentiles and cache hit rates."""
+    with st.sidebar.expander("⏱️ Performance", expanded=True):
+        st.markdown(f"**This rerun:** {total * 1000:.0f} ms")
+        # Memo lookups show up as near-zero spans; list only the ones that did work
+        shown = [(name, depth, seconds) for name, depth, seconds in spans if seconds >= 0.0001]
+        if shown:
+            rows = [f"{'&nbsp;' * 4 * depth}`{name}` {seconds * 1000:.1f} ms" for name, depth, seconds in shown]
+            st.markdown("  \n".join(rows), unsafe_allow_html=True)
+        if len(shown) < len(spans):
+            st.caption(f"{len(spans) - len(shown)} spans under 0.1 ms (cache hits) not shown.")
+        snapshot = metrics.snapshot()
+        st.markdown("**Since server start** (p50 / p95, count)")
+        st.markdown("  \n".join(
+            f"`{name}` {s['p50_ms']:.1f} / {s['p95_ms']:.1f} ms, {s['count']}×" for name, s in snapshot["spans"].items()
+        ))
+        st.markdown("**Caches** (hit rate, hits / lookups)")
+        st.markdown("  \n".join(
+            f"`{name}` {s['hit_rate']:.0%}, {s['hits']} / {s['hits'] + s['misses']}" for name, s in snapshot["caches"].items()
+        ))
+        if snapshot["counters"]:
+            st.markdown("  \n".join(f"`{name}` {value}" for name, value in snapshot["counters"].items()))
+        st.download_button("Download metrics (JSON)", json.dumps(snapshot, indent=2), file_name="profile_analyser_metrics.json", mime="application/json")
+        st.download_button("Download metrics (Prometheus)", metrics.prometheus_text(), file_name="profile_analyser_metrics.prom", mime="text/plain")
+
+
+run_spans, run_total = metrics.end_run()
+if st.sidebar.toggle("⏱️ Show performance panel", key="show_perf_panel"):
+    render_performance_panel(run_spans, run_total)
+
+# --- Progressive multi-resume analysis ---
+# Wait briefly for the next background result, then redraw with it
+if files and pending:
+    wait([futures[idx] for idx in pending], timeout=1.0, return_when=FIRST_COMPLETED)
+    st.rerun()
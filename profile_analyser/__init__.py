@@ -0,0 +1,37 @@
+"""Analysis helpers shared by the ProFile Analyser Streamlit apps.
+
+The package has no Streamlit dependency and imports nothing heavy up front:
+spaCy, PyMuPDF, python-docx, pandas and reportlab are loaded by the functions
+that use them.  The names below resolve to their submodule on first access,
+so ``from profile_analyser import analyze_resume`` only imports what it needs.
+"""
+import importlib
+
+_EXPORTS = {
+    "analyze_resume": "batch",
+    "analyze_resumes": "batch",
+    "analyze_batch": "batch",
+    "submit_analysis": "batch",
+    "submit_batch": "batch",
+    "extract_text_from_file": "extract",
+    "ExtractionError": "extract",
+    "extract_info": "extractors",
+    "validate_resume_format": "extractors",
+    "detect_field": "scoring",
+    "dynamic_resume_score": "scoring",
+    "extract_ats_features": "scoring",
+    "get_parse_cache": "cache",
+    "get_analysis": "graph",
+    "ResumeAnalysis": "graph",
+    "get_nlp": "nlp",
+    "get_job_catalog": "jobs",
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(f"{__name__}.{module}"), name)
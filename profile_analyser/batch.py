@@ -0,0 +1,262 @@
+"""Parallel analysis of many resumes on a shared worker pool.
+
+``analyze_batch`` fans text extraction, ``extract_info``, ``detect_field`` and
+``dynamic_resume_score`` out across worker processes.  Results come back in
+input order whatever order the workers finish in, identical files are only
+analyzed once, and files whose cached analysis already holds those nodes are
+not resubmitted.  Results are the shared ``ResumeAnalysis`` objects, so the
+pages can pull further nodes (ATS features, tips) from them lazily.
+
+``submit_analysis`` is the non-blocking variant for the UI: it returns a
+future per file that outlives the Streamlit rerun which submitted it, so a
+rerun mid-batch reattaches to the work in flight instead of restarting it.
+``submit_batch`` does the same for many files at once.
+
+Files are handed to the workers in chunks (``analyze_resumes``).  Within a
+chunk, the resumes whose extraction reads spaCy entities go through one
+``nlp.pipe`` call instead of one pipeline call each; chunks are sized so every
+worker still gets work, and at most ``nlp.BATCH_SIZE`` files.
+"""
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+
+from profile_analyser.cache import file_digest, get_parse_cache
+from profile_analyser.document import pipe_documents
+from profile_analyser.extractors import needs_ner
+from profile_analyser.graph import BATCH_NODES, ResumeAnalysis
+from profile_analyser.metrics import incr, observe
+from profile_analyser.nlp import BATCH_SIZE, N_PROCESS
+
+DEFAULT_WORKERS = int(os.environ.get("PROFILE_ANALYSER_WORKERS", str(min(8, os.cpu_count() or 1))))
+
+_executor = None
+_executor_workers = 0
+_executor_lock = threading.Lock()
+
+# digest -> Future of the ResumeAnalysis while its file is being analyzed
+_inflight = {}
+_inflight_lock = threading.RLock()
+
+
+def evaluate_batch_nodes(analysis):
+    """``analysis.evaluate(BATCH_NODES)``; a file whose analysis raises gets the error instead.
+
+    The failed file then reads as an empty resume whose ``error`` says what
+    went wrong, so one bad file never takes its batch down with it.
+    """
+    try:
+        return analysis.evaluate(BATCH_NODES)
+    except Exception as e:
+        incr("analysis.failed")
+        analysis.fail(f"Error analyzing {analysis.file_type.upper()}: {e}")
+        return analysis.evaluate(BATCH_NODES)
+
+
+def analyze_resume(data, file_type):
+    """Run the full single-resume pipeline (text -> info -> field -> score) into a plain dict."""
+    return evaluate_batch_nodes(ResumeAnalysis(data, file_type))
+
+
+def prime_ner(analyses, n_process=1):
+    """Pipe the documents of ``analyses`` that will need NER through one ``nlp.pipe`` call."""
+    documents = [(analysis["document"], analysis["layout"]) for analysis in analyses if "info" not in analysis]
+    pipe_documents([doc for doc, layout in documents if doc.text and needs_ner(doc, layout)], n_process=n_process)
+
+
+def analyze_resumes(items, n_process=1):
+    """``analyze_resume`` for several ``(data, file_type)`` pairs, batching their NER."""
+    analyses = [ResumeAnalysis(data, file_type) for data, file_type in items]
+    _prime_chunk(analyses, n_process)
+    return [evaluate_batch_nodes(analysis) for analysis in analyses]
+
+
+def _prime_chunk(analyses, n_process=N_PROCESS):
+    try:
+        prime_ner(analyses, n_process)
+    except Exception:
+        # Only the batching is lost: each file then runs its own NER, and the
+        # one that fails gets the error (evaluate_batch_nodes)
+        incr("analysis.ner_batch_failed")
+
+
+def chunk_items(items, max_workers, size=BATCH_SIZE):
+    """Split ``items`` so each of ``max_workers`` gets a chunk, none larger than ``size``."""
+    per = max(1, min(size, -(-len(items) // max(1, max_workers))))
+    return [items[i:i + per] for i in range(0, len(items), per)]
+
+
+def get_executor(max_workers=DEFAULT_WORKERS):
+    """Process pool shared by every caller in this process.
+
+    Workers are spawned rather than forked (the Streamlit server is
+    multi-threaded) and kept alive between batches, so each worker loads the
+    spaCy model once.
+    """
+    global _executor, _executor_workers
+    from concurrent.futures import ProcessPoolExecutor
+    from multiprocessing import get_context
+
+    with _executor_lock:
+        if _executor is None or _executor_workers != max_workers:
+            if _executor is not None:
+                _executor.shutdown(wait=False, cancel_futures=True)
+            _executor = ProcessPoolExecutor(max_workers=max_workers, mp_context=get_context("spawn"))
+            _executor_workers = max_workers
+        return _executor
+
+
+def shutdown_executor():
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=True)
+            _executor = None
+
+
+def _complete(analysis, cache, digest, values):
+    analysis.seed(values)
+    # Seeding already re-accounted the entry; this re-adds it if it was
+    # evicted while the workers ran
+    cache.put(digest, analysis)
+    return analysis
+
+
+def submit_analysis(data, file_type, max_workers=DEFAULT_WORKERS, cache=None, digest=None):
+    """Future resolving to the file's ``ResumeAnalysis`` with the batch nodes computed.
+
+    Files already analyzed return a finished future; files in flight return
+    the future of the first submission, whoever made it.  As with
+    ``get_analysis``, ``data`` may be a callable loading the bytes when
+    ``digest`` is given.
+    """
+    return submit_batch([(data, file_type, digest)], max_workers, cache)[0]
+
+
+def submit_batch(items, max_workers=DEFAULT_WORKERS, cache=None):
+    """``submit_analysis`` for ``(data, file_type, digest)`` triples; one future per item.
+
+    The files that need analyzing are sent to the pool in chunks, so their
+    NER is batched (see ``analyze_resumes``).
+    """
+    cache = get_parse_cache() if cache is None else cache
+    futures = []
+    jobs = []
+    with _inflight_lock:
+        for data, file_type, digest in items:
+            digest = digest or file_digest(data)
+            cached = cache.get(digest)
+            if cached is not None and all(name in cached for name in BATCH_NODES):
+                incr("analysis.cached")
+                future = Future()
+                future.set_result(cached)
+            elif digest in _inflight:
+                future = _inflight[digest]
+            else:
+                incr("analysis.submitted")
+                analysis = cached if cached is not None else cache.put(digest, ResumeAnalysis(data, file_type, digest, cache))
+                future = _inflight[digest] = Future()
+                jobs.append((digest, data, file_type, analysis, future))
+            futures.append(future)
+        if not jobs:
+            return futures
+
+        if max_workers <= 1:
+            for digest, *_ in jobs:
+                _inflight.pop(digest)
+            for chunk in chunk_items(jobs, 1):
+                _prime_chunk([job[3] for job in chunk])
+                for digest, _, _, analysis, future in chunk:
+                    future.set_result(_complete(analysis, cache, digest, evaluate_batch_nodes(analysis)))
+            return futures
+
+        executor = get_executor(max_workers)
+        for chunk in chunk_items(jobs, max_workers):
+            submitted = time.perf_counter()
+
+            def landed(worker, chunk=chunk, submitted=submitted):
+                observe("analysis.pool", time.perf_counter() - submitted)
+                with _inflight_lock:
+                    for digest, *_ in chunk:
+                        _inflight.pop(digest, None)
+                try:
+                    results = worker.result()
+                except BaseException as e:
+                    for *_, future in chunk:
+                        future.set_exception(e)
+                    return
+                for (digest, _, _, analysis, future), values in zip(chunk, results):
+                    future.set_result(_complete(analysis, cache, digest, values))
+
+            try:
+                payload = [(data() if callable(data) else data, file_type) for _, data, file_type, _, _ in chunk]
+            except Exception as e:
+                # e.g. the upload expired from the blob store
+                for digest, *_, future in chunk:
+                    _inflight.pop(digest, None)
+                    future.set_exception(e)
+                continue
+            executor.submit(analyze_resumes, payload).add_done_callback(landed)
+    return futures
+
+
+def analyze_batch(items, max_workers=DEFAULT_WORKERS, progress=None, cache=None):
+    """Analyze ``items`` (pairs of ``(data, file_type)``) and return their ``ResumeAnalysis`` in input order.
+
+    At most ``max_workers`` chunks are analyzed concurrently and at most twice
+    that many are queued, so large uploads are not pickled to the workers all
+    at once.  ``progress(done, total)`` is called from the calling thread after
+    every finished file (cache hits count as finished immediately).
+    """
+    cache = get_parse_cache() if cache is None else cache
+    total = len(items)
+    results = [None] * total
+    pending = {}
+    for index, (data, file_type) in enumerate(items):
+        digest = file_digest(data)
+        cached = cache.get(digest)
+        if cached is not None and all(name in cached for name in BATCH_NODES):
+            results[index] = cached
+        elif digest in pending:
+            pending[digest][3].append(index)
+        else:
+            analysis = cached if cached is not None else cache.put(digest, ResumeAnalysis(data, file_type, digest, cache))
+            pending[digest] = (data, file_type, analysis, [index])
+
+    done = total - sum(len(job[3]) for job in pending.values())
+    if progress:
+        progress(done, total)
+    if not pending:
+        return results
+
+    def finish(digest, values):
+        nonlocal done
+        _, _, analysis, indices = pending[digest]
+        _complete(analysis, cache, digest, values)
+        for index in indices:
+            results[index] = analysis
+        done += len(indices)
+        if progress:
+            progress(done, total)
+
+    if max_workers <= 1 or len(pending) == 1:
+        for chunk in chunk_items(list(pending.items()), 1):
+            _prime_chunk([job[2] for _, job in chunk])
+            for digest, (_, _, analysis, _) in chunk:
+                finish(digest, evaluate_batch_nodes(analysis))
+        return results
+
+    executor = get_executor(max_workers)
+    queue = chunk_items(list(pending.items()), max_workers)
+    running = {}
+    while queue or running:
+        while queue and len(running) < 2 * max_workers:
+            chunk = queue.pop(0)
+            payload = [(data, file_type) for _, (data, file_type, _, _) in chunk]
+            running[executor.submit(analyze_resumes, payload)] = [digest for digest, _ in chunk]
+        finished, _ = wait(running, return_when=FIRST_COMPLETED)
+        for future in finished:
+            for digest, values in zip(running.pop(future), future.result()):
+                finish(digest, values)
+    return results
@@ -0,0 +1,238 @@
+"""Benchmark harness for the extraction and scoring pipeline.
+
+``python -m profile_analyser bench`` builds a fixed, seeded corpus in memory
+with the corpus generator (short/long, PDF/DOCX, single/two-column and
+link-heavy resumes; the PDFs need reportlab), times every pipeline stage on
+every document and reports latency percentiles per stage, end-to-end
+throughput and peak RSS as JSON.  Store a run with ``-o`` and
+compare later runs with ``--baseline``; the command exits non-zero when a
+stage, the throughput or the memory peak regresses beyond the tolerance.
+
+Caches (shared documents, cached score parts) are cleared before every
+document so each measurement is a cold, first-upload analysis.
+"""
+import json
+import platform
+import random
+import sys
+import time
+
+BENCH_VERSION = 2
+DEFAULT_ITERATIONS = 5
+DEFAULT_TOLERANCE = 0.25
+# Stage slowdowns smaller than this (in ms) are treated as noise
+NOISE_FLOOR_MS = 0.5
+
+STAGES = (
+    "extract_text",
+    "personal_info",
+    "education",
+    "skills",
+    "certifications",
+    "projects",
+    "field_detection",
+    "scoring",
+    "ats_features",
+)
+
+# (name, file type, corpus length, columns, link heavy)
+CORPUS_SPECS = (
+    ("short_pdf", "pdf", "short", 1, False),
+    ("long_pdf", "pdf", "long", 1, False),
+    ("short_docx", "docx", "short", 1, False),
+    ("long_docx", "docx", "long", 1, False),
+    ("two_column_pdf", "pdf", "short", 2, False),
+    ("two_column_docx", "docx", "short", 2, False),
+    ("links_pdf", "pdf", "short", 1, True),
+    ("links_docx", "docx", "short", 1, True),
+)
+# Extra URLs listed by the link-heavy resumes
+LINK_HOSTS = ("github.com", "portfolio.dev")
+LINKS_PER_HOST = 12
+
+
+def build_corpus(seed=0):
+    """The fixed benchmark corpus: ``[(name, file_type, data), ...]``.
+
+    Content and rendering are the corpus generator's (``corpus.make_resume``
+    and its renderers), one resume per ``CORPUS_SPECS`` entry.
+    """
+    from profile_analyser.corpus import make_resume, render_docx, render_pdf
+
+    corpus = []
+    for index, (name, file_type, length, columns, link_heavy) in enumerate(CORPUS_SPECS):
+        rng = random.Random(seed * 1000 + index)
+        sections, _ = make_resume(rng, length=length)
+        if link_heavy:
+            handle = sections["email"].split("@")[0]
+            urls = [f"https://{host}/{handle}/{i}" for i in range(LINKS_PER_HOST) for host in LINK_HOSTS]
+            sections["projects"] += "\n" + "\n".join(urls)
+        data = render_pdf(sections, columns)[0] if file_type == "pdf" else render_docx(sections, columns)
+        corpus.append((name, file_type, data))
+    return corpus
+
+
+def clear_caches():
+    """Drop every per-text memo so the next analysis starts cold."""
+    from profile_analyser import document, scoring
+
+    document._document.cache_clear()
+    scoring._text_scores.cache_clear()
+
+
+def _pipeline(data, file_type):
+    """Run every stage once; return ``{stage: seconds}``."""
+    from profile_analyser.extract import extract_text_from_file
+    from profile_analyser.extractors import (
+        extract_certifications_enhanced,
+        extract_education_info,
+        extract_personal_info,
+        extract_projects,
+        extract_skills_enhanced,
+    )
+    from profile_analyser.scoring import detect_field, dynamic_resume_score, extract_ats_features
+
+    timings = {}
+    clock = time.perf_counter
+
+    start = clock()
+    text = extract_text_from_file(data, file_type)
+    timings["extract_text"] = clock() - start
+
+    start = clock()
+    info = extract_personal_info(text)
+    timings["personal_info"] = clock() - start
+    for stage, extractor, key in (
+        ("education", extract_education_info, "education"),
+        ("skills", extract_skills_enhanced, "skills"),
+        ("certifications", extract_certifications_enhanced, "certifications"),
+        ("projects", extract_projects, "projects"),
+    ):
+        start = clock()
+        info[key] = extractor(text)
+        timings[stage] = clock() - start
+
+    start = clock()
+    field = detect_field(text)
+    timings["field_detection"] = clock() - start
+
+    start = clock()
+    dynamic_resume_score(text, info, field)
+    timings["scoring"] = clock() - start
+
+    start = clock()
+    extract_ats_features(text, info, field)
+    timings["ats_features"] = clock() - start
+    return timings
+
+
+def percentile(values, q):
+    """Nearest-rank percentile of ``values`` (``q`` in 0-100)."""
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    rank = max(1, -(-q * len(ordered) // 100))
+    return ordered[int(rank) - 1]
+
+
+def peak_rss_mb():
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def run(iterations=DEFAULT_ITERATIONS, seed=0, warmup=True):
+    """Benchmark the pipeline and return the report dict."""
+    corpus = build_corpus(seed)
+    if warmup:
+        # Load spaCy, PyMuPDF and python-docx outside the measurements
+        for _, file_type, data in corpus:
+            _pipeline(data, file_type)
+    samples = {stage: [] for stage in STAGES}
+    per_doc = {name: [] for name, _, _ in corpus}
+    wall = 0.0
+    for _ in range(iterations):
+        for name, file_type, data in corpus:
+            clear_caches()
+            start = time.perf_counter()
+            timings = _pipeline(data, file_type)
+            elapsed = time.perf_counter() - start
+            wall += elapsed
+            per_doc[name].append(elapsed)
+            for stage, seconds in timings.items():
+                samples[stage].append(seconds)
+
+    def summary(values):
+        ms = [v * 1000 for v in values]
+        return {
+            "p50_ms": round(percentile(ms, 50), 3),
+            "p90_ms": round(percentile(ms, 90), 3),
+            "p99_ms": round(percentile(ms, 99), 3),
+            "mean_ms": round(sum(ms) / len(ms), 3) if ms else 0.0,
+        }
+
+    analyzed = iterations * len(corpus)
+    return {
+        "version": BENCH_VERSION,
+        "seed": seed,
+        "iterations": iterations,
+        "corpus": {name: {"type": file_type, "bytes": len(data)} for name, file_type, data in corpus},
+        "stages": {stage: summary(values) for stage, values in samples.items()},
+        "documents": {name: summary(values) for name, values in per_doc.items()},
+        "throughput_per_s": round(analyzed / wall, 2) if wall else 0.0,
+        "peak_rss_mb": peak_rss_mb(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+    }
+
+
+def compare(report, baseline, tolerance=DEFAULT_TOLERANCE):
+    """Regressions of ``report`` against ``baseline`` as human-readable strings."""
+    if baseline.get("version") != report["version"]:
+        # Another corpus or stage set: the timings do not compare
+        return [f"baseline is from bench version {baseline.get('version')}, this run is {report['version']}; "
+                "store a new baseline"]
+    regressions = []
+    for stage, stats in report["stages"].items():
+        base = baseline.get("stages", {}).get(stage)
+        if not base:
+            continue
+        for key in ("p50_ms", "p90_ms"):
+            new, old = stats[key], base[key]
+            if new > old * (1 + tolerance) and new - old > NOISE_FLOOR_MS:
+                regressions.append(f"{stage} {key}: {old:.3f} -> {new:.3f} ms (+{(new / old - 1) * 100 if old else 100:.0f}%)")
+    old_rate, new_rate = baseline.get("throughput_per_s"), report["throughput_per_s"]
+    if old_rate and new_rate < old_rate * (1 - tolerance):
+        regressions.append(f"throughput: {old_rate:.2f} -> {new_rate:.2f} resumes/s")
+    old_rss, new_rss = baseline.get("peak_rss_mb"), report["peak_rss_mb"]
+    if old_rss and new_rss and new_rss > old_rss * (1 + tolerance):
+        regressions.append(f"peak RSS: {old_rss:.1f} -> {new_rss:.1f} MB")
+    return regressions
+
+
+def format_report(report):
+    lines = [f"{'stage':<16}{'p50 ms':>10}{'p90 ms':>10}{'p99 ms':>10}{'mean ms':>10}"]
+    for stage, stats in report["stages"].items():
+        lines.append(
+            f"{stage:<16}{stats['p50_ms']:>10.3f}{stats['p90_ms']:>10.3f}{stats['p99_ms']:>10.3f}{stats['mean_ms']:>10.3f}"
+        )
+    lines.append(f"Throughput {report['throughput_per_s']:.2f} resumes/s, peak RSS {report['peak_rss_mb']} MB")
+    return "\n".join(lines)
+
+
+def load_report(path):
+    try:
+        with open(path, encoding="utf-8") as fh:
+            return json.load(fh)
+    except (OSError, ValueError) as e:
+        raise SystemExit(f"Cannot read benchmark baseline {path}: {e}")
+
+
+def save_report(report, path):
+    with open(path, "w", encoding="utf-8") as fh:
+        json.dump(report, fh, indent=2)
+        fh.write("\n")
@@ -0,0 +1,259 @@
+"""Process-wide, content-addressed store for uploaded file bytes.
+
+Sessions keep only the SHA-256 of each upload (``put`` returns it) and read
+the bytes back with ``get`` when a page needs them, so a resume uploaded by
+many sessions, or twice by one, is held once per server process.
+
+Entries are reference counted (``put`` acquires, ``release`` drops a
+reference) and bounded two ways:
+
+* memory: past ``max_memory_bytes`` the least recently used entries spill to
+  a private directory on local disk and are read back from there;
+* disk: past ``max_disk_bytes``, or once unreferenced and idle for ``ttl``
+  seconds, entries are deleted.  Streamlit gives no hook when a session goes
+  away, so referenced entries idle for ``orphan_ttl`` are deleted as well.
+
+A deleted entry makes ``get`` raise ``KeyError``; the UI then asks for the
+file again.
+"""
+import atexit
+import os
+import shutil
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+
+from profile_analyser.cache import file_digest
+
+DEFAULT_MAX_MEMORY = int(os.environ.get("PROFILE_ANALYSER_BLOB_MEMORY", str(64 * 1024 * 1024)))
+DEFAULT_MAX_DISK = int(os.environ.get("PROFILE_ANALYSER_BLOB_DISK", str(1024 * 1024 * 1024)))
+DEFAULT_TTL = float(os.environ.get("PROFILE_ANALYSER_BLOB_TTL", "3600"))
+DEFAULT_ORPHAN_TTL = float(os.environ.get("PROFILE_ANALYSER_BLOB_ORPHAN_TTL", str(24 * 3600)))
+BLOB_DIR = os.environ.get("PROFILE_ANALYSER_BLOB_DIR") or None
+
+
+class _Blob:
+    __slots__ = ("size", "data", "path", "refs", "touched", "spilling")
+
+    def __init__(self, data):
+        self.size = len(data)
+        self.data = data
+        self.path = None
+        self.refs = 0
+        self.touched = time.monotonic()
+        # Being written to disk: accounted there already, still served from data
+        self.spilling = False
+
+
+class BlobStore:
+    """Deduplicated, refcounted bytes keyed by SHA-256, spilling cold entries to disk."""
+
+    def __init__(self, max_memory_bytes=DEFAULT_MAX_MEMORY, max_disk_bytes=DEFAULT_MAX_DISK,
+                 ttl=DEFAULT_TTL, orphan_ttl=DEFAULT_ORPHAN_TTL, directory=BLOB_DIR):
+        self.max_memory_bytes = max_memory_bytes
+        self.max_disk_bytes = max_disk_bytes
+        self.ttl = ttl
+        self.orphan_ttl = orphan_ttl
+        self._base_dir = directory
+        self._dir = None
+        self._entries = OrderedDict()  # digest -> _Blob, least recently used first
+        self._lock = threading.Lock()
+        self.memory_bytes = 0
+        self.disk_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.dedup_hits = 0
+        self.spills = 0
+        self.evictions = 0
+
+    def __contains__(self, digest):
+        with self._lock:
+            return digest in self._entries
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    def put(self, data):
+        """Store ``data`` (or find the copy already stored), take a reference, return its digest."""
+        data = bytes(data or b"")
+        digest = file_digest(data)
+        with self._lock:
+            blob = self._entries.get(digest)
+            if blob is None:
+                blob = self._entries[digest] = _Blob(data)
+                self.memory_bytes += blob.size
+            else:
+                self.dedup_hits += 1
+                self._entries.move_to_end(digest)
+            blob.refs += 1
+            blob.touched = time.monotonic()
+            spills = self._enforce_locked()
+        self._spill(spills)
+        return digest
+
+    def acquire(self, digest):
+        """Take another reference to a stored entry; False if it is gone."""
+        with self._lock:
+            blob = self._entries.get(digest)
+            if blob is None:
+                return False
+            blob.refs += 1
+            blob.touched = time.monotonic()
+            return True
+
+    def release(self, digest):
+        """Drop one reference; unreferenced entries expire after ``ttl``."""
+        with self._lock:
+            blob = self._entries.get(digest)
+            if blob is not None and blob.refs > 0:
+                blob.refs -= 1
+            spills = self._enforce_locked()
+        self._spill(spills)
+
+    def get(self, digest):
+        """The stored bytes; raises ``KeyError`` if the entry was evicted."""
+        with self._lock:
+            blob = self._entries.get(digest)
+            if blob is None:
+                raise KeyError(digest)
+            blob.touched = time.monotonic()
+            self._entries.move_to_end(digest)
+            if blob.data is not None:
+                self.hits += 1
+                return blob.data
+            self.misses += 1
+            path = blob.path
+        # Read outside the lock; a concurrent eviction deletes the file and
+        # the entry is then reported as gone
+        try:
+            # Callers need bytes: a plain read is one copy, as an mmap slice would be
+            with open(path, "rb") as fh:
+                return fh.read()
+        except OSError:
+            raise KeyError(digest) from None
+
+    def sweep(self):
+        """Apply the TTLs and size limits now (they are also applied on every put/release)."""
+        with self._lock:
+            spills = self._enforce_locked()
+        self._spill(spills)
+
+    def clear(self):
+        with self._lock:
+            for digest in list(self._entries):
+                self._drop_locked(digest)
+
+    def stats(self):
+        with self._lock:
+            reads = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "spilled": sum(blob.data is None for blob in self._entries.values()),
+                "memory_bytes": self.memory_bytes,
+                "disk_bytes": self.disk_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "dedup_hits": self.dedup_hits,
+                "spills": self.spills,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / reads, 3) if reads else 0.0,
+            }
+
+    def _directory(self):
+        if self._dir is None:
+            if self._base_dir:
+                os.makedirs(self._base_dir, exist_ok=True)
+            # Private per-process directory: refcounts do not survive a restart
+            self._dir = tempfile.mkdtemp(prefix="profile_analyser_blobs_", dir=self._base_dir)
+            atexit.register(shutil.rmtree, self._dir, True)
+        return self._dir
+
+    def _drop_locked(self, digest):
+        blob = self._entries.pop(digest)
+        if blob.data is None or blob.spilling:
+            self.disk_bytes -= blob.size
+        else:
+            self.memory_bytes -= blob.size
+        if blob.path is not None:
+            try:
+                os.remove(blob.path)
+            except OSError:
+                pass
+        self.evictions += 1
+
+    def _spill(self, spills):
+        """Write the entries ``_enforce_locked`` marked for spilling, outside the lock."""
+        if not spills:
+            return
+        with self._lock:
+            directory = self._directory()
+        for digest, blob in spills:
+            try:
+                fd, path = tempfile.mkstemp(prefix=digest, dir=directory)
+                with os.fdopen(fd, "wb") as fh:
+                    fh.write(blob.data)
+            except OSError:
+                path = None
+            with self._lock:
+                blob.spilling = False
+                if self._entries.get(digest) is blob:
+                    if path is not None:
+                        blob.path = path
+                        blob.data = None
+                        self.spills += 1
+                    else:
+                        # Could not write it: keep it in memory
+                        self.disk_bytes -= blob.size
+                        self.memory_bytes += blob.size
+                    continue
+            # Dropped while it was being written
+            if path is not None:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
+    def _enforce_locked(self):
+        """Apply the TTLs and bounds; return the ``(digest, blob)`` pairs to pass to ``_spill``.
+
+        Spilled entries are accounted on disk from here on, but keep serving
+        their bytes from memory until ``_spill`` has written them, so no
+        caller waits for the disk behind the store's lock.
+        """
+        now = time.monotonic()
+        for digest, blob in list(self._entries.items()):
+            idle = now - blob.touched
+            if (blob.refs == 0 and idle > self.ttl) or idle > self.orphan_ttl:
+                self._drop_locked(digest)
+        # Coldest first; empty entries cost nothing to keep in memory
+        spills = []
+        for digest, blob in list(self._entries.items()):
+            if self.memory_bytes <= self.max_memory_bytes:
+                break
+            if blob.data is not None and blob.size and not blob.spilling:
+                blob.spilling = True
+                self.memory_bytes -= blob.size
+                self.disk_bytes += blob.size
+                spills.append((digest, blob))
+        for digest, blob in list(self._entries.items()):
+            if self.disk_bytes <= self.max_disk_bytes:
+                break
+            if blob.data is None or blob.spilling:
+                self._drop_locked(digest)
+        return [(digest, blob) for digest, blob in spills if self._entries.get(digest) is blob]
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_blob_store():
+    """Process-wide BlobStore shared by every Streamlit session."""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = BlobStore()
+    return _store
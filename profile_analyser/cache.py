@@ -0,0 +1,166 @@
+"""Server-wide, content-addressed cache of parsed resumes.
+
+Entries are keyed by the SHA-256 of the uploaded file bytes, so the same
+resume uploaded twice (by one session or by many) is extracted, parsed and
+scored exactly once per server process.  Eviction is LRU, bounded both by the
+number of entries and by an approximate memory footprint.
+"""
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+
+DEFAULT_MAX_ENTRIES = int(os.environ.get("PROFILE_ANALYSER_CACHE_ENTRIES", "256"))
+DEFAULT_MAX_BYTES = int(os.environ.get("PROFILE_ANALYSER_CACHE_BYTES", str(64 * 1024 * 1024)))
+
+
+def file_digest(data):
+    """SHA-256 hex digest used as the cache key for a file's bytes."""
+    return hashlib.sha256(data or b"").hexdigest()
+
+
+def approx_size(obj):
+    """Rough in-memory size of a cached value (strings dominate)."""
+    if hasattr(obj, "approx_size"):
+        return obj.approx_size()
+    if isinstance(obj, (str, bytes)):
+        return len(obj)
+    if isinstance(obj, dict):
+        return sum(approx_size(k) + approx_size(v) for k, v in obj.items())
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        return sum(approx_size(v) for v in obj)
+    return 8
+
+
+class ParseCache:
+    """Thread-safe LRU cache with entry-count and size limits.
+
+    ``get_or_compute`` holds a per-key lock while computing, so concurrent
+    requests for the same digest wait for the first one instead of parsing the
+    file again.
+    """
+
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._sizes = {}
+        self._total = 0
+        self._lock = threading.Lock()
+        self._inflight = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._entries
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    def get(self, key):
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        size = approx_size(value)
+        with self._lock:
+            if key in self._entries:
+                self._total -= self._sizes.pop(key)
+                del self._entries[key]
+            if size > self.max_bytes:
+                # Too large to cache at all; do not flush everything else for it
+                return value
+            self._entries[key] = value
+            self._sizes[key] = size
+            self._total += size
+            self._evict_locked()
+        return value
+
+    def resize(self, key, size):
+        """Re-account ``key`` at ``size`` bytes (its value grew in place) and evict as needed."""
+        with self._lock:
+            if key not in self._entries:
+                return
+            self._total += size - self._sizes[key]
+            self._sizes[key] = size
+            if size > self.max_bytes:
+                # Same rule as put: too large to cache at all
+                del self._entries[key]
+                self._total -= self._sizes.pop(key)
+                self.evictions += 1
+                return
+            self._evict_locked()
+
+    def get_or_compute(self, key, compute):
+        """Return the cached value for ``key``, computing it at most once."""
+        value = self.get(key)
+        if value is not None:
+            return value
+        with self._lock:
+            key_lock = self._inflight.setdefault(key, threading.Lock())
+        with key_lock:
+            with self._lock:
+                value = self._entries.get(key)
+                if value is not None:
+                    # Another caller finished parsing while we waited
+                    self._entries.move_to_end(key)
+                    self.misses -= 1
+                    self.hits += 1
+            if value is None:
+                value = self.put(key, compute())
+        with self._lock:
+            self._inflight.pop(key, None)
+        return value
+
+    def discard(self, key):
+        with self._lock:
+            if key in self._entries:
+                del self._entries[key]
+                self._total -= self._sizes.pop(key)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._sizes.clear()
+            self._total = 0
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._total,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            }
+
+    def _evict_locked(self):
+        while self._entries and (len(self._entries) > self.max_entries or self._total > self.max_bytes):
+            old_key, _ = self._entries.popitem(last=False)
+            self._total -= self._sizes.pop(old_key)
+            self.evictions += 1
+
+
+_parse_cache = None
+_parse_cache_lock = threading.Lock()
+
+
+def get_parse_cache():
+    """Process-wide ParseCache shared by every Streamlit session."""
+    global _parse_cache
+    if _parse_cache is None:
+        with _parse_cache_lock:
+            if _parse_cache is None:
+                _parse_cache = ParseCache()
+    return _parse_cache
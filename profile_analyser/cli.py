@@ -0,0 +1,435 @@
+"""Headless batch scoring: ``python -m profile_analyser score <dir|file>... -o results.jsonl``.
+
+Runs the same pipeline as the UI (extract_info, detect_field,
+dynamic_resume_score, extract_ats_features) over folders or manifests of
+PDF/DOCX files on a process pool and streams one record per file to JSONL or
+Parquet.  Records are written in input order as soon as they are ready, so
+memory stays bounded however many files are scored.
+
+``python -m profile_analyser match <resumes> --jobs <jds>`` ranks resumes
+against job descriptions (text files) with the sparse similarity engine.
+
+``python -m profile_analyser export <resumes> -o improved.zip`` renders the
+Resume Generator's improved resume for every file, in parallel, into a ZIP
+(or one combined PDF with ``-o improved.pdf``).
+
+``python -m profile_analyser corpus generate|evaluate`` builds and checks a
+synthetic, labelled resume corpus (see profile_analyser.corpus).
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, wait
+from itertools import islice
+
+from profile_analyser.batch import DEFAULT_WORKERS, analyze_resumes, chunk_items, get_executor
+from profile_analyser.extract import ExtractionError, extract_text_from_file
+from profile_analyser.nlp import BATCH_SIZE, N_PROCESS
+from profile_analyser.scoring import extract_ats_features
+
+SUPPORTED_TYPES = ("pdf", "docx")
+JOB_TYPES = ("txt", "md")
+PARQUET_BATCH_ROWS = 1000
+
+
+def iter_inputs(paths, manifest=None, types=SUPPORTED_TYPES):
+    """Yield resume file paths from files, directories (recursively) and a manifest."""
+    sources = list(paths)
+    if manifest:
+        with open(manifest, encoding="utf-8") as fh:
+            sources.extend(line.strip() for line in fh if line.strip() and not line.startswith("#"))
+    for source in sources:
+        if os.path.isdir(source):
+            for root, dirs, names in os.walk(source):
+                dirs.sort()
+                for name in sorted(names):
+                    if name.rsplit(".", 1)[-1].lower() in types:
+                        yield os.path.join(root, name)
+        else:
+            yield source
+
+
+def score_file(path, include_text=False):
+    """Analyze one resume on disk and return a JSON-serialisable record."""
+    return score_chunk([path], include_text)[0]
+
+
+def score_chunk(paths, include_text=False, n_process=1):
+    """``score_file`` for several paths; their NER runs as one ``nlp.pipe`` batch.
+
+    ``seconds`` is the chunk's wall time shared evenly by the files read.
+    """
+    records = []
+    readable = []
+    items = []
+    for path in paths:
+        record = {"path": path}
+        records.append(record)
+        try:
+            with open(path, "rb") as fh:
+                items.append((fh.read(), path.rsplit(".", 1)[-1].lower()))
+        except OSError as e:
+            record["error"] = f"Error reading {path}: {e}"
+            continue
+        readable.append(record)
+    start = time.perf_counter()
+    # analyze_resumes already reports a failing file in its own "error"
+    results = []
+    for analysis, (_, file_type) in zip(analyze_resumes(items, n_process), items):
+        try:
+            results.append((analysis, extract_ats_features(analysis["text"], analysis["info"], analysis["field"]), analysis["error"]))
+        except Exception as e:
+            results.append((analysis, None, analysis["error"] or f"Error analyzing {file_type.upper()}: {e}"))
+    seconds = round((time.perf_counter() - start) / max(1, len(items)), 4)
+    for record, (analysis, ats_features, error) in zip(readable, results):
+        record.update(
+            field=analysis["field"],
+            score=analysis["score"],
+            breakdown=analysis["breakdown"],
+            info=analysis["info"],
+            ats_features=ats_features,
+            error=error,
+            layout=analysis["layout"].kind if analysis["layout"] else None,
+            seconds=seconds,
+        )
+        if include_text:
+            record["text"] = analysis["text"]
+    return records
+
+
+def read_text(path):
+    """Text of a resume (PDF/DOCX) or plain-text job description; "" if unreadable."""
+    file_type = path.rsplit(".", 1)[-1].lower()
+    try:
+        if file_type not in SUPPORTED_TYPES:
+            with open(path, encoding="utf-8", errors="replace") as fh:
+                return fh.read()
+        with open(path, "rb") as fh:
+            return extract_text_from_file(fh.read(), file_type)
+    except (OSError, ExtractionError):
+        return ""
+
+
+def score_files(paths, max_workers=DEFAULT_WORKERS, include_text=False):
+    """Yield records for ``paths`` in input order, scoring up to ``max_workers`` chunks at once.
+
+    Paths are read ahead ``max_workers * nlp.BATCH_SIZE`` at a time and split
+    into a chunk per worker, so each worker batches its files' NER.
+    """
+    paths = iter(paths)
+
+    def chunks():
+        while True:
+            ahead = list(islice(paths, max(1, max_workers) * BATCH_SIZE))
+            if not ahead:
+                return
+            yield from chunk_items(ahead, max_workers)
+
+    if max_workers <= 1:
+        for chunk in chunks():
+            yield from score_chunk(chunk, include_text, N_PROCESS)
+        return
+    executor = get_executor(max_workers)
+    window = 2 * max_workers
+    pending_chunks = chunks()
+    running = {}
+    ready = {}
+    submitted = emitted = 0
+    exhausted = False
+    while True:
+        # Bound submitted-but-unwritten work so a slow chunk cannot grow the buffer
+        while not exhausted and submitted - emitted < window:
+            chunk = next(pending_chunks, None)
+            if chunk is None:
+                exhausted = True
+                break
+            running[executor.submit(score_chunk, chunk, include_text)] = (submitted, chunk)
+            submitted += 1
+        if not running:
+            break
+        finished, _ = wait(running, return_when=FIRST_COMPLETED)
+        for future in finished:
+            index, chunk = running.pop(future)
+            try:
+                ready[index] = future.result()
+            except Exception as e:
+                # The worker itself failed (e.g. it crashed on a file): the
+                # chunk's files get the error, the run goes on
+                ready[index] = [{"path": path, "error": f"Error scoring {path}: {e}"} for path in chunk]
+        while emitted in ready:
+            yield from ready.pop(emitted)
+            emitted += 1
+
+
+class JsonlWriter:
+    def __init__(self, path):
+        self._fh = sys.stdout if path in (None, "-") else open(path, "w", encoding="utf-8")
+
+    def write(self, record):
+        self._fh.write(json.dumps(record, default=str) + "\n")
+
+    def close(self):
+        if self._fh is sys.stdout:
+            self._fh.flush()
+        else:
+            self._fh.close()
+
+
+class ParquetWriter:
+    """Flat Parquet rows; nested fields (info, breakdown, ATS features) are stored as JSON strings."""
+
+    COLUMNS = ("path", "name", "email", "field", "score", "error", "layout", "seconds", "info", "breakdown", "ats_features", "text")
+
+    def __init__(self, path):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise SystemExit("Parquet output needs pyarrow (pip install pyarrow); use a .jsonl output instead")
+        self._pa = pa
+        self._schema = pa.schema(
+            [(name, pa.int64() if name == "score" else pa.float64() if name == "seconds" else pa.string()) for name in self.COLUMNS]
+        )
+        self._writer = pq.ParquetWriter(path, self._schema)
+        self._rows = []
+
+    def write(self, record):
+        info = record.get("info") or {}
+        self._rows.append({
+            "path": record["path"],
+            "name": info.get("name"),
+            "email": info.get("email"),
+            "field": record.get("field"),
+            "score": record.get("score"),
+            "error": record.get("error"),
+            "layout": record.get("layout"),
+            "seconds": record.get("seconds"),
+            "info": json.dumps(info, default=str),
+            "breakdown": json.dumps(record.get("breakdown"), default=str),
+            "ats_features": json.dumps(record.get("ats_features"), default=str),
+            "text": record.get("text"),
+        })
+        if len(self._rows) >= PARQUET_BATCH_ROWS:
+            self._flush()
+
+    def _flush(self):
+        if self._rows:
+            self._writer.write_table(self._pa.Table.from_pylist(self._rows, schema=self._schema))
+            self._rows = []
+
+    def close(self):
+        self._flush()
+        self._writer.close()
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m profile_analyser", description="ProFile Analyser headless tools")
+    commands = parser.add_subparsers(dest="command", required=True)
+    score = commands.add_parser("score", help="Score a folder or manifest of PDF/DOCX resumes")
+    score.add_argument("inputs", nargs="*", help="Resume files or directories (searched recursively)")
+    score.add_argument("-m", "--manifest", help="Text file with one resume path per line")
+    score.add_argument("-o", "--output", default="-", help="Output file (.jsonl or .parquet); default: JSONL on stdout")
+    score.add_argument("-f", "--format", choices=("jsonl", "parquet"), help="Output format (default: from the output extension)")
+    score.add_argument("-w", "--workers", type=int, default=DEFAULT_WORKERS, help=f"Worker processes (default: {DEFAULT_WORKERS})")
+    score.add_argument("--include-text", action="store_true", help="Include the extracted resume text in each record")
+    score.add_argument("-q", "--quiet", action="store_true", help="Do not print progress to stderr")
+    ranking = commands.add_parser("match", help="Rank resumes against job descriptions (TF-IDF or BM25)")
+    ranking.add_argument("inputs", nargs="*", help="Resume files or directories (searched recursively)")
+    ranking.add_argument("-m", "--manifest", help="Text file with one resume path per line")
+    ranking.add_argument("-j", "--jobs", nargs="+", required=True, help="Job description text files or directories")
+    ranking.add_argument("-o", "--output", default="-", help="JSONL output file (default: stdout)")
+    ranking.add_argument("--method", choices=("tfidf", "bm25"), default="bm25", help="Term weighting (default: bm25)")
+    ranking.add_argument("-k", "--top", type=int, default=10, help="Resumes to keep per job (default: 10)")
+    ranking.add_argument("-w", "--workers", type=int, default=DEFAULT_WORKERS, help=f"Worker processes for text extraction (default: {DEFAULT_WORKERS})")
+    export = commands.add_parser("export", help="Render improved resumes for many files into a ZIP or one combined PDF")
+    export.add_argument("inputs", nargs="*", help="Resume files or directories (searched recursively)")
+    export.add_argument("-m", "--manifest", help="Text file with one resume path per line")
+    export.add_argument("-o", "--output", required=True, help="Output .zip (one PDF per resume) or .pdf (all resumes in one file)")
+    export.add_argument("--columns", type=int, choices=(1, 2), default=1, help="Page columns (default: 1)")
+    export.add_argument("-w", "--workers", type=int, default=DEFAULT_WORKERS, help=f"Worker processes (default: {DEFAULT_WORKERS})")
+    export.add_argument("-q", "--quiet", action="store_true", help="Do not print progress to stderr")
+    bench = commands.add_parser("bench", help="Benchmark the extraction and scoring pipeline on a fixed corpus")
+    bench.add_argument("-n", "--iterations", type=int, default=5, help="Passes over the corpus (default: 5)")
+    bench.add_argument("--seed", type=int, default=0, help="Corpus seed (default: 0)")
+    bench.add_argument("-o", "--output", default="-", help="JSON report file (default: stdout)")
+    bench.add_argument("--baseline", help="Stored report to compare against; exit 1 on regressions")
+    bench.add_argument("--tolerance", type=float, help="Allowed slowdown as a fraction (default: 0.25)")
+    corpus = commands.add_parser("corpus", help="Generate or evaluate a synthetic resume corpus with ground-truth labels")
+    corpus_commands = corpus.add_subparsers(dest="corpus_command", required=True)
+    generate = corpus_commands.add_parser("generate", help="Write seeded PDF/DOCX resumes and labels.jsonl")
+    generate.add_argument("output", help="Output directory")
+    generate.add_argument("-n", "--count", type=int, default=100, help="Resumes to generate (default: 100)")
+    generate.add_argument("--seed", type=int, default=0, help="Corpus seed (default: 0)")
+    generate.add_argument("--formats", nargs="+", choices=("pdf", "docx"), default=["pdf", "docx"], help="File types to mix (default: both)")
+    generate.add_argument("--length", nargs="+", choices=("short", "medium", "long"), default=["medium"], help="Lengths to mix (default: medium)")
+    generate.add_argument("--columns", nargs="+", type=int, choices=(1, 2), default=[1], help="Column layouts to mix (default: 1)")
+    generate.add_argument("--pages", type=int, help="Target page count (grows the experience section to fit)")
+    generate.add_argument("--noise", type=float, default=0.0, help="Probability of typos/casing/whitespace noise per line and of a running footer (default: 0)")
+    generate.add_argument("--field", help="Generate every resume for this field")
+    generate.add_argument("-q", "--quiet", action="store_true", help="Do not print progress to stderr")
+    evaluation = corpus_commands.add_parser("evaluate", help="Score a generated corpus and compare with its labels")
+    evaluation.add_argument("corpus", help="Directory written by 'corpus generate'")
+    evaluation.add_argument("-w", "--workers", type=int, default=DEFAULT_WORKERS, help=f"Worker processes (default: {DEFAULT_WORKERS})")
+    budget = commands.add_parser("import-check", help="Fail if importing the analysis core exceeds its time budget")
+    budget.add_argument("modules", nargs="*", help="Modules to import (default: the analysis core)")
+    budget.add_argument("--budget-ms", type=float, help="Allowed import time in milliseconds")
+    return parser
+
+
+def run_score(args):
+    if not args.inputs and not args.manifest:
+        raise SystemExit("Nothing to score: pass resume files/directories or --manifest")
+    fmt = args.format or ("parquet" if str(args.output).endswith(".parquet") else "jsonl")
+    if fmt == "parquet" and args.output == "-":
+        raise SystemExit("Parquet output needs a file name (-o results.parquet)")
+    writer = ParquetWriter(args.output) if fmt == "parquet" else JsonlWriter(args.output)
+    start = time.perf_counter()
+    done = errors = 0
+    try:
+        for record in score_files(iter_inputs(args.inputs, args.manifest), args.workers, args.include_text):
+            writer.write(record)
+            done += 1
+            errors += bool(record.get("error"))
+            if not args.quiet and done % 100 == 0:
+                print(f"Scored {done} resumes ({done / (time.perf_counter() - start):.1f}/s)", file=sys.stderr)
+    finally:
+        writer.close()
+    if not args.quiet:
+        elapsed = time.perf_counter() - start
+        print(f"Scored {done} resumes in {elapsed:.1f}s, {errors} with errors", file=sys.stderr)
+    return 1 if errors and errors == done else 0
+
+
+def run_match(args):
+    from profile_analyser.similarity import match
+
+    if not args.inputs and not args.manifest:
+        raise SystemExit("Nothing to match: pass resume files/directories or --manifest")
+    resumes = list(iter_inputs(args.inputs, args.manifest))
+    jobs = list(iter_inputs(args.jobs, types=JOB_TYPES))
+    if args.workers > 1 and len(resumes) > 1:
+        resume_texts = list(get_executor(args.workers).map(read_text, resumes, chunksize=16))
+    else:
+        resume_texts = [read_text(path) for path in resumes]
+    result = match(resume_texts, [read_text(path) for path in jobs], method=args.method)
+    writer = JsonlWriter(args.output)
+    try:
+        for j, job in enumerate(jobs):
+            for rank, (r, score) in enumerate(result.top_resumes(j, args.top), 1):
+                terms = [term for term, _ in result.contributions(r, j, 5)]
+                writer.write({"job": job, "rank": rank, "resume": resumes[r], "score": round(score, 4), "terms": terms})
+    finally:
+        writer.close()
+    return 0
+
+
+def run_export(args):
+    from profile_analyser.constants import SKILL_KEYWORDS
+    from profile_analyser.render import RenderError, export_combined, export_zip, sections_from_info
+
+    if not args.inputs and not args.manifest:
+        raise SystemExit("Nothing to export: pass resume files/directories or --manifest")
+    combined = args.output.lower().endswith(".pdf")
+    if not combined and not args.output.lower().endswith(".zip"):
+        raise SystemExit("Output must be a .zip or .pdf file")
+    start = time.perf_counter()
+    resumes, names, errors = [], [], 0
+    for record in score_files(iter_inputs(args.inputs, args.manifest), args.workers):
+        if record.get("error") or "info" not in record:
+            errors += 1
+            print(f"Skipping {record['path']}: {record.get('error')}", file=sys.stderr)
+            continue
+        field = record["field"]
+        resumes.append(sections_from_info(record["info"], field, SKILL_KEYWORDS.get(field, [])))
+        stem = os.path.splitext(os.path.basename(record["path"]))[0]
+        names.append(f"{stem.replace(' ', '_')}_Professional_Resume.pdf")
+    try:
+        data = export_combined(resumes, args.columns) if combined else export_zip(resumes, names, args.columns, args.workers)
+    except RenderError as e:
+        raise SystemExit(str(e))
+    with open(args.output, "wb") as fh:
+        fh.write(data)
+    if not args.quiet:
+        print(f"Rendered {len(resumes)} resumes into {args.output} in {time.perf_counter() - start:.1f}s, {errors} skipped", file=sys.stderr)
+    return 1 if errors and not resumes else 0
+
+
+def run_bench(args):
+    from profile_analyser import bench
+
+    report = bench.run(iterations=args.iterations, seed=args.seed)
+    print(bench.format_report(report), file=sys.stderr)
+    if args.output == "-":
+        print(json.dumps(report, indent=2))
+    else:
+        bench.save_report(report, args.output)
+    if not args.baseline:
+        return 0
+    tolerance = args.tolerance if args.tolerance is not None else bench.DEFAULT_TOLERANCE
+    regressions = bench.compare(report, bench.load_report(args.baseline), tolerance)
+    for regression in regressions:
+        print(f"REGRESSION {regression}", file=sys.stderr)
+    if not regressions:
+        print(f"No regressions against {args.baseline} (tolerance {tolerance:.0%})", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+def run_corpus(args):
+    from profile_analyser import corpus
+
+    if args.corpus_command == "evaluate":
+        print(json.dumps(corpus.evaluate(args.corpus, args.workers), indent=2))
+        return 0
+    if args.field and args.field not in corpus.FIELDS:
+        raise SystemExit(f"Unknown field {args.field!r}; expected one of: {', '.join(corpus.FIELDS)}")
+    options = dict(
+        formats=tuple(args.formats),
+        columns=tuple(args.columns),
+        lengths=tuple(args.length),
+        pages=args.pages,
+        noise=args.noise,
+        field=args.field,
+    )
+    start = time.perf_counter()
+    for done, _ in enumerate(corpus.generate(args.output, args.count, args.seed, **options), 1):
+        if not args.quiet and done % 100 == 0:
+            print(f"Generated {done} resumes ({done / (time.perf_counter() - start):.1f}/s)", file=sys.stderr)
+    if not args.quiet:
+        print(f"Generated {args.count} resumes in {time.perf_counter() - start:.1f}s into {args.output}", file=sys.stderr)
+    return 0
+
+
+def run_import_check(args):
+    from profile_analyser import importcheck
+
+    budget_ms = args.budget_ms if args.budget_ms is not None else importcheck.DEFAULT_BUDGET_MS
+    ok, report = importcheck.check(budget_ms, tuple(args.modules) or importcheck.CORE_MODULES)
+    for name, micros in sorted(report["modules"].items(), key=lambda item: -item[1]):
+        print(f"{micros / 1000:8.1f} ms  {name}")
+    print(f"Total {report['milliseconds']:.1f} ms (budget {budget_ms:.0f} ms)")
+    if report["heavy"]:
+        print(f"Heavy modules imported eagerly: {', '.join(report['heavy'])}")
+    return 0 if ok else 1
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if args.command == "score":
+        return run_score(args)
+    if args.command == "match":
+        return run_match(args)
+    if args.command == "export":
+        return run_export(args)
+    if args.command == "bench":
+        return run_bench(args)
+    if args.command == "corpus":
+        return run_corpus(args)
+    if args.command == "import-check":
+        return run_import_check(args)
+    return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
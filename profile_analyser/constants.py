@@ -0,0 +1,371 @@
+"""Reference data: field skill keywords, courses, certifications and section headers."""
+
+# --- Enhanced Skill Keywords with Synonyms and Abbreviations ---
+SKILL_KEYWORDS = {
+    "Data Science": [
+        "python", "machine learning", "pandas", "numpy", "tensorflow", "data analysis",
+        "scikit-learn", "sklearn", "jupyter", "matplotlib", "seaborn", "plotly",
+        "sql", "postgresql", "mysql", "mongodb", "spark", "hadoop", "kafka",
+        "powerbi", "tableau", "excel", "r", "statistics", "regression", "classification",
+        "clustering", "nlp", "natural language processing", "deep learning", "neural networks"
+    ],
+    "Web Development": [
+        "html", "css", "javascript", "js", "react", "vue", "angular", "node", "nodejs",
+        "flask", "django", "express", "mongodb", "mysql", "postgresql", "rest api",
+        "graphql", "typescript", "ts", "bootstrap", "tailwind", "sass", "less",
+        "webpack", "babel", "npm", "yarn", "git", "github", "docker", "kubernetes"
+    ],
+    "Android Development": [
+        "android", "kotlin", "java", "xml", "gradle", "android studio", "firebase",
+        "room database", "retrofit", "okhttp", "glide", "picasso", "jetpack compose",
+        "material design", "mvvm", "mvp", "dagger", "hilt", "coroutines", "flow"
+    ],
+    "UI/UX": [
+        "figma", "adobe xd", "photoshop", "sketch", "invision", "protopie", "framer",
+        "wireframing", "prototyping", "user research", "usability testing", "design systems",
+        "responsive design", "accessibility", "wcag", "user personas", "journey mapping"
+    ],
+    "Artificial Intelligence": [
+        "deep learning", "neural networks", "nlp", "bert", "transformers", "pytorch", "keras",
+        "tensorflow", "opencv", "computer vision", "cnn", "rnn", "lstm", "gru", "gan",
+        "reinforcement learning", "q-learning", "openai", "gpt", "chatgpt", "langchain"
+    ],
+    "Cybersecurity": [
+        "network security", "penetration testing", "pen testing", "firewalls", "siem",
+        "vulnerability assessment", "encryption", "ssl", "tls", "wireshark", "nmap",
+        "metasploit", "burp suite", "owasp", "ethical hacking", "ceh", "comptia security+",
+        "cryptography", "hash functions", "digital signatures", "vpn", "ids", "ips"
+    ],
+    "Cloud Computing": [
+        "aws", "amazon web services", "azure", "gcp", "google cloud", "cloud", "devops",
+        "docker", "kubernetes", "k8s", "ci/cd", "jenkins", "gitlab", "github actions",
+        "terraform", "ansible", "serverless", "lambda", "ec2", "s3", "rds", "vpc",
+        "load balancer", "auto scaling", "cloudformation", "cloudwatch"
+    ],
+    "Software Development": [
+        "c++", "cpp", "java", "python", "oop", "object oriented programming", "git",
+        "algorithms", "data structures", "leetcode", "hackerrank", "design patterns",
+        "microservices", "api", "rest", "graphql", "testing", "unit testing", "integration testing",
+        "tdd", "bdd", "agile", "scrum", "kanban", "jira", "confluence"
+    ],
+    "Business Analyst": [
+        "business analysis", "requirement gathering", "process modeling", "sql", "excel",
+        "powerbi", "tableau", "jira", "confluence", "user stories", "use cases",
+        "bpmn", "uml", "data modeling", "er diagrams", "stakeholder management",
+        "gap analysis", "swot analysis", "root cause analysis"
+    ],
+    "Product Management": [
+        "roadmap", "product strategy", "user stories", "agile", "scrum", "market research",
+        "competitive analysis", "user personas", "journey mapping", "a/b testing",
+        "analytics", "google analytics", "mixpanel", "amplitude", "jira", "confluence",
+        "figma", "prototyping", "mvp", "minimum viable product"
+    ],
+    "Mobile App Development": [
+        "android", "ios", "swift", "kotlin", "flutter", "react native", "xamarin",
+        "mobile development", "app store", "google play", "firebase", "push notifications",
+        "in-app purchases", "mobile ui", "responsive design", "cross platform"
+    ],
+    "Game Development": [
+        "unity", "unreal", "c#", "game design", "3d modeling", "physics engine",
+        "blender", "maya", "3ds max", "game mechanics", "level design", "character design",
+        "animation", "rigging", "texturing", "shaders", "game physics", "ai in games"
+    ],
+    "Finance": [
+        "accounting", "financial analysis", "excel", "valuation", "markets", "investment",
+        "portfolio management", "risk management", "derivatives", "options", "futures",
+        "bonds", "stocks", "mutual funds", "etf", "financial modeling", "dcf", "npv", "irr"
+    ],
+    "HR": [
+        "recruitment", "onboarding", "payroll", "employee engagement", "hrms", "compliance",
+        "performance management", "talent acquisition", "employee relations", "benefits",
+        "compensation", "training", "development", "diversity", "inclusion", "workplace culture"
+    ],
+    "Digital Marketing": [
+        "seo", "search engine optimization", "sem", "search engine marketing", "google analytics",
+        "content marketing", "social media", "email marketing", "ppc", "google ads",
+        "facebook ads", "instagram ads", "linkedin ads", "conversion optimization",
+        "landing pages", "a/b testing", "marketing automation", "hubspot", "mailchimp"
+    ],
+    "Blockchain": [
+        "blockchain", "bitcoin", "ethereum", "solidity", "smart contracts", "web3",
+        "defi", "decentralized finance", "nft", "non-fungible tokens", "cryptocurrency",
+        "hyperledger", "consensus algorithms", "proof of work", "proof of stake",
+        "metamask", "ipfs", "interplanetary file system"
+    ],
+    "DevOps": [
+        "devops", "ci/cd", "continuous integration", "continuous deployment", "jenkins",
+        "gitlab ci", "github actions", "docker", "kubernetes", "terraform", "ansible",
+        "prometheus", "grafana", "elk stack", "elasticsearch", "logstash", "kibana",
+        "monitoring", "logging", "infrastructure as code", "iac"
+    ],
+    "UI/UX Design": [
+        "ui design", "ux design", "user interface", "user experience", "figma", "sketch",
+        "adobe xd", "invision", "prototyping", "wireframing", "user research",
+        "usability testing", "design systems", "responsive design", "mobile design",
+        "accessibility", "wcag", "user personas", "journey mapping"
+    ],
+    "AR/VR": [
+        "augmented reality", "virtual reality", "ar", "vr", "unity", "unreal engine",
+        "oculus", "htc vive", "hololens", "3d modeling", "blender", "maya",
+        "spatial computing", "mixed reality", "mr", "computer vision", "tracking"
+    ],
+    "IoT": [
+        "internet of things", "iot", "raspberry pi", "arduino", "sensors", "mqtt",
+        "coap", "edge computing", "fog computing", "embedded systems", "microcontrollers",
+        "wireless protocols", "bluetooth", "wifi", "zigbee", "lorawan", "nb-iot"
+    ]
+}
+
+# --- Courses by Field ---
+COURSES = {
+    "Data Science": [
+        "Data Science with Python – IBM (Coursera)",
+        "Machine Learning A-Z – Udemy",
+        "Python for Data Science – DataCamp",
+        "SQL for Data Analysis – Mode Analytics",
+        "Statistics for Data Science – Coursera",
+        "Deep Learning Specialization – DeepLearning.AI (Coursera)"
+    ],
+    "Web Development": [
+        "React for Beginners – Udemy",
+        "Full Stack with Django – Udemy",
+        "JavaScript Complete Guide – Udemy",
+        "Node.js Bootcamp – Udemy",
+        "MongoDB Complete Course – Udemy",
+        "Git & GitHub Crash Course – Udemy"
+    ],
+    "Android Development": [
+        "Android with Kotlin – Udemy",
+        "Build Apps with Firebase – Udemy",
+        "Android App Development – Coursera",
+        "Kotlin for Android – Udemy",
+        "Android Studio Masterclass – Udemy"
+    ],
+    "UI/UX": [
+        "Figma UI Basics – Udemy",
+        "UX Design Crash Course – Udemy",
+        "Adobe XD Complete Course – Udemy",
+        "User Research Methods – Coursera",
+        "Prototyping with Figma – Udemy"
+    ],
+    "Artificial Intelligence": [
+        "Deep Learning Specialization – DeepLearning.AI (Coursera)",
+        "Natural Language Processing with BERT (Coursera)",
+        "AI For Everyone (Coursera)",
+        "Computer Vision with OpenCV – Udemy",
+        "Machine Learning with Python – Coursera",
+        "TensorFlow Developer Certificate – Google"
+    ],
+    "Cybersecurity": [
+        "Introduction to Cyber Security (Coursera)",
+        "Network Security (Udemy)",
+        "Penetration Testing (NPTEL)",
+        "Ethical Hacking Course – Udemy",
+        "CompTIA Security+ Certification – Udemy",
+        "CEH v12 Complete Course – Udemy"
+    ],
+    "Cloud Computing": [
+        "AWS Cloud Practitioner Essentials (AWS)",
+        "Azure Fundamentals (Microsoft)",
+        "DevOps on AWS (Coursera)",
+        "CI/CD with GitHub Actions (Coursera)",
+        "Docker Complete Course – Udemy",
+        "Kubernetes for Beginners – Udemy"
+    ],
+    "Software Development": [
+        "Java Programming (Coursera)",
+        "Data Structures & Algorithms (Coursera)",
+        "Git & GitHub Bootcamp (Udemy)",
+        "Python Complete Course – Udemy",
+        "C++ Programming – Udemy",
+        "System Design Interview Course – Udemy"
+    ],
+    "Business Analyst": [
+        "Business Analysis Fundamentals (Udemy)",
+        "Excel to MySQL: Analytics for Business (Coursera)",
+        "SQL for Business Analysts – Udemy",
+        "Power BI Complete Course – Udemy",
+        "Tableau for Data Science – Udemy",
+        "Business Process Modeling – Udemy"
+    ],
+    "Product Management": [
+        "Digital Product Management (Coursera)",
+        "Product Management by Pragmatic Institute",
+        "Agile Project Management – Udemy",
+        "User Story Mapping – Udemy",
+        "Product Strategy Course – Udemy",
+        "A/B Testing for Product Managers – Udemy"
+    ],
+    "Mobile App Development": [
+        "iOS App Development with Swift (Coursera)",
+        "Flutter & Dart (Udemy)",
+        "React Native Complete Course – Udemy",
+        "Mobile App Development – Udemy",
+        "Cross-Platform Development – Udemy"
+    ],
+    "Game Development": [
+        "Game Development with Unity (Coursera)",
+        "Unreal Engine C++ Developer (Udemy)",
+        "Unity 2D Game Development – Udemy",
+        "3D Modeling with Blender – Udemy",
+        "Game Design Principles – Udemy"
+    ],
+    "Finance": [
+        "Financial Markets – Yale (Coursera)",
+        "Accounting Fundamentals (Udemy)",
+        "Investment Management – Coursera",
+        "Financial Modeling – Udemy",
+        "Risk Management – Coursera",
+        "Portfolio Management – Udemy"
+    ],
+    "HR": [
+        "Human Resource Management (Coursera)",
+        "HR Analytics (Udemy)",
+        "Recruitment and Selection – Udemy",
+        "Employee Relations – Udemy",
+        "HR Compliance – Udemy",
+        "Performance Management – Udemy"
+    ],
+    "Digital Marketing": [
+        "Digital Marketing Specialization (Coursera)",
+        "SEO Training (Udemy)",
+        "Google Analytics (Coursera)",
+        "Social Media Marketing – Udemy",
+        "Email Marketing – Udemy",
+        "Content Marketing – Udemy"
+    ],
+    "Blockchain": [
+        "Blockchain Basics – Coursera",
+        "Ethereum Development – Udemy",
+        "Solidity Programming – Udemy",
+        "Web3 Development – Udemy",
+        "Cryptocurrency Trading – Udemy",
+        "DeFi Fundamentals – Udemy"
+    ],
+    "DevOps": [
+        "DevOps Fundamentals – Udemy",
+        "Docker and Kubernetes – Udemy",
+        "CI/CD Pipeline – Udemy",
+        "Terraform for Beginners – Udemy",
+        "Ansible Automation – Udemy",
+        "Monitoring and Logging – Udemy"
+    ],
+    "UI/UX Design": [
+        "UI/UX Design Bootcamp – Udemy",
+        "User Experience Design – Coursera",
+        "Prototyping with Figma – Udemy",
+        "Design Systems – Udemy",
+        "User Research Methods – Udemy",
+        "Accessibility Design – Udemy"
+    ],
+    "AR/VR": [
+        "Unity AR Development – Udemy",
+        "VR Development with Unity – Udemy",
+        "3D Modeling for VR – Udemy",
+        "Spatial Computing – Coursera",
+        "Mixed Reality Development – Udemy"
+    ],
+    "IoT": [
+        "IoT Fundamentals – Coursera",
+        "Arduino Programming – Udemy",
+        "Raspberry Pi Projects – Udemy",
+        "IoT Security – Udemy",
+        "Edge Computing – Udemy",
+        "Sensor Networks – Udemy"
+    ]
+}
+
+# --- Enhanced Section Headers with Fuzzy Matching ---
+SECTION_HEADERS = {
+    "experience": ["experience", "work experience", "employment", "work history", "professional experience", "career", "employment history"],
+    "education": ["education", "academic", "academics", "qualifications", "academic background", "educational background"],
+    "skills": ["skills", "technical skills", "competencies", "expertise", "technologies", "tools", "programming languages"],
+    "projects": ["projects", "project work", "portfolio", "achievements", "key projects", "work samples"],
+    "certifications": ["certifications", "certificates", "credentials", "accreditations", "professional certifications"],
+    "contact": ["contact", "contact information", "personal information", "details", "contact details"],
+    "objective": ["objective", "career objective", "summary", "profile", "personal statement", "career summary"],
+    "declaration": ["declaration", "statement", "affirmation", "disclaimer"]
+}
+
+# --- Project Suggestions by Field ---
+PROJECT_IDEAS = {
+    "Data Science": [
+        "Movie Recommendation System (ML)",
+        "E-commerce Sales Dashboard (Tableau/Excel)",
+        "Customer Churn Prediction",
+        "Stock Price Predictor"
+    ],
+    "Web Development": [
+        "Portfolio Website (HTML/CSS/JS)",
+        "Blog Platform (Django/Flask)",
+        "E-commerce Store (React/Node)"
+    ],
+    "Android Development": [
+        "Expense Tracker App (Kotlin)",
+        "Weather App (Java)",
+        "Chat App (Firebase)"
+    ],
+    "UI/UX": [
+        "Mobile App Redesign (Figma)",
+        "Landing Page UI (Adobe XD)",
+        "User Flow Mapping"
+    ],
+    "Artificial Intelligence": ["Fake News Detection using BERT", "Image Captioning with CNN+RNN", "Speech Recognition System (Deep Learning)", "Chatbot with Transformers"],
+    "Cybersecurity": ["Network Vulnerability Scanner", "Phishing Detection System", "Firewall Rule Automation", "SIEM Log Analyzer"],
+    "Cloud Computing": ["Deploy a CI/CD pipeline with GitHub Actions and AWS", "Serverless Web App (AWS Lambda)", "Multi-cloud Monitoring Dashboard"],
+    "Software Development": ["Library Management System (Java)", "Task Manager App (Python)", "REST API with Flask/Django"],
+    "Business Analyst": ["Sales Data Dashboard (PowerBI)", "Process Optimization Case Study", "Customer Segmentation Analysis"],
+    "Product Management": ["Go-to-Market Strategy Plan", "User Feedback Analysis Tool", "Product Roadmap Dashboard"],
+    "Mobile App Development": ["Fitness Tracker App (Flutter)", "Recipe App (iOS/Swift)", "Event Planner App (React Native)"],
+    "Game Development": ["2D Platformer Game (Unity)", "Multiplayer Card Game (Unreal)", "VR Puzzle Game"],
+    "Finance": ["Stock Portfolio Tracker (Excel/Python)", "Loan Default Prediction (ML)", "Financial Statement Analyzer"],
+    "HR": ["Employee Onboarding Portal", "HR Analytics Dashboard", "Leave Management System"],
+    "Digital Marketing": ["SEO Audit & Digital Campaign (Google Analytics)", "Social Media Sentiment Analysis", "Email Campaign Automation"]
+}
+
+CERTIFICATIONS = {
+    "Data Science": ["Google Data Analytics", "IBM Data Science", "Microsoft Data Analyst Associate","CISCO","EDUSKILLS"],
+    "Web Development": ["Meta Front-End Certificate", "FreeCodeCamp Responsive Web Design"],
+    "Artificial Intelligence": ["DeepLearning.AI Specialization", "Google AI Professional Certificate"],
+    "Cybersecurity": ["CompTIA Security+", "Certified Ethical Hacker (CEH)", "Cisco CCNA Security"],
+    "Cloud Computing": ["AWS Cloud Practitioner", "Azure Fundamentals", "Google Associate Cloud Engineer"],
+    "Software Development": ["Oracle Certified Java Programmer", "Microsoft Certified: Azure Developer Associate"],
+    "Business Analyst": ["IIBA ECBA", "CBAP Certification"],
+    "Product Management": ["Pragmatic Institute Product Management", "Certified Scrum Product Owner (CSPO)"],
+    "Mobile App Development": ["Google Associate Android Developer", "Apple Certified iOS Developer"],
+    "Game Development": ["Unity Certified Developer", "Unreal Engine Certification"],
+    "Finance": ["CFA Level 1", "CPA", "Financial Risk Manager (FRM)"],
+    "HR": ["SHRM-CP", "HRCI PHR"],
+    "Digital Marketing": ["Google Analytics Individual Qualification", "HubSpot Content Marketing"],
+    "UI/UX": ["NN/g UX Certification", "Adobe Certified Expert"]
+}
+
+TOOLS_LIST = ["VS Code", "Jupyter", "GitHub", "Excel", "Tableau"]
+
+# Expanded known skills and certifications
+KNOWN_SKILLS = set([
+    "python", "machine learning", "pandas", "numpy", "tensorflow", "data analysis", "html", "css", "javascript", "react", "node", "flask", "django",
+    "android", "kotlin", "java", "xml", "figma", "adobe xd", "photoshop", "sketch", "sql", "powerbi", "tableau", "c++", "c#", "aws", "azure", "gcp", "docker", "kubernetes"
+])
+CERT_PROVIDERS = ["coursera", "udemy", "aws", "google", "microsoft", "edx", "udacity", "ibm", "oracle", "linkedin learning"]
+
+# Soft skills detected anywhere in the resume
+SOFT_SKILLS = [
+    "leadership", "communication", "teamwork", "problem solving", "critical thinking",
+    "creativity", "adaptability", "time management", "organization", "attention to detail",
+    "analytical", "strategic thinking", "project management", "customer service",
+    "negotiation", "presentation", "research", "collaboration", "initiative",
+    "flexibility", "multitasking", "decision making", "mentoring", "coaching"
+]
+
+# Common cert acronyms and exam codes
+CERT_ACRONYMS = [
+    "pmp", "cissp", "ceh", "ccna", "csm", "psm", "pspo", "itil", "ocp", "oca",
+    "security+", "network+", "a+", "aws saa", "aws sap", "gcp pca", "az-900", "dp-100",
+    "pl-300", "sc-200", "ai-102", "ms-900"
+]
+
+# --- Ideal Resume Template ---
+IDEAL_SECTIONS = ["objective", "projects", "skills", "education", "experience", "certifications", "contact", "declaration"]
+IDEAL_SKILLS = set([kw for kws in SKILL_KEYWORDS.values() for kw in kws])
+IDEAL_CERTS = set([prov.title() for prov in CERT_PROVIDERS])
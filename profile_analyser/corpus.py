@@ -0,0 +1,342 @@
+"""Synthetic resume corpus for load, scale and accuracy testing.
+
+``python -m profile_analyser corpus generate OUT -n 10000`` writes seeded
+PDF (reportlab, the Resume Generator's layout) and DOCX (python-docx) resumes
+to ``OUT`` with a ``labels.jsonl`` of ground truth next to them: the contact
+details, field, skills, certifications, education and projects each file was
+built from, plus the layout it was rendered with.  Content is drawn from
+SKILL_KEYWORDS, CERTIFICATIONS, PROJECT_IDEAS and COURSES; length, page
+count, columns and noise (typos, casing, stray whitespace, running
+headers/footers) are controllable.  The same seed always gives the same
+corpus.
+
+``python -m profile_analyser corpus evaluate OUT`` runs the analysis pipeline
+over a generated corpus and reports how much of the ground truth it recovers.
+"""
+import io
+import json
+import os
+import random
+import re
+
+from profile_analyser.constants import CERTIFICATIONS, COURSES, PROJECT_IDEAS, SKILL_KEYWORDS
+
+LABELS_FILE = "labels.jsonl"
+FORMATS = ("pdf", "docx")
+
+# Fields with enough material to build a full resume
+FIELDS = tuple(field for field in SKILL_KEYWORDS if field in PROJECT_IDEAS and field in COURSES)
+
+# length -> (jobs, bullets per job, projects, skills, certifications)
+LENGTHS = {
+    "short": (1, 3, 1, 6, 1),
+    "medium": (2, 4, 2, 10, 2),
+    "long": (4, 5, 3, 15, 3),
+}
+MAX_JOBS = 40
+
+_FIRST_NAMES = (
+    "Avery", "Jordan", "Priya", "Mateo", "Lena", "Kofi", "Mei", "Tomasz", "Aisha", "Noah",
+    "Sofia", "Ravi", "Hana", "Diego", "Amara", "Lukas", "Yara", "Ethan", "Nadia", "Kenji",
+)
+_LAST_NAMES = (
+    "Patel", "Okafor", "Novak", "Garcia", "Chen", "Larsen", "Haddad", "Silva", "Kim", "Brown",
+    "Ivanova", "Mensah", "Rossi", "Tanaka", "Schmidt", "Nguyen", "Kowalski", "Fischer", "Adeyemi", "Moreau",
+)
+_COMPANIES = (
+    "Acme Corp", "Globex Inc", "Initech LLC", "Umbrella Ltd", "Hooli", "Vandelay Industries",
+    "Stark Solutions", "Wayne Analytics", "Tyrell Systems", "Cyberdyne Labs",
+)
+_TITLES = ("Engineer", "Analyst", "Specialist", "Consultant", "Lead", "Associate", "Developer", "Manager")
+_VERBS = (
+    "Developed", "Implemented", "Led", "Designed", "Optimized", "Launched", "Analyzed", "Improved",
+    "Automated", "Built", "Delivered", "Streamlined",
+)
+_OUTCOMES = (
+    "reducing processing time by {n}%", "improving accuracy by {n}%", "serving {n}k monthly users",
+    "cutting costs by {n}%", "supporting {n} internal teams", "increasing conversion by {n}%",
+)
+_DEGREES = (
+    ("B.Tech", "Computer Science"), ("B.Sc", "Information Technology"), ("M.Sc", "Data Science"),
+    ("MBA", "Business Analytics"), ("B.E", "Electronics Engineering"), ("M.Tech", "Software Engineering"),
+    ("BBA", "Finance"), ("B.Des", "Interaction Design"),
+)
+_SCHOOLS = ("State University", "National Institute of Technology", "Tech Institute", "City College", "Metropolitan University")
+_FOOTERS = ("Confidential - {name} - Page {{page}}", "{name} | Resume | Page {{page}}", "Page {{page}}")
+
+
+def _skill_label(skill):
+    """Display form of a SKILL_KEYWORDS entry (``sql`` -> ``SQL``, ``machine learning`` -> ``Machine Learning``)."""
+    if len(skill) <= 3:
+        return skill.upper()
+    return skill.title() if skill.islower() else skill
+
+
+def _typo(rng, line):
+    """Swap two inner letters of one longer word."""
+    words = line.split(" ")
+    candidates = [i for i, word in enumerate(words) if len(word) > 5 and word.isalpha()]
+    if not candidates:
+        return line
+    i = rng.choice(candidates)
+    word = words[i]
+    j = rng.randint(1, len(word) - 3)
+    words[i] = word[:j] + word[j + 1] + word[j] + word[j + 2:]
+    return " ".join(words)
+
+
+def _add_noise(rng, line, noise):
+    """Perturb a free-text line (never a labelled value) with probability ``noise``."""
+    if rng.random() >= noise:
+        return line
+    kind = rng.choice(("typo", "upper", "lower", "space"))
+    if kind == "typo":
+        return _typo(rng, line)
+    if kind == "upper":
+        return line.upper()
+    if kind == "lower":
+        return line.lower()
+    return re.sub(" ", lambda _: rng.choice((" ", "  ", " \t")), line) + "  "
+
+
+def make_resume(rng, field=None, length="medium", jobs=None, noise=0.0):
+    """Content and ground truth for one resume.
+
+    Returns ``(sections, labels)``: ``sections`` holds the Resume Generator's
+    inputs (name, email, phone, linkedin, summary, skills, experience,
+    education, projects, certifications, field) and ``labels`` the values a
+    perfect extractor would return.  ``jobs`` overrides the number of
+    experience entries implied by ``length``.
+    """
+    field = field or rng.choice(FIELDS)
+    n_jobs, n_bullets, n_projects, n_skills, n_certs = LENGTHS[length]
+    n_jobs = jobs if jobs is not None else n_jobs
+
+    first, last = rng.choice(_FIRST_NAMES), rng.choice(_LAST_NAMES)
+    name = f"{first} {last}"
+    handle = f"{first}{last}{rng.randint(1, 99)}".lower()
+    email = f"{handle}@{rng.choice(('example.com', 'mail.test', 'inbox.dev'))}"
+    phone = f"+1 {rng.randint(200, 989)}-{rng.randint(200, 999)}-{rng.randint(1000, 9999)}"
+    linkedin = f"linkedin.com/in/{handle}"
+    github = f"github.com/{handle}" if rng.random() < 0.7 else None
+
+    pool = SKILL_KEYWORDS[field]
+    skills = [_skill_label(skill) for skill in rng.sample(pool, min(n_skills, len(pool)))]
+    projects = rng.sample(PROJECT_IDEAS[field], min(n_projects, len(PROJECT_IDEAS[field])))
+    certs = CERTIFICATIONS.get(field, [])
+    certifications = rng.sample(certs, min(n_certs, len(certs)))
+    courses = rng.sample(COURSES[field], min(max(1, n_certs - len(certifications)), len(COURSES[field])))
+    degree, major = rng.choice(_DEGREES)
+    graduated = rng.randint(2008, 2023)
+    education = [f"{degree} in {major}, {rng.choice(_SCHOOLS)}, {graduated}"]
+
+    experience = []
+    end = 2025
+    for _ in range(n_jobs):
+        start = end - rng.randint(1, 4)
+        experience.append(f"{field} {rng.choice(_TITLES)} | {rng.choice(_COMPANIES)} | {start} - {end}")
+        for _ in range(n_bullets):
+            outcome = rng.choice(_OUTCOMES).format(n=rng.randint(5, 80))
+            line = f"{rng.choice(_VERBS)} {rng.choice(skills)} solutions, {outcome}"
+            experience.append("• " + _add_noise(rng, line, noise))
+        end = start
+    project_lines = []
+    for project in projects:
+        project_lines.append(project)
+        used = ", ".join(rng.sample(skills, min(3, len(skills))))
+        project_lines.append("• " + _add_noise(rng, f"{rng.choice(_VERBS)} end to end using {used}", noise))
+    summary = _add_noise(
+        rng,
+        f"{field} professional with {2025 - end} years of experience delivering results with "
+        f"{', '.join(skills[:3])}. Passionate about building reliable, measurable solutions.",
+        noise,
+    )
+    contact_links = f"{linkedin} | {github}" if github else linkedin
+
+    sections = {
+        "name": name,
+        "email": email,
+        "phone": phone,
+        "linkedin": contact_links,
+        "summary": summary,
+        "skills": ", ".join(skills),
+        "experience": "\n".join(experience),
+        "education": "\n".join(education),
+        "projects": "\n".join(project_lines),
+        "certifications": "\n".join(f"• {cert}" for cert in certifications + courses),
+        "field": field,
+    }
+    labels = {
+        "name": name,
+        "email": email,
+        "phone": phone,
+        "linkedin": linkedin,
+        "github": github,
+        "field": field,
+        "skills": skills,
+        "certifications": certifications,
+        "courses": courses,
+        "education": [{"degree": degree, "major": major, "year": graduated}],
+        "projects": projects,
+        "jobs": n_jobs,
+    }
+    return sections, labels
+
+
+def render_pdf(sections, columns=1, footer=None):
+    """``(pdf_bytes, page_count)`` in the Resume Generator's layout."""
+    from profile_analyser.render import get_renderer
+
+    return get_renderer().render(sections, columns, footer)
+
+
+def render_docx(sections, columns=1, footer=None):
+    """DOCX bytes with the same sections (``columns`` via the section's ``w:cols``)."""
+    import docx  # python-docx
+    from docx.oxml import OxmlElement
+    from docx.oxml.ns import qn
+
+    document = docx.Document()
+    section = document.sections[0]
+    if columns > 1:
+        cols = OxmlElement("w:cols")
+        cols.set(qn("w:num"), str(columns))
+        section._sectPr.append(cols)
+    if footer:
+        section.header.paragraphs[0].text = sections["name"]
+        section.footer.paragraphs[0].text = footer.format(page=1)
+    document.add_heading(sections["name"].upper(), level=1)
+    document.add_paragraph(f"{sections['email']} | {sections['phone']} | {sections['linkedin']}")
+    for heading, key in (
+        ("PROFESSIONAL SUMMARY", "summary"),
+        ("TECHNICAL SKILLS", "skills"),
+        ("PROFESSIONAL EXPERIENCE", "experience"),
+        ("EDUCATION", "education"),
+        ("PROJECTS", "projects"),
+        ("CERTIFICATIONS & TRAINING", "certifications"),
+    ):
+        document.add_heading(heading, level=2)
+        for line in sections[key].split("\n"):
+            if line.strip().startswith("•"):
+                document.add_paragraph(line.strip().lstrip("• "), style="List Bullet")
+            elif line.strip():
+                document.add_paragraph(line)
+    buffer = io.BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+
+def _jobs_for_pages(rng_state, pages, field, length, noise, columns):
+    """Experience entries needed to fill ``pages`` pages (measured on the PDF layout)."""
+    jobs = max(1, round(pages * 4 / columns) - 2)
+    for _ in range(8):
+        rng = random.Random()
+        rng.setstate(rng_state)
+        sections, _ = make_resume(rng, field, length, jobs, noise)
+        actual = render_pdf(sections, columns)[1]
+        if actual == pages or (actual > pages and jobs == 1) or jobs >= MAX_JOBS:
+            break
+        jobs = max(1, min(MAX_JOBS, jobs + (2 if actual < pages else -2) * (abs(actual - pages))))
+    return jobs
+
+
+def generate_one(index, seed=0, formats=FORMATS, columns=(1,), lengths=("medium",), pages=None, noise=0.0, field=None):
+    """``(file_name, data, labels)`` for resume ``index`` of the corpus for ``seed``."""
+    rng = random.Random(seed * 1_000_003 + index)
+    file_type = rng.choice(formats)
+    n_columns = rng.choice(columns)
+    length = rng.choice(lengths)
+    footer = rng.choice(_FOOTERS) if noise and rng.random() < noise else None
+    jobs = None
+    if pages:
+        jobs = _jobs_for_pages(rng.getstate(), pages, field, length, noise, n_columns)
+    sections, labels = make_resume(rng, field, length, jobs, noise)
+    if footer:
+        footer = footer.format(name=sections["name"])
+    pdf, page_count = render_pdf(sections, n_columns, footer) if file_type == "pdf" or pages else (None, None)
+    data = pdf if file_type == "pdf" else render_docx(sections, n_columns, footer)
+    file_name = f"resume_{index:06d}.{file_type}"
+    labels.update(
+        file=file_name,
+        file_type=file_type,
+        length=length,
+        columns=n_columns,
+        # DOCX has no fixed layout: its page count is the PDF layout's, when measured
+        pages=page_count,
+        noise=noise,
+        footer=footer,
+    )
+    return file_name, data, labels
+
+
+def generate(out_dir, n, seed=0, **options):
+    """Write ``n`` resumes and ``labels.jsonl`` to ``out_dir``; yield each label record."""
+    os.makedirs(out_dir, exist_ok=True)
+    with open(os.path.join(out_dir, LABELS_FILE), "w", encoding="utf-8") as labels_file:
+        for index in range(n):
+            file_name, data, labels = generate_one(index, seed, **options)
+            with open(os.path.join(out_dir, file_name), "wb") as fh:
+                fh.write(data)
+            labels_file.write(json.dumps(labels) + "\n")
+            yield labels
+
+
+def load_labels(corpus_dir):
+    with open(os.path.join(corpus_dir, LABELS_FILE), encoding="utf-8") as fh:
+        return [json.loads(line) for line in fh if line.strip()]
+
+
+def _norm(value):
+    return " ".join(str(value or "").lower().split())
+
+
+def _digits(value):
+    return re.sub(r"\D", "", str(value or ""))
+
+
+def _recall(expected, found):
+    expected = {_norm(item) for item in expected}
+    if not expected:
+        return None
+    found_text = " | ".join(_norm(item) for item in found)
+    return sum(item in found_text for item in expected) / len(expected)
+
+
+def score_record(labels, analysis):
+    """Per-resume accuracy of one scored record (``score_file`` output) against its labels."""
+    info = analysis.get("info") or {}
+    result = {
+        "name": _norm(info.get("name")) == _norm(labels["name"]),
+        "email": _norm(info.get("email")) == _norm(labels["email"]),
+        "phone": _digits(labels["phone"]).endswith(_digits(info.get("phone"))[-10:] or "-"),
+        "linkedin": _norm(labels["linkedin"]) in _norm(info.get("linkedin")),
+        "field": analysis.get("field") == labels["field"],
+        "skills": _recall(labels["skills"], info.get("skills") or []),
+        "certifications": _recall(labels["certifications"], info.get("certifications") or []),
+        "projects": _recall(labels["projects"], info.get("projects") or []),
+    }
+    if labels.get("github"):
+        result["github"] = _norm(labels["github"]) in _norm(info.get("github"))
+    return result
+
+
+def evaluate(corpus_dir, max_workers=None):
+    """Analyze every resume in a generated corpus; return mean accuracy per label."""
+    from profile_analyser.batch import DEFAULT_WORKERS
+    from profile_analyser.cli import score_files
+
+    labels = load_labels(corpus_dir)
+    paths = (os.path.join(corpus_dir, record["file"]) for record in labels)
+    totals, counts, errors = {}, {}, 0
+    for record, analysis in zip(labels, score_files(paths, max_workers or DEFAULT_WORKERS)):
+        errors += bool(analysis.get("error"))
+        for key, value in score_record(record, analysis).items():
+            if value is None:
+                continue
+            totals[key] = totals.get(key, 0.0) + float(value)
+            counts[key] = counts.get(key, 0) + 1
+    return {
+        "resumes": len(labels),
+        "errors": errors,
+        "accuracy": {key: round(totals[key] / counts[key], 4) for key in sorted(totals)},
+    }
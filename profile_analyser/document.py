@@ -0,0 +1,157 @@
+"""Parsed resume shared by every extractor and scorer.
+
+A ``ResumeDocument`` is built once per resume text and holds everything the
+analyzers used to recompute for themselves: the lowercased text, the line
+index, heading lines and section spans, the keyword token stream and skill
+hits, and the spaCy doc.  ``as_document`` memoizes documents by text, so
+functions that still take a plain string (the UI calls them that way) share
+one document per resume.
+
+The spaCy budget is one pipeline pass per resume: extractors ask for
+entities inside a character range (``entities``) and get slices of the
+whole-text doc instead of running the pipeline on a substring.  Every
+consumer reads the doc of the one ``NLP_PROFILE``.  Passes are counted in
+the ``spacy.docs`` metric and passes beyond ``NLP_BUDGET`` in
+``spacy.over_budget``.  ``pipe_documents``
+fills the docs of many resumes from one ``nlp.pipe`` call up front.
+"""
+from bisect import bisect_right
+from collections import namedtuple
+from functools import cached_property, lru_cache
+
+from profile_analyser.matcher import SkillMatches, get_skill_matcher, tokenize
+from profile_analyser.metrics import incr, span
+from profile_analyser.nlp import BATCH_SIZE, N_PROCESS, covers, pipe_nlp, run_nlp
+from profile_analyser.sections import HEADING_LINE_RE, normalize_section_heading
+
+Section = namedtuple("Section", "name heading start end")
+
+# spaCy pipeline passes allowed per resume, and the profile of that pass: it
+# must cover every consumer of the document's doc (only entities today)
+NLP_BUDGET = 1
+NLP_PROFILE = "ner"
+
+
+class ResumeDocument:
+    def __init__(self, text):
+        self.text = text or ""
+        self.lower = self.text.lower()
+        self.lines = self.text.split("\n")
+        starts = [0]
+        for line in self.lines[:-1]:
+            starts.append(starts[-1] + len(line) + 1)
+        self.line_starts = starts
+        # Lines that open with a known heading word; the only candidates for
+        # section starts and ends
+        self.heading_lines = [i for i, line in enumerate(self.lines) if HEADING_LINE_RE.match(line)]
+        self._nlp_docs = {}
+
+    def __len__(self):
+        return len(self.text)
+
+    @cached_property
+    def words(self):
+        return self.text.split()
+
+    @cached_property
+    def period_chunks(self):
+        """The text split on ". " (used by the sentence-length heuristics)."""
+        return self.text.split(". ")
+
+    @cached_property
+    def tokens(self):
+        return tokenize(self.text)
+
+    @cached_property
+    def skills(self):
+        """Skill, soft-skill and cert-acronym hits (one pass over ``tokens``)."""
+        return SkillMatches(get_skill_matcher().find(self.text, self.tokens))
+
+    @cached_property
+    def sections(self):
+        """Sections as ``Section(name, heading, start, end)``, one per heading line."""
+        result = []
+        for k, i in enumerate(self.heading_lines):
+            heading = HEADING_LINE_RE.match(self.lines[i]).group(0)
+            end = self.line_starts[self.heading_lines[k + 1]] if k + 1 < len(self.heading_lines) else len(self.text)
+            result.append(Section(normalize_section_heading(heading), heading, self.line_starts[i], end))
+        return result
+
+    def line_of(self, offset):
+        """Index of the line containing character ``offset``."""
+        return bisect_right(self.line_starts, offset) - 1
+
+    def section_spans(self, header_re, stop_re):
+        """Yield ``(match, start, end)`` for every line matching ``header_re``.
+
+        The block runs from the end of the header match to the start of the
+        next heading line matching ``stop_re`` (or the end of the text).  Both
+        patterns are matched at the start of a line.
+        """
+        heading_lines = self.heading_lines
+        for k, i in enumerate(heading_lines):
+            header = header_re.match(self.lines[i])
+            if not header:
+                continue
+            start = self.line_starts[i] + header.end()
+            end = len(self.text)
+            for j in heading_lines[k + 1:]:
+                if stop_re.match(self.lines[j]):
+                    end = self.line_starts[j]
+                    break
+            yield header, start, end
+
+    def section_blocks(self, header_re, stop_re):
+        """Yield ``(match, block)``; see ``section_spans``."""
+        for header, start, end in self.section_spans(header_re, stop_re):
+            yield header, self.text[start:end]
+
+    def nlp(self, profile=NLP_PROFILE):
+        """spaCy doc for the whole text with at least ``profile``'s components.
+
+        A doc already run under a profile that covers ``profile`` is reused.
+        """
+        for have, doc in self._nlp_docs.items():
+            if covers(have, profile):
+                return doc
+        with span(f"spacy.{profile}"):
+            doc = run_nlp(self.text, profile)
+        self._nlp_docs[profile] = doc
+        incr("spacy.docs")
+        if len(self._nlp_docs) > NLP_BUDGET:
+            incr("spacy.over_budget")
+        return doc
+
+    def entities(self, start=0, end=None, labels=None):
+        """Entities of the whole-text doc lying inside ``text[start:end]``."""
+        end = len(self.text) if end is None else end
+        return [ent for ent in self.nlp().ents
+                if start <= ent.start_char and ent.end_char <= end
+                and (labels is None or ent.label_ in labels)]
+
+
+def pipe_documents(documents, profile=NLP_PROFILE, batch_size=BATCH_SIZE, n_process=N_PROCESS):
+    """Run the documents that have no doc covering ``profile`` yet through one ``nlp.pipe``."""
+    todo = [document for document in dict.fromkeys(documents)
+            if not any(covers(have, profile) for have in document._nlp_docs)]
+    if not todo:
+        return
+    with span("spacy.pipe"):
+        docs = pipe_nlp([document.text for document in todo], profile, batch_size, n_process)
+    for document, doc in zip(todo, docs):
+        document._nlp_docs[profile] = doc
+        if len(document._nlp_docs) > NLP_BUDGET:
+            incr("spacy.over_budget")
+    incr("spacy.docs", len(docs))
+
+
+@lru_cache(maxsize=64)
+def _document(text):
+    return ResumeDocument(text)
+
+
+def as_document(text_or_doc):
+    """Return the shared ResumeDocument for a text (or the document itself)."""
+    if isinstance(text_or_doc, ResumeDocument):
+        return text_or_doc
+    return _document(text_or_doc or "")
@@ -0,0 +1,164 @@
+"""Text extraction from PDF/DOCX resumes, entirely in memory.
+
+Every extractor accepts raw bytes, any readable binary buffer, or (for
+scripts) a filesystem path.  Uploads never need to be written to disk first.
+
+PDF pages are classified before their text is read (see
+profile_analyser.layout).  ``PROFILE_ANALYSER_PDF_MODE`` picks how their text
+is read:
+
+* ``auto`` (default): plain ``get_text``, except multi-column pages, which are
+  rebuilt column by column from line geometry (``structured_text``);
+* ``text``: plain ``get_text`` for every page (MuPDF's own order);
+* ``blocks``: ``structured_text`` for every page with text, which also puts
+  headings on lines of their own and joins wrapped lines.
+"""
+import os
+from collections import namedtuple
+from io import BytesIO
+
+from profile_analyser.layout import DocumentLayout, classify_page, structured_text
+
+PDF_MODES = ("auto", "text", "blocks")
+PDF_MODE = os.environ.get("PROFILE_ANALYSER_PDF_MODE", "auto")
+
+PdfPage = namedtuple("PdfPage", "number text urls layout")
+
+
+class ExtractionError(Exception):
+    """Raised when a document cannot be opened or read."""
+
+
+def _as_bytes(source):
+    """Return the document bytes for in-memory sources, or None for paths."""
+    if isinstance(source, (bytes, bytearray)):
+        return bytes(source)
+    if isinstance(source, memoryview):
+        return source.tobytes()
+    if hasattr(source, "read"):
+        if hasattr(source, "seek"):
+            try:
+                source.seek(0)
+            except Exception:
+                pass
+        return source.read()
+    return None
+
+
+def iter_pdf_pages(source, mode=None):
+    """Yield ``PdfPage(number, text, urls, layout)`` for each page, reading pages on demand.
+
+    The document is opened once and closed when the generator is exhausted or
+    closed, so callers that stop early never touch the remaining pages.
+    ``mode`` defaults to ``PDF_MODE``.
+    """
+    import fitz  # PyMuPDF
+
+    mode = mode or PDF_MODE
+    if mode not in PDF_MODES:
+        raise ValueError(f"unknown PDF mode {mode!r}; expected one of {', '.join(PDF_MODES)}")
+    try:
+        data = _as_bytes(source)
+        doc = fitz.open(stream=data, filetype="pdf") if data is not None else fitz.open(source)
+    except Exception as e:
+        raise ExtractionError(e) from e
+    try:
+        for number in range(doc.page_count):
+            try:
+                page = doc.load_page(number)
+                # One TextPage serves the layout pre-pass and the text itself
+                textpage = page.get_textpage()
+                layout = classify_page(page, textpage)
+                if (mode == "auto" and layout.kind == "columns") or (mode == "blocks" and layout.kind != "image"):
+                    text = structured_text(page, textpage, layout.gutters)
+                else:
+                    text = page.get_text(textpage=textpage)
+            except Exception as e:
+                raise ExtractionError(e) from e
+            urls = []
+            try:
+                for link in page.get_links():
+                    uri = link.get('uri')
+                    if uri and isinstance(uri, str) and uri.startswith(('http://', 'https://')):
+                        urls.append(uri.strip())
+            except Exception:
+                pass
+            yield PdfPage(number, text, urls, layout)
+    finally:
+        doc.close()
+
+
+def extract_pdf(source, stop_when=None, mode=None):
+    """PDF text and the ``DocumentLayout`` of the pages read.
+
+    With ``stop_when``, pages are read one at a time and extraction stops
+    after the first page for which ``stop_when(page_text)`` returns true (see
+    ``sections.sections_seen``).  Link targets are then only collected from
+    the pages actually read.  Without it the output is the full document.
+    ``mode`` is one of ``PDF_MODES`` (default ``PDF_MODE``).
+    """
+    pages = []
+    layouts = []
+    urls = set()
+    stream = iter_pdf_pages(source, mode)
+    try:
+        for page in stream:
+            pages.append(page.text)
+            layouts.append(page.layout)
+            urls.update(page.urls)
+            if stop_when is not None and stop_when(page.text):
+                break
+    finally:
+        stream.close()
+    text = "".join(pages)
+    if urls:
+        text += "\n\n" + "\n".join(sorted(urls))
+    return text, DocumentLayout.from_pages(layouts)
+
+
+def extract_text_from_pdf(source, stop_when=None):
+    """Improved PDF text extraction using PyMuPDF (see ``extract_pdf``)"""
+    return extract_pdf(source, stop_when)[0]
+
+
+def extract_text_from_docx(source):
+    """Extract text from .docx files"""
+    import docx  # python-docx
+
+    try:
+        data = _as_bytes(source)
+        doc = docx.Document(BytesIO(data) if data is not None else source)
+    except Exception as e:
+        raise ExtractionError(e) from e
+    text = "".join(paragraph.text + "\n" for paragraph in doc.paragraphs)
+    # Append embedded hyperlink targets (clickable links that may not appear in visible text)
+    try:
+        from docx.opc.constants import RELATIONSHIP_TYPE as DOCX_RT
+        urls = set()
+        for rel in doc.part.rels.values():
+            if getattr(rel, 'reltype', None) == DOCX_RT.HYPERLINK:
+                target = getattr(rel, 'target_ref', None)
+                if target and isinstance(target, str) and target.startswith(('http://', 'https://')):
+                    urls.add(target.strip())
+        if urls:
+            text += "\n" + "\n".join(sorted(urls))
+    except Exception:
+        pass
+    return text
+
+
+def extract_document(source, file_type, stop_when=None):
+    """``(text, layout)``; the layout is a ``DocumentLayout`` for PDFs and None otherwise."""
+    if file_type == "pdf":
+        return extract_pdf(source, stop_when)
+    return extract_text_from_file(source, file_type), None
+
+
+def extract_text_from_file(source, file_type, stop_when=None):
+    """Extract text based on file type (``stop_when`` only shortens PDFs; DOCX is read whole)"""
+    if file_type == "pdf":
+        return extract_text_from_pdf(source, stop_when)
+    elif file_type == "docx":
+        return extract_text_from_docx(source)
+    else:
+        return ""
@@ -0,0 +1,825 @@
+"""Resume information extraction: personal info, education, skills, certifications, projects."""
+import re
+
+from profile_analyser.document import as_document
+from profile_analyser.matcher import CERT_ACRONYM_SET, SKILL_KEYWORD_SET, get_skill_matcher
+from profile_analyser.metrics import span
+
+# Section header / next-section patterns, matched at the start of a line.  The
+# words must stay covered by sections.HEADING_PATTERNS.
+EDUCATION_HEADER_RE = re.compile(r"(?i)(education|academics|academic qualifications|qualifications|educational background)\b[:\-]?(.*)")
+EDUCATION_STOP_RE = re.compile(r"(?i)(experience|work|employment|projects|skills?|certifications?|licenses|summary|objective|contact|achievements?)\b")
+SKILLS_HEADER_RE = re.compile(r"(?i)(skills?|technical skills?)\b[:\-]?(.*)")
+SKILLS_STOP_RE = re.compile(r"(?i)(experience|work|employment|projects|education|certifications?|licenses|summary|objective|contact)\b")
+CERT_HEADER_RE = re.compile(r"(?i)(certificates?|certifications?|licenses?(?:\s*&\s*certifications?)?|licenses|courses|training|professional development|credentials|badges|awards\s*&\s*certifications?)\b[:\-]?(.*)")
+CERT_STOP_RE = re.compile(r"(?i)(experience|work|employment|projects|education|skills?|summary|objective|contact|achievements?)\b")
+PROJECTS_HEADER_RE = re.compile(r"(?i)(projects?|personal projects?|academic projects?)\b[:\-]?(.*)")
+PROJECTS_STOP_RE = re.compile(r"(?i)(experience|work|employment|education|skills?|certifications?|licenses|summary|objective|contact|achievements?)\b")
+
+# Contact details, scanned in one pass by scan_contacts().  Each match is an
+# email, a URL-like token or a run of phone characters; URL tokens and phone
+# runs are then narrowed with the per-kind patterns below.  A phone run backs
+# off digits that open an email address, leaving them to the email alternative.
+CONTACT_RE = re.compile(
+    r"(?P<email>\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z|]{2,}\b)"
+    r"|(?P<url>(?:https?://|www\.|linkedin\.com/|github\.com/)[^\s<>\"'()\[\]{},;|]*)"
+    r"|(?P<phone>[+(]?\d(?:[\d()+.\-]|\s(?=[\s\d(+]))*)(?![A-Za-z0-9._%+-]*@)",
+    re.IGNORECASE,
+)
+LINKEDIN_RE = re.compile(r"https?://(?:www\.)?linkedin\.com/[a-zA-Z0-9\-_/=?]+|www\.linkedin\.com/[a-zA-Z0-9\-_/=?]+|linkedin\.com/[a-zA-Z0-9\-_/=?]+", re.IGNORECASE)
+GITHUB_RE = re.compile(r"https?://(?:www\.)?github\.com/[a-zA-Z0-9\-_/=?]+|www\.github\.com/[a-zA-Z0-9\-_/=?]+|github\.com/[a-zA-Z0-9\-_/=?]+", re.IGNORECASE)
+PORTFOLIO_RE = re.compile(r"https?://[\w\.-]+\.[a-z]{2,}(?:/[a-zA-Z0-9\-_/=?#]+)?|www\.[\w\.-]+\.[a-z]{2,}(?:/[a-zA-Z0-9\-_/=?#]+)?", re.IGNORECASE)
+# In priority order: a full 3-3-4 number anywhere beats any looser digit group
+PHONE_RES = (
+    re.compile(r"\+?1?[-.\s]?\(?([0-9]{3})\)?[-.\s]?([0-9]{3})[-.\s]?([0-9]{4})"),
+    re.compile(r"\+?[0-9]{1,4}[-.\s]?[0-9]{1,4}[-.\s]?[0-9]{1,4}[-.\s]?[0-9]{1,4}"),
+    re.compile(r"\+?[0-9]{10,15}"),
+)
+
+# Characters PHONE_RES[0] accepts as the separator after the country code
+SEPARATOR_CHARS = frozenset("-. \t\n\r\f\v")
+
+# Name heuristics
+NAME_LABEL_RES = (
+    re.compile(r"(?i)^(?:name|full\s*name|applicant)\s*[:\-]\s*([A-Z][a-z]+(?:\s[A-Z][a-z]+)+)"),
+    re.compile(r"(?i)^(?:name|full\s*name|applicant)\s*[:\-]\s*([A-Z][a-z]+(?:\s[A-Z][a-z]+){1,3})"),
+)
+SIMPLE_NAME_RES = (
+    re.compile(r"^([A-Z][a-z]+\s[A-Z][a-z]+)$"),  # First Last
+    re.compile(r"^([A-Z][a-z]+\s[A-Z][a-z]+\s[A-Z][a-z]+)$"),  # First Middle Last
+    re.compile(r"^([A-Z][a-z]+\s[A-Z]\.\s[A-Z][a-z]+)$"),  # First M. Last
+)
+NON_NAME_CHARS_RE = re.compile(r"[^A-Za-z\s\-'.]")
+DIGIT_RUN_RE = re.compile(r"\d{3,}")
+NAME_TECH_WORDS = frozenset({
+    "java", "python", "html", "css", "sql", "react", "node", "django", "flask",
+    "aws", "azure", "javascript", "typescript", "angular", "vue", "spring",
+    "developer", "engineer", "analyst", "manager", "director", "consultant",
+    "software", "web", "mobile", "frontend", "backend", "fullstack", "data",
+    "science", "machine", "learning", "artificial", "intelligence", "cloud",
+    "devops", "database", "api", "rest", "graphql", "docker", "kubernetes",
+})
+
+
+# Education
+DEGREE_KEYWORDS = (
+    "bachelor", "master", "phd", r"m\.?tech", r"b\.?tech", r"b\.?e", r"m\.?e",
+    r"b\.?sc", r"m\.?sc", "mba", "bba", "associate", "diploma", "high school",
+    "intermediate", "secondary", "senior secondary", "10th", "12th", "hsc", "ssc",
+)
+INSTITUTION_KEYWORDS = ("university", "college", "institute", "school", "academy", "polytechnic")
+_YEAR = r"(19|20)\d{2}"
+_YEAR_RANGE = r"(19|20)\d{2}\s*[\-–—]\s*(19|20)?\d{2}|to\s*(19|20)\d{2}"
+_DEGREE_UNION = "(?:" + "|".join(DEGREE_KEYWORDS) + ")"
+_INSTITUTION_UNION = "(?:" + "|".join(INSTITUTION_KEYWORDS) + ")"
+DEGREE_KEYWORD_RE = re.compile(_DEGREE_UNION)
+YEAR_RE = re.compile(_YEAR)
+EDUCATION_FALLBACK_RES = (
+    re.compile(rf"(({_DEGREE_UNION})[^\n\r,;]*?(?:at|from|in)?\s*[A-Za-z .&'\-]*\s*(?:{_YEAR})?(?:\s*(?:{_YEAR_RANGE}))?)", re.IGNORECASE),
+    re.compile(rf"([A-Za-z .&'\-]+(?:{_INSTITUTION_UNION})[^\n\r,;]*\s*(?:{_YEAR})?(?:\s*(?:{_YEAR_RANGE}))?)", re.IGNORECASE),
+)
+EDUCATION_ITEM_SPLIT_RE = re.compile(r"[\n\r;\u2022\u2023\u25E6\u2043\-\–\—\|/•·∙‣◦▪]+")
+# Stripped from an education line to leave the institute name
+INSTITUTE_NOISE_RES = (
+    re.compile(r"(?i)\b(b\.?(e|tech)|btech|b\.e|b\.tech|m\.?(e|tech)|mtech|b\.sc|m\.sc|bsc|msc|phd|mba|bba|associate|diploma|intermediate|12th|hsc|senior secondary|10th|ssc|secondary|standard|grade)\b"),
+    re.compile(r"(?i)\b(at|from|in|of)\b"),
+    re.compile(r"\b(19|20)\d{2}\b"),
+    re.compile(r"\s+[\-–—]\s+"),
+)
+BTECH_RE = re.compile(r"\b(b\.?(e|tech)|btech|b\.e|b\.tech)\b")
+INTERMEDIATE_RE = re.compile(r"\b(intermediate|12th|hsc|senior secondary)\b")
+SSC_RE = re.compile(r"\b(10th|ssc|secondary)\b")
+
+# Skills
+SKILL_ITEM_SPLIT_RE = re.compile(r"[\n\r,;\u2022\u2023\u25E6\u2043\-\–\—\|/•·∙‣◦▪]+")
+NON_SKILL_CHARS_RE = re.compile(r"[^a-zA-Z0-9\+\.#\s]")
+SKILL_CONTEXT_RE = re.compile(r"(?i)(skills?\s*[:\-]|proficient in|experience with|technologies\s*[:\-]|tools\s*[:\-]|stack\s*[:\-]|familiar with)\s*(.{0,200})")
+
+# Certifications
+CERT_ITEM_SPLIT_RE = re.compile(r"[\n\r,;\u2022\u2023\u25E6\u2043\|/•·∙‣◦▪]+")
+CERT_CODE_RE = re.compile(r"\b[A-Z]{2,}-\d{2,3}\b")
+CERT_TITLE_RE = re.compile(
+    r"\baws certified [a-zA-Z ][a-zA-Z \-+:/()0-9]+"
+    r"|\bgoogle (?:cloud )?professional [a-zA-Z \-+:/()0-9]+"
+    r"|\b(?:microsoft|azure) certified [a-zA-Z \-+:/()0-9]+"
+    r"|\bcertificate in [a-zA-Z \-+:/()0-9]+"
+    r"|\bcertification in [a-zA-Z \-+:/()0-9]+"
+)
+
+# Projects
+PROJECT_ITEM_SPLIT_RE = re.compile(r"[\n\r\u2022\u2023\u25E6\u2043•·∙‣◦▪]+")
+TRAILING_PARENS_RE = re.compile(r"\s*\([^)]*\)$")
+LEADING_TITLE_RE = re.compile(r"^([A-Z][A-Za-z0-9]+(?:[\s\-][A-Z][A-Za-z0-9]+){0,6})\b")
+CAMEL_CASE_RE = re.compile(r"[A-Z][a-z]+[A-Z][a-z]+")
+
+# Shared clean-up
+WHITESPACE_RE = re.compile(r"\s+")
+PUNCTUATION_RE = re.compile(r"[^\w\s]")
+YEAR_WORD_RE = re.compile(r"\b(19|20)\d{2}\b")
+WORD_RE = re.compile(r"\b[A-Za-z][a-z]+\b")
+REPEATED_WORD_RE = re.compile(r"\b(\w+)(?:\s+\1)+\b", re.IGNORECASE)
+WEIRD_SYMBOL_RE = re.compile(r'[^\w\s\.\,\-\+\@\#\$\%\(\)\[\]\{\}\:\;\?\!]')
+
+
+def scan_contacts(text):
+    """First email, phone, LinkedIn, GitHub and portfolio URL in ``text`` (None if absent).
+
+    One ``CONTACT_RE`` pass, stopping as soon as no later match can change
+    the result.  Candidates are taken in text order; for the phone, a match of
+    an earlier ``PHONE_RES`` pattern anywhere wins over later patterns.
+    """
+    found = {"email": None, "linkedin": None, "github": None, "portfolio": None}
+    phones = [None] * len(PHONE_RES)
+    for match in CONTACT_RE.finditer(text):
+        kind = match.lastgroup
+        token = match.group(kind)
+        if kind == "email":
+            if found["email"] is None:
+                found["email"] = token
+        elif kind == "url":
+            for key, pattern in (("linkedin", LINKEDIN_RE), ("github", GITHUB_RE), ("portfolio", PORTFOLIO_RE)):
+                if found[key] is None:
+                    url = pattern.search(token)
+                    if url:
+                        found[key] = url.group(0)
+        else:
+            # PHONE_RES[0] may open on the separator before the run (its
+            # ``1?[-.\s]?`` prefix); without it a leading 1 would be taken as
+            # the country code ("call 12345678901234" -> 1234567890, not
+            # 2345678901)
+            start = match.start()
+            if start and text[start - 1] in SEPARATOR_CHARS:
+                start -= 1
+            for i, pattern in enumerate(PHONE_RES):
+                if phones[i] is None:
+                    number = pattern.search(text, start, match.end())
+                    if number:
+                        phones[i] = "".join(number.groups()) if pattern.groups else number.group(0)
+        if phones[0] is not None and all(value is not None for value in found.values()):
+            break
+    found["phone"] = next((phone for phone in phones if phone is not None), None)
+    return found
+
+
+def _normalize_url(u):
+    u = u.strip()
+    if u.startswith("www."):
+        return "https://" + u
+    if u.startswith("linkedin.com"):
+        return "https://www." + u
+    if u and not u.startswith("http"):
+        return "https://" + u
+    return u
+
+def _is_valid_name(name_candidate):
+    """Validate if a candidate string is likely a person's name"""
+    if not name_candidate or len(name_candidate.strip()) < 2:
+        return False
+
+    # Clean the candidate
+    cleaned = NON_NAME_CHARS_RE.sub("", name_candidate).strip()
+    words = cleaned.split()
+
+    # Must have 2-4 words
+    if not (2 <= len(words) <= 4):
+        return False
+
+    # Each word should start with capital letter and be mostly alphabetic
+    for word in words:
+        if not word[0].isupper() or not word.replace("'", "").replace("-", "").isalpha():
+            return False
+
+    # Avoid common non-name patterns: any word that is a tech term
+    for word in words:
+        if word.lower() in NAME_TECH_WORDS:
+            return False
+
+    # Avoid email-like patterns
+    if "@" in name_candidate or "." in name_candidate.split()[-1]:
+        return False
+
+    # Avoid phone number patterns
+    if DIGIT_RUN_RE.search(name_candidate):
+        return False
+
+    return True
+
+
+def _name_from_lines(lines):
+    """Name from an explicit label or a standalone line near the top; "Not found" otherwise."""
+    name = "Not found"
+
+    # 1) Look for explicit name labels first
+    for pattern in NAME_LABEL_RES:
+        for line in lines[:10]:
+            match = pattern.search(line)
+            if match:
+                candidate = match.group(1).strip()
+                if _is_valid_name(candidate):
+                    name = candidate
+                    break
+        if name != "Not found":
+            break
+
+    # 2) Look for standalone names in first few lines (most common case)
+    if name == "Not found":
+        for i, line in enumerate(lines[:8]):  # Check first 8 lines
+            # Skip lines that look like headers or contact info
+            if any(keyword in line.lower() for keyword in ["email", "phone", "address", "linkedin", "github", "portfolio", "objective", "summary", "profile"]):
+                continue
+
+            # Clean the line and check if it's a valid name
+            cleaned_line = NON_NAME_CHARS_RE.sub("", line).strip()
+            if _is_valid_name(cleaned_line):
+                # Additional check: make sure it's not a job title or company name
+                if not any(title in line.lower() for title in ["engineer", "developer", "analyst", "manager", "consultant", "specialist", "coordinator", "assistant", "associate", "senior", "junior", "lead", "principal", "architect", "director", "vice", "president", "ceo", "cto", "cfo"]):
+                    name = cleaned_line
+                    break
+    return name
+
+
+def uses_nlp(layout):
+    """False for scanned/image-only PDFs: whatever text they have is not worth a spaCy pass."""
+    return layout is None or layout.kind != "image"
+
+
+def needs_ner(text, layout=None):
+    """True if ``extract_info(text, layout)`` will read spaCy entities for this resume.
+
+    That is when no name is found without NER or the resume has a Skills
+    section.  Batch callers use it to pipe only those resumes through spaCy.
+    """
+    if not uses_nlp(layout):
+        return False
+    document = as_document(text)
+    if next(document.section_spans(SKILLS_HEADER_RE, SKILLS_STOP_RE), None) is not None:
+        return True
+    lines = [ln.strip() for ln in document.lines[:20] if ln.strip()]
+    return _name_from_lines(lines) == "Not found"
+
+
+# --- Enhanced Personal Info Extraction ---
+def extract_personal_info(text, use_nlp=True):
+    """Enhanced personal information extraction with improved name detection
+
+    ``use_nlp=False`` skips the spaCy fallback for the name.
+    """
+    document = as_document(text)
+    text = document.text
+
+    # Improved name extraction
+    lines = [ln.strip() for ln in document.lines[:20] if ln.strip()]
+    # End offset of the 10th non-empty line: the "top section" for NER
+    top_end, seen_lines = 0, 0
+    for i, ln in enumerate(document.lines[:20]):
+        if ln.strip():
+            top_end = document.line_starts[i] + len(ln)
+            seen_lines += 1
+            if seen_lines == 10:
+                break
+    # 1-2) Labelled name, then a standalone name line near the top
+    name = _name_from_lines(lines)
+
+    # 3) Fallback: Use spaCy NER on top section
+    if name == "Not found" and use_nlp:
+        try:
+            # PERSON entities in the first 10 lines, sliced from the resume's doc
+            person_entities = []
+            for ent in document.entities(0, top_end, labels=("PERSON",)):
+                if 2 <= len(ent.text.split()) <= 4:
+                    if _is_valid_name(ent.text):
+                        person_entities.append(ent.text.strip())
+            
+            if person_entities:
+                # Prefer entities that appear earlier in the text
+                name = person_entities[0]
+        except Exception:
+            pass
+    
+    # 4) Final fallback: simple pattern matching
+    if name == "Not found":
+        for pattern in SIMPLE_NAME_RES:
+            for line in lines[:5]:
+                match = pattern.match(line.strip())
+                if match:
+                    candidate = match.group(1).strip()
+                    if _is_valid_name(candidate):
+                        name = candidate
+                        break
+            if name != "Not found":
+                break
+    
+    # Email, phone and profile URLs from one scan of the text
+    contacts = scan_contacts(text)
+    linkedin, github, portfolio = (
+        _normalize_url(contacts[kind]) if contacts[kind] else "Not found"
+        for kind in ("linkedin", "github", "portfolio")
+    )
+
+    return {
+        "name": name,
+        "email": contacts["email"] or "Not found",
+        "phone": contacts["phone"] or "Not found",
+        "linkedin": linkedin,
+        "github": github,
+        "portfolio": portfolio
+    }
+
+# --- Enhanced Education Extraction ---
+def extract_education_info(text):
+    """Enhanced education information extraction (section-aware, robust patterns, deduped)"""
+    doc = as_document(text)
+    text = doc.text
+    found = []
+
+    # 1) Section-aware parse: Education/Academics/Qualifications
+    for header, block in doc.section_blocks(EDUCATION_HEADER_RE, EDUCATION_STOP_RE):
+        if header.group(2):
+            block = header.group(2) + "\n" + block
+        items = EDUCATION_ITEM_SPLIT_RE.split(block)
+        for item in items:
+            line = item.strip()
+            low = line.lower()
+            if len(line) < 4:
+                continue
+            if DEGREE_KEYWORD_RE.search(low) or any(k in low for k in INSTITUTION_KEYWORDS) or YEAR_RE.search(low):
+                # Keep typical education lines; avoid pure addresses/contacts
+                if "@" in low or "http" in low:
+                    continue
+                found.append(line)
+
+    # 2) Fallback patterns across full text
+    for pattern in EDUCATION_FALLBACK_RES:
+        for match in pattern.findall(text):
+            if isinstance(match, tuple):
+                edu_text = ' '.join([m for m in match if isinstance(m, str) and m]).strip()
+            else:
+                edu_text = match.strip()
+            if edu_text and len(edu_text) > 5:
+                found.append(edu_text)
+
+    # 3) Normalize and deduplicate
+    normalized = []
+    seen = set()
+    for line in found:
+        clean = WHITESPACE_RE.sub(" ", line).strip(" .")
+        # Collapse duplicated consecutive words: e.g., "Intermediate Intermediate" -> "Intermediate"
+        clean = REPEATED_WORD_RE.sub(r"\1", clean)
+        key = clean.lower()
+        if key not in seen:
+            seen.add(key)
+            normalized.append(clean)
+
+    # 4) Preferred formatting: B.Tech college, Intermediate college, 10th school
+    def extract_institute(line_text: str) -> str:
+        t = line_text
+        # Remove degree keywords and years
+        for pattern in INSTITUTE_NOISE_RES:
+            t = pattern.sub(" ", t)
+        t = WHITESPACE_RE.sub(" ", t).strip(" ,.-")
+        return t
+
+    btech_line = None
+    inter_line = None
+    ssc_line = None
+
+    for ln in normalized:
+        low = ln.lower()
+        if btech_line is None and BTECH_RE.search(low):
+            btech_line = f"B.Tech - {extract_institute(ln)}".strip()
+        if inter_line is None and INTERMEDIATE_RE.search(low):
+            inter_line = f"Intermediate - {extract_institute(ln)}".strip()
+        if ssc_line is None and SSC_RE.search(low):
+            ssc_line = f"SSC - {extract_institute(ln)}".strip()
+
+    preferred = [x for x in [btech_line, inter_line, ssc_line] if x and len(x.split('-')[-1].strip()) > 0]
+    if preferred:
+        # Deduplicate preferred
+        seenp = set()
+        finalp = []
+        for x in preferred:
+            k = x.lower()
+            if k not in seenp:
+                seenp.add(k)
+                finalp.append(x)
+        return finalp
+
+    return normalized if normalized else ["Not found"]
+
+# --- Enhanced Skills Extraction with Preprocessing ---
+def preprocess_text(text):
+    """Preprocess text for better skill matching"""
+    # Normalize case and remove punctuation
+    text = text.lower()
+    text = PUNCTUATION_RE.sub(' ', text)
+    # Remove extra whitespace
+    text = WHITESPACE_RE.sub(' ', text).strip()
+    return text
+
+def extract_skills_enhanced(text, use_nlp=True):
+    """Enhanced skills extraction with preprocessing and soft skills detection
+
+    ``use_nlp=False`` skips the spaCy entities of the Skills sections.
+    """
+    document = as_document(text)
+    text = document.text
+    # Section-aware extraction from explicit Skills sections (support multiple)
+    section_skills_map = {}
+    skills_spans = []
+    try:
+        for m, start, end in document.section_spans(SKILLS_HEADER_RE, SKILLS_STOP_RE):
+            # NER range includes the text after the heading on its own line
+            skills_spans.append((start - len(m.group(2)), end))
+            skills_block = text[start:end]
+            if m.group(2):
+                skills_block = m.group(2) + "\n" + skills_block
+            raw_items = SKILL_ITEM_SPLIT_RE.split(skills_block)
+            for item in raw_items:
+                original = item.strip()
+                cleaned_norm = NON_SKILL_CHARS_RE.sub("", original).strip().lower()
+                if 1 < len(cleaned_norm) <= 40:
+                    section_skills_map.setdefault(cleaned_norm, original)
+    except Exception:
+        pass
+
+    # Contextual spans like "proficient in", "experience with", etc.
+    context_spans_text = []
+    try:
+        for ctx in SKILL_CONTEXT_RE.finditer(text):
+            span = ctx.group(2)
+            if span:
+                context_spans_text.append(span)
+    except Exception:
+        pass
+    context_terms = set()
+    for span in context_spans_text:
+        for token in SKILL_ITEM_SPLIT_RE.split(span):
+            cleaned = NON_SKILL_CHARS_RE.sub("", token).strip().lower()
+            if 1 < len(cleaned) <= 40:
+                context_terms.add(cleaned)
+
+    # Technical skills from known keywords but limit to Skills sections or contextual spans
+    technical_skills = {k for k in SKILL_KEYWORD_SET if k in section_skills_map or k in context_terms}
+
+    # Soft skills detection (whole words, shared keyword pass)
+    detected_soft_skills = set(document.skills.soft_skills)
+    
+    # Named entity recognition for additional skills (only from skills blocks)
+    ner_skills = set()
+    try:
+        for start, end in skills_spans if use_nlp else ():
+            for ent in document.entities(start, end, labels=("ORG", "PRODUCT")):
+                if len(ent.text) < 30:
+                    ner_skills.add(preprocess_text(ent.text))
+    except Exception:
+        pass
+    
+    # Merge and normalize unique skills
+    all_norm = set(section_skills_map.keys())
+    all_norm |= technical_skills
+    all_norm |= detected_soft_skills
+    all_norm |= ner_skills
+    
+    # Filters to remove institutions/companies and noise from skills
+    org_edu_blocklist = [
+        "university", "college", "school", "institute", "academy", "junior college",
+        "polytechnic", "campus"
+    ]
+    org_company_blocklist = [
+        " private limited", " pvt", "pvt.", "limited", " ltd", "ltd.", " inc", "inc.", " llc", "llc.",
+        "solutions", "technologies", "labs", "systems", "corporation", "corp", "company"
+    ]
+    def looks_like_org_or_edu(s: str) -> bool:
+        low = s.lower()
+        if any(k in low for k in org_edu_blocklist):
+            return True
+        if any(k in low for k in org_company_blocklist):
+            return True
+        if YEAR_WORD_RE.search(low):
+            return True
+        if "@" in low or "http" in low:
+            return True
+        # Too many digits likely not a skill
+        digits = sum(ch.isdigit() for ch in low)
+        if digits / max(1, len(low)) > 0.3:
+            return True
+        return False
+
+    # Prefer original casing from section items when available
+    result = []
+    for s in all_norm:
+        if s in section_skills_map:
+            val = WHITESPACE_RE.sub(" ", section_skills_map[s]).strip(" .")
+            if not looks_like_org_or_edu(val):
+                result.append(val)
+        else:
+            if not looks_like_org_or_edu(s):
+                result.append(s)
+    # Deduplicate while preserving order
+    seen = set()
+    unique = []
+    for it in result:
+        key = it.lower()
+        if key not in seen:
+            seen.add(key)
+            unique.append(it)
+
+    # Final cleanup: remove noise, expand acronyms, allow only known short skills
+    noise_terms = {
+        "tstracking", "tracking id", "tracking", "na", "n/a"
+    }
+    alias_map = {
+        "ar": "Augmented Reality",
+        "vr": "Virtual Reality",
+        "ai": "Artificial Intelligence",
+        "ml": "Machine Learning",
+        "nlp": "Natural Language Processing",
+        "ux": "User Experience",
+        "ui": "User Interface",
+        "sem": "Search Engine Marketing",
+        "seo": "Search Engine Optimization",
+        "ips": "Intrusion Prevention System",
+        "ids": "Intrusion Detection System",
+    }
+    allowed_short = {
+        "ai", "ml", "dl", "nlp", "cv", "ux", "ui", "qa", "db", "ar", "vr", "sem", "seo", "ips", "ids"
+    }
+    cleaned = []
+    seen2 = set()
+    for item in unique:
+        base = item.strip()
+        low = base.lower()
+        if low in noise_terms:
+            continue
+        # Drop very short tokens unless in allowlist
+        if len(low) <= 2 and low not in allowed_short:
+            continue
+        if 2 < len(low) <= 3 and low not in allowed_short and not low.isupper():
+            # three-letter lowercase randoms are likely noise unless allowed
+            continue
+        # Expand known acronyms to canonical names
+        if low in alias_map:
+            base = alias_map[low]
+        # Normalize inner spaces
+        base = WHITESPACE_RE.sub(" ", base).strip()
+        key2 = base.lower()
+        if key2 not in seen2:
+            seen2.add(key2)
+            cleaned.append(base)
+
+    return cleaned if cleaned else ["Not found"]
+
+# --- Enhanced Certifications Extraction ---
+def extract_certifications_enhanced(text):
+    """Enhanced certifications extraction"""
+    # Known certification providers and keywords
+    cert_providers = [
+        "coursera", "udemy", "edx", "udacity", "aws", "amazon", "google", "microsoft", "ibm",
+        "oracle", "linkedin learning", "skillshare", "pluralsight", "datacamp",
+        "deeplearning.ai", "fast.ai", "kaggle", "hackerrank", "leetcode"
+    ]
+    
+    # Certification keywords and patterns
+    cert_keywords = [
+        "certified", "certification", "certificate", "accredited", "professional",
+        "specialist", "expert", "master", "foundation", "associate"
+    ]
+
+    doc = as_document(text)
+    text = doc.text
+    found = set()
+    # Common cert acronyms and codes (CERT_ACRONYMS, matched on word boundaries)
+    matcher = get_skill_matcher()
+
+    def has_cert_acronym(s):
+        return any(hit.keyword in CERT_ACRONYM_SET for hit in matcher.find(s))
+
+    # 1) Section-aware parsing
+    # Parse multiple certification-like sections
+    for header, block in doc.section_blocks(CERT_HEADER_RE, CERT_STOP_RE):
+        if header.group(2):
+            block = header.group(2) + "\n" + block
+        # Split by lines, bullets, commas, semicolons, pipes (avoid splitting on hyphens/dashes to keep titles intact)
+        items = CERT_ITEM_SPLIT_RE.split(block)
+        for item in items:
+            clean = item.strip()
+            low = clean.lower()
+            if len(clean) < 3:
+                continue
+            # Within certification-like sections, accept reasonable certificate/course lines
+            if any(ex in low for ex in ["university", "college", "school", "degree"]):
+                continue
+            # Keep if clear signals present
+            titlecase_words = sum(1 for w in WORD_RE.findall(clean) if w[:1].isupper())
+            signals = (
+                any(p in low for p in cert_providers) or
+                any(k in low for k in cert_keywords) or
+                has_cert_acronym(clean) or
+                CERT_CODE_RE.search(clean) or
+                any(w in low for w in ["course", "training", "badge", "credential", "nanodegree", "bootcamp", "license", "academy", "forage"])
+            )
+            if signals or titlecase_words >= 2:
+                # Collapse duplicated consecutive words inside item
+                cleaned_item = REPEATED_WORD_RE.sub(r"\1", clean)
+                found.add(cleaned_item)
+
+    # 2) Line-by-line heuristics across entire document
+    # One keyword pass over the whole text, mapped back to the lines it hit
+    acronym_lines = {doc.line_of(hit.start) for hit in doc.skills.hits if hit.keyword in CERT_ACRONYM_SET}
+    for line_no, raw in enumerate(doc.lines):
+        line = raw.strip()
+        low = line.lower()
+        if any(provider in low for provider in cert_providers) and len(line) > 3:
+            found.add(line)
+        elif (any(keyword in low for keyword in cert_keywords) or line_no in acronym_lines or CERT_CODE_RE.search(line)) and len(line) > 3 and not any(ex in low for ex in ["university", "college", "school", "degree"]):
+            found.add(line)
+        elif CERT_TITLE_RE.search(low):
+            found.add(line)
+
+    normalized = {WHITESPACE_RE.sub(" ", c).strip(" .") for c in found}
+    return list(normalized) if normalized else ["Not found"]
+
+# --- Enhanced Projects Extraction ---
+def extract_projects(text):
+    """Extract project titles/lines from resume text (section-aware with fallbacks)."""
+    doc = as_document(text)
+    text = doc.text
+    projects = []
+
+    def title_from_line(line: str) -> str:
+        s = line.strip().strip("-–—|:;•·")
+        # Take portion before comma if it looks like tags list
+        if "," in s and len(s.split(",")[0].split()) <= 6:
+            s = s.split(",")[0].strip()
+        # Prefer text before separators
+        for sep in [" - ", " – ", " — ", ":", " | ", " |", "| "]:
+            if sep in s:
+                left = s.split(sep)[0].strip()
+                if len(left) >= 3:
+                    s = left
+                    break
+        # Remove trailing parenthetical details
+        s = TRAILING_PARENS_RE.sub("", s).strip()
+        # If long sentence, try to capture leading Title Case chunk
+        m = LEADING_TITLE_RE.match(s)
+        if m and len(m.group(1)) >= 3:
+            return m.group(1)
+        # Otherwise limit to first 6 words
+        return " ".join(s.split()[:6]).strip()
+
+    def is_valid_title(title: str) -> bool:
+        low = title.lower().strip()
+        if len(low) < 3:
+            return False
+        stop_exact = {
+            "technologies", "internships", "internship", "currently", "experience", "responsibilities",
+            "built", "created", "developed"
+        }
+        if low in stop_exact:
+            return False
+        stop_sub = [" internship", "internship ", " responsibilities", " duties"]
+        if any(ss in low for ss in stop_sub):
+            return False
+        # Allow CamelCase single tokens like ScholarHunt
+        if " " not in title and CAMEL_CASE_RE.search(title):
+            return True
+        # Prefer 2-6 words for multi-word titles
+        wc = len(title.split())
+        if 2 <= wc <= 6:
+            return True
+        return False
+    # 1) Section-aware: Projects/Personal Projects/Academic Projects
+    try:
+        for header, block in doc.section_blocks(PROJECTS_HEADER_RE, PROJECTS_STOP_RE):
+            # If inline items on header line
+            if header.group(2):
+                block = header.group(2) + "\n" + block
+            # Split primarily by newlines and bullets (avoid splitting on hyphens to keep names intact)
+            items = PROJECT_ITEM_SPLIT_RE.split(block)
+            for raw in items:
+                line = raw.strip().strip("-–—|:;")
+                if len(line) < 5:
+                    continue
+                # Typical noise filters
+                low = line.lower()
+                if any(h in low for h in ["experience", "education", "skills", "certification", "contact"]):
+                    continue
+                t = title_from_line(line)
+                if is_valid_title(t):
+                    projects.append(t)
+    except Exception:
+        pass
+
+    # 2) Fallback: scan for lines containing project-like cues
+    if not projects:
+        cues = ["project:", "capstone", "built", "developed", "implemented", "designed", "engineered"]
+        lines = doc.lines
+        for i, ln in enumerate(lines):
+            low = ln.strip().lower()
+            if any(c in low for c in cues):
+                cleaned = ln.strip().strip("-–—|:;")
+                if len(cleaned) > 5:
+                    t = title_from_line(cleaned)
+                    if is_valid_title(t):
+                        projects.append(t)
+                # Grab immediate next bullet/line as context
+                if i + 1 < len(lines):
+                    nxt = lines[i+1].strip().strip("-–—|:;")
+                    if len(nxt) > 5:
+                        t2 = title_from_line(nxt)
+                        if is_valid_title(t2):
+                            projects.append(t2)
+
+    # Normalize and deduplicate
+    normalized = []
+    seen = set()
+    for p in projects:
+        clean = WHITESPACE_RE.sub(" ", p).strip(" .")
+        if len(clean) > 4:
+            k = clean.lower()
+            if k not in seen:
+                seen.add(k)
+                normalized.append(clean)
+    return normalized if normalized else ["Not found"]
+
+# --- Enhanced Info Extraction Function ---
+def extract_info(text, layout=None):
+    """Enhanced information extraction with all improvements
+
+    ``layout`` is the PDF's ``DocumentLayout``; scanned/image-only PDFs get
+    no spaCy pass (see ``uses_nlp``).
+    """
+    # One parsed document shared by every extractor below
+    text = as_document(text)
+    use_nlp = uses_nlp(layout)
+    # Extract personal info
+    with span("extract.personal_info"):
+        personal_info = extract_personal_info(text, use_nlp)
+    
+    # Extract education
+    with span("extract.education"):
+        education = extract_education_info(text)
+    
+    # Extract skills
+    with span("extract.skills"):
+        skills = extract_skills_enhanced(text, use_nlp)
+    
+    # Extract certifications
+    with span("extract.certifications"):
+        certifications = extract_certifications_enhanced(text)
+    
+    # Extract projects
+    with span("extract.projects"):
+        projects = extract_projects(text)
+    
+    return {
+        "name": personal_info["name"],
+        "email": personal_info["email"],
+        "phone": personal_info["phone"],
+        "education": education,
+        "skills": skills,
+        "certifications": certifications,
+        "projects": projects,
+        "linkedin": personal_info["linkedin"],
+        "github": personal_info["github"],
+        "portfolio": personal_info["portfolio"]
+    }
+
+# --- Resume Format Validation ---
+def validate_resume_format(text, layout=None):
+    """Validate resume format and warn about potential issues
+
+    ``layout`` (a ``DocumentLayout`` for PDFs) replaces the text heuristics
+    for scanned, multi-column and image-heavy documents.
+    """
+    doc = as_document(text)
+    text = doc.text
+    warnings = []
+    
+    # Check for very short content (might be scanned)
+    if layout is not None and layout.kind == "image":
+        warnings.append("⚠ Scanned or image-only PDF detected. There is little or no selectable text for an ATS to read.")
+    elif len(text.strip()) < 500:
+        warnings.append("⚠ Very short content detected. This might be a scanned PDF or image-based resume.")
+    
+    # Check for weird symbols (OCR artifacts)
+    weird_symbols = WEIRD_SYMBOL_RE.findall(text)
+    if len(weird_symbols) > len(text) * 0.1:  # More than 10% weird symbols
+        warnings.append("⚠ Many unusual symbols detected. This might be a scanned PDF with poor OCR.")
+    
+    # Check for multi-column indicators
+    if layout is not None:
+        multi_column = layout.kind == "columns"
+    else:
+        multi_column = any(indicator in text for indicator in ["|", "  ", "\t\t"])
+    if multi_column:
+        warnings.append("⚠ Multi-column layout detected. Consider using a single-column format for better ATS compatibility.")
+    
+    # Check for image-heavy indicators (very few words)
+    if layout is not None:
+        if layout.image_heavy:
+            warnings.append("⚠ Image-heavy pages detected. Text inside images is invisible to ATS systems.")
+    elif len(doc.words) < 100:
+        warnings.append("⚠ Very few words detected. This might be an image-heavy resume.")
+    
+    return warnings
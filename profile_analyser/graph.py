@@ -0,0 +1,161 @@
+"""Lazy analysis graph for one resume file.
+
+Every artifact the UI shows is a node with declared dependencies:
+
+    source -> extraction -> text/error/layout -> document -> info, field,
+    format_warnings -> score/breakdown, ats_features, strengths_weaknesses, tips
+
+A ``ResumeAnalysis`` computes a node the first time it is read and keeps the
+result, so a page only pays for the nodes it renders and moving between pages
+never recomputes anything.  ``get_analysis`` shares one ``ResumeAnalysis`` per
+file (keyed by the SHA-256 of its bytes) through the parse cache.
+"""
+import threading
+from operator import itemgetter
+
+from profile_analyser.cache import approx_size, file_digest, get_parse_cache
+from profile_analyser.document import as_document
+from profile_analyser.extract import ExtractionError, extract_document
+from profile_analyser.extractors import extract_info, validate_resume_format
+from profile_analyser.metrics import span
+from profile_analyser.scoring import (
+    detect_field,
+    dynamic_resume_score,
+    extract_ats_features,
+    get_personalized_tips,
+    get_strengths_weaknesses,
+)
+
+
+def _extract(source):
+    data, file_type = source
+    if callable(data):
+        # Bytes fetched on first use (e.g. from the blob store)
+        data = data()
+    try:
+        text, layout = extract_document(data, file_type)
+    except ExtractionError as e:
+        return "", f"Error extracting text from {file_type.upper()}: {e}", None
+    return text, None, layout
+
+
+# name -> (dependencies, function of the dependency values)
+NODES = {
+    "extraction": (("source",), _extract),
+    "text": (("extraction",), itemgetter(0)),
+    "error": (("extraction",), itemgetter(1)),
+    "layout": (("extraction",), itemgetter(2)),
+    "document": (("text",), as_document),
+    "format_warnings": (("document", "layout"), validate_resume_format),
+    "info": (("document", "layout"), extract_info),
+    "field": (("document",), lambda doc: detect_field(doc.text)),
+    "scored": (("document", "info", "field"), dynamic_resume_score),
+    "score": (("scored",), itemgetter(0)),
+    "breakdown": (("scored",), itemgetter(1)),
+    "ats_features": (("document", "info", "field"), extract_ats_features),
+    "strengths_weaknesses": (("document", "info"), get_strengths_weaknesses),
+    "tips": (("document", "info"), get_personalized_tips),
+}
+
+# Not kept on the analysis: documents are already shared (and bounded) by
+# as_document's own memo
+TRANSIENT = frozenset({"document"})
+
+# What the batch/worker pipeline computes for every file
+BATCH_NODES = ("text", "info", "field", "score", "breakdown", "error", "layout")
+
+
+class ResumeAnalysis:
+    """Memoized nodes of ``NODES`` for one file, computed on first access.
+
+    Reads look like the old result dict (``analysis['score']``,
+    ``analysis.get('error')``); ``in`` tells whether a node is already
+    computed.  The raw file bytes are dropped once the text is extracted.
+    ``data`` may also be a zero-argument callable returning the bytes, read
+    only if extraction runs; ``digest`` is then required.  ``cache`` is the
+    ``ParseCache`` holding the analysis under ``digest``: its size there is
+    updated every time a node is stored.
+    """
+
+    def __init__(self, data=b"", file_type="pdf", digest=None, cache=None):
+        self.digest = digest or file_digest(data)
+        self.file_type = file_type
+        self._values = {"source": (data, file_type)}
+        self._lock = threading.RLock()
+        self._cache = cache
+
+    def __getitem__(self, name):
+        if name not in NODES and name not in self._values:
+            raise KeyError(name)
+        with self._lock:
+            return self._resolve(name)
+
+    def __contains__(self, name):
+        return name in self._values
+
+    def get(self, name, default=None):
+        value = self[name]
+        return default if value is None else value
+
+    def evaluate(self, names):
+        """Compute ``names`` and return them as a plain dict."""
+        return {name: self[name] for name in names}
+
+    def seed(self, values):
+        """Store node values computed elsewhere (e.g. by a batch worker)."""
+        with self._lock:
+            for name, value in values.items():
+                if name in NODES and name not in TRANSIENT:
+                    self._values.setdefault(name, value)
+            self._release_source()
+            self._resized()
+
+    def fail(self, message):
+        """Forget every computed node: the file now reads as an empty resume with ``message`` as its error."""
+        with self._lock:
+            self._values = {"extraction": ("", message, None)}
+            self._resized()
+
+    def computed(self):
+        return tuple(name for name in self._values if name not in ("source", "extraction"))
+
+    def approx_size(self):
+        # "extraction" holds the same text as the "text" node
+        with self._lock:
+            return sum(approx_size(value) for name, value in self._values.items() if name != "extraction")
+
+    def _resolve(self, name):
+        if name in self._values:
+            return self._values[name]
+        deps, compute = NODES[name]
+        args = [self._resolve(dep) for dep in deps]
+        if isinstance(compute, itemgetter):
+            value = compute(*args)
+        else:
+            # Dependencies resolve first, so a node's span is its own work only
+            with span(f"analysis.{name}"):
+                value = compute(*args)
+        if name not in TRANSIENT:
+            self._values[name] = value
+            self._release_source()
+            self._resized()
+        return value
+
+    def _release_source(self):
+        if "extraction" in self._values or all(name in self._values for name in ("text", "error", "layout")):
+            self._values.pop("source", None)
+
+    def _resized(self):
+        if self._cache is not None:
+            self._cache.resize(self.digest, self.approx_size())
+
+
+def get_analysis(data, file_type, cache=None, digest=None):
+    """Shared ``ResumeAnalysis`` for a file's bytes (nothing is computed yet).
+
+    Pass ``digest`` when the file's SHA-256 is already known; ``data`` can then
+    be a callable so the bytes are only loaded on a cache miss.
+    """
+    cache = get_parse_cache() if cache is None else cache
+    digest = digest or file_digest(data)
+    return cache.get_or_compute(digest, lambda: ResumeAnalysis(data, file_type, digest, cache))
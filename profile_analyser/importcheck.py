@@ -0,0 +1,72 @@
+"""Import-time budget for the analysis core.
+
+Importing the core must stay cheap: process-pool workers, the CLI and scripts
+pay it on every cold start, while spaCy, PyMuPDF, python-docx, pandas and
+reportlab are imported lazily by the functions that need them.  ``measure``
+imports modules in a fresh interpreter under ``-X importtime`` and reports
+the cumulative cost; ``python -m profile_analyser import-check`` fails if the
+budget is exceeded or a heavy dependency is pulled in at import time.
+"""
+import json
+import os
+import subprocess
+import sys
+
+CORE_MODULES = (
+    "profile_analyser.cache",
+    "profile_analyser.extract",
+    "profile_analyser.extractors",
+    "profile_analyser.scoring",
+    "profile_analyser.nlp",
+    "profile_analyser.graph",
+    "profile_analyser.batch",
+    "profile_analyser.cli",
+)
+
+# Top-level packages that must only be imported on first use
+HEAVY_MODULES = ("spacy", "thinc", "fitz", "pymupdf", "docx", "pandas", "numpy", "pyarrow", "reportlab", "sklearn", "streamlit")
+
+DEFAULT_BUDGET_MS = float(os.environ.get("PROFILE_ANALYSER_IMPORT_BUDGET_MS", "150"))
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+for name in sys.argv[1:]:
+    __import__(name)
+elapsed = time.perf_counter() - start
+print(json.dumps([elapsed, sorted(sys.modules)]))
+"""
+
+
+def measure(modules=CORE_MODULES):
+    """Import ``modules`` in a fresh interpreter and return a timing report.
+
+    The report holds the wall time of the imports, the per-module cumulative
+    ``-X importtime`` figures (microseconds) for the requested modules, and
+    any heavy dependencies that ended up in ``sys.modules``.
+    """
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [root, os.environ.get("PYTHONPATH")])))
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _PROBE, *modules],
+        capture_output=True, text=True, env=env, check=False,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else "import probe failed")
+    elapsed, loaded = json.loads(proc.stdout.strip().splitlines()[-1])
+    cumulative = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cum, name = (part.strip() for part in line[len("import time:"):].split("|"))
+        if name in modules:
+            cumulative[name] = int(cum)
+    heavy = sorted({name.split(".")[0] for name in loaded if name.split(".")[0] in HEAVY_MODULES})
+    return {"milliseconds": round(elapsed * 1000, 1), "modules": cumulative, "heavy": heavy}
+
+
+def check(budget_ms=DEFAULT_BUDGET_MS, modules=CORE_MODULES):
+    """Return ``(ok, report)`` for the import budget."""
+    report = measure(modules)
+    ok = report["milliseconds"] <= budget_ms and not report["heavy"]
+    return ok, report
@@ -0,0 +1,204 @@
+"""Local job catalog with an inverted skill index for the Job Matching page.
+
+Postings are loaded from JSON/JSONL, CSV or SQLite files (the bundled
+``data/jobs.json`` by default, or the files listed in
+``PROFILE_ANALYSER_JOB_CATALOG``).  Each posting needs ``company``, ``role``
+and ``skills``; ``field``, ``location`` and ``salary`` are optional.
+
+Building a ``JobCatalog`` assigns every distinct skill an IDF weight and keeps,
+per skill, the array of postings that require it.  Matching a resume then only
+touches the postings that share at least one skill with it: each matched skill
+adds its weight to those postings, and the match score is the share of a
+posting's (IDF-weighted) required skills the resume covers.  Scores are
+computed, not typed in, and top-k retrieval over 100k+ postings takes
+milliseconds.
+"""
+import csv
+import json
+import math
+import os
+import re
+import sqlite3
+import threading
+
+from profile_analyser.metrics import timed
+
+DEFAULT_CATALOG = os.path.join(os.path.dirname(__file__), "data", "jobs.json")
+CATALOG_PATHS = os.environ.get("PROFILE_ANALYSER_JOB_CATALOG", DEFAULT_CATALOG)
+
+# Separators accepted in flat (CSV/SQLite) skill columns
+_SKILL_SPLIT_RE = re.compile(r"\s*[;|,]\s*")
+_SALARY_RE = re.compile(r"\$?\s*(\d+(?:\.\d+)?)\s*k", re.I)
+
+
+def normalize_skill(skill):
+    return " ".join(str(skill).lower().split())
+
+
+def split_skills(value):
+    if isinstance(value, (list, tuple)):
+        return [str(s).strip() for s in value if str(s).strip()]
+    return [s for s in _SKILL_SPLIT_RE.split(str(value or "").strip()) if s]
+
+
+def salary_floor_k(salary):
+    """Lower bound of a salary string like ``$120k-160k`` in thousands, or None."""
+    match = _SALARY_RE.search(salary or "")
+    return int(float(match.group(1))) if match else None
+
+
+def _posting(record):
+    return {
+        "company": str(record.get("company") or "Unknown"),
+        "role": str(record.get("role") or record.get("title") or "Unknown"),
+        "field": str(record.get("field") or "General"),
+        "location": str(record.get("location") or "Unknown"),
+        "salary": str(record.get("salary") or "Not listed"),
+        "skills": split_skills(record.get("skills")),
+    }
+
+
+def _read_json(path):
+    with open(path, encoding="utf-8") as fh:
+        if path.endswith(".jsonl"):
+            return [json.loads(line) for line in fh if line.strip()]
+        data = json.load(fh)
+    return data.get("postings", []) if isinstance(data, dict) else data
+
+
+def _read_csv(path):
+    with open(path, newline="", encoding="utf-8") as fh:
+        return list(csv.DictReader(fh))
+
+
+def _read_sqlite(path, table="postings"):
+    conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+    try:
+        conn.row_factory = sqlite3.Row
+        return [dict(row) for row in conn.execute(f'SELECT * FROM "{table}"')]
+    finally:
+        conn.close()
+
+
+def load_postings(path):
+    """Read postings from a .json/.jsonl, .csv or .sqlite/.db file."""
+    ext = path.rsplit(".", 1)[-1].lower()
+    if ext in ("json", "jsonl"):
+        records = _read_json(path)
+    elif ext == "csv":
+        records = _read_csv(path)
+    elif ext in ("sqlite", "sqlite3", "db"):
+        records = _read_sqlite(path)
+    else:
+        raise ValueError(f"Unsupported job catalog format: {path}")
+    return [_posting(record) for record in records]
+
+
+class JobCatalog:
+    """Postings plus an inverted skill index; ``top_k`` ranks them for a resume."""
+
+    def __init__(self, postings):
+        import numpy as np
+
+        self.postings = list(postings)
+        self.fields = sorted({p["field"] for p in self.postings})
+        rows = {}
+        for index, posting in enumerate(self.postings):
+            for skill in {normalize_skill(s) for s in posting["skills"]}:
+                rows.setdefault(skill, []).append(index)
+        n = max(1, len(self.postings))
+        # skill -> (posting ids, IDF weight)
+        self._index = {
+            skill: (np.array(ids, dtype=np.int32), math.log(1 + n / len(ids)))
+            for skill, ids in rows.items()
+        }
+        # Precomputed posting vectors reduce to their total weight: a posting's
+        # match is the weight of the skills it shares with the resume over this
+        totals = np.zeros(len(self.postings))
+        for ids, weight in self._index.values():
+            totals[ids] += weight
+        self._totals = totals
+        self._field_ids = {
+            field: np.array([i for i, p in enumerate(self.postings) if p["field"] == field], dtype=np.int32)
+            for field in self.fields
+        }
+
+    def __len__(self):
+        return len(self.postings)
+
+    @timed("jobs.top_k")
+    def top_k(self, skills, k=5, field=None):
+        """Best ``k`` postings for a resume's ``skills``.
+
+        Postings are restricted to ``field`` when the catalog has postings for
+        it.  Each result is a copy of the posting with ``match`` (percent of
+        its weighted skills the resume covers) and ``matched_skills`` added.
+        """
+        import numpy as np
+
+        if not self.postings:
+            return []
+        resume_skills = {normalize_skill(s) for s in skills if s and s != "Not found"}
+        scores = np.zeros(len(self.postings))
+        for skill in resume_skills:
+            entry = self._index.get(skill)
+            if entry is not None:
+                scores[entry[0]] += entry[1]
+        scores = np.divide(scores, self._totals, out=np.zeros_like(scores), where=self._totals > 0)
+        candidates = self._field_ids.get(field)
+        if candidates is None or not len(candidates):
+            candidates = np.arange(len(self.postings), dtype=np.int32)
+        k = min(k, len(candidates))
+        if k <= 0:
+            return []
+        candidate_scores = scores[candidates]
+        top = np.argpartition(-candidate_scores, k - 1)[:k]
+        # Best match first; ties keep catalog order
+        top = top[np.lexsort((candidates[top], -candidate_scores[top]))]
+        results = []
+        for position in top:
+            posting = dict(self.postings[candidates[position]])
+            posting["match"] = int(round(100 * candidate_scores[position]))
+            posting["matched_skills"] = [s for s in posting["skills"] if normalize_skill(s) in resume_skills]
+            results.append(posting)
+        return results
+
+
+_catalog = None
+_catalog_key = None
+_catalog_lock = threading.Lock()
+
+
+def _catalog_paths(paths=None):
+    return [p for p in (paths or CATALOG_PATHS).split(os.pathsep) if p]
+
+
+def _catalog_files(paths):
+    """``(path, mtime)`` of the catalog files that exist, and the paths that do not."""
+    found, missing = [], []
+    for path in paths:
+        try:
+            found.append((path, os.path.getmtime(path)))
+        except OSError:
+            missing.append(path)
+    return found, missing
+
+
+def missing_catalog_paths(paths=None):
+    """Catalog paths (default ``PROFILE_ANALYSER_JOB_CATALOG``) that are missing or unreadable."""
+    return _catalog_files(_catalog_paths(paths))[1]
+
+
+def get_job_catalog(paths=None):
+    """Process-wide catalog for ``paths`` (``os.pathsep``-separated), rebuilt when a file changes.
+
+    Missing paths are skipped (see ``missing_catalog_paths``); if none of them
+    exists the bundled ``data/jobs.json`` is used.
+    """
+    global _catalog, _catalog_key
+    key = tuple(_catalog_files(_catalog_paths(paths))[0]) or tuple(_catalog_files([DEFAULT_CATALOG])[0])
+    with _catalog_lock:
+        if _catalog is None or _catalog_key != key:
+            _catalog = JobCatalog(posting for path, _ in key for posting in load_postings(path))
+            _catalog_key = key
+        return _catalog
@@ -0,0 +1,288 @@
+"""Cheap PDF page layout classification, run before a page's text is extracted.
+
+``classify_page`` reads only what PyMuPDF has once the page's TextPage is
+built: text block geometry and character counts (the TextPage is then reused
+for the text itself), plus the page's image and font resource lists.  Word
+geometry is only read for pages whose blocks look like merged columns.  Each
+page is one of
+
+* ``"text"``: plain ``get_text`` already yields reading order;
+* ``"columns"``: text blocks sit side by side across one or more gutters, so
+  the page is read column by column (``structured_text``);
+* ``"image"``: (almost) no selectable text but images, i.e. a scanned or
+  image-only page.  The analysis skips spaCy for documents made of these.
+
+``DocumentLayout`` summarizes the pages read; ``validate_resume_format`` turns
+it into the layout warnings instead of guessing from the text.
+"""
+from bisect import bisect_right
+from collections import Counter, namedtuple
+
+# Fewer selectable characters than this on a page with images: image-only page
+MIN_PAGE_CHARS = 40
+# Pages with images and fewer characters than this count as image-heavy
+IMAGE_HEAVY_CHARS = 400
+# Blocks wider than this share of the page span columns (headers, full-width rows)
+NARROW_BLOCK = 0.55
+# A gutter must lie within this band of the page width and be this wide (points)
+GUTTER_ZONE = (0.2, 0.8)
+MIN_GUTTER = 8.0
+# Each side of a gutter must hold this share of the column blocks' characters
+MIN_COLUMN_SHARE = 0.2
+# ... and the two sides must overlap vertically by this share of the shorter side
+MIN_COLUMN_OVERLAP = 0.5
+# Word-level fallback: blocks wider than NARROW_BLOCK averaging fewer characters
+# per line than this per point of width look like merged columns, and a gutter
+# may then be crossed by this share of the lines
+SPARSE_LINE_CHARS = 0.1
+LINE_TOLERANCE = 0.05
+# structured_text: headings are lines of at most this many characters, set this
+# much larger than the body text (or bold when the body is not) ...
+MAX_HEADING_CHARS = 40
+HEADING_SCALE = 1.15
+# ... and a line ending this close (share of the column width) to its column's
+# right edge wraps onto the next line if that starts at most this many font
+# sizes further down
+WRAP_SLACK = 0.15
+WRAP_LEADING = 1.6
+
+PageLayout = namedtuple("PageLayout", "number kind chars columns gutters images fonts")
+# One text line (or its part within one column) with its largest font size
+TextLine = namedtuple("TextLine", "x0 y0 x1 y1 text size bold")
+
+
+class DocumentLayout(namedtuple("DocumentLayout", "kind pages")):
+    """Layout of the pages read: ``kind`` is ``"image"`` if every page is, else
+    ``"columns"`` if any page is, else ``"text"``."""
+
+    __slots__ = ()
+
+    @classmethod
+    def from_pages(cls, pages):
+        pages = tuple(pages)
+        kinds = {page.kind for page in pages}
+        if pages and kinds == {"image"}:
+            kind = "image"
+        elif "columns" in kinds:
+            kind = "columns"
+        else:
+            kind = "text"
+        return cls(kind, pages)
+
+    @property
+    def columns(self):
+        return max((page.columns for page in self.pages), default=1)
+
+    @property
+    def image_heavy(self):
+        """Some page carries images and little text (but is not image-only)."""
+        return any(page.images and page.kind != "image" and page.chars < IMAGE_HEAVY_CHARS for page in self.pages)
+
+    @property
+    def fonts(self):
+        return max((page.fonts for page in self.pages), default=0)
+
+
+def _text_blocks(page, textpage):
+    # (x0, y0, x1, y1, text, block_no, block_type); type 1 blocks are images
+    return [block for block in page.get_text("blocks", textpage=textpage) if block[6] == 0 and block[4].strip()]
+
+
+def _sparse(block, width):
+    """A full-width block of short lines: side-by-side columns merged into one block."""
+    block_width = block[2] - block[0]
+    lines = block[4].count("\n") or 1
+    return block_width > NARROW_BLOCK * width and len(block[4]) / lines < SPARSE_LINE_CHARS * block_width
+
+
+def _find_gutters(boxes, width, tolerance=0):
+    """x positions of the gutters between side-by-side columns of ``boxes``.
+
+    A gutter is an x band crossed by at most ``tolerance`` boxes, with enough
+    text on both sides and the two sides next to each other vertically.
+    """
+    total = sum(len(box[4]) for box in boxes)
+    if len(boxes) < 2 or not total:
+        return ()
+    low, high = GUTTER_ZONE[0] * width, GUTTER_ZONE[1] * width
+    gutters = []
+    count = 0
+    opened = None
+    # Sweep the box edges left to right, tracking how many boxes cover x
+    for x, delta in sorted([(box[0], 1) for box in boxes] + [(box[2], -1) for box in boxes]):
+        before, count = count, count + delta
+        if before > tolerance >= count:
+            opened = x
+        elif before <= tolerance < count and opened is not None:
+            start, end, opened = opened, x, None
+            middle = (start + end) / 2
+            if end - start < MIN_GUTTER or not low <= middle <= high:
+                continue
+            left = [box for box in boxes if box[2] <= start]
+            right = [box for box in boxes if box[0] >= end]
+            if min(sum(len(b[4]) for b in left), sum(len(b[4]) for b in right)) < MIN_COLUMN_SHARE * total:
+                continue
+            top = max(min(b[1] for b in left), min(b[1] for b in right))
+            bottom = min(max(b[3] for b in left), max(b[3] for b in right))
+            shorter = min(max(b[3] for b in side) - min(b[1] for b in side) for side in (left, right))
+            if bottom - top >= MIN_COLUMN_OVERLAP * shorter:
+                gutters.append(middle)
+    return tuple(gutters)
+
+
+def classify_page(page, textpage=None):
+    """``PageLayout`` of a PyMuPDF page.
+
+    Pass the page's ``textpage`` to share it with the text extraction that
+    follows.
+    """
+    blocks = _text_blocks(page, textpage)
+    width = page.rect.width
+    chars = sum(len(block[4].strip()) for block in blocks)
+    images = len(page.get_images())
+    fonts = len(page.get_fonts())
+    gutters = ()
+    if len(blocks) >= 4:
+        gutters = _find_gutters([block for block in blocks if block[2] - block[0] <= NARROW_BLOCK * width], width)
+    if not gutters and any(_sparse(block, width) for block in blocks):
+        # Only pages that look like merged columns pay for word geometry
+        words = page.get_text("words", textpage=textpage)
+        line_count = len({(word[5], word[6]) for word in words})
+        gutters = _find_gutters(words, width, int(LINE_TOLERANCE * line_count))
+    if chars < MIN_PAGE_CHARS and images:
+        kind = "image"
+    elif gutters:
+        kind = "columns"
+    else:
+        kind = "text"
+    return PageLayout(page.number, kind, chars, len(gutters) + 1, gutters, images, fonts)
+
+
+def _bold(span):
+    return bool(span["flags"] & 16) or "bold" in span["font"].lower()
+
+
+def _text_lines(page, textpage, gutters):
+    """The page's text lines as ``TextLine``s, cut at the gutters.
+
+    A line with a span across a gutter stays whole (it then spans columns).
+    """
+    lines = []
+    for block in page.get_text("dict", textpage=textpage)["blocks"]:
+        if block["type"] != 0:
+            continue
+        for line in block["lines"]:
+            spans = [span for span in line["spans"] if span["text"].strip()]
+            if not spans:
+                continue
+            if any(s["bbox"][0] < g < s["bbox"][2] for s in spans for g in gutters):
+                pieces = [spans]
+            else:
+                pieces = []
+                column = None
+                for span in spans:
+                    span_column = bisect_right(gutters, span["bbox"][0])
+                    if span_column != column:
+                        pieces.append([])
+                        column = span_column
+                    pieces[-1].append(span)
+            for piece in pieces:
+                text = piece[0]["text"]
+                for before, span in zip(piece, piece[1:]):
+                    # Spans set apart (tab stops, right-aligned dates) carry no space of their own
+                    gap = span["bbox"][0] - before["bbox"][2]
+                    if gap > 0.25 * span["size"] and not text[-1:].isspace() and not span["text"][:1].isspace():
+                        text += " "
+                    text += span["text"]
+                lines.append(TextLine(
+                    min(s["bbox"][0] for s in piece), min(s["bbox"][1] for s in piece),
+                    max(s["bbox"][2] for s in piece), max(s["bbox"][3] for s in piece),
+                    " ".join(text.split()), max(s["size"] for s in piece), all(_bold(s) for s in piece),
+                ))
+    return lines
+
+
+def _reading_order(boxes, gutters):
+    """``boxes`` (``(x0, y0, x1, y1, ...)``) in reading order.
+
+    Boxes crossing a gutter (a header, a full-width row) split the page into
+    bands; within a band each column is read top to bottom, left column first.
+    Without gutters the boxes keep their order.
+    """
+    if not gutters:
+        return list(boxes)
+    spanning = sorted((b for b in boxes if any(b[0] < g < b[2] for g in gutters)), key=lambda b: (b[1], b[0]))
+    bounds = [b[1] for b in spanning]
+    bands = [[] for _ in range(len(spanning) + 1)]
+    for index, box in enumerate(boxes):
+        if any(box[0] < g < box[2] for g in gutters):
+            continue
+        band = bisect_right(bounds, (box[1] + box[3]) / 2)
+        column = bisect_right(gutters, (box[0] + box[2]) / 2)
+        bands[band].append((column, box[1], box[0], index))
+    ordered = []
+    for index, band in enumerate(bands):
+        if index:
+            ordered.append(spanning[index - 1])
+        ordered.extend(boxes[i] for _, _, _, i in sorted(band))
+    return ordered
+
+
+def _wraps(previous, line, extent):
+    """``line`` continues ``previous``: right below it, not outdented, starting in
+    lower case, after a line that runs to the column's right edge."""
+    left, right = extent
+    return (
+        line.text[0].islower()
+        and previous.x0 <= line.x0 + 1
+        and 0 <= line.y0 - previous.y0 <= WRAP_LEADING * previous.size
+        and previous.x1 >= right - WRAP_SLACK * (right - left)
+        and not previous.text.endswith((".", ":", ";"))
+    )
+
+
+def structured_text(page, textpage=None, gutters=()):
+    """Page text rebuilt from PyMuPDF's line and span geometry.
+
+    Lines are read column by column across ``gutters`` (see ``_reading_order``).
+    Headings, i.e. short lines set larger than the body text or in bold when
+    the body is not, stand on their own line after a blank one, so each
+    section starts on a line of its own.  Lines that run to their column's
+    right edge and continue in lower case are joined with the next line.
+    """
+    lines = _text_lines(page, textpage, gutters)
+    if not lines:
+        return ""
+    sizes = Counter()
+    bold_chars = 0
+    for line in lines:
+        sizes[round(line.size, 1)] += len(line.text)
+        bold_chars += len(line.text) if line.bold else 0
+    body_size = sizes.most_common(1)[0][0]
+    body_bold = 2 * bold_chars > sum(sizes.values())
+    # Text extent of each column, for spotting lines that wrap at its right edge
+    extents = {}
+    for line in lines:
+        if any(line.x0 < g < line.x1 for g in gutters):
+            continue
+        column = bisect_right(gutters, line.x0)
+        left, right = extents.get(column, (line.x0, line.x1))
+        extents[column] = (min(left, line.x0), max(right, line.x1))
+    out = []
+    previous = None
+    for line in _reading_order(lines, gutters):
+        if len(line.text) <= MAX_HEADING_CHARS and any(c.isalpha() for c in line.text) and (
+            line.size >= HEADING_SCALE * body_size or (line.bold and not body_bold)
+        ):
+            if out and out[-1]:
+                out.append("")
+            out.append(line.text)
+            previous = None
+            continue
+        column = None if any(line.x0 < g < line.x1 for g in gutters) else bisect_right(gutters, line.x0)
+        if previous is not None and column is not None and _wraps(previous, line, extents[column]):
+            out[-1] += line.text if out[-1].endswith("-") else " " + line.text
+        else:
+            out.append(line.text)
+        previous = line
+    return "\n".join(out) + "\n"
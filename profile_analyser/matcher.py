@@ -0,0 +1,103 @@
+"""Compiled multi-pattern matcher for skill and certification keywords.
+
+Every keyword in ``SKILL_KEYWORDS``, ``KNOWN_SKILLS``, ``SOFT_SKILLS`` and
+``CERT_ACRONYMS`` is tokenized once into a phrase table.  Matching a resume is
+then a single tokenization pass plus one dictionary probe per candidate
+n-gram, however many keywords there are, instead of one substring scan of the
+whole text per keyword and per field.  Because matching works on whole tokens
+it respects word boundaries: ``go`` no longer matches inside ``google`` and
+``r`` no longer matches every word containing the letter.
+"""
+import re
+from collections import namedtuple
+
+from profile_analyser.constants import CERT_ACRONYMS, KNOWN_SKILLS, SKILL_KEYWORDS, SOFT_SKILLS
+
+# Letters/digits (any script), keeping trailing + and # so "c++", "c#" and
+# "security+" stay single tokens.  Everything else is a boundary.
+TOKEN_RE = re.compile(r"[^\W_]+[+#]*")
+
+Hit = namedtuple("Hit", "keyword start end")
+
+SOFT_SKILL_SET = frozenset(s.lower() for s in SOFT_SKILLS)
+CERT_ACRONYM_SET = frozenset(a.lower() for a in CERT_ACRONYMS)
+SKILL_KEYWORD_SET = frozenset(kw.lower() for kws in SKILL_KEYWORDS.values() for kw in kws)
+
+
+def tokenize(text):
+    """Lowercased tokens of ``text`` with their character offsets."""
+    return [(m.group().lower(), m.start(), m.end()) for m in TOKEN_RE.finditer(text)]
+
+
+class KeywordMatcher:
+    """Phrase table built once from a keyword list; ``find`` is one pass over the text."""
+
+    def __init__(self, keywords):
+        self._phrases = {}
+        for keyword in keywords:
+            tokens = tuple(token for token, _, _ in tokenize(keyword))
+            if tokens:
+                self._phrases.setdefault(tokens, keyword.lower())
+        self._first_tokens = frozenset(tokens[0] for tokens in self._phrases)
+        self.max_tokens = max(map(len, self._phrases), default=0)
+
+    def __len__(self):
+        return len(self._phrases)
+
+    def find(self, text, tokens=None):
+        """Return every keyword occurrence in ``text`` as ``Hit(keyword, start, end)``.
+
+        Hits are ordered by position; overlapping keywords (``machine learning``
+        and ``learning``) are all reported.  Pass ``tokens`` when the text has
+        already been tokenized.
+        """
+        if tokens is None:
+            tokens = tokenize(text)
+        words = [token for token, _, _ in tokens]
+        hits = []
+        for i, (token, start, _) in enumerate(tokens):
+            if token not in self._first_tokens:
+                continue
+            for n in range(1, min(self.max_tokens, len(tokens) - i) + 1):
+                keyword = self._phrases.get(tuple(words[i:i + n]))
+                if keyword is not None:
+                    hits.append(Hit(keyword, start, tokens[i + n - 1][2]))
+        return hits
+
+
+class SkillMatches:
+    """All keyword hits for one text, with per-field views for the scorers."""
+
+    __slots__ = ("hits", "keywords")
+
+    def __init__(self, hits):
+        self.hits = tuple(hits)
+        self.keywords = frozenset(hit.keyword for hit in self.hits)
+
+    def for_field(self, field):
+        """Keywords of ``field`` present in the text, in ``SKILL_KEYWORDS`` order and casing."""
+        return [kw for kw in SKILL_KEYWORDS.get(field, ()) if kw.lower() in self.keywords]
+
+    def field_counts(self):
+        return {field: len(self.for_field(field)) for field in SKILL_KEYWORDS}
+
+    @property
+    def soft_skills(self):
+        return self.keywords & SOFT_SKILL_SET
+
+    @property
+    def cert_acronyms(self):
+        return self.keywords & CERT_ACRONYM_SET
+
+
+_skill_matcher = None
+
+
+def get_skill_matcher():
+    """Matcher over every skill, soft-skill and certification keyword (built once per process)."""
+    global _skill_matcher
+    if _skill_matcher is None:
+        keywords = [kw for kws in SKILL_KEYWORDS.values() for kw in kws]
+        keywords += sorted(KNOWN_SKILLS) + SOFT_SKILLS + CERT_ACRONYMS
+        _skill_matcher = KeywordMatcher(keywords)
+    return _skill_matcher
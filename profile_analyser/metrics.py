@@ -0,0 +1,287 @@
+"""Span timings and counters for the analysis pipeline and the page renders.
+
+``with span("analysis.info"):`` (or ``@timed("render.pdf")``) records how long
+a block took.  Every span feeds a process-wide histogram, which is exported as
+Prometheus text or JSON, and the spans of the current Streamlit rerun are
+also collected between ``begin_run()`` and ``end_run()`` for the sidebar
+performance panel.  Spans nest; each records its inclusive time.
+
+Exports are opt-in:
+
+* ``PROFILE_ANALYSER_METRICS_PORT``: ``serve_from_env()`` serves ``/metrics``
+  (Prometheus text) and ``/metrics.json`` on that local port.
+* ``PROFILE_ANALYSER_METRICS_FILE``: ``end_run()`` rewrites the file after
+  every rerun (JSON if it ends in ``.json``, Prometheus text otherwise).
+
+Spans recorded inside process-pool workers stay in the worker; the main
+process records how long it waited for the pool (``analysis.pool``).
+"""
+import json
+import os
+import sys
+import threading
+import time
+from collections import deque
+from functools import wraps
+
+METRICS_PORT = os.environ.get("PROFILE_ANALYSER_METRICS_PORT")
+METRICS_FILE = os.environ.get("PROFILE_ANALYSER_METRICS_FILE")
+
+# Histogram bucket upper bounds in seconds (Prometheus ``le`` labels)
+BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# Recent samples kept per span for percentiles
+WINDOW = 1024
+
+
+class Histogram:
+    """Count, sum, cumulative buckets and a window of recent samples (seconds)."""
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.buckets = [0] * len(BUCKETS)
+        self.recent = deque(maxlen=WINDOW)
+
+    def observe(self, seconds):
+        self.count += 1
+        self.total += seconds
+        self.recent.append(seconds)
+        for i, bound in enumerate(BUCKETS):
+            if seconds <= bound:
+                self.buckets[i] += 1
+
+    def percentile(self, q):
+        if not self.recent:
+            return 0.0
+        ordered = sorted(self.recent)
+        return ordered[min(len(ordered) - 1, int(round(q / 100 * (len(ordered) - 1))))]
+
+
+_lock = threading.Lock()
+_histograms = {}
+_counters = {}
+_local = threading.local()
+
+
+def observe(name, seconds):
+    """Record one duration for ``name`` outside a ``span`` (e.g. from a callback)."""
+    with _lock:
+        histogram = _histograms.get(name)
+        if histogram is None:
+            histogram = _histograms[name] = Histogram()
+        histogram.observe(seconds)
+
+
+def incr(name, amount=1):
+    with _lock:
+        _counters[name] = _counters.get(name, 0) + amount
+
+
+class span:
+    """Time a block: ``with span("analysis.info"): ...``."""
+
+    __slots__ = ("name", "_start", "_run", "_slot")
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        stack = getattr(_local, "stack", None)
+        if stack is None:
+            stack = _local.stack = []
+        # Reserve the run entry on entry so runs list spans parent-first
+        self._run = getattr(_local, "run", None)
+        if self._run is not None:
+            self._slot = len(self._run)
+            self._run.append((self.name, len(stack), None))
+        stack.append(self.name)
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        seconds = time.perf_counter() - self._start
+        _local.stack.pop()
+        observe(self.name, seconds)
+        if self._run is not None:
+            name, depth, _ = self._run[self._slot]
+            self._run[self._slot] = (name, depth, seconds)
+        return False
+
+
+def timed(name):
+    """Decorator form of ``span``."""
+
+    def decorate(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorate
+
+
+def begin_run():
+    """Start collecting the spans of one script run on this thread."""
+    _local.run = []
+    _local.run_start = time.perf_counter()
+
+
+def end_run():
+    """Stop collecting; return this run's ``[(name, depth, seconds), ...]`` and total seconds.
+
+    Spans are listed in start order, each parent before its children.  The
+    run itself is recorded as the ``rerun`` span.
+    """
+    spans = [entry for entry in getattr(_local, "run", None) or [] if entry[2] is not None]
+    start = getattr(_local, "run_start", None)
+    _local.run = None
+    total = time.perf_counter() - start if start is not None else 0.0
+    observe("rerun", total)
+    if METRICS_FILE:
+        write_metrics(METRICS_FILE)
+    return spans, total
+
+
+def cache_stats():
+    """Hit/miss counts of the shared caches that are loaded in this process."""
+    stats = {}
+    cache = sys.modules.get("profile_analyser.cache")
+    if cache is not None and cache._parse_cache is not None:
+        stats["parse_cache"] = cache._parse_cache.stats()
+    blobs = sys.modules.get("profile_analyser.blobs")
+    if blobs is not None and blobs._store is not None:
+        stats["uploads"] = blobs._store.stats()
+    for label, module, attr in (("documents", "profile_analyser.document", "_document"),
+                                ("text_scores", "profile_analyser.scoring", "_text_scores")):
+        func = getattr(sys.modules.get(module), attr, None)
+        if func is not None:
+            info = func.cache_info()
+            lookups = info.hits + info.misses
+            stats[label] = {
+                "entries": info.currsize,
+                "hits": info.hits,
+                "misses": info.misses,
+                "hit_rate": round(info.hits / lookups, 3) if lookups else 0.0,
+            }
+    return stats
+
+
+def snapshot():
+    """Every histogram (with p50/p95/p99 in ms), counter and cache stat as a dict."""
+    with _lock:
+        spans = {
+            name: {
+                "count": h.count,
+                "total_ms": round(h.total * 1000, 3),
+                "mean_ms": round(h.total / h.count * 1000, 3) if h.count else 0.0,
+                "p50_ms": round(h.percentile(50) * 1000, 3),
+                "p95_ms": round(h.percentile(95) * 1000, 3),
+                "p99_ms": round(h.percentile(99) * 1000, 3),
+            }
+            for name, h in sorted(_histograms.items())
+        }
+        counters = dict(sorted(_counters.items()))
+    return {"spans": spans, "counters": counters, "caches": cache_stats()}
+
+
+def _label(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def prometheus_text():
+    """Metrics in the Prometheus text exposition format."""
+    lines = [
+        "# HELP profile_analyser_span_seconds Duration of instrumented pipeline stages and page renders.",
+        "# TYPE profile_analyser_span_seconds histogram",
+    ]
+    with _lock:
+        histograms = [(name, h.count, h.total, list(h.buckets)) for name, h in sorted(_histograms.items())]
+        counters = sorted(_counters.items())
+    for name, count, total, buckets in histograms:
+        label = f'span="{_label(name)}"'
+        for bound, cumulative in zip(BUCKETS, buckets):
+            lines.append(f'profile_analyser_span_seconds_bucket{{{label},le="{bound}"}} {cumulative}')
+        lines.append(f'profile_analyser_span_seconds_bucket{{{label},le="+Inf"}} {count}')
+        lines.append(f"profile_analyser_span_seconds_sum{{{label}}} {total:.6f}")
+        lines.append(f"profile_analyser_span_seconds_count{{{label}}} {count}")
+    if counters:
+        lines.append("# TYPE profile_analyser_events_total counter")
+        for name, value in counters:
+            lines.append(f'profile_analyser_events_total{{event="{_label(name)}"}} {value}')
+    caches = cache_stats()
+    if caches:
+        lines.append("# TYPE profile_analyser_cache_hits_total counter")
+        lines.extend(f'profile_analyser_cache_hits_total{{cache="{c}"}} {s["hits"]}' for c, s in caches.items())
+        lines.append("# TYPE profile_analyser_cache_misses_total counter")
+        lines.extend(f'profile_analyser_cache_misses_total{{cache="{c}"}} {s["misses"]}' for c, s in caches.items())
+        lines.append("# TYPE profile_analyser_cache_entries gauge")
+        lines.extend(f'profile_analyser_cache_entries{{cache="{c}"}} {s["entries"]}' for c, s in caches.items())
+    return "\n".join(lines) + "\n"
+
+
+def write_metrics(path):
+    """Atomically write the metrics to ``path`` (JSON for ``.json``, Prometheus text otherwise)."""
+    body = json.dumps(snapshot(), indent=2) if path.endswith(".json") else prometheus_text()
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as fh:
+        fh.write(body)
+    os.replace(tmp, path)
+
+
+_server = None
+_server_lock = threading.Lock()
+
+
+def serve(port, host="127.0.0.1"):
+    """Serve ``/metrics`` and ``/metrics.json`` from a daemon thread (once per process)."""
+    global _server
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            path = self.path.split("?", 1)[0]
+            if path == "/metrics":
+                body, content_type = prometheus_text(), "text/plain; version=0.0.4"
+            elif path == "/metrics.json":
+                body, content_type = json.dumps(snapshot()), "application/json"
+            else:
+                self.send_error(404)
+                return
+            data = body.encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, *args):
+            pass
+
+    with _server_lock:
+        if _server is None:
+            _server = ThreadingHTTPServer((host, int(port)), Handler)
+            threading.Thread(target=_server.serve_forever, name="profile-analyser-metrics", daemon=True).start()
+        return _server
+
+
+_serve_attempted = False
+
+
+def serve_from_env():
+    """Start the metrics endpoint if ``PROFILE_ANALYSER_METRICS_PORT`` is set (first call only)."""
+    global _serve_attempted
+    if METRICS_PORT and not _serve_attempted:
+        _serve_attempted = True
+        try:
+            serve(METRICS_PORT)
+        except OSError as e:
+            print(f"profile_analyser: metrics endpoint not started on port {METRICS_PORT}: {e}", file=sys.stderr)
+
+
+def reset():
+    """Forget every recorded span and counter."""
+    with _lock:
+        _histograms.clear()
+        _counters.clear()
@@ -0,0 +1,122 @@
+"""Process-wide spaCy pipeline shared by every rerun, session and caller.
+
+Streamlit re-executes the app script on every interaction, so a module-level
+``spacy.load`` in the script pays the full model load each time.  Modules that
+the script imports are only executed once per server process, which makes this
+module the natural home for the loaded pipeline.
+
+Callers pick a *profile* instead of running the whole pipeline; each profile
+disables the components that caller never reads, so e.g. name detection only
+pays for NER.  ``pipe_nlp`` runs many texts through one ``nlp.pipe`` call
+for batch analysis.
+"""
+import os
+import threading
+import time
+
+MODEL_NAME = "en_core_web_sm"
+
+# Components disabled per profile.  ``ner`` in the small English model has its
+# own embedded tok2vec, so it runs fine with the shared tok2vec switched off.
+# Noun chunks need the parser plus POS tags (tagger + attribute_ruler).
+PROFILES = {
+    "full": (),
+    "ner": ("tok2vec", "tagger", "parser", "attribute_ruler", "lemmatizer"),
+    "parser": ("lemmatizer",),
+}
+
+# Upper bound on characters handed to the pipeline in a single call.  Keeps the
+# per-rerun NLP cost bounded for very long (or garbage) documents.
+MAX_CHARS = int(os.environ.get("PROFILE_ANALYSER_NLP_MAX_CHARS", "100000"))
+
+# ``nlp.pipe`` settings for batch analysis.  Extra processes only pay off for
+# large in-process batches; pool workers always pipe in their own process.
+BATCH_SIZE = int(os.environ.get("PROFILE_ANALYSER_NLP_BATCH_SIZE", "32"))
+N_PROCESS = int(os.environ.get("PROFILE_ANALYSER_NLP_PROCESSES", "1"))
+
+_lock = threading.Lock()
+_nlp = None
+_stats = {
+    "load_seconds": 0.0,
+    "loads": 0,
+    "calls": {},
+    "seconds": {},
+    "truncated": 0,
+    "batches": 0,
+}
+
+
+def get_nlp():
+    """Return the shared pipeline, loading it on first use only."""
+    global _nlp
+    if _nlp is None:
+        with _lock:
+            if _nlp is None:
+                import spacy
+
+                start = time.perf_counter()
+                _nlp = spacy.load(MODEL_NAME)
+                _stats["load_seconds"] = time.perf_counter() - start
+                _stats["loads"] += 1
+    return _nlp
+
+
+def covers(have, want):
+    """True if a doc run under profile ``have`` carries everything ``want`` computes."""
+    return set(PROFILES[have]) <= set(PROFILES[want])
+
+
+def run_nlp(text, profile="full"):
+    """Run ``text`` through the shared pipeline with only ``profile``'s components."""
+    nlp = get_nlp()
+    disable = [name for name in PROFILES[profile] if name in nlp.pipe_names]
+    truncated = len(text) > MAX_CHARS
+    if truncated:
+        text = text[:MAX_CHARS]
+    start = time.perf_counter()
+    doc = nlp(text, disable=disable)
+    elapsed = time.perf_counter() - start
+    with _lock:
+        _stats["truncated"] += truncated
+        _stats["calls"][profile] = _stats["calls"].get(profile, 0) + 1
+        _stats["seconds"][profile] = _stats["seconds"].get(profile, 0.0) + elapsed
+    return doc
+
+
+def pipe_nlp(texts, profile="full", batch_size=BATCH_SIZE, n_process=N_PROCESS):
+    """Docs for ``texts`` (in order) from one ``nlp.pipe`` pass under ``profile``."""
+    nlp = get_nlp()
+    disable = [name for name in PROFILES[profile] if name in nlp.pipe_names]
+    clipped = []
+    truncated = 0
+    for text in texts:
+        if len(text) > MAX_CHARS:
+            text = text[:MAX_CHARS]
+            truncated += 1
+        clipped.append(text)
+    if not clipped:
+        return []
+    start = time.perf_counter()
+    docs = list(nlp.pipe(clipped, disable=disable, batch_size=batch_size,
+                         n_process=n_process if len(clipped) > batch_size else 1))
+    elapsed = time.perf_counter() - start
+    with _lock:
+        _stats["calls"][profile] = _stats["calls"].get(profile, 0) + len(docs)
+        _stats["seconds"][profile] = _stats["seconds"].get(profile, 0.0) + elapsed
+        _stats["batches"] += 1
+        _stats["truncated"] += truncated
+    return docs
+
+
+def pipeline_stats():
+    """Snapshot of load time and per-profile call counts/durations."""
+    with _lock:
+        return {
+            "loaded": _nlp is not None,
+            "load_seconds": round(_stats["load_seconds"], 4),
+            "loads": _stats["loads"],
+            "calls": dict(_stats["calls"]),
+            "seconds": {k: round(v, 4) for k, v in _stats["seconds"].items()},
+            "truncated": _stats["truncated"],
+            "batches": _stats["batches"],
+        }
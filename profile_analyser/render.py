@@ -0,0 +1,330 @@
+"""PDF rendering of generated resumes with reportlab.
+
+reportlab is optional: it is imported on first use and ``RenderError`` is
+raised when it is missing, so the apps can tell the user how to install it.
+
+A process-wide ``ResumeRenderer`` loads reportlab, builds the paragraph
+styles and works out the page frames once; every render after that only lays
+out the resume.  ``render_resume`` caches finished PDFs by a hash of their
+inputs, so clicking "Generate" again with unchanged fields costs nothing.
+For many resumes, ``render_batch`` renders on the shared process pool and
+``export_zip`` / ``export_combined`` package the results as one ZIP or one
+PDF with every resume starting on a new page.
+"""
+import hashlib
+import json
+import os
+import threading
+import zipfile
+from io import BytesIO
+
+from profile_analyser.cache import ParseCache
+from profile_analyser.metrics import span, timed
+
+# The Resume Generator's inputs, in generate_pdf_resume's argument order
+RESUME_FIELDS = (
+    "name", "email", "phone", "linkedin", "summary", "skills", "experience", "education", "projects",
+    "certifications", "field",
+)
+
+RENDER_CACHE_ENTRIES = int(os.environ.get("PROFILE_ANALYSER_RENDER_CACHE_ENTRIES", "128"))
+RENDER_CACHE_BYTES = int(os.environ.get("PROFILE_ANALYSER_RENDER_CACHE_BYTES", str(32 * 1024 * 1024)))
+
+ADDITIONAL_INFO = [
+    "• Proficient in Agile methodologies and project management tools",
+    "• Strong problem-solving skills with analytical mindset",
+    "• Excellent communication and collaboration abilities",
+    "• Committed to continuous professional development",
+]
+
+
+class RenderError(Exception):
+    """Raised when a resume cannot be rendered (e.g. reportlab is not installed)."""
+
+
+class ResumeRenderer:
+    """reportlab, styles and page geometry loaded once; renders resumes from section dicts.
+
+    Section dicts hold the ``RESUME_FIELDS`` keys.  Rendering only reads the
+    shared styles, so one renderer serves every session.
+    """
+
+    def __init__(self):
+        try:
+            from reportlab import platypus
+            from reportlab.lib import colors
+            from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY
+            from reportlab.lib.pagesizes import letter
+            from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+            from reportlab.lib.units import inch
+        except ImportError as e:
+            raise RenderError("PDF generation requires the 'reportlab' package. Please install it: pip install reportlab") from e
+        self.platypus = platypus
+        self.pagesize = letter
+        self.margin = 0.75 * inch
+        self.gutter = 0.3 * inch
+        styles = getSampleStyleSheet()
+        self.title_style = ParagraphStyle(
+            'CustomTitle',
+            parent=styles['Heading1'],
+            fontSize=18,
+            spaceAfter=6,
+            alignment=TA_CENTER,
+            textColor=colors.darkblue,
+            fontName='Helvetica-Bold'
+        )
+        self.heading_style = ParagraphStyle(
+            'CustomHeading',
+            parent=styles['Heading2'],
+            fontSize=14,
+            spaceAfter=6,
+            spaceBefore=12,
+            textColor=colors.darkblue,
+            fontName='Helvetica-Bold',
+            borderWidth=1,
+            borderColor=colors.darkblue,
+            borderPadding=3
+        )
+        self.normal_style = ParagraphStyle(
+            'CustomNormal',
+            parent=styles['Normal'],
+            fontSize=10,
+            spaceAfter=6,
+            alignment=TA_JUSTIFY
+        )
+        self.bullet_style = ParagraphStyle(
+            'CustomBullet',
+            parent=styles['Normal'],
+            fontSize=10,
+            spaceAfter=3,
+            leftIndent=20,
+            bulletIndent=10
+        )
+        # column count -> (x, y, width, height) of each column frame
+        self._frame_boxes = {}
+
+    def story(self, sections):
+        """Flowables for one resume (the Resume Generator's layout)."""
+        Paragraph, Spacer = self.platypus.Paragraph, self.platypus.Spacer
+        story = []
+
+        # Title
+        story.append(Paragraph(sections["name"].upper(), self.title_style))
+        story.append(Spacer(1, 6))
+
+        # Contact Information
+        contact_info = f"{sections['email']} | {sections['phone']} | {sections['linkedin']}"
+        story.append(Paragraph(contact_info, self.normal_style))
+        story.append(Spacer(1, 12))
+
+        # Professional Summary
+        story.append(Paragraph("PROFESSIONAL SUMMARY", self.heading_style))
+        story.append(Paragraph(sections["summary"], self.normal_style))
+        story.append(Spacer(1, 6))
+
+        # Technical Skills
+        story.append(Paragraph("TECHNICAL SKILLS", self.heading_style))
+        story.append(Paragraph(sections["skills"], self.normal_style))
+        story.append(Spacer(1, 6))
+
+        # Multi-line sections: "•" lines are bullets, anything else a normal paragraph
+        for heading, key in (
+            ("PROFESSIONAL EXPERIENCE", "experience"),
+            ("EDUCATION", "education"),
+            ("PROJECTS", "projects"),
+            ("CERTIFICATIONS & TRAINING", "certifications"),
+        ):
+            story.append(Paragraph(heading, self.heading_style))
+            for line in sections[key].split('\n'):
+                if line.strip():
+                    if line.strip().startswith('•'):
+                        story.append(Paragraph(line.strip(), self.bullet_style))
+                    else:
+                        story.append(Paragraph(line.strip(), self.normal_style))
+            story.append(Spacer(1, 6))
+
+        # Additional Information
+        story.append(Paragraph("ADDITIONAL INFORMATION", self.heading_style))
+        for info in ADDITIONAL_INFO:
+            story.append(Paragraph(info, self.bullet_style))
+        return story
+
+    def render(self, sections, columns=1, footer=None):
+        """``(pdf_bytes, page_count)`` for one resume."""
+        return self.build(self.story(sections), columns, footer)
+
+    def render_combined(self, resumes, columns=1):
+        """One PDF holding every resume in ``resumes``, each starting on a new page."""
+        story = []
+        for sections in resumes:
+            if story:
+                story.append(self.platypus.PageBreak())
+            story.extend(self.story(sections))
+        return self.build(story, columns)[0]
+
+    def build(self, story, columns=1, footer=None):
+        """Lay ``story`` out on letter pages in ``columns`` columns; return ``(pdf_bytes, page_count)``.
+
+        ``footer`` is drawn at the bottom of every page, with ``{page}``
+        replaced by the page number.
+        """
+        platypus = self.platypus
+        buffer = BytesIO()
+        margin = self.margin
+
+        def on_page(canvas, doc):
+            if footer:
+                canvas.saveState()
+                canvas.setFont("Helvetica", 8)
+                canvas.drawCentredString(self.pagesize[0] / 2, margin / 2, footer.format(page=canvas.getPageNumber()))
+                canvas.restoreState()
+
+        if columns == 1:
+            doc = platypus.SimpleDocTemplate(
+                buffer, pagesize=self.pagesize, rightMargin=margin, leftMargin=margin, topMargin=margin, bottomMargin=margin
+            )
+            doc.build(story, onFirstPage=on_page, onLaterPages=on_page)
+        else:
+            # Frames keep layout state while a document builds; only their geometry is shared
+            frames = [platypus.Frame(*box, id=f"col{i}") for i, box in enumerate(self._columns(columns))]
+            template = platypus.PageTemplate(id="columns", frames=frames, onPage=on_page)
+            doc = platypus.BaseDocTemplate(buffer, pagesize=self.pagesize, pageTemplates=[template])
+            doc.build(story)
+        data = buffer.getvalue()
+        buffer.close()
+        return data, doc.page
+
+    def _columns(self, columns):
+        boxes = self._frame_boxes.get(columns)
+        if boxes is None:
+            width, height = self.pagesize
+            column_width = (width - 2 * self.margin - (columns - 1) * self.gutter) / columns
+            boxes = self._frame_boxes[columns] = [
+                (self.margin + i * (column_width + self.gutter), self.margin, column_width, height - 2 * self.margin)
+                for i in range(columns)
+            ]
+        return boxes
+
+
+_renderer = None
+_renderer_lock = threading.Lock()
+_render_cache = ParseCache(max_entries=RENDER_CACHE_ENTRIES, max_bytes=RENDER_CACHE_BYTES)
+
+
+def get_renderer():
+    """Process-wide ResumeRenderer (raises RenderError without reportlab)."""
+    global _renderer
+    if _renderer is None:
+        with _renderer_lock:
+            if _renderer is None:
+                _renderer = ResumeRenderer()
+    return _renderer
+
+
+def render_key(sections, columns=1, footer=None):
+    """SHA-256 of everything that affects the rendered PDF."""
+    payload = json.dumps([[sections.get(key, "") for key in RESUME_FIELDS], columns, footer], ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def render_resume(sections, columns=1, footer=None):
+    """Cached ``(pdf_bytes, page_count)`` for a section dict."""
+    renderer = get_renderer()
+    key = render_key(sections, columns, footer)
+    return _render_cache.get_or_compute(key, lambda: renderer.render(sections, columns, footer))
+
+
+@timed("render.pdf")
+def generate_pdf_resume(name, email, phone, linkedin, summary, skills, experience, education, projects, certifications, field, columns=1):
+    """Generate a professional PDF resume with ATS-optimized formatting"""
+    values = (name, email, phone, linkedin, summary, skills, experience, education, projects, certifications, field)
+    return render_resume(dict(zip(RESUME_FIELDS, values)), columns)[0]
+
+
+def _render_one(sections, columns):
+    # Worker side of render_batch: the renderer is set up once per worker process
+    return get_renderer().render(sections, columns)
+
+
+def render_batch(resumes, columns=1, max_workers=None):
+    """PDF bytes for every section dict in ``resumes`` (input order), rendered on the shared process pool."""
+    from profile_analyser.batch import DEFAULT_WORKERS, get_executor
+
+    resumes = list(resumes)
+    get_renderer()  # fail fast without reportlab
+    workers = max_workers or DEFAULT_WORKERS
+    results = [None] * len(resumes)
+    todo = []
+    for index, sections in enumerate(resumes):
+        cached = _render_cache.get(render_key(sections, columns))
+        if cached is not None:
+            results[index] = cached[0]
+        else:
+            todo.append(index)
+    with span("render.batch"):
+        if workers > 1 and len(todo) > 1:
+            pending = [resumes[i] for i in todo]
+            rendered = get_executor(workers).map(_render_one, pending, [columns] * len(todo), chunksize=4)
+            for index, result in zip(todo, rendered):
+                # Workers cache in their own process; keep a copy here too
+                _render_cache.put(render_key(resumes[index], columns), result)
+                results[index] = result[0]
+        else:
+            for index in todo:
+                results[index] = render_resume(resumes[index], columns)[0]
+    return results
+
+
+def export_zip(resumes, names=None, columns=1, max_workers=None):
+    """ZIP archive of every resume's PDF; ``names`` defaults to ``<name>_Professional_Resume.pdf``."""
+    resumes = list(resumes)
+    pdfs = render_batch(resumes, columns, max_workers)
+    if names is None:
+        names = [f"{(sections.get('name') or 'Resume').replace(' ', '_')}_Professional_Resume.pdf" for sections in resumes]
+    buffer = BytesIO()
+    seen = {}
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+        for name, pdf in zip(names, pdfs):
+            # Keep every entry when two candidates share a name
+            count = seen[name] = seen.get(name, 0) + 1
+            if count > 1:
+                stem, dot, ext = name.rpartition(".")
+                name = f"{stem}_{count}.{ext}" if dot else f"{name}_{count}"
+            archive.writestr(name, pdf)
+    return buffer.getvalue()
+
+
+@timed("render.combined")
+def export_combined(resumes, columns=1):
+    """Every resume in one PDF from a single layout pass, each starting on a new page."""
+    return get_renderer().render_combined(list(resumes), columns)
+
+
+def sections_from_info(info, field, field_skills=()):
+    """Resume Generator inputs for an analyzed resume, using the page's defaults for missing sections."""
+    def found(key):
+        return [v for v in info.get(key) or [] if v and v != 'Not found']
+
+    def text(key):
+        value = info.get(key)
+        return value if value and value != 'Not found' else ""
+
+    def bullets(values):
+        return "\n".join(v if v.startswith('•') else f"• {v}" for v in values)
+
+    field_skills = list(field_skills)
+    top_skills = ', '.join(field_skills[:3])
+    skills, education, projects, certifications = found('skills'), found('education'), found('projects'), found('certifications')
+    return {
+        "name": text('name'),
+        "email": text('email'),
+        "phone": text('phone'),
+        "linkedin": text('linkedin'),
+        "summary": f"Results-driven {field} professional with {len(field_skills[:3])}+ years of experience in {top_skills}. Proven track record of delivering innovative solutions and driving measurable business outcomes.",
+        "skills": ', '.join(skills) if skills else ', '.join(field_skills[:8]),
+        "experience": f"• Developed and implemented {field.lower()} solutions resulting in 25% improvement in efficiency\n• Collaborated with cross-functional teams to deliver projects on time and within budget\n• Utilized {top_skills} to optimize processes and enhance user experience",
+        "education": bullets(education) if education else "• Bachelor's Degree in Computer Science/Related Field\n• Relevant coursework: Data Structures, Algorithms, Database Management",
+        "projects": bullets(projects) if projects else f"• {field} Application - Built using {top_skills}, deployed on cloud platform\n• Data Analysis Project - Developed predictive models achieving 85% accuracy",
+        "certifications": bullets(certifications) if certifications else f"• {field} Certification - Industry-recognized credential\n• Professional Development Courses - Continuous learning initiatives",
+        "field": field,
+    }
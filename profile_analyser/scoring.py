@@ -0,0 +1,642 @@
+"""Field detection, resume scoring, ATS features and feedback."""
+from collections import namedtuple
+from functools import lru_cache
+
+from profile_analyser.constants import (
+    CERT_PROVIDERS,
+    COURSES,
+    IDEAL_SECTIONS,
+    IDEAL_SKILLS,
+    SKILL_KEYWORDS,
+)
+from profile_analyser.document import as_document
+from profile_analyser.matcher import SkillMatches, get_skill_matcher
+
+
+# --- Detect Field ---
+def detect_field(text_or_skills):
+    # Resume texts share their memoized document; a skills list (e.g. the live
+    # edit preview, every keystroke) is matched directly so it never evicts one
+    if isinstance(text_or_skills, str):
+        skills = as_document(text_or_skills).skills
+    else:
+        skills = SkillMatches(get_skill_matcher().find(" ".join([s for s in text_or_skills if isinstance(s, str)])))
+    max_matches = 0
+    best_field = "General"
+    for field, match_count in skills.field_counts().items():
+        if match_count > max_matches:
+            max_matches = match_count
+            best_field = field
+    return best_field
+
+# --- Scoring without Job Description ---
+def template_score(text, info):
+    lower = as_document(text).lower
+    # Section completeness
+    section_score = int(40 * sum(1 for s in IDEAL_SECTIONS if s in lower) / len(IDEAL_SECTIONS))
+    # Skill diversity
+    skill_score = int(30 * len([s for s in info['skills'] if s in IDEAL_SKILLS]) / len(IDEAL_SKILLS))
+    # Certification diversity
+    cert_score = int(15 * len([c for c in info['certifications'] if any(p.lower() in c.lower() for p in CERT_PROVIDERS)]) / len(CERT_PROVIDERS))
+    # Education presence
+    edu_score = 15 if info['education'] and info['education'][0] != 'Not found' else 0
+    return section_score + skill_score + cert_score + edu_score
+
+# --- Resume Clarity Helper ---
+def clarity_score(text):
+    doc = as_document(text)
+    text = doc.text
+    # Metrics: presence of numbers/percentages, bullet points, concise sentences
+    metrics = 0
+    if any(x in text for x in ["%", "percent", "improved", "reduced", "increased", "decreased"]):
+        metrics += 1
+    if "•" in text or "- " in text:
+        metrics += 1
+    if len([s for s in doc.period_chunks if len(s) < 120]) > 3:
+        metrics += 1
+    return int((metrics / 3) * 15)  # up to 15 points for clarity
+
+# --- Professional Resume Scoring System (Enhancv-inspired) ---
+# The score splits into parts that read only the resume text (sections, action
+# verbs, formatting, headers) and parts that read the extracted info and field
+# (skills, contact details, certifications, education).  Text parts are
+# computed once per resume text; editing the info only re-evaluates the info
+# parts, so rescoring on every edit is cheap.  They are memoized by the text
+# itself, not the document: the memo then holds no spaCy docs and survives
+# as_document rebuilding a document it dropped.
+TextScores = namedtuple(
+    "TextScores",
+    "content experience action_verb_count formatting headers format_compat experience_details bonus",
+)
+
+
+@lru_cache(maxsize=64)
+def _text_scores(text):
+    doc = as_document(text)
+    lower = doc.lower
+
+    # === 1. CONTENT COMPLETENESS (20 points) ===
+    content_score = 0
+    
+    # Essential sections (12 points)
+    essential_sections = ["experience", "education", "skills"]
+    present_essential = sum(1 for section in essential_sections if section in lower)
+    content_score += (present_essential / len(essential_sections)) * 12
+    
+    # Optional sections (8 points)
+    optional_sections = ["objective", "summary", "projects", "certifications", "achievements", "volunteer"]
+    present_optional = sum(1 for section in optional_sections if section in lower)
+    content_score += min((present_optional / len(optional_sections)) * 8, 8)
+    
+    # === 3. EXPERIENCE & IMPACT (20 points) ===
+    experience_score = 0
+    
+    # Action verbs and metrics (15 points)
+    action_verbs = ["achieved", "developed", "implemented", "managed", "led", "created", "designed", 
+                   "improved", "increased", "reduced", "optimized", "launched", "coordinated", "analyzed"]
+    metrics_indicators = ["%", "percent", "improved", "reduced", "increased", "decreased", "by", "from", "to"]
+    
+    action_verb_count = sum(1 for verb in action_verbs if verb in lower)
+    metrics_count = sum(1 for metric in metrics_indicators if metric in lower)
+    
+    if action_verb_count >= 5 and metrics_count >= 3:
+        experience_score += 15
+    elif action_verb_count >= 3 and metrics_count >= 1:
+        experience_score += 10
+    elif action_verb_count >= 2:
+        experience_score += 7
+    elif action_verb_count >= 1:
+        experience_score += 3
+    
+    # Experience length and depth (5 points)
+    if len(text) > 2000:  # Substantial content
+        experience_score += 5
+    elif len(text) > 1000:
+        experience_score += 3
+    elif len(text) > 500:
+        experience_score += 1
+    
+    # === 4. PROFESSIONAL PRESENTATION: formatting (5 points) ===
+    formatting_indicators = 0
+    if "•" in text or "- " in text:  # Bullet points
+        formatting_indicators += 2
+    if any(char in text for char in ["|", "•", "-"]):  # Consistent formatting
+        formatting_indicators += 2
+    if len([s for s in doc.period_chunks if len(s) < 150]) > 5:  # Concise sentences
+        formatting_indicators += 1
+    
+    # === ATS Section Headers (4 points) ===
+    standard_headers = ["experience", "education", "skills", "certifications", "projects", "summary", "objective"]
+    header_matches = sum(1 for header in standard_headers if header in lower)
+    header_score = (header_matches / len(standard_headers)) * 4
+    
+    # === ATS Format Compatibility (3 points) ===
+    format_score = 0
+    # Check for common ATS-friendly formatting
+    if "•" in text or "- " in text:  # Bullet points
+        format_score += 1
+    if not any(char in text for char in ["[", "]", "{", "}", "|", "~", "^"]):  # No special characters
+        format_score += 1
+    if len(text) > 500 and len(text) < 3000:  # Optimal length
+        format_score += 1
+    
+    # === ATS Experience Details (3 points) ===
+    details_score = 0
+    # Check for job titles, company names, dates
+    if any(word in lower for word in ["experience", "work", "employment", "job"]):
+        details_score += 1
+    if any(word in lower for word in ["2024", "2023", "2022", "2021", "2020"]):
+        details_score += 1
+    if any(word in lower for word in ["company", "corporation", "inc", "ltd", "llc"]):
+        details_score += 1
+    
+    # === BONUS POINTS (text part) ===
+    bonus_points = 0
+    
+    # Projects section
+    if 'projects' in lower:
+        bonus_points += 3
+    
+    # GitHub/Portfolio links
+    if any(url in lower for url in ['github.com', 'portfolio', 'behance.net']):
+        bonus_points += 2
+    
+    # Professional summary/objective
+    if any(section in lower for section in ['summary', 'objective', 'profile']):
+        bonus_points += 2
+    
+    # Recent experience (if mentioned)
+    if any(year in text for year in ['2024', '2023', '2022']):
+        bonus_points += 1
+
+    return TextScores(
+        content_score, experience_score, action_verb_count, formatting_indicators,
+        header_score, format_score, details_score, bonus_points,
+    )
+
+
+def text_scores(text):
+    """The text-only parts of ``dynamic_resume_score`` (cached per resume text)."""
+    return _text_scores(as_document(text).text)
+
+
+def skills_assessment(skills, field):
+    """Skills Assessment points (25) and the number of valid skills."""
+    skills_score = 0
+    
+    # Skills quantity and relevance (15 points)
+    valid_skills = [s for s in skills if s != 'Not found' and len(s.strip()) > 0]
+    skills_count = len(valid_skills)
+    
+    if skills_count >= 8:
+        skills_score += 10
+    elif skills_count >= 5:
+        skills_score += 7
+    elif skills_count >= 3:
+        skills_score += 5
+    elif skills_count >= 1:
+        skills_score += 3
+    
+    # Field-specific skills (10 points)
+    field_skills = SKILL_KEYWORDS.get(field, [])
+    if field_skills:
+        field_skill_set = {sk.lower() for sk in field_skills}
+        relevant_skills = [s for s in valid_skills if s.lower() in field_skill_set]
+        relevance_ratio = len(relevant_skills) / max(1, len(valid_skills))
+        skills_score += relevance_ratio * 10
+    return skills_score, skills_count
+
+
+def dynamic_resume_score(text, info, field="General"):
+    """
+    Comprehensive resume scoring based on industry standards and ATS optimization.
+    Scoring criteria inspired by professional resume analyzers like Enhancv.
+    """
+    doc = as_document(text)
+    parts = _text_scores(doc.text)
+    score = 0
+    breakdown = {}
+    
+    # === 1. CONTENT COMPLETENESS (20 points) ===
+    score += parts.content
+    breakdown["Content Completeness"] = round(parts.content, 1)
+    
+    # === 2. SKILLS ASSESSMENT (25 points) ===
+    skills_score, skills_count = skills_assessment(info['skills'], field)
+    score += skills_score
+    breakdown["Skills Assessment"] = round(skills_score, 1)
+    
+    # === 3. EXPERIENCE & IMPACT (20 points) ===
+    score += parts.experience
+    breakdown["Experience & Impact"] = round(parts.experience, 1)
+    
+    # === 4. PROFESSIONAL PRESENTATION (15 points) ===
+    presentation_score = 0
+    
+    # Contact information (5 points)
+    contact_info = 0
+    if info['email'] != 'Not found':
+        contact_info += 2
+    if info['phone'] != 'Not found':
+        contact_info += 2
+    if info['linkedin'] != 'Not found':
+        contact_info += 1
+    presentation_score += min(contact_info, 5)
+    
+    # Professional formatting (5 points)
+    presentation_score += min(parts.formatting, 5)
+    
+    # Certifications and credentials (5 points)
+    valid_certs = [c for c in info['certifications'] if c != 'Not found' and len(c.strip()) > 0]
+    if len(valid_certs) >= 3:
+        presentation_score += 5
+    elif len(valid_certs) >= 1:
+        presentation_score += 3
+    
+    score += presentation_score
+    breakdown["Professional Presentation"] = round(presentation_score, 1)
+    
+    # === 5. ATS OPTIMIZATION (20 points) ===
+    ats_score = 0
+    ats_breakdown = {}
+    
+    # === ATS Keyword Optimization (8 points) ===
+    field_keywords = SKILL_KEYWORDS.get(field, [])
+    if field_keywords:
+        keyword_matches = len(doc.skills.for_field(field))
+        keyword_ratio = keyword_matches / max(1, len(field_keywords))
+        keyword_score = keyword_ratio * 8
+        ats_score += keyword_score
+        ats_breakdown["Keyword Match"] = round(keyword_score, 1)
+    else:
+        ats_breakdown["Keyword Match"] = 0
+    
+    # === ATS Section Headers (4 points) ===
+    ats_score += parts.headers
+    ats_breakdown["Section Headers"] = round(parts.headers, 1)
+    
+    # === ATS Format Compatibility (3 points) ===
+    ats_score += parts.format_compat
+    ats_breakdown["Format Compatibility"] = parts.format_compat
+    
+    # === ATS Contact Information (2 points) ===
+    contact_score = 0
+    if info['email'] != 'Not found':
+        contact_score += 1
+    if info['phone'] != 'Not found':
+        contact_score += 1
+    ats_score += contact_score
+    ats_breakdown["Contact Info"] = contact_score
+    
+    # === ATS Experience Details (3 points) ===
+    ats_score += parts.experience_details
+    ats_breakdown["Experience Details"] = parts.experience_details
+    
+    score += ats_score
+    breakdown["ATS Optimization"] = round(ats_score, 1)
+    breakdown["ATS Details"] = ats_breakdown
+    
+    # === BONUS POINTS (up to 10 points) ===
+    bonus_points = parts.bonus
+    
+    # Education details
+    if info['education'] and info['education'][0] != 'Not found':
+        bonus_points += 2
+    
+    score += bonus_points
+    breakdown["Bonus Points"] = round(bonus_points, 1)
+    
+    # === FINAL SCORE CALCULATION ===
+    final_score = min(100, round(score))
+    
+    # Adjust score based on field-specific requirements
+    if field in ["Cybersecurity", "Cloud Computing"] and len(valid_certs) < 1:
+        final_score = max(0, final_score - 10)  # Certifications are crucial for these fields
+    
+    if field in ["Data Science", "Artificial Intelligence"] and skills_count < 5:
+        final_score = max(0, final_score - 8)  # Technical skills are essential
+    
+    if field in ["Product Management", "Business Analyst"] and parts.action_verb_count < 3:
+        final_score = max(0, final_score - 5)  # Leadership/management skills important
+    
+    breakdown["Total Score"] = final_score
+    
+    return final_score, breakdown
+
+# --- Enhanced Dynamic Strengths/Weaknesses Analysis ---
+def get_strengths_weaknesses(text, info):
+    """
+    Comprehensive analysis of resume strengths and weaknesses based on industry standards.
+    """
+    doc = as_document(text)
+    text, lower = doc.text, doc.lower
+    strengths = []
+    weaknesses = []
+    
+    # === STRENGTHS ANALYSIS ===
+    
+    # Contact Information
+    if info['email'] != 'Not found' and info['phone'] != 'Not found':
+        strengths.append("Complete contact information provided")
+    elif info['email'] != 'Not found':
+        strengths.append("Email address included")
+    
+    # Professional Presence
+    if info['linkedin'] != 'Not found':
+        strengths.append("LinkedIn profile linked for professional networking")
+    
+    # Content Structure
+    if 'projects' in lower:
+        strengths.append("Projects section demonstrates practical experience")
+    if 'summary' in lower or 'objective' in lower:
+        strengths.append("Professional summary/objective provides clear direction")
+    if 'certifications' in lower:
+        strengths.append("Certifications section shows continuous learning")
+    
+    # Skills Assessment
+    valid_skills = [s for s in info['skills'] if s != 'Not found' and len(s.strip()) > 0]
+    if len(valid_skills) >= 8:
+        strengths.append("Comprehensive skill set with 8+ technical skills")
+    elif len(valid_skills) >= 5:
+        strengths.append("Good range of technical skills (5+ skills listed)")
+    
+    # Impact and Metrics
+    action_verbs = ["achieved", "developed", "implemented", "managed", "led", "created", "designed", 
+                   "improved", "increased", "reduced", "optimized", "launched", "coordinated", "analyzed"]
+    action_verb_count = sum(1 for verb in action_verbs if verb in lower)
+    if action_verb_count >= 5:
+        strengths.append("Strong use of action verbs demonstrates leadership")
+    elif action_verb_count >= 3:
+        strengths.append("Good use of action verbs shows initiative")
+    
+    # Quantifiable Results
+    metrics_indicators = ["%", "percent", "improved", "reduced", "increased", "decreased", "by", "from", "to"]
+    metrics_count = sum(1 for metric in metrics_indicators if metric in lower)
+    if metrics_count >= 3:
+        strengths.append("Quantifiable achievements with measurable impact")
+    elif metrics_count >= 1:
+        strengths.append("Some quantifiable results included")
+    
+    # Formatting and Presentation
+    if "•" in text or "- " in text:
+        strengths.append("Professional bullet-point formatting")
+    if len([s for s in doc.period_chunks if len(s) < 150]) > 5:
+        strengths.append("Concise, readable writing style")
+    
+    # === WEAKNESSES ANALYSIS ===
+    
+    # Contact Information Issues
+    if info['email'] == 'Not found':
+        weaknesses.append("Missing email address - essential for contact")
+    if info['phone'] == 'Not found':
+        weaknesses.append("Missing phone number - limits communication options")
+    if info['linkedin'] == 'Not found':
+        weaknesses.append("No LinkedIn profile - missing professional networking opportunity")
+    
+    # Content Gaps
+    if 'projects' not in lower:
+        weaknesses.append("No projects section - missing practical experience demonstration")
+    if 'summary' not in lower and 'objective' not in lower:
+        weaknesses.append("No professional summary/objective - unclear career direction")
+    if 'certifications' not in lower:
+        weaknesses.append("No certifications section - missing credential validation")
+    
+    # Skills Issues
+    if len(valid_skills) < 3:
+        weaknesses.append("Limited technical skills (less than 3 skills listed)")
+    elif len(valid_skills) < 5:
+        weaknesses.append("Moderate skill set - consider adding more relevant skills")
+    
+    # Impact and Results Issues
+    if action_verb_count < 2:
+        weaknesses.append("Limited use of action verbs - weakens impact statements")
+    if metrics_count == 0:
+        weaknesses.append("No quantifiable results - missing measurable achievements")
+    
+    # Formatting Issues
+    if "•" not in text and "- " not in text:
+        weaknesses.append("No bullet points - reduces readability and scannability")
+    if len([s for s in doc.period_chunks if len(s) > 200]) > 3:
+        weaknesses.append("Some sentences too long - affects readability")
+    
+    # Content Quality
+    if len(text) < 500:
+        weaknesses.append("Resume too brief - may lack sufficient detail")
+    elif len(text) > 3000:
+        weaknesses.append("Resume too lengthy - may lose reader attention")
+    
+    # Professional Development
+    if not info['certifications'] or info['certifications'][0] == 'Not found':
+        weaknesses.append("No certifications - missing professional development evidence")
+    
+    # Recent Experience
+    if not any(year in text for year in ['2024', '2023', '2022']):
+        weaknesses.append("No recent experience mentioned - may appear outdated")
+    
+    # Remove duplicates and ensure quality
+    strengths = list(set([s for s in strengths if s and len(s.strip()) > 0]))
+    weaknesses = list(set([w for w in weaknesses if w and len(w.strip()) > 0]))
+    
+    # Limit to top 5 most important items
+    return strengths[:5], weaknesses[:5]
+
+# --- ATS Feature Extraction and Analysis ---
+def extract_ats_features(text, info, field):
+    """
+    Comprehensive ATS feature extraction and analysis.
+    Returns detailed breakdown of ATS compatibility factors.
+    """
+    doc = as_document(text)
+    text, lower = doc.text, doc.lower
+    features = {}
+    
+    # === KEYWORD ANALYSIS ===
+    field_keywords = SKILL_KEYWORDS.get(field, [])
+    keyword_matches = doc.skills.for_field(field)
+    if field_keywords:
+        features["Keywords Found"] = keyword_matches[:10]  # Top 10 matches
+        features["Keyword Match Rate"] = f"{len(keyword_matches)}/{len(field_keywords)} ({len(keyword_matches)/len(field_keywords)*100:.1f}%)"
+    else:
+        features["Keywords Found"] = []
+        features["Keyword Match Rate"] = "N/A"
+    
+    # === SECTION HEADERS ===
+    standard_headers = ["experience", "education", "skills", "certifications", "projects", "summary", "objective", "work history", "employment"]
+    found_headers = [h for h in standard_headers if h in lower]
+    features["Standard Headers Found"] = found_headers
+    features["Header Compliance"] = f"{len(found_headers)}/{len(standard_headers)} ({len(found_headers)/len(standard_headers)*100:.1f}%)"
+    
+    # === CONTACT INFORMATION ===
+    contact_info = {}
+    contact_info["Email"] = "Present" if info['email'] != 'Not found' else "Missing"
+    contact_info["Phone"] = "Present" if info['phone'] != 'Not found' else "Missing"
+    contact_info["LinkedIn"] = "Present" if info['linkedin'] != 'Not found' else "Missing"
+    features["Contact Information"] = contact_info
+    
+    # === FORMATTING ANALYSIS ===
+    formatting = {}
+    formatting["Bullet Points"] = "Present" if "•" in text or "- " in text else "Missing"
+    formatting["Special Characters"] = "Clean" if not any(char in text for char in ["[", "]", "{", "}", "|", "~", "^"]) else "Contains Special Chars"
+    formatting["Content Length"] = f"{len(text)} characters ({'Optimal' if 500 <= len(text) <= 3000 else 'Too Short' if len(text) < 500 else 'Too Long'})"
+    features["Formatting"] = formatting
+    
+    # === EXPERIENCE DETAILS ===
+    experience = {}
+    experience["Experience Section"] = "Present" if any(word in lower for word in ["experience", "work", "employment"]) else "Missing"
+    experience["Recent Dates"] = "Present" if any(year in text for year in ["2024", "2023", "2022"]) else "Missing"
+    experience["Company Names"] = "Present" if any(word in lower for word in ["company", "corporation", "inc", "ltd", "llc"]) else "Missing"
+    features["Experience Details"] = experience
+    
+    # === SKILLS ANALYSIS ===
+    skills = {}
+    valid_skills = [s for s in info['skills'] if s != 'Not found' and len(s.strip()) > 0]
+    skills["Skills Count"] = len(valid_skills)
+    skills["Skills Quality"] = "Strong" if len(valid_skills) >= 5 else "Moderate" if len(valid_skills) >= 3 else "Weak"
+    features["Skills Analysis"] = skills
+    
+    # === ATS COMPATIBILITY SCORE ===
+    compatibility_score = 0
+    max_score = 20
+    
+    # Keywords (8 points)
+    if field_keywords:
+        keyword_ratio = len(keyword_matches) / len(field_keywords)
+        compatibility_score += keyword_ratio * 8
+    
+    # Headers (4 points)
+    header_ratio = len(found_headers) / len(standard_headers)
+    compatibility_score += header_ratio * 4
+    
+    # Formatting (3 points)
+    if "•" in text or "- " in text:
+        compatibility_score += 1
+    if not any(char in text for char in ["[", "]", "{", "}", "|", "~", "^"]):
+        compatibility_score += 1
+    if 500 <= len(text) <= 3000:
+        compatibility_score += 1
+    
+    # Contact (2 points)
+    if info['email'] != 'Not found':
+        compatibility_score += 1
+    if info['phone'] != 'Not found':
+        compatibility_score += 1
+    
+    # Experience (3 points)
+    if any(word in lower for word in ["experience", "work", "employment"]):
+        compatibility_score += 1
+    if any(year in text for year in ["2024", "2023", "2022"]):
+        compatibility_score += 1
+    if any(word in lower for word in ["company", "corporation", "inc", "ltd", "llc"]):
+        compatibility_score += 1
+    
+    features["ATS Compatibility Score"] = f"{compatibility_score:.1f}/{max_score} ({compatibility_score/max_score*100:.1f}%)"
+    
+    return features
+
+# --- Enhanced Personalized Tips ---
+def get_personalized_tips(text, info):
+    """
+    Generate personalized, actionable tips based on resume analysis.
+    """
+    doc = as_document(text)
+    text, lower = doc.text, doc.lower
+    tips = []
+    
+    # Contact Information Tips
+    if info['linkedin'] == 'Not found':
+        tips.append("🔗 *Add LinkedIn Profile*: Include your LinkedIn URL to enhance professional credibility and networking opportunities.")
+    
+    if info['email'] == 'Not found':
+        tips.append("📧 *Add Email Address*: Include a professional email address for direct communication.")
+    
+    if info['phone'] == 'Not found':
+        tips.append("📱 *Add Phone Number*: Include your phone number for immediate contact options.")
+    
+    # Content Structure Tips
+    if 'projects' not in lower:
+        tips.append("💼 *Add Projects Section*: Include 2-3 relevant projects with technologies used and outcomes achieved.")
+    
+    if 'summary' not in lower and 'objective' not in lower:
+        tips.append("📝 *Add Professional Summary*: Include a 2-3 sentence summary highlighting your key strengths and career goals.")
+    
+    if 'certifications' not in lower:
+        tips.append("🏆 *Add Certifications*: Include relevant certifications to demonstrate continuous learning and expertise.")
+    
+    # Skills Enhancement Tips
+    valid_skills = [s for s in info['skills'] if s != 'Not found' and len(s.strip()) > 0]
+    if len(valid_skills) < 5:
+        tips.append("🛠 *Expand Skills Section*: List at least 5-8 relevant technical skills for your target role.")
+    
+    # Impact and Results Tips
+    action_verbs = ["achieved", "developed", "implemented", "managed", "led", "created", "designed", 
+                   "improved", "increased", "reduced", "optimized", "launched", "coordinated", "analyzed"]
+    action_verb_count = sum(1 for verb in action_verbs if verb in lower)
+    if action_verb_count < 3:
+        tips.append("🚀 *Use Action Verbs*: Start bullet points with strong action verbs like 'Developed', 'Implemented', 'Led'.")
+    
+    metrics_indicators = ["%", "percent", "improved", "reduced", "increased", "decreased", "by", "from", "to"]
+    metrics_count = sum(1 for metric in metrics_indicators if metric in lower)
+    if metrics_count < 2:
+        tips.append("📊 *Add Quantifiable Results*: Include specific metrics like 'Increased efficiency by 25%' or 'Reduced costs by $10K'.")
+    
+    # Formatting Tips
+    if "•" not in text and "- " not in text:
+        tips.append("📋 *Use Bullet Points*: Format experience and skills with bullet points for better readability.")
+    
+    # Content Quality Tips
+    if len(text) < 800:
+        tips.append("📄 *Expand Content*: Add more detail to experience descriptions and achievements.")
+    
+    if len(text) > 2500:
+        tips.append("✂ *Condense Content*: Keep resume concise and focused on most relevant information.")
+    
+    # Professional Development Tips
+    if not info['certifications'] or info['certifications'][0] == 'Not found':
+        tips.append("🎓 *Pursue Certifications*: Consider industry-relevant certifications to strengthen your profile.")
+    
+    # Recent Experience Tips
+    if not any(year in text for year in ['2024', '2023', '2022']):
+        tips.append("🕒 *Update Recent Experience*: Ensure your most recent work experience is prominently featured.")
+    
+    # ATS Optimization Tips
+    if not any(section in lower for section in ['experience', 'education', 'skills']):
+        tips.append("🔍 *Use Standard Headers*: Include standard section headers like 'Experience', 'Education', 'Skills' for ATS compatibility.")
+    
+    # Limit to most important tips
+    return tips[:6]
+
+# --- Relevant/Irrelevant Courses/Certs ---
+def classify_courses_certs(info, field):
+    relevant_courses = [c for c in COURSES.get(field, []) if any(kw in c.lower() for kw in info['skills'])]
+    irrelevant_courses = [c for c in COURSES.get(field, []) if c not in relevant_courses]
+    relevant_certs = [c for c in info['certifications'] if any(p in c.lower() for p in CERT_PROVIDERS if p in field.lower() or p in ' '.join(info['skills']).lower())]
+    irrelevant_certs = [c for c in info['certifications'] if c not in relevant_certs]
+    return relevant_courses, irrelevant_courses, relevant_certs, irrelevant_certs
+
+# --- Suggest Missing from Template ---
+def suggest_missing(info, text):
+    lower = as_document(text).lower
+    missing_sections = [s for s in IDEAL_SECTIONS if s not in lower]
+    have_skills = {sk.lower() for sk in info['skills']}
+    missing_skills = [s for s in IDEAL_SKILLS if s not in have_skills]
+    missing_certs = [p.title() for p in CERT_PROVIDERS if not any(p in c.lower() for c in info['certifications'])]
+    return missing_sections, missing_skills, missing_certs
+
+
+# Recommend missing skills for the predicted field
+
+def recommend_skills(extracted_skills, field):
+    if field in SKILL_KEYWORDS:
+        have_skills = {s.lower() for s in extracted_skills}
+        missing = [kw for kw in SKILL_KEYWORDS[field] if kw not in have_skills]
+        return missing
+    return []
+
+# --- Course Relevance Helper ---
+def course_relevance(course, missing_skills):
+    for skill in missing_skills:
+        if skill.lower() in course.lower():
+            return "✅ Strongly Recommended"
+    if any(word in course.lower() for word in ["crash", "introduction", "beginner"]):
+        return "✅ Add after completion"
+    return "✅ Must Have"
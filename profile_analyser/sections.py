@@ -0,0 +1,113 @@
+"""Section headings: the heading vocabulary and heading normalization."""
+import re
+import threading
+from collections import Counter
+from difflib import SequenceMatcher
+from functools import lru_cache
+
+from profile_analyser.constants import SECTION_HEADERS
+
+# Heading words the extractors look for at the start of a line, either to open
+# their own section or to find where it ends.  Every header/stop pattern used
+# in extractors.py must be covered here: ResumeDocument only offers lines
+# matching HEADING_LINE_RE as section boundaries.
+HEADING_PATTERNS = {
+    "education": r"education|academics|academic qualifications|qualifications|educational background",
+    "skills": r"skills?|technical skills?",
+    "certifications": (
+        r"certificates?|certifications?|licenses?(?:\s*&\s*certifications?)?|licenses|courses|training"
+        r"|professional development|credentials|badges|awards\s*&\s*certifications?"
+    ),
+    "projects": r"projects?|personal projects?|academic projects?",
+    "experience": r"experience|work|employment",
+    "objective": r"summary|objective",
+    "contact": r"contact",
+    "achievements": r"achievements?",
+}
+
+HEADING_LINE_RE = re.compile(r"(?i)(?:%s)\b" % "|".join(HEADING_PATTERNS.values()))
+_FAMILY_RES = {name: re.compile(r"(?i)(?:%s)\b" % pattern) for name, pattern in HEADING_PATTERNS.items()}
+_EMAIL_RE = re.compile(r"[\w.+-]+@[\w-]+\.[\w.-]+")
+
+
+def sections_seen(*names):
+    """Page predicate for ``extract_text_from_pdf(stop_when=...)``.
+
+    Feed it page texts in order; it returns true once every named section
+    (keys of ``HEADING_PATTERNS``) has been read to its end, i.e. a heading of
+    another section followed it.  ``"contact"`` is also satisfied by an email
+    address, since contact details rarely have a heading.
+    """
+    pending = set(names)
+    current = [None]
+
+    def seen(page_text):
+        if "contact" in pending and _EMAIL_RE.search(page_text):
+            pending.discard("contact")
+        for line in page_text.split("\n"):
+            if not HEADING_LINE_RE.match(line):
+                continue
+            family = next(name for name, family_re in _FAMILY_RES.items() if family_re.match(line))
+            if family == current[0]:
+                continue
+            if current[0] in pending:
+                pending.discard(current[0])
+            current[0] = family
+        return not pending
+
+    return seen
+
+
+# difflib's ratio is 2*M/T (M matching chars, T total length); a variation can
+# only exceed 0.8 if M could exceed 0.4*T.  M is bounded by the shorter length
+# and by the character multiset overlap, which rules out almost every
+# variation before SequenceMatcher runs.
+_index = None
+# The per-variation SequenceMatchers are stateful; fuzzy lookups take turns
+_lookup_lock = threading.Lock()
+
+
+def _build_index():
+    variations = [
+        (section, variation, len(variation), Counter(variation), SequenceMatcher(None, "", variation))
+        for section, names in SECTION_HEADERS.items()
+        for variation in names
+    ]
+    exact = {}
+    for _, variation, _, _, _ in variations:
+        exact.setdefault(variation, _fuzzy_lookup(variation, variations))
+    return exact, variations
+
+
+def _fuzzy_lookup(text_lower, variations):
+    n = len(text_lower)
+    counts = None
+    for section, variation, length, variation_counts, matcher in variations:
+        total = n + length
+        if 10 * min(n, length) <= 4 * total:
+            continue
+        if counts is None:
+            counts = Counter(text_lower)
+        if 10 * sum((counts & variation_counts).values()) <= 4 * total:
+            continue
+        # seq2 (the variation) is indexed once; only seq1 changes per call
+        matcher.set_seq1(text_lower)
+        if matcher.ratio() > 0.8:
+            return section
+    return text_lower
+
+
+@lru_cache(maxsize=4096)
+def _normalize(text_lower):
+    global _index
+    with _lookup_lock:
+        if _index is None:
+            _index = _build_index()
+        exact, variations = _index
+        section = exact.get(text_lower)
+        return section if section is not None else _fuzzy_lookup(text_lower, variations)
+
+
+def normalize_section_heading(text):
+    """Normalize section headings using fuzzy matching"""
+    return _normalize(text.lower().strip())
@@ -0,0 +1,151 @@
+"""Resume x job-description similarity on sparse term matrices.
+
+``match(resumes, job_descriptions)`` tokenizes both batches into one shared
+vocabulary (words and two-word phrases), weights them with TF-IDF or BM25 and
+scores every pair with a single sparse matrix product.  The result ranks
+resumes per job (and jobs per resume) and breaks any pair's score down into
+per-term contributions.  ``top_terms`` ranks one text's terms by frequency.
+scikit-learn builds the count matrices; the weighting and the product are
+plain scipy.sparse.
+"""
+from profile_analyser.matcher import TOKEN_RE
+from profile_analyser.metrics import timed
+
+METHODS = ("tfidf", "bm25")
+
+# Words that carry no signal in a job description (on top of English stop words)
+JOB_STOP_WORDS = frozenset({
+    "ability", "able", "candidate", "candidates", "excellent", "experience", "good", "ideal", "including",
+    "job", "join", "looking", "plus", "preferred", "required", "requirements", "responsibilities", "role",
+    "skills", "strong", "team", "use", "using", "work", "years",
+})
+
+
+def _vectorizer(ngram_range):
+    from sklearn.feature_extraction.text import ENGLISH_STOP_WORDS, CountVectorizer
+
+    return CountVectorizer(
+        token_pattern=TOKEN_RE.pattern,
+        lowercase=True,
+        stop_words=sorted(ENGLISH_STOP_WORDS | JOB_STOP_WORDS),
+        ngram_range=ngram_range,
+        dtype=float,
+    )
+
+
+def _bm25_documents(counts, idf, k1, b):
+    """Row-wise BM25 term weights (saturated tf, length-normalized, times idf)."""
+    import numpy as np
+
+    counts = counts.tocsr(copy=True)
+    lengths = np.asarray(counts.sum(axis=1)).ravel()
+    avg_length = lengths.mean() if len(lengths) and lengths.mean() > 0 else 1.0
+    row_length = np.repeat(lengths, np.diff(counts.indptr))
+    tf = counts.data
+    counts.data = tf * (k1 + 1) / (tf + k1 * (1 - b + b * row_length / avg_length)) * idf[counts.indices]
+    return counts
+
+
+def top_terms(text, k=12, ngram_range=(1, 2)):
+    """The ``k`` most frequent terms of one text (e.g. a job description), first seen first on ties.
+
+    Frequencies are the text's own: weighting by IDF over a resume + job pair
+    would rank the terms both share lowest, and those are the ones tailoring
+    looks for.
+    """
+    from collections import Counter
+
+    return [term for term, _ in Counter(_vectorizer(ngram_range).build_analyzer()(text or "")).most_common(k)]
+
+
+class MatchResult:
+    """Scores for every (resume, job) pair plus the weighted matrices behind them."""
+
+    def __init__(self, scores, resume_matrix, job_matrix, terms, method):
+        self.scores = scores
+        self.method = method
+        self.terms = terms
+        self._resumes = resume_matrix
+        self._jobs = job_matrix
+
+    @property
+    def shape(self):
+        return self.scores.shape
+
+    def top_resumes(self, job, k=10):
+        """``[(resume_index, score), ...]`` for one job, best first."""
+        return self._top(self.scores[:, job], k)
+
+    def top_jobs(self, resume, k=10):
+        """``[(job_index, score), ...]`` for one resume, best first."""
+        return self._top(self.scores[resume], k)
+
+    def contributions(self, resume, job, k=10):
+        """The terms behind ``scores[resume, job]`` as ``[(term, contribution), ...]``."""
+        row = self._resumes[resume].multiply(self._jobs[job]).tocsr()
+        order = row.data.argsort()[::-1][:k]
+        return [(self.terms[row.indices[i]], float(row.data[i])) for i in order if row.data[i] > 0]
+
+    @staticmethod
+    def _top(column, k):
+        import numpy as np
+
+        k = min(k, len(column))
+        if k <= 0:
+            return []
+        top = np.argpartition(-column, k - 1)[:k]
+        top = top[np.lexsort((top, -column[top]))]
+        return [(int(i), float(column[i])) for i in top]
+
+
+@timed("similarity.match")
+def match(resumes, job_descriptions, method="tfidf", ngram_range=(1, 2), k1=1.5, b=0.75):
+    """Score every resume text against every job description.
+
+    ``tfidf`` gives cosine similarities in [0, 1] (sublinear tf, L2-normalized
+    rows).  ``bm25`` ranks resumes as documents for each job description as a
+    query; its scores are unbounded and only comparable within one job.  IDF
+    is computed over both batches together.
+    """
+    import numpy as np
+    from scipy.sparse import csr_matrix
+
+    if method not in METHODS:
+        raise ValueError(f"Unknown similarity method {method!r}; expected one of {METHODS}")
+    resumes = [text or "" for text in resumes]
+    job_descriptions = [text or "" for text in job_descriptions]
+    n_resumes = len(resumes)
+    if not resumes or not job_descriptions:
+        empty = np.zeros((n_resumes, len(job_descriptions)))
+        return MatchResult(empty, csr_matrix((n_resumes, 0)), csr_matrix((len(job_descriptions), 0)), [], method)
+    vectorizer = _vectorizer(ngram_range)
+    try:
+        counts = vectorizer.fit_transform(resumes + job_descriptions).tocsr()
+        terms = vectorizer.get_feature_names_out()
+    except ValueError:
+        # Nothing but stop words (or no text at all) on either side
+        empty = np.zeros((n_resumes, len(job_descriptions)))
+        return MatchResult(empty, csr_matrix((n_resumes, 0)), csr_matrix((len(job_descriptions), 0)), [], method)
+    resume_counts, job_counts = counts[:n_resumes], counts[n_resumes:]
+    n_docs = counts.shape[0]
+    df = np.bincount(counts.indices, minlength=counts.shape[1])
+
+    if method == "tfidf":
+        idf = np.log((1 + n_docs) / (1 + df)) + 1
+
+        def weigh(matrix):
+            matrix = matrix.copy()
+            matrix.data = (1 + np.log(matrix.data)) * idf[matrix.indices]
+            norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+            matrix.data /= np.repeat(np.where(norms > 0, norms, 1.0), np.diff(matrix.indptr))
+            return matrix
+
+        resume_matrix, job_matrix = weigh(resume_counts), weigh(job_counts)
+    else:
+        idf = np.log(1 + (n_docs - df + 0.5) / (df + 0.5))
+        resume_matrix = _bm25_documents(resume_counts, idf, k1, b)
+        job_matrix = job_counts.copy()
+        job_matrix.data = np.ones_like(job_matrix.data)
+
+    scores = (resume_matrix @ job_matrix.T).toarray()
+    return MatchResult(scores, resume_matrix, job_matrix, terms, method)
@@ -0,0 +1,52 @@
+import pytest
+
+
+def build_pdf(*pages):
+    """PDF bytes with one page per argument; a page is a list of ``(x, y, text[, size[, bold]])``."""
+    import fitz  # PyMuPDF
+
+    doc = fitz.open()
+    for lines in pages:
+        page = doc.new_page(width=612, height=792)
+        for x, y, text, *style in lines:
+            size = style[0] if style else 10
+            bold = style[1] if len(style) > 1 else False
+            page.insert_text((x, y), text, fontsize=size, fontname="hebo" if bold else "helv")
+    data = doc.tobytes()
+    doc.close()
+    return data
+
+
+def column(x, y, lines, leading=14):
+    """``lines`` stacked from ``(x, y)`` down, as page entries for ``build_pdf``."""
+    return [(x, y + i * leading, line) for i, line in enumerate(lines)]
+
+
+@pytest.fixture
+def resume_pdf():
+    return build_pdf(
+        [(72, 72, "Jane Doe", 16, True), (72, 92, "jane@site.org | 555-123-4567")]
+        + [(72, 130, "Skills", 13, True)]
+        + column(72, 150, ["Python, SQL, Docker and Kubernetes", "Machine learning with scikit-learn"])
+        + [(72, 200, "Education", 13, True)]
+        + column(72, 220, ["B.Sc Computer Science, State University, 2018"]),
+    )
+
+
+@pytest.fixture
+def plain_resume():
+    """``plain_resume(name)``: PDF bytes of a resume whose analysis needs no spaCy model
+    (the name is found without NER and there is no Skills section)."""
+
+    def make(name="Jane Doe"):
+        handle = name.lower().replace(" ", ".")
+        return build_pdf(
+            [(72, 72, name, 16, True), (72, 92, f"{handle}@site.org | 555-123-4567")]
+            + [(72, 130, "Experience", 13, True)]
+            + column(72, 150, ["Data Analyst, Acme Corp (2020 - 2024)",
+                               "- Developed Python and SQL reports, reducing effort by 30%"])
+            + [(72, 200, "Education", 13, True)]
+            + column(72, 220, ["B.Sc Computer Science, State University, 2019"]),
+        )
+
+    return make
@@ -0,0 +1,191 @@
+from concurrent.futures import Future
+
+import pytest
+
+from profile_analyser import batch, graph, metrics
+from profile_analyser.batch import analyze_batch, analyze_resumes, chunk_items, submit_analysis, submit_batch
+from profile_analyser.cache import ParseCache, file_digest
+from profile_analyser.graph import BATCH_NODES
+
+
+@pytest.fixture
+def info_calls(monkeypatch):
+    """Count evaluations of the ``info`` node."""
+    calls = []
+    deps, compute = graph.NODES["info"]
+
+    def counted(doc, layout):
+        calls.append(doc.text)
+        return compute(doc, layout)
+
+    monkeypatch.setitem(graph.NODES, "info", (deps, counted))
+    return calls
+
+
+def test_chunk_items():
+    assert chunk_items(list(range(10)), 4) == [[0, 1, 2], [3, 4, 5], [6, 7, 8], [9]]
+    assert chunk_items(list(range(10)), 2, size=3) == [[0, 1, 2], [3, 4, 5], [6, 7, 8], [9]]
+    assert chunk_items(list(range(3)), 8) == [[0], [1], [2]]
+    assert chunk_items([], 4) == []
+
+
+def test_analyze_resumes_returns_the_batch_nodes_in_order(plain_resume):
+    results = analyze_resumes([(plain_resume("Jane Doe"), "pdf"), (plain_resume("John Roe"), "pdf")])
+    assert [result["info"]["name"] for result in results] == ["Jane Doe", "John Roe"]
+    assert all(set(result) == set(BATCH_NODES) and result["error"] is None for result in results)
+
+
+def test_analyze_batch_keeps_input_order_and_analyzes_duplicates_once(plain_resume, info_calls):
+    jane, john = plain_resume("Jane Doe"), plain_resume("John Roe")
+    progress = []
+    results = analyze_batch([(jane, "pdf"), (john, "pdf"), (jane, "pdf")], max_workers=1,
+                            progress=lambda done, total: progress.append((done, total)), cache=ParseCache())
+    assert [result["info"]["name"] for result in results] == ["Jane Doe", "John Roe", "Jane Doe"]
+    assert results[0] is results[2]
+    assert len(info_calls) == 2
+    assert progress[0] == (0, 3) and progress[-1] == (3, 3)
+
+
+def test_analyze_batch_serves_analyzed_files_from_the_cache(plain_resume, info_calls):
+    cache = ParseCache()
+    jane = plain_resume("Jane Doe")
+    [first] = analyze_batch([(jane, "pdf")], max_workers=1, cache=cache)
+    progress = []
+    [again] = analyze_batch([(jane, "pdf")], max_workers=1, cache=cache,
+                            progress=lambda done, total: progress.append((done, total)))
+    assert again is first
+    assert len(info_calls) == 1
+    assert progress == [(1, 1)]
+
+
+class ManualExecutor:
+    """Stands in for the process pool: ``run`` completes the submitted chunks on demand."""
+
+    def __init__(self):
+        self.submitted = []
+
+    def submit(self, fn, *args):
+        future = Future()
+        self.submitted.append((fn, args, future))
+        return future
+
+    def run(self, error=None):
+        pending, self.submitted = self.submitted, []
+        for fn, args, future in pending:
+            if error is None:
+                future.set_result(fn(*args))
+            else:
+                future.set_exception(error)
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    executor = ManualExecutor()
+    monkeypatch.setattr(batch, "get_executor", lambda max_workers: executor)
+    yield executor
+    batch._inflight.clear()
+
+
+def test_submit_batch_reuses_work_in_flight(plain_resume, pool):
+    cache = ParseCache()
+    jane, john = plain_resume("Jane Doe"), plain_resume("John Roe")
+    futures = submit_batch([(jane, "pdf", None), (john, "pdf", None)], max_workers=2, cache=cache)
+    assert len(pool.submitted) == 2 and not any(future.done() for future in futures)
+    # A rerun (or another session) asking for the same file gets the same future
+    assert submit_analysis(jane, "pdf", max_workers=2, cache=cache) is futures[0]
+    assert len(pool.submitted) == 2
+    pool.run()
+    analyses = [future.result() for future in futures]
+    assert [analysis["info"]["name"] for analysis in analyses] == ["Jane Doe", "John Roe"]
+    assert batch._inflight == {}
+    # Landed analyses are served from the cache without another submission
+    again = submit_analysis(jane, "pdf", max_workers=2, cache=cache)
+    assert again.done() and again.result() is analyses[0]
+    assert pool.submitted == []
+
+
+def test_submit_batch_loads_callable_sources_once(plain_resume, pool):
+    jane = plain_resume("Jane Doe")
+    reads = []
+
+    def load():
+        reads.append(1)
+        return jane
+
+    digest = file_digest(jane)
+    futures = submit_batch([(load, "pdf", digest), (load, "pdf", digest)], max_workers=2, cache=ParseCache())
+    assert futures[0] is futures[1]
+    assert reads == [1]
+    pool.run()
+    assert futures[0].result()["info"]["name"] == "Jane Doe"
+
+
+def test_expired_source_fails_only_its_future(plain_resume, pool):
+    def expired():
+        raise KeyError("gone")
+
+    futures = submit_batch([(expired, "pdf", "0" * 64), (plain_resume(), "pdf", None)],
+                           max_workers=2, cache=ParseCache())
+    with pytest.raises(KeyError):
+        futures[0].result(0)
+    assert "0" * 64 not in batch._inflight
+    pool.run()
+    assert futures[1].result()["error"] is None
+
+
+def test_in_thread_submission_completes_immediately(plain_resume):
+    cache = ParseCache()
+    [future] = submit_batch([(plain_resume(), "pdf", None)], max_workers=1, cache=cache)
+    analysis = future.result(0)
+    assert all(name in analysis for name in BATCH_NODES)
+    assert cache.get(analysis.digest) is analysis
+
+
+def failures():
+    return metrics.snapshot()["counters"].get("analysis.failed", 0)
+
+
+def test_a_failing_file_gets_an_error_and_the_rest_of_the_batch_succeeds(plain_resume, monkeypatch):
+    deps, compute = graph.NODES["info"]
+
+    def info(doc, layout):
+        if "John Roe" in doc.text:
+            raise ValueError("boom")
+        return compute(doc, layout)
+
+    monkeypatch.setitem(graph.NODES, "info", (deps, info))
+    before = failures()
+    jane, john = analyze_resumes([(plain_resume("Jane Doe"), "pdf"), (plain_resume("John Roe"), "pdf")])
+    assert jane["error"] is None and jane["info"]["name"] == "Jane Doe"
+    assert john["error"] == "Error analyzing PDF: boom"
+    assert john["text"] == "" and set(john) == set(BATCH_NODES)
+    assert failures() == before + 1
+
+
+def test_a_failed_ner_batch_falls_back_to_per_file_analysis(plain_resume, monkeypatch):
+    def broken(analyses, n_process=1):
+        raise RuntimeError("pipe failed")
+
+    monkeypatch.setattr(batch, "prime_ner", broken)
+    before = metrics.snapshot()["counters"].get("analysis.ner_batch_failed", 0)
+    results = analyze_resumes([(plain_resume("Jane Doe"), "pdf"), (plain_resume("John Roe"), "pdf")])
+    assert [result["info"]["name"] for result in results] == ["Jane Doe", "John Roe"]
+    assert all(result["error"] is None for result in results)
+    assert metrics.snapshot()["counters"]["analysis.ner_batch_failed"] == before + 1
+
+
+def test_a_crashed_worker_fails_only_its_chunk(plain_resume, pool):
+    cache = ParseCache()
+    jane, john = plain_resume("Jane Doe"), plain_resume("John Roe")
+    futures = submit_batch([(jane, "pdf", None), (john, "pdf", None)], max_workers=2, cache=cache)
+    *_, crashed = pool.submitted.pop(0)
+    crashed.set_exception(RuntimeError("worker died"))
+    with pytest.raises(RuntimeError):
+        futures[0].result(0)
+    assert not futures[1].done()
+    pool.run()
+    assert futures[1].result()["info"]["name"] == "John Roe"
+    assert batch._inflight == {}
+    # The crashed file is not cached, so asking again resubmits it
+    retry = submit_analysis(jane, "pdf", max_workers=2, cache=cache)
+    assert retry is not futures[0] and len(pool.submitted) == 1
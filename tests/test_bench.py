@@ -0,0 +1,32 @@
+from profile_analyser import bench
+
+
+def texts(corpus):
+    from profile_analyser.extract import extract_text_from_file
+
+    return {name: extract_text_from_file(data, file_type) for name, file_type, data in corpus}
+
+
+def test_corpus_is_seeded():
+    corpus = bench.build_corpus(seed=3)
+    assert [(name, file_type) for name, file_type, _ in corpus] == [spec[:2] for spec in bench.CORPUS_SPECS]
+    # PDF bytes carry creation dates; the content is what is seeded
+    assert texts(corpus) == texts(bench.build_corpus(seed=3))
+    assert texts(corpus) != texts(bench.build_corpus(seed=4))
+
+
+def test_link_heavy_resumes_list_their_urls():
+    for name, text in texts(bench.build_corpus()).items():
+        expected = len(bench.LINK_HOSTS) * bench.LINKS_PER_HOST if name.startswith("links_") else 0
+        assert text.count("https://") == expected, name
+
+
+def test_compare_flags_regressions_beyond_the_tolerance():
+    def report(p50, rate=10.0, rss=100.0):
+        return {"version": bench.BENCH_VERSION, "stages": {"scoring": {"p50_ms": p50, "p90_ms": p50}},
+                "throughput_per_s": rate, "peak_rss_mb": rss}
+
+    assert bench.compare(report(10.0), report(10.0)) == []
+    assert bench.compare(report(10.2), report(10.0)) == []  # under the noise floor
+    assert len(bench.compare(report(20.0, rate=5.0, rss=200.0), report(10.0))) == 4
+    assert bench.compare(report(10.0), dict(report(10.0), version=1))[0].startswith("baseline is from bench version 1")
@@ -0,0 +1,151 @@
+import os
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from profile_analyser import blobs
+from profile_analyser.blobs import BlobStore
+
+
+def files(directory):
+    return [name for _, _, names in os.walk(directory) for name in names]
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = SimpleNamespace(t=0.0)
+    monkeypatch.setattr(blobs, "time", SimpleNamespace(monotonic=lambda: now.t))
+    return now
+
+
+def test_put_deduplicates(tmp_path):
+    store = BlobStore(directory=str(tmp_path))
+    first = store.put(b"resume")
+    assert store.put(b"resume") == first
+    assert len(store) == 1
+    assert store.get(first) == b"resume"
+    stats = store.stats()
+    assert (stats["dedup_hits"], stats["memory_bytes"]) == (1, 6)
+
+
+def test_coldest_entry_spills_to_disk(tmp_path):
+    store = BlobStore(max_memory_bytes=10, directory=str(tmp_path))
+    a = store.put(b"a" * 8)
+    b = store.put(b"b" * 8)
+    stats = store.stats()
+    assert (stats["spilled"], stats["memory_bytes"], stats["disk_bytes"]) == (1, 8, 8)
+    [spilled] = files(tmp_path)
+    assert spilled.startswith(a)
+    assert store.get(a) == b"a" * 8
+    assert store.get(b) == b"b" * 8
+    assert (store.stats()["hits"], store.stats()["misses"]) == (1, 1)
+
+
+def test_disk_bound_deletes_coldest_spilled_entry(tmp_path):
+    store = BlobStore(max_memory_bytes=0, max_disk_bytes=10, directory=str(tmp_path))
+    a = store.put(b"a" * 8)
+    b = store.put(b"b" * 8)
+    assert a not in store
+    with pytest.raises(KeyError):
+        store.get(a)
+    assert store.get(b) == b"b" * 8
+    assert store.stats()["disk_bytes"] == 8
+
+
+def test_unreferenced_entry_expires_after_ttl(tmp_path, clock):
+    store = BlobStore(ttl=10, orphan_ttl=100, directory=str(tmp_path))
+    digest = store.put(b"data")
+    clock.t = 1
+    store.release(digest)
+    assert digest in store
+    clock.t = 12
+    store.sweep()
+    assert digest not in store
+
+
+def test_referenced_entry_outlives_ttl_until_orphan_ttl(tmp_path, clock):
+    store = BlobStore(ttl=10, orphan_ttl=100, directory=str(tmp_path))
+    digest = store.put(b"data")
+    assert store.acquire(digest)
+    store.release(digest)
+    clock.t = 50
+    store.sweep()
+    assert digest in store
+    clock.t = 101
+    store.sweep()
+    assert digest not in store
+    assert not store.acquire(digest)
+
+
+def test_reads_refresh_idle_time(tmp_path, clock):
+    store = BlobStore(ttl=10, orphan_ttl=100, directory=str(tmp_path))
+    digest = store.put(b"data")
+    store.release(digest)
+    clock.t = 8
+    store.get(digest)
+    clock.t = 16
+    store.sweep()
+    assert digest in store
+
+
+def test_clear_removes_spilled_files(tmp_path):
+    store = BlobStore(max_memory_bytes=0, directory=str(tmp_path))
+    store.put(b"spilled")
+    store.clear()
+    assert len(store) == 0
+    assert files(tmp_path) == []
+
+
+@pytest.fixture
+def slow_disk(monkeypatch):
+    """Spill writes block until ``release`` is set; ``writing`` is set once one starts."""
+    state = SimpleNamespace(writing=threading.Event(), release=threading.Event())
+    fdopen = os.fdopen
+
+    class BlockingFile:
+        def __init__(self, fh):
+            self.fh = fh
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            self.fh.close()
+
+        def write(self, data):
+            state.writing.set()
+            assert state.release.wait(5)
+            return self.fh.write(data)
+
+    monkeypatch.setattr(blobs.os, "fdopen", lambda fd, mode: BlockingFile(fdopen(fd, mode)))
+    return state
+
+
+def test_spills_are_written_outside_the_store_lock(tmp_path, slow_disk):
+    store = BlobStore(max_memory_bytes=10, directory=str(tmp_path))
+    a = store.put(b"a" * 8)
+    spiller = threading.Thread(target=store.put, args=(b"b" * 8,))
+    spiller.start()
+    assert slow_disk.writing.wait(5)
+    # The spill of a is in progress: the store still answers, from memory
+    assert store.get(a) == b"a" * 8
+    assert store.put(b"c" * 2) and store.stats()["spilled"] == 0
+    slow_disk.release.set()
+    spiller.join(5)
+    assert store.stats()["spilled"] == 1
+    assert store.get(a) == b"a" * 8
+
+
+def test_entry_dropped_while_spilling_leaves_no_file(tmp_path, slow_disk):
+    store = BlobStore(max_memory_bytes=10, directory=str(tmp_path))
+    store.put(b"a" * 8)
+    spiller = threading.Thread(target=store.put, args=(b"b" * 8,))
+    spiller.start()
+    assert slow_disk.writing.wait(5)
+    store.clear()
+    slow_disk.release.set()
+    spiller.join(5)
+    stats = store.stats()
+    assert (stats["entries"], stats["memory_bytes"], stats["disk_bytes"]) == (0, 0, 0)
+    assert files(tmp_path) == []
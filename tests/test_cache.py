@@ -0,0 +1,90 @@
+from profile_analyser.cache import ParseCache, approx_size
+
+
+def test_lru_entry_bound():
+    cache = ParseCache(max_entries=2, max_bytes=1000)
+    cache.put("a", "1")
+    cache.put("b", "2")
+    assert cache.get("a") == "1"  # b is now the least recently used
+    cache.put("c", "3")
+    assert "b" not in cache
+    assert "a" in cache and "c" in cache
+    assert cache.stats()["evictions"] == 1
+
+
+def test_byte_bound_evicts_oldest_first():
+    cache = ParseCache(max_entries=10, max_bytes=10)
+    cache.put("a", "aaaa")
+    cache.put("b", "bbbb")
+    cache.put("c", "cccc")
+    assert "a" not in cache
+    assert len(cache) == 2
+    assert cache.stats()["bytes"] == 8
+
+
+def test_oversized_value_is_returned_but_not_cached():
+    cache = ParseCache(max_entries=10, max_bytes=10)
+    cache.put("a", "aaaa")
+    assert cache.put("big", "x" * 11) == "x" * 11
+    assert "big" not in cache
+    assert "a" in cache
+
+
+def test_replacing_a_key_updates_its_size():
+    cache = ParseCache(max_entries=10, max_bytes=10)
+    cache.put("a", "aaaaaaaa")
+    cache.put("a", "aa")
+    cache.put("b", "bbbbbbbb")
+    assert "a" in cache and "b" in cache
+    assert cache.stats()["bytes"] == 10
+
+
+def test_get_or_compute_computes_once():
+    cache = ParseCache()
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return {"text": "parsed"}
+
+    assert cache.get_or_compute("k", compute) == {"text": "parsed"}
+    assert cache.get_or_compute("k", compute) == {"text": "parsed"}
+    assert len(calls) == 1
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"]) == (1, 1)
+
+
+def test_discard_and_clear():
+    cache = ParseCache()
+    cache.put("a", "aa")
+    cache.put("b", "bb")
+    cache.discard("a")
+    cache.discard("missing")
+    assert "a" not in cache and cache.stats()["bytes"] == 2
+    cache.clear()
+    assert len(cache) == 0 and cache.stats()["bytes"] == 0
+
+
+def test_approx_size():
+    assert approx_size({"name": "Jane", "skills": ["sql", "go"]}) == 4 + 4 + 6 + 5
+    assert approx_size(3) == 8
+
+
+def test_resize_reaccounts_an_entry_that_grew():
+    cache = ParseCache(max_entries=10, max_bytes=10)
+    cache.put("a", "aaaa")
+    cache.put("b", "bb")
+    cache.resize("b", 8)
+    assert "a" not in cache and "b" in cache
+    assert cache.stats()["bytes"] == 8
+    cache.resize("missing", 4)
+    assert cache.stats()["bytes"] == 8
+
+
+def test_resize_past_the_byte_bound_drops_the_entry():
+    cache = ParseCache(max_entries=10, max_bytes=10)
+    cache.put("a", "aa")
+    cache.put("b", "bb")
+    cache.resize("b", 11)
+    assert "b" not in cache and "a" in cache
+    assert cache.stats()["bytes"] == 2
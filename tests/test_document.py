@@ -0,0 +1,115 @@
+import re
+
+import pytest
+
+from profile_analyser import document, nlp
+from profile_analyser.document import ResumeDocument, as_document, pipe_documents
+
+TEXT = """Jane Doe
+jane@site.org
+Experience
+Data Analyst, Acme Corp
+Education
+B.Sc Statistics
+Skills
+Python, SQL"""
+
+
+@pytest.fixture
+def ruler_pipeline(monkeypatch):
+    """A blank English pipeline tagging a few fixed names, with fresh stats."""
+    spacy = pytest.importorskip("spacy")
+    pipeline = spacy.blank("en")
+    pipeline.add_pipe("entity_ruler").add_patterns([
+        {"label": "PERSON", "pattern": "Jane Doe"},
+        {"label": "ORG", "pattern": "Acme Corp"},
+        {"label": "ORG", "pattern": "SQL"},
+    ])
+    monkeypatch.setattr(nlp, "_nlp", pipeline)
+    monkeypatch.setattr(nlp, "_stats", {"load_seconds": 0.0, "loads": 0, "calls": {}, "seconds": {},
+                                        "truncated": 0, "batches": 0})
+
+
+def passes():
+    return sum(nlp.pipeline_stats()["calls"].values())
+
+
+@pytest.fixture(autouse=True)
+def cold_memo():
+    document._document.cache_clear()
+    yield
+    document._document.cache_clear()
+
+
+def test_line_index():
+    doc = ResumeDocument(TEXT)
+    assert doc.lines[2] == "Experience"
+    assert [TEXT[start:].split("\n", 1)[0] for start in doc.line_starts] == doc.lines
+    assert doc.line_of(0) == 0
+    assert doc.line_of(TEXT.index("Acme")) == 3
+    assert doc.line_of(len(TEXT)) == len(doc.lines) - 1
+    assert doc.lower == TEXT.lower() and len(doc) == len(TEXT)
+
+
+def test_sections_split_the_text_at_heading_lines():
+    doc = ResumeDocument(TEXT)
+    assert [(s.name, s.heading) for s in doc.sections] == [
+        ("experience", "Experience"), ("education", "Education"), ("skills", "Skills")]
+    experience, education, skills = doc.sections
+    assert TEXT[experience.start:experience.end] == "Experience\nData Analyst, Acme Corp\n"
+    assert experience.end == education.start and skills.end == len(TEXT)
+
+
+def test_section_spans_run_to_the_next_stop_heading():
+    doc = ResumeDocument(TEXT)
+    [(header, start, end)] = doc.section_spans(re.compile(r"(?i)experience"), re.compile(r"(?i)skills"))
+    assert header.group(0) == "Experience"
+    assert TEXT[start:end] == "\nData Analyst, Acme Corp\nEducation\nB.Sc Statistics\n"
+    # Without a stop heading the block runs to the end of the text
+    [(_, block)] = doc.section_blocks(re.compile(r"(?i)education"), re.compile(r"(?i)awards"))
+    assert block == "\nB.Sc Statistics\nSkills\nPython, SQL"
+
+
+def test_headings_are_matched_only_at_the_start_of_a_line():
+    doc = ResumeDocument("Jane Doe\nI have experience with SQL\nSkills\nPython")
+    assert [s.name for s in doc.sections] == ["skills"]
+
+
+def test_as_document_shares_one_document_per_text():
+    doc = as_document(TEXT)
+    assert as_document(TEXT) is doc
+    assert as_document(doc) is doc
+    assert as_document(None) is as_document("")
+    assert as_document(None).text == "" and as_document(None).sections == []
+
+
+def test_entities_are_sliced_from_one_whole_text_doc(ruler_pipeline):
+    doc = ResumeDocument(TEXT)
+    assert [ent.text for ent in doc.entities()] == ["Jane Doe", "Acme Corp", "SQL"]
+    experience = next(s for s in doc.sections if s.name == "experience")
+    assert [ent.text for ent in doc.entities(experience.start, experience.end)] == ["Acme Corp"]
+    assert [ent.text for ent in doc.entities(0, TEXT.index("\n"), labels={"PERSON"})] == ["Jane Doe"]
+    assert doc.entities(labels={"GPE"}) == []
+    assert passes() == 1
+
+
+def test_a_covering_doc_is_reused(ruler_pipeline):
+    doc = ResumeDocument(TEXT)
+    full = doc.nlp("full")
+    assert doc.nlp("ner") is full
+    assert doc.entities()[0].doc is full
+    assert passes() == 1
+
+
+def test_pipe_documents_fills_documents_in_one_batch(ruler_pipeline):
+    first, second = ResumeDocument(TEXT), ResumeDocument("Jane Doe\nSkills\nSQL")
+    done = ResumeDocument("Acme Corp")
+    done.nlp()
+    pipe_documents([first, second, first, done])
+    stats = nlp.pipeline_stats()
+    assert stats["batches"] == 1 and stats["calls"] == {"ner": 3}
+    assert [ent.text for ent in second.entities()] == ["Jane Doe", "SQL"]
+    assert passes() == 3
+    # Nothing left to run: no new batch
+    pipe_documents([first, second])
+    assert nlp.pipeline_stats()["batches"] == 1
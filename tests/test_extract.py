@@ -0,0 +1,113 @@
+from io import BytesIO
+
+import pytest
+
+from profile_analyser import extract
+from profile_analyser.extract import (
+    ExtractionError, extract_document, extract_pdf, extract_text_from_docx, extract_text_from_file,
+)
+from profile_analyser.sections import sections_seen
+
+from conftest import build_pdf, column
+
+
+def docx_bytes(*paragraphs):
+    docx = pytest.importorskip("docx")
+    document = docx.Document()
+    for paragraph in paragraphs:
+        document.add_paragraph(paragraph)
+    buffer = BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+
+def test_pdf_sources_give_the_same_text(resume_pdf, tmp_path):
+    path = tmp_path / "resume.pdf"
+    path.write_bytes(resume_pdf)
+    buffer = BytesIO(resume_pdf)
+    buffer.read()  # a consumed upload buffer is rewound
+    texts = [extract_text_from_file(source, "pdf")
+             for source in (resume_pdf, bytearray(resume_pdf), memoryview(resume_pdf), buffer, str(path))]
+    assert "Jane Doe" in texts[0] and "Python, SQL" in texts[0]
+    assert texts == [texts[0]] * 5
+
+
+def test_docx_from_bytes_and_path(tmp_path):
+    data = docx_bytes("Jane Doe", "Skills", "Python, SQL")
+    path = tmp_path / "resume.docx"
+    path.write_bytes(data)
+    assert extract_text_from_docx(data) == "Jane Doe\nSkills\nPython, SQL\n"
+    assert extract_text_from_docx(str(path)) == extract_text_from_docx(BytesIO(data))
+    assert extract_document(data, "docx") == ("Jane Doe\nSkills\nPython, SQL\n", None)
+
+
+@pytest.mark.parametrize("file_type", ["pdf", "docx"])
+def test_unreadable_documents_raise_extraction_error(file_type):
+    with pytest.raises(ExtractionError):
+        extract_text_from_file(b"not a document", file_type)
+
+
+def test_unknown_file_type_has_no_text():
+    assert extract_text_from_file(b"plain", "txt") == ""
+
+
+@pytest.fixture
+def three_pages():
+    """Contact and experience, then education, then projects with a link."""
+    import fitz  # PyMuPDF
+
+    data = build_pdf(
+        column(72, 72, ["Jane Doe", "jane@site.org", "Experience", "Analyst, Acme Corp"]),
+        column(72, 72, ["Education", "B.Sc Statistics", "Skills", "Python, SQL"]),
+        column(72, 72, ["Projects", "Dashboard for sales data"]),
+    )
+    doc = fitz.open(stream=data, filetype="pdf")
+    doc[2].insert_link({"kind": fitz.LINK_URI, "from": fitz.Rect(72, 60, 200, 80), "uri": "https://github.com/jane"})
+    data = doc.tobytes()
+    doc.close()
+    return data
+
+
+@pytest.fixture
+def pages_read(monkeypatch):
+    """Page numbers ``extract_pdf`` pulled from the page stream."""
+    numbers = []
+    iter_pages = extract.iter_pdf_pages
+
+    def counted(source, mode=None):
+        for page in iter_pages(source, mode):
+            numbers.append(page.number)
+            yield page
+
+    monkeypatch.setattr(extract, "iter_pdf_pages", counted)
+    return numbers
+
+
+def test_extraction_stops_after_the_page_completing_the_sections(three_pages, pages_read):
+    text, layout = extract_pdf(three_pages, stop_when=sections_seen("contact", "education"))
+    assert pages_read == [0, 1]
+    assert "B.Sc Statistics" in text and "Projects" not in text
+    assert [page.number for page in layout.pages] == [0, 1]
+    # Links are only collected from the pages read
+    assert "github.com" not in text
+
+
+def test_without_stop_when_the_whole_document_is_read(three_pages, pages_read):
+    text, layout = extract_pdf(three_pages)
+    assert pages_read == [0, 1, 2] and len(layout.pages) == 3
+    assert "Dashboard for sales data" in text
+    assert text.endswith("\n\nhttps://github.com/jane")
+
+
+def test_a_stop_condition_never_met_reads_every_page(three_pages, pages_read):
+    extract_pdf(three_pages, stop_when=sections_seen("certifications"))
+    assert pages_read == [0, 1, 2]
+
+
+def test_sections_seen_waits_for_the_section_to_end():
+    seen = sections_seen("contact", "skills")
+    assert not seen("Jane Doe\nExperience\nAnalyst")
+    assert not seen("Skills\nPython")  # skills may continue on the next page
+    assert not seen("SQL, Docker")
+    assert not seen("Education\nB.Sc")  # skills is done, but no contact details yet
+    assert seen("Contact\njane@site.org")
@@ -0,0 +1,87 @@
+import random
+import re
+
+import pytest
+
+from profile_analyser.extractors import scan_contacts
+
+# The per-field findall passes scan_contacts replaced (app.py before the
+# single-pass scan), kept here as the reference behaviour.
+BASELINE_EMAIL = r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b"
+BASELINE_PHONES = [
+    r"\+?1?[-.\s]?\(?([0-9]{3})\)?[-.\s]?([0-9]{3})[-.\s]?([0-9]{4})",
+    r"\+?[0-9]{1,4}[-.\s]?[0-9]{1,4}[-.\s]?[0-9]{1,4}[-.\s]?[0-9]{1,4}",
+    r"\+?[0-9]{10,15}",
+]
+BASELINE_URLS = {
+    "linkedin": r"(?:linkedin\s*[:\-]?\s*(?:\n|\r|\s)*)?(https?://(?:www\.)?linkedin\.com/[a-zA-Z0-9\-_/=?]+|www\.linkedin\.com/[a-zA-Z0-9\-_/=?]+|linkedin\.com/[a-zA-Z0-9\-_/=?]+)",
+    "github": r"(?:github\s*[:\-]?\s*(?:\n|\r|\s)*)?(https?://(?:www\.)?github\.com/[a-zA-Z0-9\-_/=?]+|www\.github\.com/[a-zA-Z0-9\-_/=?]+|github\.com/[a-zA-Z0-9\-_/=?]+)",
+    "portfolio": r"(?:portfolio\s*[:\-]?\s*(?:\n|\r|\s)*)?(https?://[\w\.-]+\.[a-z]{2,}(?:/[a-zA-Z0-9\-_/=?#]+)?|www\.[\w\.-]+\.[a-z]{2,}(?:/[a-zA-Z0-9\-_/=?#]+)?)",
+}
+
+# Emails and URLs carry no digits: digits inside them are the one intended
+# difference from the baseline (they are no longer taken for a phone number)
+FRAGMENTS = [
+    "john.doe@mail.com", "jane@site.org", "+1 (555) 123-4567", "555.123.4567", "+91 98765 43210",
+    "2010", "2014-2018", "linkedin.com/in/jane-doe", "https://www.linkedin.com/in/x", "www.github.com/foo",
+    "https://github.com/bar/baz", "https://janedoe.dev/work", "www.site.io", "Python3", "3rd", "B.Sc",
+    "Phone:", "Email:", "LinkedIn:", "Portfolio:", "|", ",", "\n", " ", "Jane Doe", "12", "45%",
+    "https://uk.linkedin.com/in/z", "tel5551234567ext", "(555)", "call 12345678901234", "1-800-555-0199",
+]
+
+
+def baseline_contacts(text):
+    emails = re.findall(BASELINE_EMAIL, text)
+    found = {"email": emails[0] if emails else None, "phone": None}
+    for pattern in BASELINE_PHONES:
+        phones = re.findall(pattern, text)
+        if phones:
+            found["phone"] = "".join(phones[0]) if isinstance(phones[0], tuple) else phones[0]
+            break
+    for key, pattern in BASELINE_URLS.items():
+        matches = re.findall(pattern, text, re.IGNORECASE)
+        found[key] = matches[0] if matches else None
+    return found
+
+
+def generated_texts(n=2000, seed=1):
+    rng = random.Random(seed)
+    for _ in range(n):
+        yield " ".join(rng.choice(FRAGMENTS) for _ in range(rng.randint(1, 12)))
+
+
+@pytest.mark.parametrize("text", [
+    "",
+    "Jane Doe\njane@site.org | +1 (555) 123-4567\nlinkedin.com/in/jane-doe | github.com/jane",
+    "Phone: 555.123.4567 Email: john.doe@mail.com Portfolio: https://janedoe.dev/work",
+    "Education 2014-2018 B.Sc, GPA 3.8",
+    "+91 98765 43210",
+    "12345678901234",
+    "call 12345678901234 now",
+    "x 5551234567890",
+])
+def test_scan_contacts_matches_baseline(text):
+    assert scan_contacts(text) == baseline_contacts(text)
+
+
+def test_scan_contacts_matches_baseline_on_generated_text():
+    for text in generated_texts():
+        assert scan_contacts(text) == baseline_contacts(text), text
+
+
+def test_phone_keeps_baseline_anchoring():
+    # A separator before the run lets the optional country-code 1 stay empty
+    assert scan_contacts("call 12345678901234 now")["phone"] == "1234567890"
+    assert scan_contacts("12345678901234")["phone"] == "2345678901"
+
+
+def test_digits_in_email_or_url_are_not_a_phone():
+    assert scan_contacts("x99@site.org")["phone"] is None
+    assert scan_contacts("https://github.com/user123")["phone"] is None
+    assert scan_contacts("x99@site.org 555-123-4567")["phone"] == "5551234567"
+
+
+def test_first_candidate_per_kind_wins():
+    found = scan_contacts("a@one.com b@two.com https://github.com/first github.com/second")
+    assert found["email"] == "a@one.com"
+    assert found["github"] == "https://github.com/first"
@@ -0,0 +1,131 @@
+import pytest
+
+from profile_analyser import graph
+from profile_analyser.cache import ParseCache, file_digest
+from profile_analyser.graph import ResumeAnalysis, get_analysis
+
+from conftest import build_pdf, column
+
+# Nodes that need no spaCy model
+MODEL_FREE_NODES = ("text", "error", "layout", "field", "format_warnings")
+
+
+@pytest.fixture
+def field_calls(monkeypatch):
+    """Count evaluations of the ``field`` node."""
+    calls = []
+    deps, compute = graph.NODES["field"]
+
+    def counted(*args):
+        calls.append(args)
+        return compute(*args)
+
+    monkeypatch.setitem(graph.NODES, "field", (deps, counted))
+    return calls
+
+
+def lazy_analysis(data, cache):
+    """``get_analysis`` as the UI calls it: the bytes come from the blob store on first use."""
+    return get_analysis(lambda: data, "pdf", cache=cache, digest=file_digest(data))
+
+
+def test_nodes_are_computed_on_first_read_only(resume_pdf, field_calls):
+    analysis = ResumeAnalysis(resume_pdf, "pdf")
+    assert analysis.computed() == ()
+    assert "Python" in analysis["text"]
+    assert "text" in analysis and "field" not in analysis
+    assert analysis.get("error") is None
+    analysis["field"]
+    analysis["field"]
+    assert len(field_calls) == 1
+    assert "document" not in analysis  # shared through as_document instead
+
+
+def test_source_is_released_after_extraction(resume_pdf):
+    analysis = ResumeAnalysis(resume_pdf, "pdf")
+    analysis["text"]
+    assert "source" not in analysis
+
+
+def test_callable_source_is_read_only_when_extraction_runs(resume_pdf):
+    reads = []
+
+    def load():
+        reads.append(1)
+        return resume_pdf
+
+    analysis = ResumeAnalysis(load, "pdf", digest=file_digest(resume_pdf))
+    assert reads == []
+    analysis["layout"]
+    analysis["text"]
+    assert reads == [1]
+
+
+def test_seed_skips_transient_and_computed_nodes(resume_pdf, field_calls):
+    analysis = ResumeAnalysis(resume_pdf, "pdf")
+    analysis.seed({"text": "seeded", "error": None, "layout": None, "field": "Data Science", "document": object()})
+    assert analysis["text"] == "seeded" and analysis["field"] == "Data Science"
+    assert "document" not in analysis and "source" not in analysis
+    analysis.seed({"field": "Web Development"})
+    assert analysis["field"] == "Data Science"
+    assert field_calls == []
+
+
+def test_fail_turns_the_file_into_an_empty_resume_with_an_error(resume_pdf):
+    analysis = ResumeAnalysis(resume_pdf, "pdf")
+    analysis["field"]
+    analysis.fail("Error analyzing PDF: boom")
+    assert analysis["text"] == "" and analysis["error"] == "Error analyzing PDF: boom"
+    assert "field" not in analysis
+
+
+def test_unknown_node():
+    with pytest.raises(KeyError):
+        ResumeAnalysis(b"", "pdf")["nope"]
+
+
+def test_extraction_error_is_a_node_value():
+    analysis = ResumeAnalysis(b"not a pdf", "pdf")
+    assert analysis["text"] == ""
+    assert analysis["error"].startswith("Error extracting text from PDF")
+
+
+def test_get_analysis_shares_one_analysis_per_file(resume_pdf):
+    cache = ParseCache()
+    first = get_analysis(resume_pdf, "pdf", cache=cache)
+    assert get_analysis(resume_pdf, "pdf", cache=cache) is first
+    assert get_analysis(lambda: pytest.fail("bytes reloaded"), "pdf", cache=cache, digest=first.digest) is first
+
+
+def test_cache_accounts_for_nodes_computed_after_insertion(resume_pdf):
+    cache = ParseCache(max_bytes=10 ** 6)
+    analysis = lazy_analysis(resume_pdf, cache)
+    inserted = cache.stats()["bytes"]
+    analysis.evaluate(MODEL_FREE_NODES)
+    assert cache.stats()["bytes"] == analysis.approx_size() > inserted + len(analysis["text"])
+
+
+def test_byte_bound_holds_as_analyses_grow(resume_pdf):
+    other_pdf = build_pdf(column(72, 72, ["John Roe", "john@site.org", "Skills", "Java, Spring and SQL"]))
+    sizes = []
+    for data in (resume_pdf, other_pdf):
+        sizing = ResumeAnalysis(data, "pdf")
+        sizing.evaluate(MODEL_FREE_NODES)
+        sizes.append(sizing.approx_size())
+    cache = ParseCache(max_bytes=sum(sizes) - 1)
+    first = lazy_analysis(resume_pdf, cache)
+    first.evaluate(MODEL_FREE_NODES)
+    second = lazy_analysis(other_pdf, cache)
+    assert first.digest in cache and second.digest in cache
+    second.evaluate(MODEL_FREE_NODES)
+    assert first.digest not in cache and second.digest in cache
+    assert cache.stats()["bytes"] == sizes[1]
+
+
+def test_analysis_outgrowing_the_cache_is_dropped(resume_pdf):
+    cache = ParseCache(max_bytes=64)
+    analysis = lazy_analysis(resume_pdf, cache)
+    assert analysis.digest in cache
+    analysis["field"]
+    assert analysis.digest not in cache
+    assert cache.stats()["bytes"] == 0
@@ -0,0 +1,65 @@
+import json
+
+from profile_analyser import jobs
+from profile_analyser.jobs import DEFAULT_CATALOG, JobCatalog, get_job_catalog, load_postings, missing_catalog_paths
+
+
+def posting(company, field, skills):
+    return {"company": company, "role": "Engineer", "field": field, "location": "Remote",
+            "salary": "Not listed", "skills": skills}
+
+
+CATALOG = JobCatalog([
+    posting("A", "Data Science", ["Python", "SQL"]),
+    posting("B", "Web Development", ["JavaScript", "React"]),
+    posting("C", "Data Science", ["Python", "SQL"]),
+    posting("D", "Data Science", ["Python", "Spark", "SQL"]),
+    posting("E", "Web Development", ["Python", "Django"]),
+])
+
+
+def companies(results):
+    return [result["company"] for result in results]
+
+
+def test_ranks_by_weighted_coverage():
+    results = CATALOG.top_k(["python", " SQL "], k=5)
+    assert companies(results)[:3] == ["A", "C", "D"]
+    assert [r["match"] for r in results[:2]] == [100, 100]
+    assert 0 < results[2]["match"] < 100
+    assert results[2]["matched_skills"] == ["Python", "SQL"]
+
+
+def test_ties_keep_catalog_order():
+    assert companies(CATALOG.top_k(["Python", "SQL"], k=2)) == ["A", "C"]
+    # No skills at all: every posting scores 0 and the catalog order stands
+    assert companies(CATALOG.top_k([], k=5)) == ["A", "B", "C", "D", "E"]
+    assert companies(CATALOG.top_k(["Not found"], k=2)) == ["A", "B"]
+
+
+def test_field_filter():
+    results = CATALOG.top_k(["Python"], k=5, field="Web Development")
+    assert companies(results) == ["E", "B"]
+    assert results[1]["match"] == 0
+
+
+def test_unknown_field_searches_every_posting():
+    assert len(CATALOG.top_k(["Python"], k=10, field="Astronomy")) == 5
+
+
+def test_empty_catalog():
+    assert JobCatalog([]).top_k(["Python"]) == []
+
+
+def test_missing_catalog_paths_are_skipped(tmp_path):
+    catalog_file = tmp_path / "jobs.json"
+    catalog_file.write_text(json.dumps([posting("Local", "Data Science", ["Python"])]))
+    missing = str(tmp_path / "gone.csv")
+    paths = jobs.os.pathsep.join([missing, str(catalog_file)])
+    assert missing_catalog_paths(paths) == [missing]
+    assert companies(get_job_catalog(paths).postings) == ["Local"]
+
+
+def test_all_paths_missing_falls_back_to_bundled_catalog(tmp_path):
+    catalog = get_job_catalog(str(tmp_path / "gone.json"))
+    assert len(catalog) == len(load_postings(DEFAULT_CATALOG))
@@ -0,0 +1,137 @@
+import fitz  # PyMuPDF
+import pytest
+
+from profile_analyser.extract import extract_pdf, iter_pdf_pages
+from profile_analyser.layout import DocumentLayout, PageLayout, classify_page, structured_text
+
+from conftest import build_pdf, column
+
+SECTIONS = [
+    (["Experience", "Data Analyst, Acme Corp", "Built SQL reports for sales"],
+     ["Skills", "Python, SQL, Pandas", "Docker and Kubernetes"]),
+    (["Education", "B.Sc Statistics, 2019"], ["Projects", "Sales dashboard"]),
+]
+
+
+def two_columns():
+    """A page written row by row across two columns, as resume templates do."""
+    entries = [(72, 60, "Jane Doe", 16, True)]
+    y = 100
+    for left, right in SECTIONS:
+        for x, lines in ((72, left), (330, right)):
+            entries.append((x, y, lines[0], 12, True))
+            entries.extend(column(x, y + 14, lines[1:]))
+        y += 70
+    # Interleave the two columns line by line in the content stream
+    entries[1:] = sorted(entries[1:], key=lambda entry: (entry[1], entry[0]))
+    return entries
+
+
+def open_pages(*pages):
+    return list(fitz.open(stream=build_pdf(*pages), filetype="pdf"))
+
+
+def image_page():
+    """A page holding one image and no text, like a scanned resume."""
+    doc = fitz.open(stream=build_pdf([]), filetype="pdf")
+    pixmap = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, 64, 64), False)
+    pixmap.clear_with(200)
+    doc[0].insert_image(fitz.Rect(72, 100, 540, 700), pixmap=pixmap)
+    return fitz.open(stream=doc.tobytes(), filetype="pdf")[0]
+
+
+def test_single_column_page():
+    [page] = open_pages(column(72, 72, ["Jane Doe", "Experience"] + ["Analyst at Acme Corp building SQL reports"] * 3))
+    layout = classify_page(page)
+    assert (layout.kind, layout.columns, layout.gutters, layout.images) == ("text", 1, (), 0)
+    assert layout.chars > 100 and layout.fonts == 1
+
+
+def test_side_by_side_columns():
+    [page] = open_pages(two_columns())
+    layout = classify_page(page, page.get_textpage())
+    assert layout.kind == "columns" and layout.columns == 2
+    [gutter] = layout.gutters
+    # Between the right edge of the left column's text and the right column
+    assert 200 < gutter < 330
+    assert layout.fonts == 2
+
+
+def test_image_only_page():
+    layout = classify_page(image_page())
+    assert (layout.kind, layout.chars, layout.images) == ("image", 0, 1)
+
+
+def test_document_layout_summarizes_the_pages():
+    def page(kind, chars=500, images=0, columns=1):
+        return PageLayout(0, kind, chars, columns, (), images, 1)
+
+    assert DocumentLayout.from_pages([page("image", 0, 1)] * 2).kind == "image"
+    assert DocumentLayout.from_pages([page("image", 0, 1), page("text")]).kind == "text"
+    mixed = DocumentLayout.from_pages(iter([page("text"), page("columns", columns=3)]))
+    assert mixed.kind == "columns" and mixed.columns == 3 and len(mixed.pages) == 2
+    assert DocumentLayout.from_pages([]) == DocumentLayout("text", ())
+    assert DocumentLayout.from_pages([]).columns == 1
+    assert DocumentLayout.from_pages([page("text", 120, 1)]).image_heavy
+    assert not DocumentLayout.from_pages([page("image", 0, 1), page("text")]).image_heavy
+
+
+def test_structured_text_reads_column_by_column():
+    [page] = open_pages(two_columns())
+    textpage = page.get_textpage()
+    text = structured_text(page, textpage, classify_page(page, textpage).gutters)
+    assert text == (
+        "Jane Doe\n\n"
+        "Experience\nData Analyst, Acme Corp\nBuilt SQL reports for sales\n\n"
+        "Education\nB.Sc Statistics, 2019\n\n"
+        "Skills\nPython, SQL, Pandas\nDocker and Kubernetes\n\n"
+        "Projects\nSales dashboard\n"
+    )
+    # MuPDF's own order interleaves the columns
+    assert "Experience\nSkills" in page.get_text()
+
+
+def test_structured_text_joins_wrapped_lines():
+    [page] = open_pages(
+        [(72, 72, "Experience", 12, True)]
+        + column(72, 90, [
+            "Built reporting pipelines in Python and SQL that cut the monthly",
+            "close by two days for the finance team.",
+            "Led the migration of legacy dashboards onto a shared data ware-",
+            "house used by four departments.",
+            "Short line",
+            "lower case line that is not a continuation",
+        ])
+    )
+    assert structured_text(page).split("\n") == [
+        "Experience",
+        "Built reporting pipelines in Python and SQL that cut the monthly close by two days for the finance team.",
+        "Led the migration of legacy dashboards onto a shared data ware-house used by four departments.",
+        "Short line",
+        "lower case line that is not a continuation",
+        "",
+    ]
+
+
+def test_structured_text_of_a_page_without_text():
+    assert structured_text(image_page()) == ""
+
+
+@pytest.mark.parametrize("mode, in_columns", [("auto", True), ("blocks", True), ("text", False)])
+def test_pdf_modes(mode, in_columns):
+    data = build_pdf(two_columns())
+    text, layout = extract_pdf(data, mode=mode)
+    assert layout.kind == "columns"
+    assert ("Built SQL reports for sales\n\nEducation" in text) is in_columns
+
+
+def test_blocks_mode_restructures_single_column_pages():
+    data = build_pdf(column(72, 72, ["jane@site.org"]) + [(72, 90, "Experience", 12, True)]
+                     + column(72, 104, ["Analyst, Acme Corp"]))
+    assert extract_pdf(data, mode="blocks")[0] == "jane@site.org\n\nExperience\nAnalyst, Acme Corp\n"
+    assert extract_pdf(data, mode="auto")[0] == "jane@site.org\nExperience\nAnalyst, Acme Corp\n"
+
+
+def test_unknown_pdf_mode():
+    with pytest.raises(ValueError, match="unknown PDF mode"):
+        next(iter_pdf_pages(build_pdf([]), mode="columns"))
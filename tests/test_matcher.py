@@ -0,0 +1,46 @@
+from profile_analyser.matcher import KeywordMatcher, SkillMatches, get_skill_matcher
+
+
+def keywords(matcher, text):
+    return [hit.keyword for hit in matcher.find(text)]
+
+
+def test_whole_tokens_only():
+    matcher = KeywordMatcher(["git", "github", "go", "r"])
+    assert keywords(matcher, "Pushed to GitHub from Google") == ["github"]
+    assert keywords(matcher, "git and github") == ["git", "github"]
+    assert keywords(matcher, "Go, R and rust") == ["go", "r"]
+
+
+def test_trailing_plus_and_hash_stay_in_the_token():
+    matcher = KeywordMatcher(["c", "c++", "c#", "security+"])
+    assert keywords(matcher, "C++ and C# (CompTIA Security+)") == ["c++", "c#", "security+"]
+    assert keywords(matcher, "ANSI C, C++") == ["c", "c++"]
+
+
+def test_hyphenated_phrase():
+    matcher = KeywordMatcher(["scikit-learn", "learn"])
+    text = "Built models with Scikit-Learn"
+    hits = matcher.find(text)
+    assert [hit.keyword for hit in hits] == ["scikit-learn", "learn"]
+    assert text[hits[0].start:hits[0].end] == "Scikit-Learn"
+    assert keywords(matcher, "scikit learn") == ["scikit-learn", "learn"]
+    assert keywords(matcher, "scikitlearn") == []
+
+
+def test_overlapping_phrases_are_all_reported():
+    matcher = KeywordMatcher(["machine learning", "learning", "machine"])
+    assert keywords(matcher, "machine learning") == ["machine", "machine learning", "learning"]
+
+
+def test_duplicate_keywords_collapse():
+    matcher = KeywordMatcher(["Python", "python", "  "])
+    assert len(matcher) == 1
+    assert keywords(matcher, "PYTHON") == ["python"]
+
+
+def test_skill_matches_views():
+    matches = SkillMatches(get_skill_matcher().find("Python, SQL and teamwork; AWS certified (PMP)"))
+    assert {"python", "sql"} <= matches.keywords
+    assert "teamwork" in matches.soft_skills
+    assert "pmp" in matches.cert_acronyms
@@ -0,0 +1,41 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from profile_analyser import nlp
+
+
+@pytest.fixture
+def blank_pipeline(monkeypatch):
+    """A blank English pipeline in place of the model, with fresh stats."""
+    spacy = pytest.importorskip("spacy")
+    monkeypatch.setattr(nlp, "_nlp", spacy.blank("en"))
+    monkeypatch.setattr(nlp, "_stats", {"load_seconds": 0.0, "loads": 0, "calls": {}, "seconds": {},
+                                        "truncated": 0, "batches": 0})
+    monkeypatch.setattr(nlp, "MAX_CHARS", 20)
+
+
+def test_long_texts_are_truncated_and_counted(blank_pipeline):
+    assert nlp.run_nlp("word " * 10, "ner").text == ("word " * 10)[:20]
+    nlp.run_nlp("short", "ner")
+    docs = nlp.pipe_nlp(iter(["word " * 10, "short", "x" * 21]), "ner")
+    assert [len(doc.text) for doc in docs] == [20, 5, 20]
+    stats = nlp.pipeline_stats()
+    assert stats["truncated"] == 3
+    assert stats["calls"] == {"ner": 5}
+    assert stats["batches"] == 1
+
+
+def test_stats_are_exact_under_concurrent_calls(blank_pipeline):
+    with ThreadPoolExecutor(8) as pool:
+        list(pool.map(lambda i: nlp.run_nlp("long text " * (i % 3 + 1), "ner"), range(300)))
+        list(pool.map(lambda i: nlp.pipe_nlp(["long text " * 3] * 4, "parser"), range(50)))
+    stats = nlp.pipeline_stats()
+    assert stats["truncated"] == 100 + 200
+    assert stats["calls"] == {"ner": 300, "parser": 200}
+
+
+def test_covers():
+    assert nlp.covers("full", "ner")
+    assert nlp.covers("parser", "ner")
+    assert not nlp.covers("ner", "parser")
@@ -0,0 +1,59 @@
+import gc
+import weakref
+
+import pytest
+
+from profile_analyser import document, scoring
+from profile_analyser.scoring import detect_field, text_scores
+
+TEXT = """Jane Doe
+Summary
+Data analyst who developed dashboards and reduced reporting time by 40%.
+Experience
+Analyst, Acme (2022 - 2024)
+- Implemented SQL pipelines | Python | Tableau
+Education
+B.Sc Statistics
+Skills
+Python, SQL, Pandas, Machine Learning
+"""
+
+
+@pytest.fixture(autouse=True)
+def cold_caches():
+    document._document.cache_clear()
+    scoring._text_scores.cache_clear()
+    yield
+    document._document.cache_clear()
+    scoring._text_scores.cache_clear()
+
+
+def test_text_scores_are_memoized_by_text():
+    first = text_scores(TEXT)
+    assert text_scores(TEXT) is first
+    # A document rebuilt for the same text still hits
+    document._document.cache_clear()
+    assert text_scores(TEXT) is first
+    info = scoring._text_scores.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (2, 1, 1)
+
+
+def test_text_scores_memo_holds_no_documents():
+    doc = weakref.ref(document.as_document(TEXT))
+    text_scores(TEXT)
+    document._document.cache_clear()
+    gc.collect()
+    assert doc() is None
+
+
+def test_text_scores_accept_a_document():
+    assert text_scores(document.as_document(TEXT)) == text_scores(TEXT)
+
+
+def test_detect_field_from_text_and_from_skills():
+    assert detect_field(TEXT) == "Data Science"
+    document._document.cache_clear()
+    assert detect_field(["Python", "SQL", "Pandas", "Machine Learning", None]) == "Data Science"
+    # Skills lists (the live edit preview) never enter the document memo
+    assert document._document.cache_info().currsize == 0
+    assert detect_field([]) == "General"
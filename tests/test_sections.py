@@ -0,0 +1,46 @@
+import random
+from difflib import SequenceMatcher
+
+import pytest
+
+from profile_analyser.constants import SECTION_HEADERS
+from profile_analyser.sections import normalize_section_heading
+
+
+def baseline_normalize(text):
+    """The difflib loop normalize_section_heading replaced."""
+    text_lower = text.lower().strip()
+    for section, variations in SECTION_HEADERS.items():
+        for variation in variations:
+            if SequenceMatcher(None, text_lower, variation).ratio() > 0.8:
+                return section
+    return text_lower
+
+
+def heading_variants():
+    rng = random.Random(0)
+    letters = "abcdefghijklmnopqrstuvwxyz "
+    for names in SECTION_HEADERS.values():
+        for name in names:
+            yield name
+            yield "  " + name.upper() + "\n"
+            yield name[1:]
+            yield name[:-1]
+            yield name + "s"
+            yield name + " & awards"
+            i = rng.randrange(len(name))
+            yield name[:i] + rng.choice(letters) + name[i + 1:]
+            if len(name) > 2:
+                yield name[:i] + name[i + 1:i + 2] + name[i:i + 1] + name[i + 2:]
+    for _ in range(500):
+        yield "".join(rng.choice(letters) for _ in range(rng.randint(0, 30)))
+
+
+@pytest.mark.parametrize("text", ["Experience", "WORK HISTORY", "Educaton", "Skils", "Hobbies", "", "   "])
+def test_normalize_section_heading_examples(text):
+    assert normalize_section_heading(text) == baseline_normalize(text)
+
+
+def test_normalize_section_heading_matches_difflib_loop():
+    for text in heading_variants():
+        assert normalize_section_heading(text) == baseline_normalize(text), repr(text)
@@ -0,0 +1,60 @@
+import pytest
+
+from profile_analyser.similarity import match, top_terms
+
+RESUMES = [
+    "Python developer building Django web services on PostgreSQL",
+    "Registered nurse providing patient care in a hospital ward",
+    "Data analyst using Python, pandas and SQL for reporting",
+]
+JOBS = [
+    "Backend Python developer: Django, PostgreSQL, web services",
+    "Hospital nurse for patient care",
+    "SQL reporting analyst with pandas",
+]
+
+
+@pytest.mark.parametrize("method", ["tfidf", "bm25"])
+def test_each_job_ranks_its_resume_first(method):
+    result = match(RESUMES, JOBS, method=method)
+    assert result.shape == (3, 3)
+    for job in range(3):
+        assert result.top_resumes(job, k=1)[0][0] == job
+    assert [job for job, _ in result.top_jobs(1)][0] == 1
+
+
+def test_tfidf_scores_are_cosines():
+    scores = match(RESUMES, JOBS).scores
+    assert (scores >= 0).all() and (scores <= 1 + 1e-9).all()
+    assert match(["python django"], ["python django"]).scores[0, 0] == pytest.approx(1.0)
+
+
+def test_ties_rank_lower_index_first():
+    result = match(["python sql", "java", "python sql"], ["python sql"])
+    assert result.top_resumes(0) == [(0, result.scores[0, 0]), (2, result.scores[0, 0]), (1, 0.0)]
+
+
+def test_contributions_name_the_shared_terms():
+    terms = [term for term, _ in match(RESUMES, JOBS).contributions(0, 0)]
+    assert "django" in terms and "postgresql" in terms
+    assert "nurse" not in terms
+
+
+def test_empty_and_stop_word_only_input():
+    assert match([], JOBS).shape == (0, 3)
+    result = match(["the and of"], ["a an the"])
+    assert result.scores.tolist() == [[0.0]]
+    assert result.top_resumes(0) == [(0, 0.0)]
+
+
+def test_unknown_method():
+    with pytest.raises(ValueError):
+        match(RESUMES, JOBS, method="cosine")
+
+
+def test_top_terms_use_the_text_alone():
+    text = "Kubernetes and Terraform. Kubernetes clusters, Kubernetes upgrades; Terraform modules."
+    assert top_terms(text, k=2) == ["kubernetes", "terraform"]
+    assert top_terms("", k=5) == []
+    # Stop words and generic job-ad words are not terms
+    assert top_terms("strong team experience required", k=5) == []